@@ -0,0 +1,5 @@
+from .base import TABLES, Backend, Table
+from .memory import MemoryBackend
+from .sqlite import SQLiteBackend
+
+__all__ = ["TABLES", "Backend", "MemoryBackend", "SQLiteBackend", "Table"]
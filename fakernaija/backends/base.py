@@ -0,0 +1,180 @@
+"""This module defines the dataset backend interface and the bundled tables."""
+
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from fakernaija.records import Record
+
+DATA_PATH = Path(__file__).parent.parent / "data"
+
+
+@dataclass(frozen=True)
+class Table:
+    """A dataset table and the columns its records are filtered by."""
+
+    name: str
+    path: Path
+    columns: tuple[str, ...]
+    filters: tuple[str, ...]
+    json_columns: tuple[str, ...] = ()
+
+
+TABLES = {
+    table.name: table
+    for table in [
+        Table(
+            "first_names",
+            DATA_PATH / "names" / "first_names.json",
+            ("tribe", "gender", "name"),
+            ("tribe", "gender"),
+        ),
+        Table(
+            "last_names",
+            DATA_PATH / "names" / "last_names.json",
+            ("tribe", "name"),
+            ("tribe",),
+        ),
+        Table(
+            "schools",
+            DATA_PATH / "schools.json",
+            ("name", "acronym", "state", "type", "ownership"),
+            ("ownership", "state", "type"),
+        ),
+        Table(
+            "states",
+            DATA_PATH / "states.json",
+            ("name", "code", "capital", "slogan", "lgas", "region", "postal_code"),
+            ("name", "region"),
+            json_columns=("lgas",),
+        ),
+    ]
+}
+
+
+def get_table(name: str) -> Table:
+    """Get a dataset table by name.
+
+    Args:
+        name (str): The name of the table, e.g. ``schools``.
+
+    Returns:
+        Table: The table.
+
+    Raises:
+        ValueError: If the table does not exist.
+    """
+    try:
+        return TABLES[name]
+    except KeyError:
+        msg = f"Unknown table: {name}. Available tables are: {', '.join(TABLES)}"
+        raise ValueError(msg) from None
+
+
+def validate_filters(table: Table, filters: dict[str, Any]) -> dict[str, Any]:
+    """Validate the filter columns of a query and drop the unset filters.
+
+    Args:
+        table (Table): The queried table.
+        filters (dict[str, Any]): The filter values by column. None values
+            are ignored.
+
+    Returns:
+        dict[str, Any]: The filters that are set.
+
+    Raises:
+        ValueError: If a column cannot be filtered by.
+    """
+    for column in filters:
+        if column not in table.filters:
+            msg = f"Unsupported filter for {table.name}: {column}. Supported filters are: {', '.join(table.filters)}"
+            raise ValueError(msg)
+    return {column: value for column, value in filters.items() if value is not None}
+
+
+def validate_column(table: Table, column: str) -> None:
+    """Validate that a column exists in a table.
+
+    Args:
+        table (Table): The queried table.
+        column (str): The column.
+
+    Raises:
+        ValueError: If the column does not exist.
+    """
+    if column not in table.columns:
+        msg = f"Unknown column for {table.name}: {column}. Available columns are: {', '.join(table.columns)}"
+        raise ValueError(msg)
+
+
+class Backend(ABC):
+    """The interface of the storage behind the dataset providers.
+
+    A backend stores the records of the tables in ``TABLES`` and answers
+    filtered queries. Filters are exact, case-insensitive matches on the
+    ``filters`` columns of a table; None values are ignored.
+    """
+
+    @abstractmethod
+    def select(self, table: str, **filters: Any) -> Sequence[Record]:  # noqa: ANN401
+        """Get the records of a table matching the filters.
+
+        Args:
+            table (str): The name of the table.
+            **filters: The filter values by column.
+
+        Returns:
+            Sequence[Record]: The matching records, in table order.
+        """
+
+    @abstractmethod
+    def sample(self, table: str, n: int, **filters: Any) -> list[Record]:  # noqa: ANN401
+        """Draw ``n`` random records, with replacement, matching the filters.
+
+        Args:
+            table (str): The name of the table.
+            n (int): The number of records to draw.
+            **filters: The filter values by column.
+
+        Returns:
+            list[Record]: The drawn records, or an empty list if none match.
+        """
+
+    @abstractmethod
+    def count(self, table: str, **filters: Any) -> int:  # noqa: ANN401
+        """Count the records of a table matching the filters.
+
+        Args:
+            table (str): The name of the table.
+            **filters: The filter values by column.
+
+        Returns:
+            int: The number of matching records.
+        """
+
+    @abstractmethod
+    def values(self, table: str, column: str, **filters: Any) -> tuple[Any, ...]:  # noqa: ANN401
+        """Get a column of the records matching the filters.
+
+        Args:
+            table (str): The name of the table.
+            column (str): The column to get.
+            **filters: The filter values by column.
+
+        Returns:
+            tuple[Any, ...]: The column values, in table order.
+        """
+
+    @abstractmethod
+    def distinct(self, table: str, column: str) -> list[Any]:
+        """Get the distinct values of a column, in order of first appearance.
+
+        Args:
+            table (str): The name of the table.
+            column (str): The column.
+
+        Returns:
+            list[Any]: The distinct values.
+        """
@@ -0,0 +1,154 @@
+"""This module provides the in-memory dataset backend."""
+
+import random
+from collections.abc import Iterable, Mapping
+from typing import Any
+
+from fakernaija.backends.base import (
+    TABLES,
+    Backend,
+    get_table,
+    validate_column,
+    validate_filters,
+)
+from fakernaija.records import Record, freeze_records
+from fakernaija.utils import load_json
+
+
+class MemoryBackend(Backend):
+    """A backend holding the tables as frozen records in memory.
+
+    Tables are loaded on first use, from the given records or else from the
+    bundled JSON files. Filtered selections are cached, so repeated queries
+    with the same filters return the same tuple.
+    """
+
+    def __init__(
+        self,
+        tables: Mapping[str, Iterable[Mapping[str, Any]]] | None = None,
+    ) -> None:
+        """Initialize the MemoryBackend.
+
+        Args:
+            tables (Mapping[str, Iterable[Mapping[str, Any]]] | None, optional):
+                The records of some tables by table name. Other tables are
+                loaded from the bundled data. Defaults to None.
+
+        Raises:
+            ValueError: If a table does not exist.
+        """
+        self._sources = dict(tables or {})
+        for table in self._sources:
+            get_table(table)
+        self._tables: dict[str, tuple[Record, ...]] = {}
+        self._selections: dict[
+            tuple[str, tuple[tuple[str, Any], ...]], tuple[Record, ...]
+        ] = {}
+
+    def _records(self, table: str) -> tuple[Record, ...]:
+        """Get all records of a table, loading them on first use."""
+        records = self._tables.get(table)
+        if records is None:
+            source = self._sources.pop(table, None)
+            if source is None:
+                definition = TABLES[table]
+                source = load_json(definition.path, list(definition.columns))
+            records = self._tables[table] = freeze_records(source)
+        return records
+
+    def select(self, table: str, **filters: Any) -> tuple[Record, ...]:  # noqa: ANN401
+        """Get the records of a table matching the filters.
+
+        Args:
+            table (str): The name of the table.
+            **filters: The filter values by column.
+
+        Returns:
+            tuple[Record, ...]: The matching records, in table order.
+
+        Raises:
+            ValueError: If the table does not exist or a filter is not supported.
+        """
+        set_filters = validate_filters(get_table(table), filters)
+        key = (
+            table,
+            tuple(
+                (column, str(value).casefold())
+                for column, value in sorted(set_filters.items())
+            ),
+        )
+        selection = self._selections.get(key)
+        if selection is None:
+            selection = self._selections[key] = tuple(
+                record
+                for record in self._records(table)
+                if all(
+                    str(record[column]).casefold() == value for column, value in key[1]
+                )
+            )
+        return selection
+
+    def sample(self, table: str, n: int, **filters: Any) -> list[Record]:  # noqa: ANN401
+        """Draw ``n`` random records, with replacement, matching the filters.
+
+        Args:
+            table (str): The name of the table.
+            n (int): The number of records to draw.
+            **filters: The filter values by column.
+
+        Returns:
+            list[Record]: The drawn records, or an empty list if none match.
+
+        Raises:
+            ValueError: If the table does not exist or a filter is not supported.
+        """
+        records = self.select(table, **filters)
+        return random.choices(records, k=n) if records else []
+
+    def count(self, table: str, **filters: Any) -> int:  # noqa: ANN401
+        """Count the records of a table matching the filters.
+
+        Args:
+            table (str): The name of the table.
+            **filters: The filter values by column.
+
+        Returns:
+            int: The number of matching records.
+
+        Raises:
+            ValueError: If the table does not exist or a filter is not supported.
+        """
+        return len(self.select(table, **filters))
+
+    def values(self, table: str, column: str, **filters: Any) -> tuple[Any, ...]:  # noqa: ANN401
+        """Get a column of the records matching the filters.
+
+        Args:
+            table (str): The name of the table.
+            column (str): The column to get.
+            **filters: The filter values by column.
+
+        Returns:
+            tuple[Any, ...]: The column values, in table order.
+
+        Raises:
+            ValueError: If the table or column does not exist or a filter is
+                not supported.
+        """
+        validate_column(get_table(table), column)
+        return tuple(record[column] for record in self.select(table, **filters))
+
+    def distinct(self, table: str, column: str) -> list[Any]:
+        """Get the distinct values of a column, in order of first appearance.
+
+        Args:
+            table (str): The name of the table.
+            column (str): The column.
+
+        Returns:
+            list[Any]: The distinct values.
+
+        Raises:
+            ValueError: If the table or column does not exist.
+        """
+        return list(dict.fromkeys(self.values(table, column)))
@@ -0,0 +1,359 @@
+"""This module provides the SQLite dataset backend."""
+
+import functools
+import json
+import random
+import sqlite3
+import threading
+from array import array
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from pathlib import Path
+from typing import Any
+
+from fakernaija.backends.base import (
+    TABLES,
+    Backend,
+    Table,
+    get_table,
+    validate_column,
+    validate_filters,
+)
+from fakernaija.records import Record, to_builtin
+from fakernaija.utils import iter_records, load_json
+
+SQLITE_BATCH_SIZE = 10_000
+SQLITE_MAX_VARIABLES = 900
+ROWID_CACHE_SIZE = 256
+
+FilterKey = tuple[tuple[str, Any], ...]
+
+
+def _encode(table: Table, record: Mapping[str, Any]) -> tuple[Any, ...]:
+    """Convert a record to a table row, storing JSON columns as JSON text."""
+    return tuple(
+        json.dumps(to_builtin(record[column]))
+        if column in table.json_columns and not isinstance(record[column], str)
+        else record[column]
+        for column in table.columns
+    )
+
+
+def _source_records(
+    table: Table,
+    source: str | Path | Iterable[Mapping[str, Any]] | None,
+) -> Iterable[Mapping[str, Any]]:
+    """Get the records to store in a table."""
+    if source is None:
+        return load_json(table.path, list(table.columns))
+    if isinstance(source, str | Path):
+        return iter_records(
+            source,
+            [column for column in table.columns if column not in table.json_columns],
+        )
+    return source
+
+
+def _batched(
+    rows: Iterable[tuple[Any, ...]], size: int
+) -> Iterator[list[tuple[Any, ...]]]:
+    """Split rows into lists of at most ``size`` rows."""
+    batch: list[tuple[Any, ...]] = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+class SQLiteBackend(Backend):
+    """A backend querying the tables from an SQLite database file.
+
+    Only the rows a query returns are loaded. Every filter column is indexed,
+    and ``sample`` draws random rowids from the matching rows before fetching
+    just the drawn rows, so sampling a few records of a large table stays
+    cheap. The rowids of each filter combination are cached; an unfiltered
+    table with contiguous rowids is represented by a ``range``.
+
+    Build a database from the bundled data, or from custom record files, with
+    ``SQLiteBackend.build``.
+
+    Examples:
+        .. code-block:: python
+
+            >>> from fakernaija import Naija
+            >>> from fakernaija.backends import SQLiteBackend
+            >>> backend = SQLiteBackend.build("dataset.db")
+            >>> naija = Naija(backend=backend)
+            >>> naija.school(state="lagos")["state"]
+            'Lagos'
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        """Open an SQLite database, read-only.
+
+        Args:
+            path (str | Path): The path to a database built with ``build``.
+
+        Raises:
+            FileNotFoundError: If the database file is not found.
+        """
+        database = Path(path)
+        if not database.is_file():
+            msg = f"File not found: {database}"
+            raise FileNotFoundError(msg)
+        self.path = database
+        self._connection = sqlite3.connect(
+            f"{database.resolve().as_uri()}?mode=ro",
+            uri=True,
+            check_same_thread=False,
+        )
+        self._lock = threading.Lock()
+        self._rowids = functools.lru_cache(maxsize=ROWID_CACHE_SIZE)(self._query_rowids)
+
+    @classmethod
+    def build(
+        cls,
+        path: str | Path,
+        sources: Mapping[str, str | Path | Iterable[Mapping[str, Any]]] | None = None,
+        batch_size: int = SQLITE_BATCH_SIZE,
+    ) -> "SQLiteBackend":
+        """Build an SQLite database of the tables and open it.
+
+        Existing tables in the database are replaced. Records are streamed into
+        the database in batches, so sources larger than memory can be stored.
+
+        Args:
+            path (str | Path): The path of the database file.
+            sources (Mapping[str, str | Path | Iterable[Mapping[str, Any]]] | None, optional):
+                The records of some tables by table name, as a ``.jsonl``,
+                ``.ndjson``, ``.csv`` or ``.json`` file or as an iterable of
+                records. Other tables are filled from the bundled data.
+                Defaults to None.
+            batch_size (int, optional): The number of rows inserted at once.
+                Defaults to SQLITE_BATCH_SIZE.
+
+        Returns:
+            SQLiteBackend: The backend of the built database.
+
+        Raises:
+            ValueError: If a table does not exist or a record is invalid.
+        """
+        sources = dict(sources or {})
+        for table in sources:
+            get_table(table)
+
+        connection = sqlite3.connect(path)
+        try:
+            with connection:
+                for table in TABLES.values():
+                    cls._create_table(
+                        connection,
+                        table,
+                        _source_records(table, sources.get(table.name)),
+                        batch_size,
+                    )
+        finally:
+            connection.close()
+        return cls(path)
+
+    @staticmethod
+    def _create_table(
+        connection: sqlite3.Connection,
+        table: Table,
+        records: Iterable[Mapping[str, Any]],
+        batch_size: int,
+    ) -> None:
+        """Create and fill a table, then index its filter columns."""
+        columns = ", ".join(f"{column} TEXT COLLATE NOCASE" for column in table.columns)
+        placeholders = ", ".join("?" for _ in table.columns)
+        connection.execute(f"DROP TABLE IF EXISTS {table.name}")
+        connection.execute(f"CREATE TABLE {table.name} ({columns})")
+        for batch in _batched(
+            (_encode(table, record) for record in records), batch_size
+        ):
+            connection.executemany(
+                f"INSERT INTO {table.name} VALUES ({placeholders})",  # noqa: S608
+                batch,
+            )
+        for column in table.filters:
+            connection.execute(
+                f"CREATE INDEX {table.name}_{column} ON {table.name} ({column})"
+            )
+        if len(table.filters) > 1:
+            connection.execute(
+                f"CREATE INDEX {table.name}_{'_'.join(table.filters)} "
+                f"ON {table.name} ({', '.join(table.filters)})"
+            )
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._connection.close()
+
+    def _execute(self, query: str, parameters: Sequence[Any] = ()) -> list[Any]:
+        """Run a query and fetch all of its rows."""
+        with self._lock:
+            return self._connection.execute(query, parameters).fetchall()
+
+    @staticmethod
+    def _filter_key(table: Table, filters: dict[str, Any]) -> FilterKey:
+        """Validate the filters of a query and normalize them to a cache key."""
+        return tuple(
+            (column, value.casefold() if isinstance(value, str) else value)
+            for column, value in sorted(validate_filters(table, filters).items())
+        )
+
+    @staticmethod
+    def _where(key: FilterKey) -> str:
+        """Build the WHERE clause of a filter key."""
+        if not key:
+            return ""
+        return " WHERE " + " AND ".join(f"{column} = ?" for column, _ in key)
+
+    def _decode(self, table: Table, row: Sequence[Any]) -> Record:
+        """Convert a table row to a record, decoding its JSON columns."""
+        return Record(
+            {
+                column: json.loads(value) if column in table.json_columns else value
+                for column, value in zip(table.columns, row, strict=True)
+            }
+        )
+
+    def _query_rowids(self, table: str, key: FilterKey) -> Sequence[int]:
+        """Get the rowids of the rows matching a filter key, in table order."""
+        if not key:
+            ((count, last),) = self._execute(
+                f"SELECT count(*), max(rowid) FROM {table}"  # noqa: S608
+            )
+            if count == (last or 0):
+                return range(1, count + 1)
+        return array(
+            "q",
+            (
+                rowid
+                for (rowid,) in self._execute(
+                    f"SELECT rowid FROM {table}{self._where(key)} ORDER BY rowid",  # noqa: S608
+                    [value for _, value in key],
+                )
+            ),
+        )
+
+    def select(self, table: str, **filters: Any) -> tuple[Record, ...]:  # noqa: ANN401
+        """Get the records of a table matching the filters.
+
+        Args:
+            table (str): The name of the table.
+            **filters: The filter values by column.
+
+        Returns:
+            tuple[Record, ...]: The matching records, in table order.
+
+        Raises:
+            ValueError: If the table does not exist or a filter is not supported.
+        """
+        definition = get_table(table)
+        key = self._filter_key(definition, filters)
+        rows = self._execute(
+            f"SELECT {', '.join(definition.columns)} FROM {table}"  # noqa: S608
+            f"{self._where(key)} ORDER BY rowid",
+            [value for _, value in key],
+        )
+        return tuple(self._decode(definition, row) for row in rows)
+
+    def sample(self, table: str, n: int, **filters: Any) -> list[Record]:  # noqa: ANN401
+        """Draw ``n`` random records, with replacement, matching the filters.
+
+        Only the drawn rows are fetched from the database.
+
+        Args:
+            table (str): The name of the table.
+            n (int): The number of records to draw.
+            **filters: The filter values by column.
+
+        Returns:
+            list[Record]: The drawn records, or an empty list if none match.
+
+        Raises:
+            ValueError: If the table does not exist or a filter is not supported.
+        """
+        definition = get_table(table)
+        rowids = self._rowids(table, self._filter_key(definition, filters))
+        if not rowids:
+            return []
+        drawn = random.choices(rowids, k=n)
+        unique = list(dict.fromkeys(drawn))
+        records: dict[int, Record] = {}
+        for start in range(0, len(unique), SQLITE_MAX_VARIABLES):
+            chunk = unique[start : start + SQLITE_MAX_VARIABLES]
+            rows = self._execute(
+                f"SELECT rowid, {', '.join(definition.columns)} FROM {table} "  # noqa: S608
+                f"WHERE rowid IN ({', '.join('?' for _ in chunk)})",
+                chunk,
+            )
+            for rowid, *row in rows:
+                records[rowid] = self._decode(definition, row)
+        return [records[rowid] for rowid in drawn]
+
+    def count(self, table: str, **filters: Any) -> int:  # noqa: ANN401
+        """Count the records of a table matching the filters.
+
+        Args:
+            table (str): The name of the table.
+            **filters: The filter values by column.
+
+        Returns:
+            int: The number of matching records.
+
+        Raises:
+            ValueError: If the table does not exist or a filter is not supported.
+        """
+        return len(self._rowids(table, self._filter_key(get_table(table), filters)))
+
+    def values(self, table: str, column: str, **filters: Any) -> tuple[Any, ...]:  # noqa: ANN401
+        """Get a column of the records matching the filters.
+
+        Args:
+            table (str): The name of the table.
+            column (str): The column to get.
+            **filters: The filter values by column.
+
+        Returns:
+            tuple[Any, ...]: The column values, in table order.
+
+        Raises:
+            ValueError: If the table or column does not exist or a filter is
+                not supported.
+        """
+        definition = get_table(table)
+        validate_column(definition, column)
+        key = self._filter_key(definition, filters)
+        rows = self._execute(
+            f"SELECT {column} FROM {table}{self._where(key)} ORDER BY rowid",  # noqa: S608
+            [value for _, value in key],
+        )
+        if column in definition.json_columns:
+            return tuple(json.loads(value) for (value,) in rows)
+        return tuple(value for (value,) in rows)
+
+    def distinct(self, table: str, column: str) -> list[Any]:
+        """Get the distinct values of a column, in order of first appearance.
+
+        Values differing only in case are considered the same.
+
+        Args:
+            table (str): The name of the table.
+            column (str): The column.
+
+        Returns:
+            list[Any]: The distinct values.
+
+        Raises:
+            ValueError: If the table or column does not exist.
+        """
+        definition = get_table(table)
+        validate_column(definition, column)
+        rows = self._execute(
+            f"SELECT {column} FROM {table} GROUP BY {column} ORDER BY min(rowid)"  # noqa: S608
+        )
+        return [value for (value,) in rows]
@@ -8,10 +8,12 @@ from .faculty import (
     faculty,
     faculty_name,
 )
+from .generate import generate
 from .license_plate import license_plate
 from .marital_status import marital_status
 from .name import first_name, full_name, last_name, prefix
 from .phonenumber import phone_number
+from .profile import profile
 from .religion import religion
 from .school import school, school_name
 from .state import (
@@ -40,6 +42,9 @@ __all__ = [
     # Name commands
     "first_name",
     "full_name",
+    # Generate command
+    "generate",
+    # Name commands
     "last_name",
     # License plate command
     "license_plate",
@@ -48,6 +53,8 @@ __all__ = [
     # PhoneNumber command
     "phone_number",
     "prefix",
+    # Profile command
+    "profile",
     # Religion command
     "religion",
     # School commands
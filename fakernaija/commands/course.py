@@ -3,7 +3,11 @@
 import click
 
 from fakernaija import Naija
-from fakernaija.utils import generate_command_data, handle_command_output
+from fakernaija.utils import (
+    generate_command_data,
+    handle_command_output,
+    output_options,
+)
 
 naija = Naija()
 
@@ -21,8 +25,12 @@ naija = Naija()
     "-o",
     default=None,
     help="The format of the output file.",
-    type=click.Choice(["json", "csv", "text"], case_sensitive=False),
+    type=click.Choice(
+        ["json", "jsonl", "csv", "text", "sqlite", "pgcopy", "sql"],
+        case_sensitive=False,
+    ),
 )
+@output_options
 def course(repeat: int, output: str) -> None:
     """Returns random course objects.
 
@@ -55,7 +63,7 @@ def course(repeat: int, output: str) -> None:
             $ naija course --repeat 30 --output csv
             Generated data saved to /path/to/directory/filename.ext
     """
-    data = generate_command_data(repeat, naija.course)
+    data = generate_command_data(repeat, naija, "course")
     if data:
         handle_command_output(data, output, "courses", "courses")
 
@@ -73,8 +81,12 @@ def course(repeat: int, output: str) -> None:
     "-o",
     default=None,
     help="The format of the output file.",
-    type=click.Choice(["json", "csv", "text"], case_sensitive=False),
+    type=click.Choice(
+        ["json", "jsonl", "csv", "text", "sqlite", "pgcopy", "sql"],
+        case_sensitive=False,
+    ),
 )
+@output_options
 def course_name(repeat: int, output: str) -> None:
     """Returns random course names.
 
@@ -84,7 +96,7 @@ def course_name(repeat: int, output: str) -> None:
         output (str): The format of the output file if provided.
 
     Note:
-        - Output options: csv, json, text
+        - Output options: csv, json, jsonl, pgcopy, sql, sqlite, text
 
     Examples:
         To return a single random course name:
@@ -110,7 +122,7 @@ def course_name(repeat: int, output: str) -> None:
             $ naija course_name --repeat 30 --output json
             Generated data saved to /path/to/directory/filename.ext
     """
-    data = generate_command_data(repeat, naija.course_name)
+    data = generate_command_data(repeat, naija, "course_name")
     if data:
         handle_command_output(data, output, "course_names", "course names")
 
@@ -128,8 +140,12 @@ def course_name(repeat: int, output: str) -> None:
     "-o",
     default=None,
     help="The format of the output file.",
-    type=click.Choice(["json", "csv", "text"], case_sensitive=False),
+    type=click.Choice(
+        ["json", "jsonl", "csv", "text", "sqlite", "pgcopy", "sql"],
+        case_sensitive=False,
+    ),
 )
+@output_options
 def course_code(repeat: int, output: str) -> None:
     """Returns random course codes.
 
@@ -139,7 +155,7 @@ def course_code(repeat: int, output: str) -> None:
         output (str): The format of the output file if provided.
 
     Note:
-        - Output options: csv, json, text
+        - Output options: csv, json, jsonl, pgcopy, sql, sqlite, text
 
     Examples:
         To return a single random course code:
@@ -165,6 +181,6 @@ def course_code(repeat: int, output: str) -> None:
             $ naija course_code --repeat 30 --output text
             Generated data saved to /path/to/directory/filename.ext
     """
-    data = generate_command_data(repeat, naija.course_code)
+    data = generate_command_data(repeat, naija, "course_code")
     if data:
         handle_command_output(data, output, "course_codes", "course codes")
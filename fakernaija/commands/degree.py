@@ -3,7 +3,11 @@
 import click
 
 from fakernaija import Naija
-from fakernaija.utils import generate_command_data, handle_command_output
+from fakernaija.utils import (
+    generate_command_data,
+    handle_command_output,
+    output_options,
+)
 
 naija = Naija()
 
@@ -31,8 +35,12 @@ naija = Naija()
     "-o",
     default=None,
     help="The format of the output file.",
-    type=click.Choice(["json", "csv", "text"], case_sensitive=False),
+    type=click.Choice(
+        ["json", "jsonl", "csv", "text", "sqlite", "pgcopy", "sql"],
+        case_sensitive=False,
+    ),
 )
+@output_options
 def degree(repeat: int, degree_type: str | None, output: str) -> None:
     """Returns random degree objects.
 
@@ -45,7 +53,7 @@ def degree(repeat: int, degree_type: str | None, output: str) -> None:
 
     Note:
         - Degree type options: undergraduate, masters, doctorate
-        - Output options: csv, json, text
+        - Output options: csv, json, jsonl, pgcopy, sql, sqlite, text
 
     Examples:
         To return a single random degree object:
@@ -78,7 +86,7 @@ def degree(repeat: int, degree_type: str | None, output: str) -> None:
             $ naija degree --repeat 30 --degree-type undergraduate --output json
             Generated data saved to /path/to/directory/filename.ext
     """
-    data = generate_command_data(repeat, naija.degree, degree_type=degree_type)
+    data = generate_command_data(repeat, naija, "degree", degree_type=degree_type)
     if data:
         handle_command_output(data, output, "degrees", "degrees")
 
@@ -106,8 +114,12 @@ def degree(repeat: int, degree_type: str | None, output: str) -> None:
     "-o",
     default=None,
     help="The format of the output file.",
-    type=click.Choice(["json", "csv", "text"], case_sensitive=False),
+    type=click.Choice(
+        ["json", "jsonl", "csv", "text", "sqlite", "pgcopy", "sql"],
+        case_sensitive=False,
+    ),
 )
+@output_options
 def degree_name(repeat: int, degree_type: str | None, output: str) -> None:
     """Returns random degree names.
 
@@ -120,7 +132,7 @@ def degree_name(repeat: int, degree_type: str | None, output: str) -> None:
 
     Note:
         - Degree type options: undergraduate, masters, doctorate
-        - Output options: csv, json, text
+        - Output options: csv, json, jsonl, pgcopy, sql, sqlite, text
 
     Examples:
         To return a single random degree name:
@@ -153,7 +165,7 @@ def degree_name(repeat: int, degree_type: str | None, output: str) -> None:
             $ naija degree_name --repeat 30 --degree-type undergraduate --output csv
             Generated data saved to /path/to/directory/filename.ext
     """
-    data = generate_command_data(repeat, naija.degree_name, degree_type=degree_type)
+    data = generate_command_data(repeat, naija, "degree_name", degree_type=degree_type)
     if data:
         handle_command_output(data, output, "degree_names", "degree names")
 
@@ -181,8 +193,12 @@ def degree_name(repeat: int, degree_type: str | None, output: str) -> None:
     "-o",
     default=None,
     help="The format of the output file.",
-    type=click.Choice(["json", "csv", "text"], case_sensitive=False),
+    type=click.Choice(
+        ["json", "jsonl", "csv", "text", "sqlite", "pgcopy", "sql"],
+        case_sensitive=False,
+    ),
 )
+@output_options
 def degree_abbr(repeat: int, degree_type: str | None, output: str) -> None:
     """Returns random degree abbreviations.
 
@@ -195,7 +211,7 @@ def degree_abbr(repeat: int, degree_type: str | None, output: str) -> None:
 
     Note:
         - Degree type options: undergraduate, masters, doctorate
-        - Output options: csv, json, text
+        - Output options: csv, json, jsonl, pgcopy, sql, sqlite, text
 
     Examples:
         To return a single random degree abbreviation:
@@ -228,6 +244,6 @@ def degree_abbr(repeat: int, degree_type: str | None, output: str) -> None:
             $ naija degree_abbr --repeat 30 --degree-type undergraduate --output text
             Generated data saved to /path/to/directory/filename.ext
     """
-    data = generate_command_data(repeat, naija.degree_abbr, degree_type=degree_type)
+    data = generate_command_data(repeat, naija, "degree_abbr", degree_type=degree_type)
     if data:
         handle_command_output(data, output, "degree_abbrs", "degree abbreviations")
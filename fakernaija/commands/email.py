@@ -3,7 +3,11 @@
 import click
 
 from fakernaija import Naija
-from fakernaija.utils import generate_command_data, handle_command_output
+from fakernaija.utils import (
+    generate_command_data,
+    handle_command_output,
+    output_options,
+)
 
 naija = Naija()
 
@@ -50,8 +54,12 @@ naija = Naija()
     "-o",
     default=None,
     help="The format of the output file.",
-    type=click.Choice(["json", "csv", "text"], case_sensitive=False),
+    type=click.Choice(
+        ["json", "jsonl", "csv", "text", "sqlite", "pgcopy", "sql"],
+        case_sensitive=False,
+    ),
 )
+@output_options
 def email(  # noqa: PLR0913
     repeat: int,
     tribe: str,
@@ -75,7 +83,7 @@ def email(  # noqa: PLR0913
     Note:
         - Gender options: male, female
         - Tribe options: yoruba, igbo, hausa, edo, fulani, ijaw
-        - Output options: csv, json, text
+        - Output options: csv, json, jsonl, pgcopy, sql, sqlite, text
 
     Examples:
         To generate a single random email address:
@@ -140,7 +148,8 @@ def email(  # noqa: PLR0913
     """
     data = generate_command_data(
         repeat,
-        naija.email,
+        naija,
+        "email",
         tribe=tribe,
         gender=gender,
         domain=domain,
@@ -3,7 +3,11 @@
 import click
 
 from fakernaija import Naija
-from fakernaija.utils import generate_command_data, handle_command_output
+from fakernaija.utils import (
+    generate_command_data,
+    handle_command_output,
+    output_options,
+)
 
 naija = Naija()
 
@@ -21,8 +25,12 @@ naija = Naija()
     "-o",
     default=None,
     help="The format of the output file.",
-    type=click.Choice(["json", "csv", "text"], case_sensitive=False),
+    type=click.Choice(
+        ["json", "jsonl", "csv", "text", "sqlite", "pgcopy", "sql"],
+        case_sensitive=False,
+    ),
 )
+@output_options
 def faculty(repeat: int, output: str) -> None:
     """Returns random faculty objects.
 
@@ -32,7 +40,7 @@ def faculty(repeat: int, output: str) -> None:
         output (str): The format of the output file if provided.
 
     Note:
-        - Output options: csv, json, text
+        - Output options: csv, json, jsonl, pgcopy, sql, sqlite, text
 
     Examples:
         To return a single random faculty:
@@ -58,7 +66,7 @@ def faculty(repeat: int, output: str) -> None:
             $ naija faculty --repeat 30 --output json
             Generated data saved to /path/to/directory/filename.ext
     """
-    data = generate_command_data(repeat, naija.faculty)
+    data = generate_command_data(repeat, naija, "faculty")
     if data:
         handle_command_output(data, output, "faculties", "faculties")
 
@@ -76,8 +84,12 @@ def faculty(repeat: int, output: str) -> None:
     "-o",
     default=None,
     help="The format of the output file.",
-    type=click.Choice(["json", "csv", "text"], case_sensitive=False),
+    type=click.Choice(
+        ["json", "jsonl", "csv", "text", "sqlite", "pgcopy", "sql"],
+        case_sensitive=False,
+    ),
 )
+@output_options
 def faculty_name(repeat: int, output: str) -> None:
     """Returns random faculty names.
 
@@ -87,7 +99,7 @@ def faculty_name(repeat: int, output: str) -> None:
         output (str): The format of the output file if provided.
 
     Note:
-        - Output options: csv, json, text
+        - Output options: csv, json, jsonl, pgcopy, sql, sqlite, text
 
     Examples:
         To return a single faculty name:
@@ -113,7 +125,7 @@ def faculty_name(repeat: int, output: str) -> None:
             $ naija faculty_name --repeat 30 --output json
             Generated data saved to /path/to/directory/filename.ext
     """
-    data = generate_command_data(repeat, naija.faculty_name)
+    data = generate_command_data(repeat, naija, "faculty_name")
     if data:
         handle_command_output(data, output, "faculty_name", "faculties")
 
@@ -137,8 +149,12 @@ def faculty_name(repeat: int, output: str) -> None:
     "-o",
     default=None,
     help="The format of the output file.",
-    type=click.Choice(["json", "csv", "text"], case_sensitive=False),
+    type=click.Choice(
+        ["json", "jsonl", "csv", "text", "sqlite", "pgcopy", "sql"],
+        case_sensitive=False,
+    ),
 )
+@output_options
 def department_name(repeat: int, faculty: str, output: str) -> None:
     """Returns random department names.
 
@@ -153,7 +169,7 @@ def department_name(repeat: int, faculty: str, output: str) -> None:
         ValueError: If the given faculty name is invalid.
 
     Note:
-        - Output options: csv, json, text
+        - Output options: csv, json, jsonl, pgcopy, sql, sqlite, text
 
     Examples:
         To return a single department name:
@@ -195,6 +211,6 @@ def department_name(repeat: int, faculty: str, output: str) -> None:
             $ naija department_name --repeat 30 --output text
             Generated data saved to /path/to/directory/filename.ext
     """
-    data = generate_command_data(repeat, naija.department_name, faculty=faculty)
+    data = generate_command_data(repeat, naija, "department_name", faculty=faculty)
     if data:
         handle_command_output(data, output, "department_name", "departments")
@@ -0,0 +1,163 @@
+"""Generate command to return rows of data described by a schema or a field list."""
+
+import itertools
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import click
+
+from fakernaija import Naija
+from fakernaija.parallel import SchemaJob
+from fakernaija.schema import load_schema, parse_fields
+from fakernaija.utils import (
+    generate_parallel_command_data,
+    handle_command_output,
+    output_options,
+    uses_parallel_generation,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+naija = Naija()
+
+
+@click.command()
+@click.option(
+    "--schema",
+    "-s",
+    default=None,
+    help="Path to a JSON or TOML file mapping column names to fields.",
+    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+)
+@click.option(
+    "--fields",
+    "-f",
+    default=None,
+    help=(
+        "Comma-separated fields to generate as columns, with optional arguments, "
+        "e.g. 'full_name(tribe=igbo),email,phone_number(network=mtn),state_name'."
+    ),
+    type=str,
+)
+@click.option(
+    "--no-link",
+    is_flag=True,
+    help="Do not link the --fields of each row, e.g. the email to the full name.",
+)
+@click.option(
+    "--repeat",
+    "-r",
+    default=1,
+    help="Number of rows to return. Defaults to 1.",
+    type=int,
+)
+@click.option(
+    "--output",
+    "-o",
+    default=None,
+    help="The format of the output file.",
+    type=click.Choice(
+        ["json", "jsonl", "csv", "text", "sqlite", "pgcopy", "sql"],
+        case_sensitive=False,
+    ),
+)
+@output_options
+def generate(
+    schema: Path | None,
+    fields: str | None,
+    no_link: bool,
+    repeat: int,
+    output: str,
+) -> None:
+    """Generate and return rows of data described by a schema file or a field list.
+
+    The schema maps column names to field specs, e.g.
+    ``full_name(tribe=yoruba)``. Arguments starting with ``$`` take their
+    value from another column of the same row.
+
+    Instead of a schema file, ``--fields`` lists the field specs, each
+    generated into a column named after its field, or ``column=spec``.
+    Fields that take the value of another listed field get it, so the rows
+    are coherent: the email matches the ``full_name``, and the LGA, postal
+    code, license plate and school match the ``state_name``. All columns
+    are generated in one pass, a batch at a time, and streamed to the output.
+
+    Args:
+        schema (Path | None): Path to a JSON or TOML schema file.
+        fields (str | None): The comma-separated field specs, if no schema
+            file is given.
+        no_link (bool): Do not link the fields of each row.
+        repeat (int): The number of rows to return.
+            Must be a positive integer. Defaults to 1.
+        output (str): The format of the output file if provided.
+
+    Note:
+        - Field options: any ``Naija`` method, e.g. email, state_name, profile
+        - Output options: csv, json, jsonl, pgcopy, sql, sqlite, text
+
+    Examples:
+        Given a ``people.toml`` schema:
+
+        .. code-block:: toml
+
+            name = "full_name(tribe=yoruba)"
+            email = "email(name=$name)"
+            state = "state_name(region=SW)"
+            lga = "state_lga(state=$state)"
+
+        To generate 3 rows:
+
+        .. code-block:: console
+
+            $ naija generate --schema people.toml --repeat 3
+            {'name': 'Bukky Ogunleye', 'email': 'bukky.ogunleye@hotmail.com', 'state': 'Oyo', 'lga': {'name': 'Saki-East', 'code': 'GMD'}}
+            {'name': 'Akin Ogunlade', 'email': 'ogunlade.akin52@gmail.com', 'state': 'Ondo', 'lga': {'name': 'Ose', 'code': 'FFN'}}
+            {'name': 'Bolanle Ogunbiyi', 'email': 'ogunbiyi.bolanle@yahoo.com', 'state': 'Osun', 'lga': {'name': 'Ede-North', 'code': 'EDE'}}
+
+        To generate 100,000 rows and save them as CSV:
+
+        .. code-block:: console
+
+            $ naija generate --schema people.toml --repeat 100000 --output csv
+            Generated data saved to /path/to/directory/dataset.csv
+
+        To generate rows from a field list, without a schema file:
+
+        .. code-block:: console
+
+            $ naija generate --fields "full_name(tribe=igbo),email,phone_number,state_name,state_lga" --repeat 2
+            {'full_name': 'Chidi Okafor', 'email': 'chidi.okafor@gmail.com', 'phone_number': '08031234567', 'state_name': 'Enugu', 'state_lga': {'name': 'Udi', 'code': 'UDI'}}
+            {'full_name': 'Ngozi Eze', 'email': 'ezengozi41@yahoo.com', 'phone_number': '07061234567', 'state_name': 'Kano', 'state_lga': {'name': 'Dala', 'code': 'DAL'}}
+    """
+    if (schema is None) == (fields is None):
+        click.echo("Error: Use either --schema or --fields.", err=True)
+        return
+    if repeat < 1:
+        click.echo(
+            "Error: Repeat count must be a positive integer greater than 0.",
+            err=True,
+        )
+        return
+    data: Iterable[Any]
+    try:
+        spec = (
+            load_schema(schema)
+            if schema
+            else parse_fields(fields or "", link=not no_link)
+        )
+        plan = naija.compile_schema(spec)
+        if uses_parallel_generation():
+            # Generate a row now to report errors before starting the workers
+            plan.generate(1)
+            data = generate_parallel_command_data(SchemaJob(spec), repeat)
+        else:
+            batches = plan.batches(repeat)
+            # Generate the first batch now to report errors before any output
+            first = next(batches)
+            data = itertools.chain(first, itertools.chain.from_iterable(batches))
+    except ValueError as e:
+        click.echo(f"Error: {e}", err=True)
+        return
+    # The columns are named by the user, so CSV headers keep their names
+    handle_command_output(data, output, "dataset", "rows", label_columns=False)
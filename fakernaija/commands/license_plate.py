@@ -3,7 +3,11 @@
 import click
 
 from fakernaija import Naija
-from fakernaija.utils import generate_command_data, handle_command_output
+from fakernaija.utils import (
+    generate_command_data,
+    handle_command_output,
+    output_options,
+)
 
 naija = Naija()
 
@@ -28,8 +32,12 @@ naija = Naija()
     "-o",
     default=None,
     help="The format of the output file.",
-    type=click.Choice(["json", "csv", "text"], case_sensitive=False),
+    type=click.Choice(
+        ["json", "jsonl", "csv", "text", "sqlite", "pgcopy", "sql"],
+        case_sensitive=False,
+    ),
 )
+@output_options
 def license_plate(repeat: int, state: str, output: str) -> None:
     """Generate and returns random license plates.
 
@@ -40,7 +48,7 @@ def license_plate(repeat: int, state: str, output: str) -> None:
         output (str): The format of the output file if provided.
 
     Note:
-        - Output options: csv, json, text
+        - Output options: csv, json, jsonl, pgcopy, sql, sqlite, text
         - State options: 36 states in Nigeria + FCT
 
     Examples:
@@ -74,6 +82,6 @@ def license_plate(repeat: int, state: str, output: str) -> None:
             $ naija license_plate --repeat 30 --output text
             Generated data saved to /path/to/directory/filename.ext
     """
-    data = generate_command_data(repeat, naija.license_plate, state=state)
+    data = generate_command_data(repeat, naija, "license_plate", state=state)
     if data:
         handle_command_output(data, output, "license_plate", "license plates")
@@ -3,7 +3,11 @@
 import click
 
 from fakernaija import Naija
-from fakernaija.utils import generate_command_data, handle_command_output
+from fakernaija.utils import (
+    generate_command_data,
+    handle_command_output,
+    output_options,
+)
 
 naija = Naija()
 
@@ -21,8 +25,12 @@ naija = Naija()
     "-o",
     default=None,
     help="The format of the output file.",
-    type=click.Choice(["json", "csv", "text"], case_sensitive=False),
+    type=click.Choice(
+        ["json", "jsonl", "csv", "text", "sqlite", "pgcopy", "sql"],
+        case_sensitive=False,
+    ),
 )
+@output_options
 def marital_status(repeat: int, output: str) -> None:
     """Returns random marital statuses.
 
@@ -32,7 +40,7 @@ def marital_status(repeat: int, output: str) -> None:
         output (str): The format of the output file if provided.
 
     Note:
-        - Output options: csv, json, text
+        - Output options: csv, json, jsonl, pgcopy, sql, sqlite, text
 
     Examples:
         To return a single random marital status:
@@ -58,6 +66,6 @@ def marital_status(repeat: int, output: str) -> None:
             $ naija marital_status --repeat 30 --output text
             Generated data saved to /path/to/directory/filename.ext
     """
-    data = generate_command_data(repeat, naija.marital_status)
+    data = generate_command_data(repeat, naija, "marital_status")
     if data:
         handle_command_output(data, output, "marital_status", "marital statuses")
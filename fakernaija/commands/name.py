@@ -3,7 +3,11 @@
 import click
 
 from fakernaija import Naija
-from fakernaija.utils import generate_command_data, handle_command_output
+from fakernaija.utils import (
+    generate_command_data,
+    handle_command_output,
+    output_options,
+)
 
 naija = Naija()
 
@@ -41,8 +45,12 @@ naija = Naija()
     "-o",
     default=None,
     help="The format of the output file.",
-    type=click.Choice(["json", "csv", "text"], case_sensitive=False),
+    type=click.Choice(
+        ["json", "jsonl", "csv", "text", "sqlite", "pgcopy", "sql"],
+        case_sensitive=False,
+    ),
 )
+@output_options
 def full_name(
     repeat: int,
     gender: str,
@@ -63,7 +71,7 @@ def full_name(
     Note:
         - Gender options: male, female
         - Tribe options: yoruba, igbo, hausa, edo, fulani, ijaw
-        - Output options: csv, json, text
+        - Output options: csv, json, jsonl, pgcopy, sql, sqlite, text
 
     Examples:
         To generate a single random full name:
@@ -121,7 +129,8 @@ def full_name(
     """
     data = generate_command_data(
         repeat,
-        naija.full_name,
+        naija,
+        "full_name",
         tribe=tribe,
         gender=gender,
         middle_name=middlename,
@@ -157,8 +166,12 @@ def full_name(
     "-o",
     default=None,
     help="The format of the output file.",
-    type=click.Choice(["json", "csv", "text"], case_sensitive=False),
+    type=click.Choice(
+        ["json", "jsonl", "csv", "text", "sqlite", "pgcopy", "sql"],
+        case_sensitive=False,
+    ),
 )
+@output_options
 def first_name(
     repeat: int,
     tribe: str,
@@ -177,7 +190,7 @@ def first_name(
     Note:
         - Gender options: male, female
         - Tribe options: yoruba, igbo, hausa, edo, fulani, ijaw
-        - Output options: csv, json, text
+        - Output options: csv, json, jsonl, pgcopy, sql, sqlite, text
 
     Examples:
         To generate a single random first name:
@@ -228,7 +241,8 @@ def first_name(
     """
     data = generate_command_data(
         repeat,
-        naija.first_name,
+        naija,
+        "first_name",
         tribe=tribe,
         gender=gender,
     )
@@ -256,8 +270,12 @@ def first_name(
     "-o",
     default=None,
     help="The format of the output file.",
-    type=click.Choice(["json", "csv", "text"], case_sensitive=False),
+    type=click.Choice(
+        ["json", "jsonl", "csv", "text", "sqlite", "pgcopy", "sql"],
+        case_sensitive=False,
+    ),
 )
+@output_options
 def last_name(repeat: int, tribe: str, output: str) -> None:
     """Generate and return random last names.
 
@@ -269,7 +287,7 @@ def last_name(repeat: int, tribe: str, output: str) -> None:
 
     Note:
         - Tribe options: yoruba, igbo, hausa, edo, fulani, ijaw
-        - Output options: csv, json, text
+        - Output options: csv, json, jsonl, pgcopy, sql, sqlite, text
 
     Examples:
         To generate a single random last name:
@@ -313,7 +331,8 @@ def last_name(repeat: int, tribe: str, output: str) -> None:
     """
     data = generate_command_data(
         repeat,
-        naija.last_name,
+        naija,
+        "last_name",
         tribe=tribe,
     )
     if data:
@@ -345,8 +364,12 @@ def last_name(repeat: int, tribe: str, output: str) -> None:
     "-o",
     default=None,
     help="The format of the output file.",
-    type=click.Choice(["json", "csv", "text"], case_sensitive=False),
+    type=click.Choice(
+        ["json", "jsonl", "csv", "text", "sqlite", "pgcopy", "sql"],
+        case_sensitive=False,
+    ),
 )
+@output_options
 def prefix(repeat: int, gender: str, title: str, output: str) -> None:
     """Returns random name prefixes.
 
@@ -360,7 +383,7 @@ def prefix(repeat: int, gender: str, title: str, output: str) -> None:
     Note:
         - Gender options: male, female
         - Title options: traditional, professional
-        - Output options: csv, json, text
+        - Output options: csv, json, jsonl, pgcopy, sql, sqlite, text
 
     Examples:
         To return a single random prefix:
@@ -411,7 +434,8 @@ def prefix(repeat: int, gender: str, title: str, output: str) -> None:
     """
     data = generate_command_data(
         repeat,
-        naija.prefix,
+        naija,
+        "prefix",
         gender=gender,
         title=title,
     )
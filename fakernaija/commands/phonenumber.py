@@ -3,7 +3,11 @@
 import click
 
 from fakernaija import Naija
-from fakernaija.utils import generate_command_data, handle_command_output
+from fakernaija.utils import (
+    generate_command_data,
+    handle_command_output,
+    output_options,
+)
 
 naija = Naija()
 
@@ -37,8 +41,12 @@ naija = Naija()
     "-o",
     default=None,
     help="The format of the output file.",
-    type=click.Choice(["json", "csv", "text"], case_sensitive=False),
+    type=click.Choice(
+        ["json", "jsonl", "csv", "text", "sqlite", "pgcopy", "sql"],
+        case_sensitive=False,
+    ),
 )
+@output_options
 def phone_number(repeat: int, network: str, prefix: str, output: str) -> None:
     """Generate and return random phone numbers.
 
@@ -54,7 +62,7 @@ def phone_number(repeat: int, network: str, prefix: str, output: str) -> None:
             combination does not match.
 
     Note:
-        - Output options: csv, json, text
+        - Output options: csv, json, jsonl, pgcopy, sql, sqlite, text
         - Available networks and prefixes:
             - mtn: 0703, 0706, 0803, 0806, 0813, 0816, 0810, 0814, 0903, 0906, 0913, 0916
             - glo: 0705, 0805, 0807, 0811, 0815, 0905, 0915
@@ -110,7 +118,8 @@ def phone_number(repeat: int, network: str, prefix: str, output: str) -> None:
     """
     data = generate_command_data(
         repeat,
-        naija.phone_number,
+        naija,
+        "phone_number",
         network=network,
         prefix=prefix,
     )
@@ -0,0 +1,142 @@
+"""Profile command to generate and return random person profiles."""
+
+import click
+
+from fakernaija import Naija
+from fakernaija.utils import (
+    generate_command_data,
+    handle_command_output,
+    output_options,
+)
+
+naija = Naija()
+
+
+@click.command()
+@click.option(
+    "--repeat",
+    "-r",
+    default=1,
+    help="Number of random profiles to return. Defaults to 1.",
+    type=int,
+)
+@click.option(
+    "--tribe",
+    "-t",
+    default=None,
+    help="The tribe of the people in the profiles.",
+    type=click.Choice(
+        ["yoruba", "igbo", "hausa", "edo", "fulani", "ijaw"],
+        case_sensitive=False,
+    ),
+)
+@click.option(
+    "--gender",
+    "-g",
+    default=None,
+    help="The gender of the people in the profiles.",
+    type=click.Choice(["male", "female"], case_sensitive=False),
+)
+@click.option(
+    "--state",
+    "-s",
+    default=None,
+    help="The state of residence of the people in the profiles.",
+)
+@click.option(
+    "--region",
+    default=None,
+    help="The region of the state of residence.",
+    type=click.Choice(["NC", "NE", "NW", "SE", "SS", "SW"], case_sensitive=False),
+)
+@click.option(
+    "--network",
+    "-n",
+    default=None,
+    help="The network of the phone numbers.",
+    type=click.Choice(
+        ["mtn", "glo", "airtel", "etisalat"],
+        case_sensitive=False,
+    ),
+)
+@click.option(
+    "--domain",
+    "-d",
+    default=None,
+    help="A custom domain to use for the email addresses.",
+)
+@click.option(
+    "--output",
+    "-o",
+    default=None,
+    help="The format of the output file.",
+    type=click.Choice(
+        ["json", "jsonl", "csv", "text", "sqlite", "pgcopy", "sql"],
+        case_sensitive=False,
+    ),
+)
+@output_options
+def profile(  # noqa: PLR0913, PLR0917
+    repeat: int,
+    tribe: str,
+    gender: str,
+    state: str,
+    region: str,
+    network: str,
+    domain: str,
+    output: str,
+) -> None:
+    """Generate and return random person profiles with consistent fields.
+
+    Args:
+        repeat (int): The number of random profiles to return.
+            Must be a positive integer. Defaults to 1.
+        tribe (str): The tribe of the people in the profiles.
+        gender (str): The gender of the people in the profiles.
+        state (str): The state of residence of the people in the profiles.
+        region (str): The region of the state of residence.
+        network (str): The network of the phone numbers.
+        domain (str): A custom domain to use for the email addresses.
+        output (str): The format of the output file if provided.
+
+    Note:
+        - Tribe options: yoruba, igbo, hausa, edo, fulani, ijaw
+        - Gender options: male, female
+        - Region options: NC, NE, NW, SE, SS, SW
+        - Network options: mtn, glo, airtel, etisalat
+        - Output options: csv, json, jsonl, pgcopy, sql, sqlite, text
+
+    Examples:
+        To generate a single random profile:
+
+        .. code-block:: console
+
+            $ naija profile
+            {'first_name': 'Kemi', 'last_name': 'Oluwole', 'gender': 'female', 'tribe': 'yoruba', 'email': 'kemi.oluwole77@gov.ng', 'phone_number': '09089660597', 'state': 'Abia', 'lga': 'Isiala-Ngwa South', 'postal_code': '440001', 'license_plate': 'MBA-906WA', 'religion': 'Christian', 'marital_status': 'Single'}
+
+        To generate profiles of Igbo women living in Lagos:
+
+        .. code-block:: console
+
+            $ naija profile --tribe igbo --gender female --state lagos
+
+        To generate 100,000 profiles and save them as CSV:
+
+        .. code-block:: console
+
+            $ naija profile --repeat 100000 --output csv
+            Generated data saved to /path/to/directory/profiles.csv
+    """
+    data = generate_command_data(
+        repeat,
+        naija,
+        "profile",
+        tribe=tribe,
+        gender=gender,
+        state=state,
+        region=region,
+        network=network,
+        domain=domain,
+    )
+    if data:
+        handle_command_output(data, output, "profiles", "profiles")
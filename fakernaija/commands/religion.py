@@ -3,7 +3,11 @@
 import click
 
 from fakernaija import Naija
-from fakernaija.utils import generate_command_data, handle_command_output
+from fakernaija.utils import (
+    generate_command_data,
+    handle_command_output,
+    output_options,
+)
 
 naija = Naija()
 
@@ -21,8 +25,12 @@ naija = Naija()
     "-o",
     default=None,
     help="The format of the output file.",
-    type=click.Choice(["json", "csv", "text"], case_sensitive=False),
+    type=click.Choice(
+        ["json", "jsonl", "csv", "text", "sqlite", "pgcopy", "sql"],
+        case_sensitive=False,
+    ),
 )
+@output_options
 def religion(repeat: int, output: str) -> None:
     """Returns random religions.
 
@@ -32,7 +40,7 @@ def religion(repeat: int, output: str) -> None:
         output (str): The format of the output file if provided.
 
     Note:
-        - Output options: csv, json, text
+        - Output options: csv, json, jsonl, pgcopy, sql, sqlite, text
 
     Examples:
         To return a single random religion:
@@ -58,6 +66,6 @@ def religion(repeat: int, output: str) -> None:
             $ naija religion --repeat 30 --output json
             Generated data saved to /path/to/directory/filename.ext
     """
-    data = generate_command_data(repeat, naija.religion)
+    data = generate_command_data(repeat, naija, "religion")
     if data:
         handle_command_output(data, output, "religion", "religions")
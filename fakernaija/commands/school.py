@@ -3,7 +3,11 @@
 import click
 
 from fakernaija import Naija
-from fakernaija.utils import generate_command_data, handle_command_output
+from fakernaija.utils import (
+    generate_command_data,
+    handle_command_output,
+    output_options,
+)
 
 naija = Naija()
 
@@ -45,8 +49,12 @@ naija = Naija()
     "-o",
     default=None,
     help="The format of the output file.",
-    type=click.Choice(["json", "csv", "text"], case_sensitive=False),
+    type=click.Choice(
+        ["json", "jsonl", "csv", "text", "sqlite", "pgcopy", "sql"],
+        case_sensitive=False,
+    ),
 )
+@output_options
 def school(
     repeat: int,
     ownership: str,
@@ -68,7 +76,7 @@ def school(
         - Ownership options: federal, state, private
         - School type options: university, polytechnic, college
         - State options: 36 states in Nigeria + FCT
-        - Output options: csv, json, text
+        - Output options: csv, json, jsonl, pgcopy, sql, sqlite, text
 
     Examples:
         To return a single random school object:
@@ -126,7 +134,8 @@ def school(
     """
     data = generate_command_data(
         repeat,
-        naija.school,
+        naija,
+        "school",
         ownership=ownership,
         state=state,
         school_type=school_type,
@@ -178,8 +187,12 @@ def school(
     "-o",
     default=None,
     help="The format of the output file.",
-    type=click.Choice(["json", "csv", "text"], case_sensitive=False),
+    type=click.Choice(
+        ["json", "jsonl", "csv", "text", "sqlite", "pgcopy", "sql"],
+        case_sensitive=False,
+    ),
 )
+@output_options
 def school_name(  # noqa: PLR0913
     repeat: int,
     acronym: bool,
@@ -203,7 +216,7 @@ def school_name(  # noqa: PLR0913
         - Ownership options: federal, state, private
         - School type options: university, polytechnic, college
         - State options: 36 states in Nigeria + FCT
-        - Output options: csv, json, text
+        - Output options: csv, json, jsonl, pgcopy, sql, sqlite, text
 
     Examples:
         To return a single random school name:
@@ -268,7 +281,8 @@ def school_name(  # noqa: PLR0913
     """
     data = generate_command_data(
         repeat,
-        naija.school_name,
+        naija,
+        "school_name",
         acronym=acronym,
         ownership=ownership,
         state=state,
@@ -3,7 +3,11 @@
 import click
 
 from fakernaija import Naija
-from fakernaija.utils import generate_command_data, handle_command_output
+from fakernaija.utils import (
+    generate_command_data,
+    handle_command_output,
+    output_options,
+)
 
 naija = Naija()
 
@@ -30,8 +34,12 @@ naija = Naija()
     "-o",
     default=None,
     help="The format of the output file.",
-    type=click.Choice(["json", "csv", "text"], case_sensitive=False),
+    type=click.Choice(
+        ["json", "jsonl", "csv", "text", "sqlite", "pgcopy", "sql"],
+        case_sensitive=False,
+    ),
 )
+@output_options
 def state(repeat: int, region: str, output: str) -> None:
     """Return random state objects.
 
@@ -43,7 +51,7 @@ def state(repeat: int, region: str, output: str) -> None:
 
     Note:
         - Region options: NW, NE, NC, SE, SW, SS
-        - Output options: csv, json, text
+        - Output options: csv, json, jsonl, pgcopy, sql, sqlite, text
 
     Examples:
         To return a single random state object:
@@ -78,7 +86,8 @@ def state(repeat: int, region: str, output: str) -> None:
     """
     data = generate_command_data(
         repeat,
-        naija.state,
+        naija,
+        "state",
         region=region,
     )
     if data:
@@ -107,8 +116,12 @@ def state(repeat: int, region: str, output: str) -> None:
     "-o",
     default=None,
     help="The format of the output file.",
-    type=click.Choice(["json", "csv", "text"], case_sensitive=False),
+    type=click.Choice(
+        ["json", "jsonl", "csv", "text", "sqlite", "pgcopy", "sql"],
+        case_sensitive=False,
+    ),
 )
+@output_options
 def state_name(repeat: int, region: str, output: str) -> None:
     """Return random state names.
 
@@ -120,7 +133,7 @@ def state_name(repeat: int, region: str, output: str) -> None:
 
     Note:
         - Region options: NW, NE, NC, SE, SW, SS
-        - Output options: csv, json, text
+        - Output options: csv, json, jsonl, pgcopy, sql, sqlite, text
 
     Examples:
         To return a single random state name:
@@ -155,7 +168,8 @@ def state_name(repeat: int, region: str, output: str) -> None:
     """
     data = generate_command_data(
         repeat,
-        naija.state_name,
+        naija,
+        "state_name",
         region=region,
     )
     if data:
@@ -184,8 +198,12 @@ def state_name(repeat: int, region: str, output: str) -> None:
     "-o",
     default=None,
     help="The format of the output file.",
-    type=click.Choice(["json", "csv", "text"], case_sensitive=False),
+    type=click.Choice(
+        ["json", "jsonl", "csv", "text", "sqlite", "pgcopy", "sql"],
+        case_sensitive=False,
+    ),
 )
+@output_options
 def state_capital(repeat: int, region: str, output: str) -> None:
     """Return random state capitals.
 
@@ -197,7 +215,7 @@ def state_capital(repeat: int, region: str, output: str) -> None:
 
     Note:
         - Region options: NW, NE, NC, SE, SW, SS
-        - Output options: csv, json, text
+        - Output options: csv, json, jsonl, pgcopy, sql, sqlite, text
 
     Examples:
         To return a random state capital:
@@ -232,7 +250,8 @@ def state_capital(repeat: int, region: str, output: str) -> None:
     """
     data = generate_command_data(
         repeat,
-        naija.state_capital,
+        naija,
+        "state_capital",
         region=region,
     )
     if data:
@@ -259,8 +278,12 @@ def state_capital(repeat: int, region: str, output: str) -> None:
     "-o",
     default=None,
     help="The format of the output file.",
-    type=click.Choice(["json", "csv", "text"], case_sensitive=False),
+    type=click.Choice(
+        ["json", "jsonl", "csv", "text", "sqlite", "pgcopy", "sql"],
+        case_sensitive=False,
+    ),
 )
+@output_options
 def state_lga(repeat: int, state: str, output: str) -> None:
     """Return a random LGA or LGA in a specified state.
 
@@ -272,7 +295,7 @@ def state_lga(repeat: int, state: str, output: str) -> None:
 
     Note:
         - State options: 36 states in Nigeria + FCT
-        - Output options: csv, json, text
+        - Output options: csv, json, jsonl, pgcopy, sql, sqlite, text
 
     Examples:
         To return a single random LGA:
@@ -307,7 +330,8 @@ def state_lga(repeat: int, state: str, output: str) -> None:
     """
     data = generate_command_data(
         repeat,
-        naija.state_lga,
+        naija,
+        "state_lga",
         state=state,
     )
     if data:
@@ -334,8 +358,12 @@ def state_lga(repeat: int, state: str, output: str) -> None:
     "-o",
     default=None,
     help="The format of the output file.",
-    type=click.Choice(["json", "csv", "text"], case_sensitive=False),
+    type=click.Choice(
+        ["json", "jsonl", "csv", "text", "sqlite", "pgcopy", "sql"],
+        case_sensitive=False,
+    ),
 )
+@output_options
 def state_postal_code(repeat: int, state: str, output: str) -> None:
     """Return random postal codes.
 
@@ -347,7 +375,7 @@ def state_postal_code(repeat: int, state: str, output: str) -> None:
 
     Note:
         - State options: 36 states in Nigeria + FCT
-        - Output options: csv, json, text
+        - Output options: csv, json, jsonl, pgcopy, sql, sqlite, text
 
     Examples:
         To return a single random state postal code:
@@ -382,7 +410,8 @@ def state_postal_code(repeat: int, state: str, output: str) -> None:
     """
     data = generate_command_data(
         repeat,
-        naija.state_postal_code,
+        naija,
+        "state_postal_code",
         state=state,
     )
     if data:
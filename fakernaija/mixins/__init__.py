@@ -6,6 +6,7 @@ from .license_plate import LicensePlate
 from .marital_status import MaritalStatus
 from .name import Name
 from .phonenumber import PhoneNumber
+from .profile import Profile
 from .religion import Religion
 from .school import School
 from .state import State
@@ -19,6 +20,7 @@ __all__ = [
     "MaritalStatus",
     "Name",
     "PhoneNumber",
+    "Profile",
     "Religion",
     "School",
     "State",
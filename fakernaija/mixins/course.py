@@ -4,10 +4,13 @@ This module defines a mixin class which groups related methods for
 fetching and returning course-related data from its provider.
 """
 
+import functools
 import random
+from collections.abc import Callable
 
 from fakernaija.providers import CourseProvider
-from fakernaija.utils import get_unique_value
+from fakernaija.records import Record
+from fakernaija.utils import compile_unique_value, get_unique_value, unique_values
 
 
 class Course:
@@ -19,11 +22,11 @@ class Course:
         self._used_course_names: set[str] = set()
         self._used_course_codes: set[str] = set()
 
-    def course(self) -> dict[str, str]:
+    def course(self) -> Record:
         """Returns a random course object.
 
         Returns:
-            dict[str, str]: A dictionary with course name and code.
+            Record: A read-only record with the course name and code.
 
         Example:
             .. code-block:: python
@@ -60,7 +63,7 @@ class Course:
                 Chemical Process Technology III
                 Analytical Mechanics
         """
-        course_names = self.course_provider.get_courses_name()
+        course_names = self.course_provider.course_name_pool
         course_name = get_unique_value(course_names, self._used_course_names)
         self._used_course_names.add(course_name)
         return course_name
@@ -88,7 +91,55 @@ class Course:
                 COS452
                 MTH421
         """
-        course_codes = self.course_provider.get_courses_code()
+        course_codes = self.course_provider.course_code_pool
         course_code = get_unique_value(course_codes, self._used_course_codes)
         self._used_course_codes.add(course_code)
         return course_code
+
+    def _compile_course(self) -> Callable[[], Record]:
+        """Compile the course generator."""
+        return functools.partial(
+            random.choice, tuple(self.course_provider.get_courses())
+        )
+
+    def _compile_course_name(self) -> Callable[[], str]:
+        """Compile the course_name generator."""
+        return compile_unique_value(
+            self.course_provider.course_name_pool,
+            self._used_course_names,
+        )
+
+    def _compile_course_code(self) -> Callable[[], str]:
+        """Compile the course_code generator."""
+        return compile_unique_value(
+            self.course_provider.course_code_pool,
+            self._used_course_codes,
+        )
+
+    def _many_course(self, n: int) -> list[Record]:
+        """Generate ``n`` courses at once."""
+        return self.course_provider.courses(n)
+
+    def _many_course_name(self, n: int) -> list[str]:
+        """Generate ``n`` course names at once."""
+        return unique_values(
+            self.course_provider.course_name_pool,
+            self._used_course_names,
+            n,
+        )
+
+    def _many_course_code(self, n: int) -> list[str]:
+        """Generate ``n`` course codes at once."""
+        return unique_values(
+            self.course_provider.course_code_pool,
+            self._used_course_codes,
+            n,
+        )
+
+    def _columns_course(self) -> tuple[str, ...]:
+        """Get the columns of the course rows."""
+        return self.course_provider.course_columns
+
+    def _rows_course(self, n: int) -> list[tuple[str, ...]]:
+        """Generate ``n`` courses as tuple rows."""
+        return random.choices(self.course_provider.get_course_rows(), k=n)
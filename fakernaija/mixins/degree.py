@@ -4,10 +4,18 @@ This module defines a mixin class which groups related methods for
 fetching and returning degree-related data from its provider.
 """
 
+import functools
 import random
+from collections.abc import Callable
 
 from fakernaija.providers import DegreeProvider
-from fakernaija.utils import get_unique_value
+from fakernaija.records import Record
+from fakernaija.utils import (
+    compile_unique_value,
+    distinct_values,
+    get_unique_value,
+    unique_values,
+)
 
 
 class Degree:
@@ -19,7 +27,7 @@ class Degree:
         self._used_degree_names: set[str] = set()
         self._used_degree_abbrs: set[str] = set()
 
-    def degree(self, degree_type: str | None = None) -> dict:
+    def degree(self, degree_type: str | None = None) -> Record:
         """Returns a random degree object, optionally filtered by degree type.
 
         Args:
@@ -27,7 +35,7 @@ class Degree:
                 Defaults to None.
 
         Returns:
-            dict[str, str]: A dictionary with degree name, type and abbreviation.
+            Record: A read-only record with the degree name, type and abbreviation.
 
         Raises:
             ValueError: If an unsupported degree type is passed to the parameter.
@@ -81,7 +89,9 @@ class Degree:
                 >>> print(f"Random doctorate degree name: {degree_name}")
                 Random doctorate degree name: Doctor of Philosophy
         """
-        degree_names = self.degree_provider.get_degree_names(degree_type)
+        degree_names = distinct_values(
+            self.degree_provider.get_degree_names(degree_type)
+        )
         degree_name = get_unique_value(degree_names, self._used_degree_names)
         self._used_degree_names.add(degree_name)
         return degree_name
@@ -116,7 +126,68 @@ class Degree:
                 >>> print(f"Random masters degree abbreviation: {degree_abbr}")
                 Random masters degree abbreviation: MBA
         """
-        degree_abbrs = self.degree_provider.get_degree_abbrs(degree_type)
+        # Shared abbreviations, e.g. DVM, are listed once per degree
+        degree_abbrs = distinct_values(
+            self.degree_provider.get_degree_abbrs(degree_type)
+        )
         degree_abbr = get_unique_value(degree_abbrs, self._used_degree_abbrs)
         self._used_degree_abbrs.add(degree_abbr)
         return degree_abbr
+
+    def _compile_degree(self, degree_type: str | None = None) -> Callable[[], Record]:
+        """Compile the degree generator."""
+        provider = self.degree_provider
+        return functools.partial(
+            random.choice,
+            provider.degrees_by_type[provider.validate_degree_type(degree_type)],
+        )
+
+    def _compile_degree_name(self, degree_type: str | None = None) -> Callable[[], str]:
+        """Compile the degree_name generator."""
+        provider = self.degree_provider
+        return compile_unique_value(
+            provider.degree_name_pools[provider.validate_degree_type(degree_type)],
+            self._used_degree_names,
+        )
+
+    def _compile_degree_abbr(self, degree_type: str | None = None) -> Callable[[], str]:
+        """Compile the degree_abbr generator."""
+        provider = self.degree_provider
+        return compile_unique_value(
+            provider.degree_abbr_pools[provider.validate_degree_type(degree_type)],
+            self._used_degree_abbrs,
+        )
+
+    def _many_degree(self, n: int, degree_type: str | None = None) -> list[Record]:
+        """Generate ``n`` degrees at once."""
+        return self.degree_provider.degrees(n, degree_type)
+
+    def _many_degree_name(self, n: int, degree_type: str | None = None) -> list[str]:
+        """Generate ``n`` degree names at once."""
+        provider = self.degree_provider
+        return unique_values(
+            provider.degree_name_pools[provider.validate_degree_type(degree_type)],
+            self._used_degree_names,
+            n,
+        )
+
+    def _many_degree_abbr(self, n: int, degree_type: str | None = None) -> list[str]:
+        """Generate ``n`` degree abbreviations at once."""
+        provider = self.degree_provider
+        return unique_values(
+            provider.degree_abbr_pools[provider.validate_degree_type(degree_type)],
+            self._used_degree_abbrs,
+            n,
+        )
+
+    def _columns_degree(self) -> tuple[str, ...]:
+        """Get the columns of the degree rows."""
+        return self.degree_provider.degree_columns
+
+    def _rows_degree(
+        self,
+        n: int,
+        degree_type: str | None = None,
+    ) -> list[tuple[str, ...]]:
+        """Generate ``n`` degrees as tuple rows."""
+        return random.choices(self.degree_provider.get_degree_rows(degree_type), k=n)
@@ -1,14 +1,21 @@
 """Email mixin to group related methods for the EmailProvider."""
 
-from fakernaija.providers import EmailProvider
+from collections.abc import Callable
+
+from fakernaija.providers import EmailProvider, NameProvider
 
 
 class Email:
     """Methods for the EmailProvider."""
 
-    def __init__(self) -> None:
-        """Initializes the Email mixin and its provider."""
-        self.email_provider = EmailProvider()
+    def __init__(self, name_provider: NameProvider | None = None) -> None:
+        """Initializes the Email mixin and its provider.
+
+        Args:
+            name_provider (NameProvider | None, optional): The provider of the
+                names. Defaults to None (a NameProvider of the bundled names).
+        """
+        self.email_provider = EmailProvider(name_provider)
 
     def email(
         self,
@@ -83,3 +90,13 @@ class Email:
             domain,
             name,
         )
+
+    def _compile_email(
+        self,
+        tribe: str | None = None,
+        gender: str | None = None,
+        domain: str | None = None,
+        name: str | None = None,
+    ) -> Callable[[], str]:
+        """Compile the email generator."""
+        return self.email_provider.compile_email(tribe, gender, domain, name)
@@ -1,9 +1,10 @@
 """Faculty mixin to group related methods for the FacultyProvider."""
 
 import random
+from collections.abc import Callable
 
 from fakernaija.providers import FacultyProvider
-from fakernaija.utils import get_unique_value
+from fakernaija.utils import compile_unique_value, get_unique_value, unique_values
 
 
 class Faculty:
@@ -61,7 +62,7 @@ class Faculty:
                 Social Sciences
                 Basic Medical Sciences
         """
-        faculty_names = self.faculty_provider.get_faculty_names()
+        faculty_names = self.faculty_provider.faculty_name_pool
         faculty_name = get_unique_value(
             faculty_names,
             self._used_faculty_names,
@@ -100,10 +101,65 @@ class Faculty:
                 >>> print(f"Random department in a specific Faculty: {department_name}")
                 Random department in a specific Faculty: Psychology
         """
-        department_names = self.faculty_provider.get_department_names(faculty)
+        provider = self.faculty_provider
+        department_names = provider.department_pools[provider.validate_faculty(faculty)]
         department_name = get_unique_value(
             department_names,
             self._used_department_names,
         )
         self._used_department_names.add(department_name)
         return department_name
+
+    def _compile_faculty(self) -> Callable[[], dict[str, list[str]]]:
+        """Compile the faculty generator."""
+        faculties = tuple(self.faculty_provider.faculties_data)
+        choice = random.choice
+
+        def generate() -> dict[str, list[str]]:
+            faculty = choice(faculties)
+            return {
+                "faculty_name": faculty["name"],
+                "departments": faculty["departments"],
+            }
+
+        return generate
+
+    def _compile_faculty_name(self) -> Callable[[], str]:
+        """Compile the faculty_name generator."""
+        return compile_unique_value(
+            self.faculty_provider.faculty_name_pool,
+            self._used_faculty_names,
+        )
+
+    def _compile_department_name(self, faculty: str | None = None) -> Callable[[], str]:
+        """Compile the department_name generator."""
+        provider = self.faculty_provider
+        return compile_unique_value(
+            provider.department_pools[provider.validate_faculty(faculty)],
+            self._used_department_names,
+        )
+
+    def _many_faculty_name(self, n: int) -> list[str]:
+        """Generate ``n`` faculty names at once."""
+        return unique_values(
+            self.faculty_provider.faculty_name_pool,
+            self._used_faculty_names,
+            n,
+        )
+
+    def _many_department_name(self, n: int, faculty: str | None = None) -> list[str]:
+        """Generate ``n`` department names at once."""
+        provider = self.faculty_provider
+        return unique_values(
+            provider.department_pools[provider.validate_faculty(faculty)],
+            self._used_department_names,
+            n,
+        )
+
+    def _columns_faculty(self) -> tuple[str, ...]:
+        """Get the columns of the faculty rows."""
+        return self.faculty_provider.faculty_columns
+
+    def _rows_faculty(self, n: int) -> list[tuple[str, str]]:
+        """Generate ``n`` faculties as tuple rows."""
+        return random.choices(self.faculty_provider.faculty_rows, k=n)
@@ -1,5 +1,7 @@
 """LicensePlate mixin to group related methods for the LicensePlateProvider."""
 
+from collections.abc import Callable
+
 from fakernaija.providers import LicensePlateProvider
 
 
@@ -47,3 +49,7 @@ class LicensePlate:
                 Random license plate number from a specific state: EZA-352CC
         """
         return self.license_plate_provider.generate_license_plate(state=state)
+
+    def _compile_license_plate(self, state: str | None = None) -> Callable[[], str]:
+        """Compile the license_plate generator."""
+        return self.license_plate_provider.compile_license_plate(state)
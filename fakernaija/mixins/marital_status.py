@@ -1,7 +1,9 @@
 """MaritalStatus mixin module."""
 
+from collections.abc import Callable
+
 from fakernaija.providers import MaritalStatusProvider
-from fakernaija.utils import get_unique_value
+from fakernaija.utils import compile_unique_value, get_unique_value, unique_values
 
 
 class MaritalStatus:
@@ -39,3 +41,18 @@ class MaritalStatus:
         marital_status = get_unique_value(marital_statuses, self._used_marital_statuses)
         self._used_marital_statuses.add(marital_status)
         return marital_status
+
+    def _compile_marital_status(self) -> Callable[[], str]:
+        """Compile the marital_status generator."""
+        return compile_unique_value(
+            tuple(self.marital_status_provider.get_marital_statuses()),
+            self._used_marital_statuses,
+        )
+
+    def _many_marital_status(self, n: int) -> list[str]:
+        """Generate ``n`` marital statuses at once."""
+        return unique_values(
+            self.marital_status_provider.get_marital_statuses(),
+            self._used_marital_statuses,
+            n,
+        )
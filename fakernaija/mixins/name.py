@@ -1,15 +1,22 @@
 """Name mixin to group related methods for the NameProvider."""
 
+from collections.abc import Callable
+
 from fakernaija.providers import NameProvider
-from fakernaija.utils import get_unique_value
+from fakernaija.utils import compile_unique_value, get_unique_value, unique_values
 
 
 class Name:
     """Methods for the NameProvider."""
 
-    def __init__(self) -> None:
-        """Initializes the Name mixin and its provider."""
-        self.name_provider = NameProvider()
+    def __init__(self, name_provider: NameProvider | None = None) -> None:
+        """Initializes the Name mixin and its provider.
+
+        Args:
+            name_provider (NameProvider | None, optional): The provider of the
+                names. Defaults to None (a NameProvider of the bundled names).
+        """
+        self.name_provider = name_provider or NameProvider()
         self._used_prefixes: set[str] = set()
 
     def first_name(
@@ -241,7 +248,56 @@ class Name:
                 >>> print(f"Random female traditional prefix: {female_traditional_prefix}")
                 Random female traditional prefix: Iyalode
         """
-        prefixes = self.name_provider.generate_prefixes(title, gender)
+        prefixes = self.name_provider.get_prefix_pool(title, gender)
         prefix = get_unique_value(prefixes, self._used_prefixes)
         self._used_prefixes.add(prefix)
         return prefix
+
+    def _compile_first_name(
+        self,
+        tribe: str | None = None,
+        gender: str | None = None,
+    ) -> Callable[[], str]:
+        """Compile the first_name generator."""
+        return self.name_provider.compile_first_name(tribe=tribe, gender=gender)
+
+    def _compile_last_name(self, tribe: str | None = None) -> Callable[[], str]:
+        """Compile the last_name generator."""
+        return self.name_provider.compile_last_name(tribe=tribe)
+
+    def _compile_full_name(
+        self,
+        middle_name: bool = False,
+        tribe: str | None = None,
+        gender: str | None = None,
+    ) -> Callable[[], str]:
+        """Compile the full_name generator."""
+        return self.name_provider.compile_full_name(
+            tribe=tribe,
+            gender=gender,
+            middle_name=middle_name,
+        )
+
+    def _compile_prefix(
+        self,
+        gender: str | None = None,
+        title: str | None = None,
+    ) -> Callable[[], str]:
+        """Compile the prefix generator."""
+        return compile_unique_value(
+            self.name_provider.get_prefix_pool(title, gender),
+            self._used_prefixes,
+        )
+
+    def _many_prefix(
+        self,
+        n: int,
+        gender: str | None = None,
+        title: str | None = None,
+    ) -> list[str]:
+        """Generate ``n`` prefixes at once."""
+        return unique_values(
+            self.name_provider.get_prefix_pool(title, gender),
+            self._used_prefixes,
+            n,
+        )
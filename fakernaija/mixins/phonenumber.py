@@ -1,5 +1,7 @@
 """PhoneNumber mixin to group related methods for the PhoneNumberProvider."""
 
+from collections.abc import Callable
+
 from fakernaija.providers import PhoneNumberProvider
 
 
@@ -69,3 +71,25 @@ class PhoneNumber:
             network=network,
             prefix=prefix,
         )
+
+    def _compile_phone_number(
+        self,
+        network: str | None = None,
+        prefix: str | None = None,
+    ) -> Callable[[], str]:
+        """Compile the phone_number generator."""
+        return self.phonenumber_provider.compile_phone_number(
+            network=network,
+            prefix=prefix,
+        )
+
+    def _many_phone_number(
+        self,
+        n: int,
+        network: str | None = None,
+        prefix: str | None = None,
+    ) -> list[str]:
+        """Generate ``n`` phone numbers at once."""
+        return self.phonenumber_provider.phone_numbers(
+            n, network=network, prefix=prefix
+        )
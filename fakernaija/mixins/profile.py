@@ -0,0 +1,151 @@
+"""Profile mixin to group related methods for the ProfileProvider."""
+
+from collections.abc import Callable
+from typing import Any
+
+from fakernaija.backends import Backend
+from fakernaija.providers import NameProvider, ProfileProvider
+
+
+class Profile:
+    """Mixin class to add correlated person profile generation."""
+
+    def __init__(
+        self,
+        name_provider: NameProvider | None = None,
+        backend: Backend | None = None,
+    ) -> None:
+        """Initializes the Profile mixin and its provider.
+
+        Args:
+            name_provider (NameProvider | None, optional): The provider of the
+                names. Defaults to None (a NameProvider of the bundled names).
+            backend (Backend | None, optional): The backend to load the states
+                from. Defaults to None (the bundled JSON file).
+        """
+        self.profile_provider = ProfileProvider(name_provider, backend)
+
+    def profile(  # noqa: PLR0913, PLR0917
+        self,
+        tribe: str | None = None,
+        gender: str | None = None,
+        state: str | None = None,
+        region: str | None = None,
+        network: str | None = None,
+        domain: str | None = None,
+    ) -> dict[str, Any]:
+        """Generate a random person profile with consistent fields.
+
+        The tribe, gender and state are drawn once and every other field is
+        derived from them: the email is built from the profile's names, and
+        the LGA, postal code and license plate belong to the profile's state.
+
+        Args:
+            tribe (str | None, optional): The tribe of the person.
+            gender (str | None, optional): The gender of the person.
+            state (str | None, optional): The state of residence.
+            region (str | None, optional): The region abbreviation of the state
+                of residence.
+            network (str | None, optional): The network of the phone number.
+            domain (str | None, optional): The domain of the email address.
+
+        Returns:
+            dict[str, Any]: A random profile.
+
+        Raises:
+            ValueError: If a constraint is invalid or no data matches them.
+
+        Note:
+            - Tribe options: yoruba, igbo, hausa, edo, fulani, ijaw
+            - Gender options: male, female
+            - Region options: NC, NE, NW, SE, SS, SW
+            - Network options: mtn, glo, airtel, etisalat
+
+        Examples:
+            .. code-block:: python
+
+                >>> from fakernaija import Naija
+                >>> naija = Naija()
+
+                >>> profile = naija.profile(tribe="igbo", state="lagos")
+                >>> print(profile)
+                {'first_name': 'Onyeka', 'last_name': 'Okafor', 'gender': 'male', 'tribe': 'igbo', 'email': 'okafor.onyeka@yahoo.com', 'phone_number': '08066716952', 'state': 'Lagos', 'lga': 'Ibeju-Lekki', 'postal_code': '100001', 'license_plate': 'AKD-384FD', 'religion': 'Christian', 'marital_status': 'Married'}
+        """
+        return self.profile_provider.generate_profile(
+            tribe=tribe,
+            gender=gender,
+            state=state,
+            region=region,
+            network=network,
+            domain=domain,
+        )
+
+    def profiles(  # noqa: PLR0913, PLR0917
+        self,
+        n: int,
+        tribe: str | None = None,
+        gender: str | None = None,
+        state: str | None = None,
+        region: str | None = None,
+        network: str | None = None,
+        domain: str | None = None,
+    ) -> list[dict[str, Any]]:
+        """Generate ``n`` random person profiles in a single pass.
+
+        The constraints are validated once and the independent fields are
+        drawn a column at a time, which makes this much faster than calling
+        ``profile`` in a loop.
+
+        Args:
+            n (int): The number of profiles to generate.
+            tribe (str | None, optional): The tribe of the people.
+            gender (str | None, optional): The gender of the people.
+            state (str | None, optional): The state of residence.
+            region (str | None, optional): The region abbreviation of the state
+                of residence.
+            network (str | None, optional): The network of the phone numbers.
+            domain (str | None, optional): The domain of the email addresses.
+
+        Returns:
+            list[dict[str, Any]]: A list of ``n`` random profiles.
+
+        Raises:
+            ValueError: If a constraint is invalid or no data matches them.
+
+        Examples:
+            .. code-block:: python
+
+                >>> from fakernaija import Naija
+                >>> naija = Naija()
+
+                >>> profiles = naija.profiles(100_000, region="SW")
+                >>> len(profiles)
+                100000
+        """
+        return self.profile_provider.profiles(
+            n,
+            tribe=tribe,
+            gender=gender,
+            state=state,
+            region=region,
+            network=network,
+            domain=domain,
+        )
+
+    def _compile_profile(
+        self, **constraints: str | None
+    ) -> Callable[[], dict[str, Any]]:
+        """Compile the profile generator."""
+        return self.profile_provider.compile_profile(**constraints)
+
+    def _many_profile(self, n: int, **constraints: str | None) -> list[dict[str, Any]]:
+        """Generate ``n`` profiles at once."""
+        return self.profile_provider.profiles(n, **constraints)
+
+    def _columns_profile(self) -> tuple[str, ...]:
+        """Get the columns of the profile rows."""
+        return self.profile_provider.profile_columns
+
+    def _rows_profile(self, n: int, **constraints: str | None) -> list[tuple[str, ...]]:
+        """Generate ``n`` profiles as tuple rows."""
+        return self.profile_provider.profile_rows(n, **constraints)
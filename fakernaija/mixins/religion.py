@@ -1,7 +1,9 @@
 """Religion mixin module."""
 
+from collections.abc import Callable
+
 from fakernaija.providers import ReligionProvider
-from fakernaija.utils import get_unique_value
+from fakernaija.utils import compile_unique_value, get_unique_value, unique_values
 
 
 class Religion:
@@ -39,3 +41,18 @@ class Religion:
         religion = get_unique_value(religions, self._used_religions)
         self._used_religions.add(religion)
         return religion
+
+    def _compile_religion(self) -> Callable[[], str]:
+        """Compile the religion generator."""
+        return compile_unique_value(
+            tuple(self.religion_provider.get_religions()),
+            self._used_religions,
+        )
+
+    def _many_religion(self, n: int) -> list[str]:
+        """Generate ``n`` religions at once."""
+        return unique_values(
+            self.religion_provider.get_religions(),
+            self._used_religions,
+            n,
+        )
@@ -1,17 +1,26 @@
 """SchoolMixin to group related methods for the SchoolProvider."""
 
+import functools
 import random
+from collections.abc import Callable
 
+from fakernaija.backends import Backend
 from fakernaija.providers import SchoolProvider
-from fakernaija.utils import get_unique_value
+from fakernaija.records import Record
+from fakernaija.utils import compile_unique_value, get_unique_value, unique_values
 
 
 class School:
     """Mixin class for generating random Nigerian schools and school names."""
 
-    def __init__(self) -> None:
-        """Initializes the School mixin and its provider."""
-        self.school_provider = SchoolProvider()
+    def __init__(self, backend: Backend | None = None) -> None:
+        """Initializes the School mixin and its provider.
+
+        Args:
+            backend (Backend | None, optional): The backend to query the
+                schools from. Defaults to None (the bundled JSON file).
+        """
+        self.school_provider = SchoolProvider(backend)
         self._used_school_names: set[str] = set()
 
     def school(
@@ -19,7 +28,7 @@ class School:
         ownership: str | None = None,
         state: str | None = None,
         school_type: str | None = None,
-    ) -> dict[str, str] | None:
+    ) -> Record | None:
         """Get a random school object based on optional parameters.
 
         Args:
@@ -28,7 +37,7 @@ class School:
             school_type (str | None, optional): Filter by type.
 
         Returns:
-            dict[str, str] | None: A dictionary representing a random school
+            Record | None: A read-only record of a random school
                 or None if no match found.
 
         Raises:
@@ -65,12 +74,8 @@ class School:
                 >>> print(f"Random federal university in Lagos: {school}")
                 Random federal university in Lagos: {'name': 'University of Lagos', 'acronym': 'UNILAG', 'state': 'Lagos', 'type': 'university', 'ownership': 'Federal'}
         """
-        schools = self.school_provider.get_schools(
-            ownership,
-            state,
-            school_type,
-        )
-        return random.choice(schools) if schools else None
+        schools = self.school_provider.sample_schools(1, ownership, state, school_type)
+        return schools[0] if schools else None
 
     def school_name(
         self,
@@ -137,7 +142,7 @@ class School:
                 >>> print(f"Random federal university acronym in Lagos: {school_acronym}")
                 Random federal university acronym in Lagos: UNILAG
         """
-        school_names = self.school_provider.get_school_names(
+        school_names = self.school_provider.get_school_name_pool(
             ownership,
             state,
             school_type,
@@ -150,3 +155,93 @@ class School:
         school_name = get_unique_value(school_names, self._used_school_names)
         self._used_school_names.add(school_name)
         return school_name
+
+    def _compile_school(
+        self,
+        ownership: str | None = None,
+        state: str | None = None,
+        school_type: str | None = None,
+    ) -> Callable[[], Record | None]:
+        """Compile the school generator."""
+        if self.school_provider.backend is not None:
+            if not self.school_provider.sample_schools(
+                1, ownership, state, school_type
+            ):
+                return lambda: None
+            return lambda: self.school(ownership, state, school_type)
+        schools = tuple(self.school_provider.get_schools(ownership, state, school_type))
+        if not schools:
+            return lambda: None
+        return functools.partial(random.choice, schools)
+
+    def _compile_school_name(
+        self,
+        acronym: bool = False,
+        ownership: str | None = None,
+        state: str | None = None,
+        school_type: str | None = None,
+    ) -> Callable[[], str | None]:
+        """Compile the school_name generator."""
+        school_names = self.school_provider.get_school_name_pool(
+            ownership,
+            state,
+            school_type,
+            acronym,
+        )
+        if not school_names:
+            return lambda: None
+        return compile_unique_value(school_names, self._used_school_names)
+
+    def _many_school(
+        self,
+        n: int,
+        ownership: str | None = None,
+        state: str | None = None,
+        school_type: str | None = None,
+    ) -> list[Record | None]:
+        """Generate ``n`` schools at once."""
+        schools = self.school_provider.sample_schools(n, ownership, state, school_type)
+        if not schools:
+            return [None] * n
+        return list(schools)
+
+    def _many_school_name(
+        self,
+        n: int,
+        acronym: bool = False,
+        ownership: str | None = None,
+        state: str | None = None,
+        school_type: str | None = None,
+    ) -> list[str | None]:
+        """Generate ``n`` school names or acronyms at once."""
+        school_names = self.school_provider.get_school_name_pool(
+            ownership,
+            state,
+            school_type,
+            acronym,
+        )
+        if not school_names:
+            return [None] * n
+        return list(unique_values(school_names, self._used_school_names, n))
+
+    def _columns_school(self) -> tuple[str, ...]:
+        """Get the columns of the school rows."""
+        return self.school_provider.school_columns
+
+    def _rows_school(
+        self,
+        n: int,
+        ownership: str | None = None,
+        state: str | None = None,
+        school_type: str | None = None,
+    ) -> list[tuple[str, ...]]:
+        """Generate ``n`` schools as tuple rows.
+
+        Unlike ``school``, no rows are returned if no school matches.
+        """
+        school_rows = self.school_provider.get_school_rows(
+            ownership,
+            state,
+            school_type,
+        )
+        return random.choices(school_rows, k=n) if school_rows else []
@@ -1,31 +1,41 @@
 """State mixin to group related methods for the StateProvider."""
 
+import functools
 import random
+from collections.abc import Callable, Sequence
+from typing import Any
 
+from fakernaija.backends import Backend
 from fakernaija.providers import StateProvider
-from fakernaija.utils import get_unique_value
+from fakernaija.records import Record
+from fakernaija.utils import compile_unique_value, get_unique_value, unique_values
 
 
 class State:
     """Methods for the StateProvider."""
 
-    def __init__(self) -> None:
-        """Initializes the State mixin and its provider."""
-        self.state_provider = StateProvider()
+    def __init__(self, backend: Backend | None = None) -> None:
+        """Initializes the State mixin and its provider.
+
+        Args:
+            backend (Backend | None, optional): The backend to load the states
+                from. Defaults to None (the bundled JSON file).
+        """
+        self.state_provider = StateProvider(backend)
         self._used_state_names: set[str] = set()
         self._used_state_capitals: set[str] = set()
         self._used_state_lgas: set[str] = set()
         self._used_state_postal_codes: set[str] = set()
 
-    def state(self, region: str | None = None) -> dict[str, str]:
-        """Get a dictionary of random state information, optionally filtered by region.
+    def state(self, region: str | None = None) -> Record:
+        """Get a record of random state information, optionally filtered by region.
 
         Args:
             region (str | None, optional): The region abbreviation to
                 filter by.
 
         Returns:
-            dict[str, str]: Random state information, optionally filtered
+            Record: Random, read-only state information, optionally filtered
                 by region.
 
         Raises:
@@ -170,15 +180,15 @@ class State:
         self._used_state_capitals.add(state_capital)
         return state_capital
 
-    def state_lga(self, state: str | None = None) -> str:
+    def state_lga(self, state: str | None = None) -> Record:
         """Get a random LGA, optionally filtered by state.
 
         Args:
             state (str | None, optional): The name of the state to filter by.
 
         Returns:
-            str: Random LGA in the specified state or any state if
-                none is specified.
+            Record: The name and code of a random LGA in the specified state
+                or any state if none is specified.
 
         Raises:
             ValueError: If the specified state does not exist.
@@ -253,3 +263,88 @@ class State:
         if state:
             return self.state_provider.get_postal_code_by_state(state)
         return random.choice(self.state_provider.get_postal_codes())
+
+    def _region_states(self, region: str | None) -> Sequence[Record]:
+        """Get the states of a region, or all states if no region is given."""
+        if region:
+            self.state_provider.validate_region(region)
+            return self.state_provider.get_states_by_region(region)
+        return self.state_provider.get_states()
+
+    def _compile_state(self, region: str | None = None) -> Callable[[], Record]:
+        """Compile the state generator."""
+        return functools.partial(random.choice, tuple(self._region_states(region)))
+
+    def _compile_state_name(self, region: str | None = None) -> Callable[[], str]:
+        """Compile the state_name generator."""
+        return compile_unique_value(
+            tuple(state["name"] for state in self._region_states(region)),
+            self._used_state_names,
+        )
+
+    def _compile_state_capital(self, region: str | None = None) -> Callable[[], str]:
+        """Compile the state_capital generator."""
+        return compile_unique_value(
+            tuple(state["capital"] for state in self._region_states(region)),
+            self._used_state_capitals,
+        )
+
+    def _compile_state_lga(self, state: str | None = None) -> Callable[[], Any]:
+        """Compile the state_lga generator."""
+        if state:
+            state_lgas = self.state_provider.get_state_lgas(state)
+        else:
+            state_lgas = self.state_provider.get_lgas()
+        return functools.partial(random.choice, tuple(state_lgas))
+
+    def _compile_state_postal_code(self, state: str | None = None) -> Callable[[], str]:
+        """Compile the state_postal_code generator."""
+        if state:
+            postal_code = self.state_provider.get_postal_code_by_state(state)
+            return lambda: postal_code
+        return functools.partial(
+            random.choice,
+            tuple(self.state_provider.get_postal_codes()),
+        )
+
+    def _many_state(self, n: int, region: str | None = None) -> list[Record]:
+        """Generate ``n`` states at once."""
+        return random.choices(self._region_states(region), k=n)
+
+    def _many_state_name(self, n: int, region: str | None = None) -> list[str]:
+        """Generate ``n`` state names at once."""
+        return unique_values(
+            [state["name"] for state in self._region_states(region)],
+            self._used_state_names,
+            n,
+        )
+
+    def _many_state_capital(self, n: int, region: str | None = None) -> list[str]:
+        """Generate ``n`` state capitals at once."""
+        return unique_values(
+            [state["capital"] for state in self._region_states(region)],
+            self._used_state_capitals,
+            n,
+        )
+
+    def _many_state_lga(self, n: int, state: str | None = None) -> list[Any]:
+        """Generate ``n`` LGAs at once."""
+        if state:
+            state_lgas = self.state_provider.get_state_lgas(state)
+        else:
+            state_lgas = self.state_provider.get_lgas()
+        return random.choices(state_lgas, k=n)
+
+    def _many_state_postal_code(self, n: int, state: str | None = None) -> list[str]:
+        """Generate ``n`` postal codes at once."""
+        if state:
+            return [self.state_provider.get_postal_code_by_state(state)] * n
+        return random.choices(self.state_provider.get_postal_codes(), k=n)
+
+    def _columns_state(self) -> tuple[str, ...]:
+        """Get the columns of the state rows."""
+        return self.state_provider.state_columns
+
+    def _rows_state(self, n: int, region: str | None = None) -> list[tuple[Any, ...]]:
+        """Generate ``n`` states as tuple rows."""
+        return random.choices(self.state_provider.get_state_rows(region), k=n)
@@ -1,5 +1,20 @@
 """This module provides a `Naija` class that generates random Nigerian data."""
 
+import difflib
+import functools
+import itertools
+from collections.abc import (
+    Callable,
+    Generator,
+    Hashable,
+    Iterator,
+    Mapping,
+    Sequence,
+)
+from pathlib import Path
+from typing import Any
+
+from fakernaija.backends import Backend
 from fakernaija.mixins import (
     Course,
     Degree,
@@ -9,10 +24,17 @@ from fakernaija.mixins import (
     MaritalStatus,
     Name,
     PhoneNumber,
+    Profile,
     Religion,
     School,
     State,
 )
+from fakernaija.providers import NameProvider
+from fakernaija.schema import SchemaPlan, load_schema
+from fakernaija.utils import row_column
+
+DEFAULT_CHUNK_SIZE = 1024
+STREAM_CACHE_SIZE = 64
 
 
 class Naija(
@@ -24,6 +46,7 @@ class Naija(
     MaritalStatus,
     Name,
     PhoneNumber,
+    Profile,
     Religion,
     School,
     State,
@@ -34,16 +57,414 @@ class Naija(
     to generate specific types of data.
     """
 
-    def __init__(self) -> None:
-        """Initializes the Naija class and its inherited mixins."""
+    def __init__(
+        self,
+        data_dir: str | Path | None = None,
+        backend: Backend | None = None,
+    ) -> None:
+        """Initializes the Naija class and its inherited mixins.
+
+        The name, email and profile methods share one NameProvider.
+
+        Args:
+            data_dir (str | Path | None, optional): A directory of custom name
+                files (see ``NameProvider.from_dir``) to generate names,
+                emails and profiles from. Defaults to None (the bundled names).
+            backend (Backend | None, optional): The backend to query the names,
+                schools and states from, e.g. an ``SQLiteBackend``. Names come
+                from ``data_dir`` if it is given. Defaults to None (the bundled
+                JSON files, held in memory).
+
+        Raises:
+            FileNotFoundError: If the directory has no first or last names file.
+            ValueError: If a name file is not valid.
+
+        Examples:
+            .. code-block:: python
+
+                >>> from fakernaija import Naija
+                >>> naija = Naija(data_dir="corpus")
+                >>> naija.full_name(tribe="tiv")
+                'Terver Akaa'
+        """
+        name_provider = (
+            NameProvider(backend=backend)
+            if data_dir is None
+            else NameProvider.from_dir(data_dir)
+        )
         Course.__init__(self)
         Degree.__init__(self)
-        Email.__init__(self)
+        Email.__init__(self, name_provider)
         Faculty.__init__(self)
         LicensePlate.__init__(self)
         MaritalStatus.__init__(self)
-        Name.__init__(self)
+        Name.__init__(self, name_provider)
         PhoneNumber.__init__(self)
+        Profile.__init__(self, name_provider, backend)
         Religion.__init__(self)
-        School.__init__(self)
-        State.__init__(self)
+        School.__init__(self, backend)
+        State.__init__(self, backend)
+
+    @classmethod
+    def fields(cls) -> list[str]:
+        """Get the names of the fields that can be compiled.
+
+        Returns:
+            list[str]: Sorted field names, e.g. ``email`` or ``state_name``.
+        """
+        return sorted(
+            name.removeprefix("_compile_")
+            for name in dir(cls)
+            if name.startswith("_compile_")
+        )
+
+    def reset_unique(self) -> None:
+        """Forget the values used by the fields that never repeat a value.
+
+        After a reset, fields such as ``state_name`` or ``religion`` draw
+        from all of their values again, as in a new session.
+        """
+        for name, value in vars(self).items():
+            if name.startswith("_used_") and isinstance(value, set):
+                value.clear()
+
+    def _validate_field(self, field: str) -> None:
+        """Raise a ValueError with suggestions if the field is not supported."""
+        if not hasattr(self, f"_compile_{field}"):
+            fields = self.fields()
+            suggestions = difflib.get_close_matches(field, fields)
+            msg = f"Unsupported field: {field}."
+            if suggestions:
+                msg += f" Did you mean: {', '.join(suggestions)}?"
+            else:
+                msg += f" Supported fields are: {', '.join(fields)}."
+            raise ValueError(msg)
+
+    @staticmethod
+    def _validate_arguments(field: str, kwargs: Mapping[str, Any]) -> None:
+        """Raise a ValueError if an argument value is unhashable, e.g. a list."""
+        for name, value in kwargs.items():
+            if not isinstance(value, Hashable):
+                msg = f"Invalid {name} for {field}: {type(value).__name__} values are not supported."
+                raise ValueError(msg)  # noqa: TRY004
+
+    def compile(self, field: str, **kwargs: Any) -> Callable[[], Any]:  # noqa: ANN401
+        """Compile a field generator with its arguments validated and bound.
+
+        Arguments are normalized and validated once, and the matching data
+        pool is resolved up front, so the returned callable only has to pick
+        a value on every call. Fields that never repeat a value (such as
+        ``state_name``) share their used values with the regular method.
+
+        Args:
+            field (str): Name of the field, e.g. ``email`` or ``phone_number``.
+            **kwargs: Arguments accepted by the field's regular method.
+
+        Returns:
+            Callable[[], Any]: A zero-argument callable generating the field.
+
+        Raises:
+            ValueError: If the field is not supported or an argument is invalid.
+
+        Examples:
+            .. code-block:: python
+
+                >>> from fakernaija import Naija
+                >>> naija = Naija()
+
+                >>> email = naija.compile("email", tribe="igbo", gender="female")
+                >>> print(email())
+                chiamaka.okafor@gmail.com
+                >>> emails = [email() for _ in range(1000)]
+        """
+        self._validate_field(field)
+        self._validate_arguments(field, kwargs)
+        return getattr(self, f"_compile_{field}")(**kwargs)
+
+    def many(
+        self,
+        field: str,
+        n: int,
+        stream: bool = False,
+        **kwargs: Any,  # noqa: ANN401
+    ) -> list[Any] | Iterator[Any]:
+        """Generate ``n`` values of a field at once.
+
+        Fields with a batch implementation (such as ``phone_number`` or
+        ``state_name``) generate the whole batch in one pass. Other fields
+        run their compiled generator in a tight loop. Arguments are
+        validated once, before anything is generated.
+
+        Args:
+            field (str): Name of the field, e.g. ``email`` or ``phone_number``.
+            n (int): The number of values to generate.
+            stream (bool, optional): Return an iterator that generates values
+                lazily instead of a list. Defaults to False.
+            **kwargs: Arguments accepted by the field's regular method.
+
+        Returns:
+            list[Any] | Iterator[Any]: The generated values.
+
+        Raises:
+            ValueError: If ``n`` is negative, the field is not supported or
+                an argument is invalid.
+
+        Examples:
+            .. code-block:: python
+
+                >>> from fakernaija import Naija
+                >>> naija = Naija()
+
+                >>> naija.many("phone_number", 3, network="mtn")
+                ['08031234567', '08145678901', '07069876543']
+
+                >>> for email in naija.many("email", 1_000_000, stream=True):
+                ...     pass
+        """
+        if n < 0:
+            msg = f"The number of values must be a non-negative integer, got {n}."
+            raise ValueError(msg)
+
+        batch = None if stream else getattr(self, f"_many_{field}", None)
+        if batch is not None:
+            # Batch implementations validate their arguments themselves
+            self._validate_arguments(field, kwargs)
+            return batch(n, **kwargs)
+
+        generate = self.compile(field, **kwargs)
+        if stream:
+            return itertools.starmap(generate, itertools.repeat((), n))
+        return list(itertools.starmap(generate, itertools.repeat((), n)))
+
+    def row_header(self, fields: str | Sequence[str]) -> tuple[str, ...]:
+        """Get the column header of the rows generated by ``rows``.
+
+        Args:
+            fields (str | Sequence[str]): A record field such as ``state`` or
+                ``profile``, a single field, or a sequence of fields.
+
+        Returns:
+            tuple[str, ...]: The column names, in row order.
+
+        Raises:
+            ValueError: If a field is not supported.
+
+        Examples:
+            .. code-block:: python
+
+                >>> from fakernaija import Naija
+                >>> naija = Naija()
+
+                >>> naija.row_header("degree")
+                ('name', 'degree_type', 'abbr')
+        """
+        if isinstance(fields, str):
+            columns = getattr(self, f"_columns_{fields}", None)
+            if columns is not None:
+                return columns()
+            fields = [fields]
+        for field in fields:
+            self._validate_field(field)
+        return tuple(fields)
+
+    def rows(
+        self,
+        fields: str | Sequence[str],
+        n: int,
+        **kwargs: Any,  # noqa: ANN401
+    ) -> list[tuple[Any, ...]]:
+        """Generate ``n`` rows as plain tuples in a fixed column order.
+
+        Record fields (``state``, ``school``, ``degree``, ``course``,
+        ``faculty`` and ``profile``) draw from precomputed tuple rows instead
+        of building a dict per row. A sequence of fields generates one column
+        per field. Rows only hold strings, numbers and None; nested values,
+        e.g. the LGAs of a state or ``state_lga`` records, are JSON text. The
+        rows can be fed straight to ``csv.writer.writerows`` or
+        ``sqlite3.Connection.executemany``; use ``row_header`` for the column
+        names.
+
+        Args:
+            fields (str | Sequence[str]): A record field, a single field, or a
+                sequence of fields.
+            n (int): The number of rows to generate.
+            **kwargs: Arguments of the field. Only supported for a single field;
+                use ``compile_schema`` to pass arguments to several fields.
+
+        Returns:
+            list[tuple[Any, ...]]: The generated rows.
+
+        Raises:
+            ValueError: If ``n`` is negative, a field is not supported or an
+                argument is invalid.
+
+        Examples:
+            .. code-block:: python
+
+                >>> import csv, sys
+                >>> from fakernaija import Naija
+                >>> naija = Naija()
+
+                >>> writer = csv.writer(sys.stdout)
+                >>> writer.writerow(naija.row_header("state"))
+                >>> writer.writerows(naija.rows("state", 1000, region="SW"))
+
+                >>> naija.rows(["full_name", "email", "phone_number"], 1)
+                [('Ugochi Maduike', 'gidado.bello@hotmail.com', '08031234567')]
+        """
+        if isinstance(fields, str):
+            rows = getattr(self, f"_rows_{fields}", None)
+            if rows is None:
+                return [
+                    (value,) for value in row_column(self.many(fields, n, **kwargs))
+                ]
+            if n < 0:
+                msg = f"The number of values must be a non-negative integer, got {n}."
+                raise ValueError(msg)
+            return rows(n, **kwargs)
+
+        if kwargs:
+            msg = "Arguments are only supported for a single field. Use compile_schema to pass arguments to several fields."
+            raise ValueError(msg)
+        if not fields:
+            msg = "At least one field is required."
+            raise ValueError(msg)
+        return list(
+            zip(*(row_column(self.many(field, n)) for field in fields), strict=True),
+        )
+
+    def stream(
+        self,
+        field: str,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        **kwargs: Any,  # noqa: ANN401
+    ) -> Generator[Any, Mapping[str, Any] | None, None]:
+        """Stream values of a field endlessly, one chunk at a time.
+
+        The stream refills itself through the field's batch generation, so it
+        only holds one chunk of values in memory. Use ``itertools.islice`` to
+        take a fixed number of values.
+
+        Sending a mapping of arguments to the stream changes them from the next
+        value on; ``None`` values remove an argument. The generators of the
+        last argument sets used are kept, so switching back and forth does not
+        rebuild them.
+
+        Args:
+            field (str): Name of the field, e.g. ``email`` or ``phone_number``.
+            chunk_size (int, optional): The number of values generated per
+                refill. Defaults to ``DEFAULT_CHUNK_SIZE``.
+            **kwargs: Arguments accepted by the field's regular method.
+
+        Returns:
+            Generator[Any, Mapping[str, Any] | None, None]: An endless generator
+                of values.
+
+        Raises:
+            ValueError: If ``chunk_size`` is not positive, the field is not
+                supported or an argument is invalid. Invalid arguments sent to
+                the stream raise when sent and end the stream.
+
+        Examples:
+            .. code-block:: python
+
+                >>> import itertools
+                >>> from fakernaija import Naija
+                >>> naija = Naija()
+
+                >>> phone_numbers = naija.stream("phone_number", network="mtn")
+                >>> list(itertools.islice(phone_numbers, 3))
+                ['08031234567', '08145678901', '07069876543']
+
+                >>> phone_numbers.send({"network": "glo"})
+                '08051234567'
+        """
+        if chunk_size < 1:
+            msg = f"The chunk size must be a positive integer, got {chunk_size}."
+            raise ValueError(msg)
+        cached_refill = functools.lru_cache(maxsize=STREAM_CACHE_SIZE)(
+            functools.partial(self._stream_refill, field),
+        )
+
+        def refill_for(kwargs: Mapping[str, Any]) -> Callable[[int], list[Any]]:
+            # Unhashable values cannot be cache keys, so reject them first
+            self._validate_arguments(field, kwargs)
+            return cached_refill(tuple(sorted(kwargs.items())))
+
+        # Validate the arguments now rather than on the first value
+        refill = refill_for(kwargs)
+        return self._stream(chunk_size, kwargs, refill, refill_for)
+
+    def _stream_refill(
+        self,
+        field: str,
+        arguments: tuple[tuple[str, Any], ...],
+    ) -> Callable[[int], list[Any]]:
+        """Build the chunk generator of a field for a set of arguments."""
+        kwargs = dict(arguments)
+        generate = self.compile(field, **kwargs)
+        batch = getattr(self, f"_many_{field}", None)
+        if batch is not None:
+            return functools.partial(batch, **kwargs)
+        return lambda n: list(itertools.starmap(generate, itertools.repeat((), n)))
+
+    @staticmethod
+    def _stream(
+        chunk_size: int,
+        kwargs: dict[str, Any],
+        refill: Callable[[int], list[Any]],
+        refill_for: Callable[[Mapping[str, Any]], Callable[[int], list[Any]]],
+    ) -> Generator[Any, Mapping[str, Any] | None, None]:
+        """Yield values chunk by chunk, switching arguments on ``send``."""
+        while True:
+            for value in refill(chunk_size):
+                changes = yield value
+                if changes:
+                    kwargs = {
+                        key: value
+                        for key, value in {**kwargs, **changes}.items()
+                        if value is not None
+                    }
+                    refill = refill_for(kwargs)
+                    # Drop the rest of the chunk generated with the old arguments
+                    break
+
+    def compile_schema(self, schema: Mapping[str, Any] | str | Path) -> SchemaPlan:
+        """Compile a dataset schema into a reusable generation plan.
+
+        A schema maps column names to field specs such as
+        ``"full_name(tribe=yoruba)"``. Arguments starting with ``$`` take
+        their value from another column of the same row, e.g.
+        ``"email(name=$name)"`` or ``"state_lga(state=$state.name)"``.
+
+        Args:
+            schema (Mapping[str, Any] | str | Path): The schema, or the path to
+                a JSON or TOML schema file.
+
+        Returns:
+            SchemaPlan: The compiled plan, which generates rows with
+                ``generate(n)`` or lazily with ``batches(n)``.
+
+        Raises:
+            FileNotFoundError: If the schema file is not found.
+            ValueError: If the schema is invalid.
+
+        Examples:
+            .. code-block:: python
+
+                >>> from fakernaija import Naija
+                >>> naija = Naija()
+
+                >>> plan = naija.compile_schema(
+                ...     {
+                ...         "name": "full_name(tribe=yoruba)",
+                ...         "email": "email(name=$name)",
+                ...         "state": "state_name(region=SW)",
+                ...     }
+                ... )
+                >>> plan.generate(1)
+                [{'name': 'Bukky Ogunleye', 'email': 'bukky.ogunleye@hotmail.com', 'state': 'Oyo'}]
+        """
+        if isinstance(schema, str | Path):
+            schema = load_schema(schema)
+        return SchemaPlan(self, schema)
@@ -0,0 +1,226 @@
+"""This module generates data in chunks across a pool of worker processes.
+
+The ``repeat`` values of a CLI command are split into chunks of a fixed
+size. Each chunk is generated from its own seed, derived from a base seed
+and the chunk index, with the session-unique values reset, so a chunk's
+values only depend on the base seed and its index: the output is the same
+for any number of workers. Each worker builds its ``Naija`` instance, and
+loads its datasets, once.
+"""
+
+import concurrent.futures
+import dataclasses
+import hashlib
+import itertools
+import random
+from collections.abc import Callable, Iterator, Mapping
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from fakernaija.naija import Naija
+
+PARALLEL_CHUNK_SIZE = 20_000
+PARALLEL_CHUNKS_PER_WORKER = 2
+
+
+@dataclass(frozen=True)
+class FieldJob:
+    """A job generating the values of a field, e.g. ``email(tribe=igbo)``."""
+
+    field: str
+    arguments: Mapping[str, Any] = dataclasses.field(default_factory=dict)
+
+    def compile(self, naija: "Naija") -> Callable[[int], list[Any]]:
+        """Bind the job to a Naija instance.
+
+        Args:
+            naija (Naija): The Naija instance generating the data.
+
+        Returns:
+            Callable[[int], list[Any]]: A function generating ``n`` values.
+        """
+
+        def generate(n: int) -> list[Any]:
+            return [
+                item
+                for item in naija.many(self.field, n, **self.arguments)
+                if item is not None
+            ]
+
+        return generate
+
+
+@dataclass(frozen=True)
+class SchemaJob:
+    """A job generating the rows of a dataset schema."""
+
+    schema: Mapping[str, Any]
+
+    def compile(self, naija: "Naija") -> Callable[[int], list[Any]]:
+        """Compile the schema against a Naija instance.
+
+        Args:
+            naija (Naija): The Naija instance generating the data.
+
+        Returns:
+            Callable[[int], list[Any]]: A function generating ``n`` rows.
+        """
+        return naija.compile_schema(self.schema).generate
+
+
+Job = FieldJob | SchemaJob
+
+
+class _Worker:
+    """The generator of the chunks of a job, built once per process."""
+
+    def __init__(self, job: Job) -> None:
+        from fakernaija.naija import Naija  # noqa: PLC0415
+
+        self.naija = Naija()
+        self.generate = job.compile(self.naija)
+
+    def run(self, size: int, seed: int) -> list[Any]:
+        """Generate a chunk from its seed, independently of earlier chunks."""
+        random.seed(seed)
+        self.naija.reset_unique()
+        return self.generate(size)
+
+
+_worker: _Worker | None = None
+
+
+def _init_worker(job: Job) -> None:
+    """Build the generator of a worker process."""
+    global _worker  # noqa: PLW0603
+    _worker = _Worker(job)
+
+
+def _run_chunk(size: int, seed: int) -> list[Any]:
+    """Generate a chunk in a worker process."""
+    if _worker is None:
+        msg = "The worker process is not initialized."
+        raise RuntimeError(msg)
+    return _worker.run(size, seed)
+
+
+def derive_seed(seed: int, index: int) -> int:
+    """Derive the seed of a chunk from the base seed.
+
+    Args:
+        seed (int): The base seed.
+        index (int): The index of the chunk.
+
+    Returns:
+        int: A 64-bit seed, the same for the same base seed and index.
+    """
+    digest = hashlib.blake2b(f"{seed}:{index}".encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "big")
+
+
+def chunk_sizes(repeat: int, chunk_size: int = PARALLEL_CHUNK_SIZE) -> list[int]:
+    """Split ``repeat`` values into chunks of ``chunk_size``, the last one smaller."""
+    full, rest = divmod(repeat, chunk_size)
+    return [chunk_size] * full + ([rest] if rest else [])
+
+
+def generate_chunks(  # noqa: PLR0913
+    job: Job,
+    repeat: int,
+    workers: int = 1,
+    seed: int | None = None,
+    *,
+    ordered: bool = True,
+    chunk_size: int = PARALLEL_CHUNK_SIZE,
+) -> Iterator[list[Any]]:
+    """Generate the ``repeat`` values of a job in chunks, across processes.
+
+    Only ``PARALLEL_CHUNKS_PER_WORKER`` chunks per worker are pending at a
+    time, so the output is generated in bounded memory. In order, the chunks
+    are yielded as they were split, so with a seed the output is
+    reproducible whatever the number of workers. Unordered, each chunk is
+    yielded as soon as it is done, so a slow chunk does not hold back the
+    others.
+
+    Args:
+        job (Job): The job, a ``FieldJob`` or ``SchemaJob``.
+        repeat (int): The total number of values.
+        workers (int, optional): The number of worker processes; 1 generates
+            the chunks in this process. Defaults to 1.
+        seed (int | None, optional): The base seed of the chunk seeds.
+            Defaults to None (a random base seed).
+        ordered (bool, optional): Yield the chunks in order. Defaults to True.
+        chunk_size (int, optional): The number of values per chunk.
+            Defaults to PARALLEL_CHUNK_SIZE.
+
+    Yields:
+        list[Any]: The values of the next chunk.
+
+    Raises:
+        ValueError: If the number of workers or the chunk size is not positive.
+
+    Examples:
+        .. code-block:: python
+
+            >>> from fakernaija.parallel import FieldJob, generate_chunks
+            >>> chunks = generate_chunks(FieldJob("email"), 100_000, workers=4, seed=42)
+            >>> sum(len(chunk) for chunk in chunks)
+            100000
+    """
+    if workers < 1 or chunk_size < 1:
+        msg = "The number of workers and the chunk size must be positive."
+        raise ValueError(msg)
+    if seed is None:
+        seed = random.SystemRandom().getrandbits(64)
+    tasks = [
+        (size, derive_seed(seed, index))
+        for index, size in enumerate(chunk_sizes(repeat, chunk_size))
+    ]
+
+    if workers == 1:
+        worker = _Worker(job)
+        state = random.getstate()
+        try:
+            for size, chunk_seed in tasks:
+                yield worker.run(size, chunk_seed)
+        finally:
+            # Leave the random state of this process as it was
+            random.setstate(state)
+        return
+
+    executor = concurrent.futures.ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(job,),
+    )
+    try:
+        pending = iter(tasks)
+        window = workers * PARALLEL_CHUNKS_PER_WORKER
+        futures = [
+            executor.submit(_run_chunk, *task)
+            for task in itertools.islice(pending, window)
+        ]
+        if ordered:
+            while futures:
+                chunk = futures.pop(0).result()
+                futures.extend(
+                    executor.submit(_run_chunk, *task)
+                    for task in itertools.islice(pending, 1)
+                )
+                yield chunk
+        else:
+            running = set(futures)
+            while running:
+                done, running = concurrent.futures.wait(
+                    running,
+                    return_when=concurrent.futures.FIRST_COMPLETED,
+                )
+                running.update(
+                    executor.submit(_run_chunk, *task)
+                    for task in itertools.islice(pending, len(done))
+                )
+                for future in done:
+                    yield future.result()
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
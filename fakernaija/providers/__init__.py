@@ -6,6 +6,7 @@ from .license_plate import LicensePlateProvider
 from .marital_status import MaritalStatusProvider
 from .name import NameProvider
 from .phonenumber import PhoneNumberProvider
+from .profile import ProfileProvider
 from .religion import ReligionProvider
 from .school import SchoolProvider
 from .state import StateProvider
@@ -19,6 +20,7 @@ __all__ = [
     "MaritalStatusProvider",
     "NameProvider",
     "PhoneNumberProvider",
+    "ProfileProvider",
     "ReligionProvider",
     "SchoolProvider",
     "StateProvider",
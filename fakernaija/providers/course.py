@@ -3,9 +3,13 @@
 Resource link: https://entangle-pair.blogspot.com/2014/07/academic-programmes-and-course-outline.html
 """
 
+import difflib
+import random
+import re
 from pathlib import Path
 
-from fakernaija.utils import load_json
+from fakernaija.records import Record, freeze_records
+from fakernaija.utils import distinct_values, load_json, records_to_rows
 
 
 class CourseProvider:
@@ -16,8 +20,12 @@ class CourseProvider:
 
     Attributes:
         data_path (Path): The path to the directory containing the courses JSON data.
-        courses_data (list[dict[str, str]]): The loaded course data, each entry containing
+        courses_data (tuple[Record, ...]): The loaded course records, each containing
             the course name and code.
+        course_names (tuple[str, ...]): The names of all courses.
+        course_codes (tuple[str, ...]): The codes of all courses.
+        course_name_pool (tuple[str, ...]): The distinct course names.
+        course_code_pool (tuple[str, ...]): The distinct course codes.
 
     Data Structure:
         The structure of the course data used is as follows:
@@ -36,28 +44,209 @@ class CourseProvider:
         Sets the path to the directory containing Courses data.
         """
         self.data_path = Path(__file__).parent.parent / "data" / "courses.json"
-        self.courses_data = load_json(self.data_path, ["name", "code"])
+        self.courses_data = freeze_records(load_json(self.data_path, ["name", "code"]))
+        self.course_columns = ("name", "code")
+        self._build_indexes()
+
+    def _build_indexes(self) -> None:
+        """Build the course name/code pools and lookup indexes.
+
+        ``course_name_pool`` and ``course_code_pool`` hold each name and code
+        once, for drawing session-unique values without bias.
+        ``courses_by_code`` and ``codes_by_name`` map to tuples because a few
+        codes and names are shared by several courses. ``courses_by_prefix``
+        maps the letters of a course code (e.g. ``CHM``) to its courses, with
+        the ``None`` key holding every course.
+        """
+        self.course_names = tuple(course["name"] for course in self.courses_data)
+        self.course_codes = tuple(course["code"] for course in self.courses_data)
+        self.course_name_pool = distinct_values(self.course_names)
+        self.course_code_pool = distinct_values(self.course_codes)
+
+        courses_by_code: dict[str, list[Record]] = {}
+        courses_by_prefix: dict[str | None, list[Record]] = {}
+        codes_by_name: dict[str, list[str]] = {}
+        for course in self.courses_data:
+            code = course["code"].upper()
+            courses_by_code.setdefault(code, []).append(course)
+            courses_by_prefix.setdefault(self._code_prefix(code), []).append(course)
+            codes_by_name.setdefault(course["name"].casefold(), []).append(
+                course["code"],
+            )
+        courses_by_prefix[None] = list(self.courses_data)
+
+        self.courses_by_code = {
+            code: tuple(courses) for code, courses in courses_by_code.items()
+        }
+        self.courses_by_prefix = {
+            prefix: tuple(courses) for prefix, courses in courses_by_prefix.items()
+        }
+        self.codes_by_name = {
+            name: tuple(codes) for name, codes in codes_by_name.items()
+        }
+        self.course_rows_by_prefix = {
+            prefix: records_to_rows(courses, self.course_columns)
+            for prefix, courses in self.courses_by_prefix.items()
+        }
+
+    @staticmethod
+    def _code_prefix(code: str) -> str:
+        """Get the department-style prefix of a course code, e.g. ``COS``."""
+        match = re.match(r"[A-Za-z]+", code)
+        return match.group().upper() if match else ""
+
+    def validate_code_prefix(self, code_prefix: str | None) -> str | None:
+        """Validate a course code prefix and return its lookup key.
+
+        Args:
+            code_prefix (str | None): The course code prefix, e.g. ``CSC``.
+
+        Returns:
+            str | None: The uppercased code prefix used as the key of
+                ``courses_by_prefix`` or None if no prefix is given.
+
+        Raises:
+            ValueError: If no course code starts with the prefix.
+        """
+        if not code_prefix:
+            return None
+
+        key = code_prefix.strip().upper()
+        if key not in self.courses_by_prefix:
+            prefixes = sorted(prefix for prefix in self.courses_by_prefix if prefix)
+            suggestions = difflib.get_close_matches(key, prefixes, n=3, cutoff=0.6)
+            msg = (
+                f"Invalid course code prefix: {code_prefix}. Did you mean: {', '.join(suggestions)}?"
+                if suggestions
+                else f"Invalid course code prefix: {code_prefix}. Valid prefixes are: {', '.join(prefixes)}"
+            )
+            raise ValueError(msg)
+        return key
 
     def get_courses_name(self) -> list[str]:
-        """Get a list of all course names.
+        """Get all course names.
 
         Returns:
-            list[str]: A list of course names.
+            list[str]: A new list of course names, copied from ``course_names``.
         """
-        return [course["name"] for course in self.courses_data]
+        return list(self.course_names)
 
     def get_courses_code(self) -> list[str]:
-        """Get a list of all the courses code.
+        """Get all the courses code.
 
         Returns:
-            list[str]: A list of courses code.
+            list[str]: A new list of courses code, copied from ``course_codes``.
         """
-        return [course["code"] for course in self.courses_data]
+        return list(self.course_codes)
 
-    def get_courses(self) -> list[dict[str, str]]:
+    def get_courses(self) -> tuple[Record, ...]:
         """Get a list of all courses with their names and codes.
 
         Returns:
-            list[dict[str, str]]: A list of courses with their names and codes.
+            tuple[Record, ...]: The courses with their names and codes.
         """
         return self.courses_data
+
+    def get_courses_by_code(self, code: str) -> tuple[Record, ...]:
+        """Get the courses with a course code.
+
+        The lookup is case-insensitive. A few codes are shared by several courses.
+
+        Args:
+            code (str): The course code, e.g. ``COS101``.
+
+        Returns:
+            tuple[Record, ...]: The courses with the course code.
+
+        Raises:
+            ValueError: If no course has the course code.
+        """
+        try:
+            return self.courses_by_code[code.strip().upper()]
+        except KeyError:
+            msg = f"Invalid course code: {code}."
+            raise ValueError(msg) from None
+
+    def get_courses_by_prefix(self, code_prefix: str) -> tuple[Record, ...]:
+        """Get the courses whose code starts with a department-style prefix.
+
+        Args:
+            code_prefix (str): The course code prefix, e.g. ``CSC``.
+
+        Returns:
+            tuple[Record, ...]: The courses with the code prefix.
+
+        Raises:
+            ValueError: If no course code starts with the prefix.
+        """
+        return self.courses_by_prefix[self.validate_code_prefix(code_prefix)]
+
+    def get_course_codes_by_name(self, name: str) -> tuple[str, ...]:
+        """Get the codes of the courses with a course name.
+
+        The lookup is case-insensitive. A few names are shared by several courses.
+
+        Args:
+            name (str): The course name.
+
+        Returns:
+            tuple[str, ...]: The codes of the courses with the name.
+
+        Raises:
+            ValueError: If no course has the name.
+        """
+        try:
+            return self.codes_by_name[name.strip().casefold()]
+        except KeyError:
+            suggestions = difflib.get_close_matches(
+                name, self.course_names, n=3, cutoff=0.6
+            )
+            msg = (
+                f"Invalid course name: {name}. Did you mean: {', '.join(suggestions)}?"
+                if suggestions
+                else f"Invalid course name: {name}."
+            )
+            raise ValueError(msg) from None
+
+    def get_course_rows(
+        self,
+        code_prefix: str | None = None,
+    ) -> tuple[tuple[str, ...], ...]:
+        """Get the courses as tuple rows, optionally filtered by code prefix.
+
+        The values of each row follow ``course_columns``.
+
+        Args:
+            code_prefix (str | None, optional): The course code prefix to
+                filter by, e.g. ``CSC``. Defaults to None.
+
+        Returns:
+            tuple[tuple[str, ...], ...]: The precomputed course rows.
+
+        Raises:
+            ValueError: If no course code starts with the prefix.
+        """
+        return self.course_rows_by_prefix[self.validate_code_prefix(code_prefix)]
+
+    def courses(
+        self,
+        n: int,
+        code_prefix: str | None = None,
+    ) -> list[Record]:
+        """Get ``n`` random courses, optionally filtered by code prefix.
+
+        Courses are drawn independently, so a batch may contain repeats.
+
+        Args:
+            n (int): The number of courses to return.
+            code_prefix (str | None, optional): The course code prefix to
+                filter by, e.g. ``CSC``. Defaults to None.
+
+        Returns:
+            list[Record]: A list of ``n`` random courses.
+
+        Raises:
+            ValueError: If no course code starts with the prefix.
+        """
+        courses = self.courses_by_prefix[self.validate_code_prefix(code_prefix)]
+        return random.choices(courses, k=n)
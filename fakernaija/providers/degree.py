@@ -1,9 +1,16 @@
 """This module provides a DegreeProvider class for accessing information about degrees awarded in Nigerian schools from a JSON file."""
 
 import difflib
+import random
 from pathlib import Path
 
-from fakernaija.utils import load_json, normalize_input
+from fakernaija.records import Record, freeze_records
+from fakernaija.utils import (
+    distinct_values,
+    load_json,
+    normalize_choice,
+    records_to_rows,
+)
 
 
 class DegreeProvider:
@@ -15,15 +22,77 @@ class DegreeProvider:
         Sets the path to the directory containing Degrees data.
         """
         self.data_path = Path(__file__).parent.parent / "data" / "degrees.json"
-        self.degrees_data = load_json(
-            self.data_path,
-            [
-                "name",
-                "degree_type",
-                "abbr",
-            ],
+        self.degrees_data = freeze_records(
+            load_json(
+                self.data_path,
+                [
+                    "name",
+                    "degree_type",
+                    "abbr",
+                ],
+            ),
         )
         self.valid_degree_types = ["undergraduate", "masters", "doctorate"]
+        self.degree_columns = ("name", "degree_type", "abbr")
+        self._build_indexes()
+
+    def _build_indexes(self) -> None:
+        """Bucket the degrees data by degree type and index it by abbreviation.
+
+        The ``*_by_type`` dicts map each degree type to tuples of degree
+        records, names and abbreviations, with the ``None`` key holding every
+        degree. ``degrees_by_abbr`` maps a compact abbreviation key (see
+        ``_abbr_key``) to the degrees sharing it. ``degree_name_pools`` and
+        ``degree_abbr_pools`` hold each name and abbreviation of a type once,
+        for drawing session-unique values without bias.
+        """
+        degrees_by_type: dict[str | None, list[Record]] = {
+            degree_type: [] for degree_type in self.valid_degree_types
+        }
+        degrees_by_abbr: dict[str, list[Record]] = {}
+        for degree in self.degrees_data:
+            degrees_by_type.setdefault(degree["degree_type"], []).append(degree)
+            degrees_by_abbr.setdefault(self._abbr_key(degree["abbr"]), []).append(
+                degree,
+            )
+        degrees_by_type[None] = list(self.degrees_data)
+
+        self.degrees_by_type = {
+            degree_type: tuple(degrees)
+            for degree_type, degrees in degrees_by_type.items()
+        }
+        self.degree_names_by_type = {
+            degree_type: tuple(degree["name"] for degree in degrees)
+            for degree_type, degrees in self.degrees_by_type.items()
+        }
+        self.degree_abbrs_by_type = {
+            degree_type: tuple(degree["abbr"] for degree in degrees)
+            for degree_type, degrees in self.degrees_by_type.items()
+        }
+        self.degree_name_pools = {
+            degree_type: distinct_values(names)
+            for degree_type, names in self.degree_names_by_type.items()
+        }
+        self.degree_abbr_pools = {
+            degree_type: distinct_values(abbrs)
+            for degree_type, abbrs in self.degree_abbrs_by_type.items()
+        }
+        self.degrees_by_abbr = {
+            key: tuple(degrees) for key, degrees in degrees_by_abbr.items()
+        }
+        self.degree_rows_by_type = {
+            degree_type: records_to_rows(degrees, self.degree_columns)
+            for degree_type, degrees in self.degrees_by_type.items()
+        }
+
+    @staticmethod
+    def _abbr_key(abbr: str) -> str:
+        """Get the lookup key of a degree abbreviation.
+
+        Dots, spaces and case are ignored, so ``B.Sc.``, ``BSc`` and ``b.sc``
+        share the key ``bsc``.
+        """
+        return abbr.replace(".", "").replace(" ", "").casefold()
 
     def validate_degree_type(self, degree_type: str | None) -> str | None:
         """Normalize and validate degree type.
@@ -37,7 +106,7 @@ class DegreeProvider:
         Raises:
             ValueError: If the degree type is not valid.
         """
-        degree_type = normalize_input(degree_type)
+        degree_type = normalize_choice(degree_type, self.valid_degree_types)
         if degree_type and degree_type not in self.valid_degree_types:
             # Find close matches to the input degree type
             suggestions = difflib.get_close_matches(
@@ -51,45 +120,106 @@ class DegreeProvider:
             raise ValueError(msg)
         return degree_type
 
-    def get_degrees(self, degree_type: str | None = None) -> list[dict]:
-        """Get a list of degrees filtered by degree type if specified.
+    def get_degrees(self, degree_type: str | None = None) -> list[Record]:
+        """Get the degrees filtered by degree type if specified.
 
         Args:
             degree_type (str | None, optional): The type of degree to filter by.
                                                 Defaults to None (any degree type).
 
         Returns:
-            list[dict]: A list of degree dictionaries.
+            list[Record]: A new list of degree records, copied from the cached
+                ``degrees_by_type`` bucket.
         """
-        degree_type = self.validate_degree_type(degree_type)
-        if degree_type:
-            return [
-                degree
-                for degree in self.degrees_data
-                if degree["degree_type"] == degree_type
-            ]
-        return self.degrees_data
+        return list(self.degrees_by_type[self.validate_degree_type(degree_type)])
 
     def get_degree_names(self, degree_type: str | None = None) -> list[str]:
-        """Get a list of degree names filtered by degree type if specified.
+        """Get the degree names filtered by degree type if specified.
 
         Args:
             degree_type (str | None, optional): The type of degree to filter by.
                                                 Defaults to None (any degree type).
 
         Returns:
-            list[str]: A list of degree names.
+            list[str]: A new list of degree names, copied from the cached
+                ``degree_names_by_type`` bucket.
         """
-        return [degree["name"] for degree in self.get_degrees(degree_type)]
+        return list(self.degree_names_by_type[self.validate_degree_type(degree_type)])
 
     def get_degree_abbrs(self, degree_type: str | None = None) -> list[str]:
-        """Get a list of degree abbreviations filtered by degree type if specified.
+        """Get the degree abbreviations filtered by degree type if specified.
+
+        Args:
+            degree_type (str | None, optional): The type of degree to filter by.
+                                                Defaults to None (any degree type).
+
+        Returns:
+            list[str]: A new list of degree abbreviations, copied from the
+                cached ``degree_abbrs_by_type`` bucket.
+        """
+        return list(self.degree_abbrs_by_type[self.validate_degree_type(degree_type)])
+
+    def get_degree_rows(
+        self, degree_type: str | None = None
+    ) -> tuple[tuple[str, ...], ...]:
+        """Get the degrees as tuple rows, optionally filtered by degree type.
+
+        The values of each row follow ``degree_columns``.
+
+        Args:
+            degree_type (str | None, optional): The type of degree to filter by.
+                                                Defaults to None (all degrees).
+
+        Returns:
+            tuple[tuple[str, ...], ...]: The precomputed degree rows.
+
+        Raises:
+            ValueError: If the degree type is not valid.
+        """
+        return self.degree_rows_by_type[self.validate_degree_type(degree_type)]
+
+    def degrees(self, n: int, degree_type: str | None = None) -> list[Record]:
+        """Get ``n`` random degrees filtered by degree type if specified.
+
+        Degrees are drawn independently, so a batch may contain repeats.
 
         Args:
+            n (int): The number of degrees to return.
             degree_type (str | None, optional): The type of degree to filter by.
                                                 Defaults to None (any degree type).
 
         Returns:
-            list[str]: A list of degree abbreviations.
+            list[Record]: A list of ``n`` random degree records.
+
+        Raises:
+            ValueError: If the degree type is not valid.
         """
-        return [degree["abbr"] for degree in self.get_degrees(degree_type)]
+        degrees = self.degrees_by_type[self.validate_degree_type(degree_type)]
+        return random.choices(degrees, k=n)
+
+    def get_degrees_by_abbr(self, abbr: str) -> tuple[Record, ...]:
+        """Get the degrees matching an abbreviation.
+
+        The lookup ignores dots, spaces and case, so ``BSc`` matches ``B.Sc.``.
+        Some abbreviations are shared by several degrees (e.g. ``DVM``).
+
+        Args:
+            abbr (str): The degree abbreviation.
+
+        Returns:
+            tuple[Record, ...]: The degrees matching the abbreviation.
+
+        Raises:
+            ValueError: If no degree matches the abbreviation.
+        """
+        try:
+            return self.degrees_by_abbr[self._abbr_key(abbr)]
+        except KeyError:
+            abbrs = self.degree_abbrs_by_type[None]
+            suggestions = difflib.get_close_matches(abbr, abbrs, n=3, cutoff=0.6)
+            msg = (
+                f"Invalid degree abbreviation: '{abbr}'. Did you mean: {', '.join(suggestions)}?"
+                if suggestions
+                else f"Invalid degree abbreviation: '{abbr}'."
+            )
+            raise ValueError(msg) from None
@@ -3,20 +3,27 @@
 import difflib
 import random
 import re
+from collections.abc import Callable
 
 from fakernaija.providers.name import NameProvider
-from fakernaija.utils import normalize_input
+from fakernaija.utils import normalize_choice, normalize_input
+
+EMAIL_REGEX = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
 
 
 class EmailProvider:
     """Provides functionality for generating email addresses with Nigerian names."""
 
-    def __init__(self) -> None:
+    def __init__(self, name_provider: NameProvider | None = None) -> None:
         """Initialize the EmailProvider.
 
         Initializes NameProvider and sets up email domains.
+
+        Args:
+            name_provider (NameProvider | None, optional): The provider of the
+                names. Defaults to None (a NameProvider of the bundled names).
         """
-        self.name_provider = NameProvider()
+        self.name_provider = name_provider or NameProvider()
         self.default_domains = [
             "gmail.com",
             "yahoo.com",
@@ -51,33 +58,30 @@ class EmailProvider:
         Returns:
             bool: True if the email address is valid, False otherwise.
         """
-        regex = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
-        return re.match(regex, email) is not None
+        return re.match(EMAIL_REGEX, email) is not None
 
-    def generate_email(
+    def validate_options(
         self,
         tribe: str | None = None,
         gender: str | None = None,
         domain: str | None = None,
-        name: str | None = None,
-    ) -> str:
-        """Generate a random email address with Nigerian names.
+    ) -> tuple[str | None, str | None, str | None]:
+        """Normalize and validate the tribe, gender and domain of an email.
 
         Args:
             tribe (str | None, optional): The ethnic group to filter by. Defaults to None.
             gender (str | None, optional): The gender to filter by. Defaults to None.
             domain (str | None, optional): The domain to use for the email. Defaults to None.
-            name (str | None, optional): The name to use for the email. Defaults to None.
 
         Returns:
-            str: The generated email address.
+            tuple[str | None, str | None, str | None]: The normalized tribe, gender and domain.
 
         Raises:
-            ValueError: If the domain is invalid or if no matching data is found for the given tribe or gender.
+            ValueError: If the tribe, gender or domain is invalid.
         """
         # Normalize the inputs
-        tribe = normalize_input(tribe)
-        gender = normalize_input(gender)
+        tribe = normalize_choice(tribe, self.name_provider.tribes)
+        gender = normalize_choice(gender, self.name_provider.genders)
         domain = normalize_input(domain)
 
         if tribe and tribe not in self.name_provider.tribes:
@@ -107,6 +111,31 @@ class EmailProvider:
             msg = f"Invalid domain: {domain}"
             raise ValueError(msg)
 
+        return tribe, gender, domain
+
+    def generate_email(
+        self,
+        tribe: str | None = None,
+        gender: str | None = None,
+        domain: str | None = None,
+        name: str | None = None,
+    ) -> str:
+        """Generate a random email address with Nigerian names.
+
+        Args:
+            tribe (str | None, optional): The ethnic group to filter by. Defaults to None.
+            gender (str | None, optional): The gender to filter by. Defaults to None.
+            domain (str | None, optional): The domain to use for the email. Defaults to None.
+            name (str | None, optional): The name to use for the email. Defaults to None.
+
+        Returns:
+            str: The generated email address.
+
+        Raises:
+            ValueError: If the domain is invalid or if no matching data is found for the given tribe or gender.
+        """
+        tribe, gender, domain = self.validate_options(tribe, gender, domain)
+
         if name:
             # If a name is provided, use it directly
             name_parts = name.lower().split()
@@ -154,3 +183,72 @@ class EmailProvider:
             raise ValueError(msg)
 
         return email
+
+    def compile_email(
+        self,
+        tribe: str | None = None,
+        gender: str | None = None,
+        domain: str | None = None,
+        name: str | None = None,
+    ) -> Callable[[], str]:
+        """Compile an email generator with the options validated once.
+
+        The returned callable generates emails like ``generate_email`` with
+        the same options, drawing from name pools filtered up front.
+
+        Args:
+            tribe (str | None, optional): The ethnic group to filter by. Defaults to None.
+            gender (str | None, optional): The gender to filter by. Defaults to None.
+            domain (str | None, optional): The domain to use for the email. Defaults to None.
+            name (str | None, optional): The name to use for the email. Defaults to None.
+
+        Returns:
+            Callable[[], str]: A zero-argument callable returning a random email address.
+
+        Raises:
+            ValueError: If the domain is invalid or if no matching data is found for the given tribe or gender.
+        """
+        tribe, gender, domain = self.validate_options(tribe, gender, domain)
+
+        if name:
+            name_parts = name.lower().split()
+            first_name = name_parts[0]
+            last_name = name_parts[-1] if len(name_parts) > 1 else ""
+            pools: tuple[tuple[tuple[str, ...], tuple[str, ...]], ...] = (
+                ((first_name,), (last_name,)),
+            )
+        else:
+            pools = tuple(
+                (
+                    tuple(first_name.lower() for first_name in first_names),
+                    tuple(last_name.lower() for last_name in last_names),
+                )
+                for first_names, last_names in self.name_provider.get_name_pools(
+                    tribe,
+                    gender,
+                )
+            )
+        domains = (domain,) if domain else tuple(self.default_domains)
+
+        choice = random.choice
+        rand = random.random
+        randrange = random.randrange
+        match_email = re.compile(EMAIL_REGEX).match
+        separators = (".", "")
+
+        def generate() -> str:
+            first_names, last_names = choice(pools)
+            names = (choice(first_names), choice(last_names))
+            # Either name first, with or without a dot: the four email formats
+            if rand() < 0.5:  # noqa: PLR2004
+                names = names[::-1]
+            local_part = choice(separators).join(names)
+            if rand() < 0.5:  # noqa: PLR2004
+                local_part = f"{local_part}{randrange(1, 10000)}"
+            email = f"{local_part}@{choice(domains)}"
+            if match_email(email) is None:
+                msg = f"Invalid email format generated: {email}"
+                raise ValueError(msg)
+            return email
+
+        return generate
@@ -4,9 +4,10 @@ Resource link: https://punchng.com/full-list-newly-restructured-programmes-in-ni
 """
 
 import difflib
+import random
 from pathlib import Path
 
-from fakernaija.utils import load_json
+from fakernaija.utils import distinct_values, load_json, row_value
 
 
 class FacultyProvider:
@@ -26,6 +27,49 @@ class FacultyProvider:
             ],
         )
         self.faculty_names = [faculty["name"] for faculty in self.faculties_data]
+        self.faculty_columns = ("faculty_name", "departments")
+        self.faculty_rows = tuple(
+            (faculty["name"], row_value(faculty["departments"]))
+            for faculty in self.faculties_data
+        )
+        self._build_indexes()
+
+    def _build_indexes(self) -> None:
+        """Build the department lookup indexes from the faculties data.
+
+        ``departments_by_faculty`` maps each casefolded faculty name to a
+        tuple of its departments, with the ``None`` key holding every
+        department. ``faculties_by_department`` maps each department to the
+        faculties offering it, as some departments exist in several faculties.
+        ``department_pools`` and ``faculty_name_pool`` hold each department of
+        a faculty and each faculty name once, for drawing session-unique
+        values without bias.
+        """
+        self._faculty_keys: dict[str, str] = {}
+        self.departments_by_faculty: dict[str | None, tuple[str, ...]] = {}
+        faculties_by_department: dict[str, list[str]] = {}
+        for faculty in self.faculties_data:
+            key = faculty["name"].casefold()
+            self._faculty_keys[key] = faculty["name"]
+            self.departments_by_faculty[key] = tuple(faculty["departments"])
+            for department in faculty["departments"]:
+                faculties_by_department.setdefault(department, []).append(
+                    faculty["name"],
+                )
+        self.departments_by_faculty[None] = tuple(
+            department
+            for faculty in self.faculties_data
+            for department in faculty["departments"]
+        )
+        self.department_pools = {
+            key: distinct_values(departments)
+            for key, departments in self.departments_by_faculty.items()
+        }
+        self.faculty_name_pool = distinct_values(self.faculty_names)
+        self.faculties_by_department = {
+            department: tuple(faculties)
+            for department, faculties in faculties_by_department.items()
+        }
 
     def get_faculty_names(self) -> list[str]:
         """Get a list of all faculty names.
@@ -35,6 +79,36 @@ class FacultyProvider:
         """
         return self.faculty_names
 
+    def validate_faculty(self, faculty: str | None) -> str | None:
+        """Validate a faculty name and return its lookup key.
+
+        Args:
+            faculty (str | None): The name of the faculty.
+
+        Returns:
+            str | None: The casefolded faculty name used as the key of
+                ``departments_by_faculty`` or None if no faculty is given.
+
+        Raises:
+            ValueError: If the faculty name is invalid.
+        """
+        if not faculty:
+            return None
+
+        key = faculty.casefold()
+        if key not in self._faculty_keys:
+            # Find close matches to the input faculty name
+            suggestions = difflib.get_close_matches(
+                faculty, self.faculty_names, n=3, cutoff=0.6
+            )
+            msg = (
+                f"Invalid faculty name: {faculty}. Did you mean: {', '.join(suggestions)}?"
+                if suggestions
+                else f"Invalid faculty name: {faculty}. Valid faculties are: {', '.join(self.faculty_names)}"
+            )
+            raise ValueError(msg)
+        return key
+
     def get_department_names(self, faculty: str | None = None) -> list[str]:
         """Get a list of department names. Optionally filter by faculty.
 
@@ -47,29 +121,47 @@ class FacultyProvider:
         Raises:
             ValueError: If the faculty name is invalid.
         """
-        if faculty and faculty is not None:
-            # Normalize faculty names for case-insensitive comparison
-            faculty_dict = {f.lower(): f for f in self.faculty_names}
-
-            if faculty.lower() not in faculty_dict:
-                # Find close matches to the input faculty name
-                suggestions = difflib.get_close_matches(
-                    faculty, self.faculty_names, n=3, cutoff=0.6
-                )
-                msg = (
-                    f"Invalid faculty name: {faculty}. Did you mean: {', '.join(suggestions)}?"
-                    if suggestions
-                    else f"Invalid faculty name: {faculty}. Valid faculties are: {', '.join(self.faculty_names)}"
-                )
-                raise ValueError(msg)
-
-            faculty_name = faculty_dict[faculty.lower()]
-            for fac in self.faculties_data:
-                if fac["name"] == faculty_name:
-                    return fac["departments"]
-
-        # Return all departments if no faculty is specified
-        departments = []
-        for fac in self.faculties_data:
-            departments.extend(fac["departments"])
-        return departments
+        return list(self.departments_by_faculty[self.validate_faculty(faculty)])
+
+    def department_names(self, n: int, faculty: str | None = None) -> list[str]:
+        """Get ``n`` random department names. Optionally filter by faculty.
+
+        Departments are drawn independently, so a batch may contain repeats.
+
+        Args:
+            n (int): The number of department names to return.
+            faculty (str, optional): The name of the faculty. Defaults to None.
+
+        Returns:
+            list[str]: A list of ``n`` random department names.
+
+        Raises:
+            ValueError: If the faculty name is invalid.
+        """
+        departments = self.departments_by_faculty[self.validate_faculty(faculty)]
+        return random.choices(departments, k=n)
+
+    def get_faculty_names_by_department(self, department: str) -> tuple[str, ...]:
+        """Get the names of the faculties offering a department.
+
+        Args:
+            department (str): The name of the department.
+
+        Returns:
+            tuple[str, ...]: The names of the faculties offering the department.
+
+        Raises:
+            ValueError: If the department name is invalid.
+        """
+        try:
+            return self.faculties_by_department[department]
+        except KeyError:
+            suggestions = difflib.get_close_matches(
+                department, self.faculties_by_department, n=3, cutoff=0.6
+            )
+            msg = (
+                f"Invalid department name: {department}. Did you mean: {', '.join(suggestions)}?"
+                if suggestions
+                else f"Invalid department name: {department}."
+            )
+            raise ValueError(msg) from None
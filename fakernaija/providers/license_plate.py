@@ -2,7 +2,9 @@
 
 import difflib
 import random
+from collections.abc import Callable
 from pathlib import Path
+from string import ascii_uppercase
 
 from fakernaija.providers.state import StateProvider
 from fakernaija.utils import load_json, normalize_input
@@ -30,15 +32,15 @@ class LicensePlateProvider:
         self.state_names = self.state_provider.get_state_names()
         self.lga_codes = self.state_provider.get_lga_codes()
 
-    def generate_license_plate(self, state: str | None = None) -> str:
-        """Generate a random Nigerian license plate.
+    def get_plate_codes(self, state: str | None = None) -> list[str]:
+        """Get the LGA codes used as license plate prefixes.
 
         Args:
-            state (str | None, optional): The name of the state for which to
-                generate the license plate. Defaults to None.
+            state (str | None, optional): The name of the state to get the
+                LGA codes of. Defaults to None (all states).
 
         Returns:
-            str: A randomly generated Nigerian license plate.
+            list[str]: The LGA codes of the state or of all states.
 
         Raises:
             ValueError: If the state name is invalid.
@@ -61,13 +63,49 @@ class LicensePlateProvider:
                 )
                 raise ValueError(msg)
             # Use the correctly cased state name to access LGA codes
-            state_name = state_dict[state.lower()]
-            lga_code = random.choice(self.lga_codes[state_name])
-        else:
-            # Randomly choose an LGA code from all available ones if no state is specified
-            all_lgas = [code for codes in self.lga_codes.values() for code in codes]
-            lga_code = random.choice(all_lgas)
+            return self.lga_codes[state_dict[state.lower()]]
+
+        # All available LGA codes if no state is specified
+        return [code for codes in self.lga_codes.values() for code in codes]
+
+    def generate_license_plate(self, state: str | None = None) -> str:
+        """Generate a random Nigerian license plate.
+
+        Args:
+            state (str | None, optional): The name of the state for which to
+                generate the license plate. Defaults to None.
+
+        Returns:
+            str: A randomly generated Nigerian license plate.
 
+        Raises:
+            ValueError: If the state name is invalid.
+        """
+        lga_code = random.choice(self.get_plate_codes(state))
         digits = "".join(random.choices("0123456789", k=3))
         letters = "".join(random.choices("ABCDEFGHIJKLMNOPQRSTUVWXYZ", k=2))
         return f"{lga_code}-{digits}{letters}"
+
+    def compile_license_plate(self, state: str | None = None) -> Callable[[], str]:
+        """Compile a license plate generator with the state validated once.
+
+        Args:
+            state (str | None, optional): The name of the state for which to
+                generate license plates. Defaults to None.
+
+        Returns:
+            Callable[[], str]: A zero-argument callable returning a random
+                license plate.
+
+        Raises:
+            ValueError: If the state name is invalid.
+        """
+        lga_codes = tuple(self.get_plate_codes(state))
+        choice = random.choice
+        randrange = random.randrange
+        letter_pairs = tuple(a + b for a in ascii_uppercase for b in ascii_uppercase)
+
+        def generate() -> str:
+            return f"{choice(lga_codes)}-{randrange(1000):03d}{choice(letter_pairs)}"
+
+        return generate
@@ -1,31 +1,419 @@
 """This module provides a NameProvider class for generating Nigerian name combinations."""
 
+import base64
+import contextlib
 import difflib
+import functools
+import json
 import random
+from array import array
+from collections.abc import Callable, Iterable, Mapping
+from itertools import compress
 from pathlib import Path
+from typing import Any
 
-from fakernaija.utils import load_json, normalize_input
+from fakernaija.backends import Backend
+from fakernaija.utils import (
+    distinct_values,
+    iter_records,
+    load_json,
+    normalize_choice,
+    normalize_input,
+)
+
+NAME_FILE_SUFFIXES = (".jsonl", ".ndjson", ".csv", ".json")
+NAME_INDEX_FILENAME = "names.index.json"
+NAME_INDEX_VERSION = 2
+MAX_CATEGORIES = 256
 
 
 class NameProvider:
     """Provides functionality for generating names based on tribe and gender."""
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        first_names: Iterable[Mapping[str, Any]] | None = None,
+        last_names: Iterable[Mapping[str, Any]] | None = None,
+        backend: Backend | None = None,
+    ) -> None:
         """Initialize the NameProvider.
 
-        Sets the path to the directory containing name data files.
+        Sets the path to the directory containing name data files. With a
+        ``backend``, names are queried from the backend instead of being held
+        in memory: name pools are loaded per filter on first use, and single
+        names are sampled without loading a pool.
+
+        Args:
+            first_names (Iterable[Mapping[str, Any]] | None, optional): First
+                name records with ``tribe``, ``gender`` and ``name`` keys.
+                Defaults to None (the bundled first names).
+            last_names (Iterable[Mapping[str, Any]] | None, optional): Last
+                name records with ``tribe`` and ``name`` keys. Defaults to
+                None (the bundled last names).
+            backend (Backend | None, optional): The backend to query the names
+                from. Defaults to None (the name records).
+
+        Raises:
+            ValueError: If both name records and a backend are given.
         """
         self.data_path = Path(__file__).parent.parent / "data" / "names"
-        self.first_names = load_json(
-            self.data_path / "first_names.json",
-            ["tribe", "gender", "name"],
-        )
-        self.last_names = load_json(
-            self.data_path / "last_names.json",
-            ["tribe", "name"],
-        )
         self.tribes = ["yoruba", "igbo", "hausa", "edo", "fulani", "ijaw"]
         self.genders = ["male", "female"]
+        self.backend = backend
+        if backend is not None:
+            if first_names is not None or last_names is not None:
+                msg = "Pass either name records or a backend, not both."
+                raise ValueError(msg)
+            first_names = last_names = ()
+        if first_names is None:
+            first_names = load_json(
+                self.data_path / "first_names.json",
+                ["tribe", "gender", "name"],
+            )
+        if last_names is None:
+            last_names = load_json(
+                self.data_path / "last_names.json",
+                ["tribe", "name"],
+            )
+        self._build_columns(first_names, last_names)
+        if backend is not None:
+            self._add_backend_categories(backend)
+        self._first_name_pools: dict[
+            tuple[str | None, str | None], tuple[str, ...]
+        ] = {}
+        self._last_name_pools: dict[str | None, tuple[str, ...]] = {}
+        self.prefix_pools = {
+            (title, gender): distinct_values(self.generate_prefixes(title, gender))
+            for title in (None, "professional", "traditional")
+            for gender in (None, "male", "female")
+        }
+
+    @classmethod
+    def from_files(
+        cls,
+        first_names: str | Path,
+        last_names: str | Path,
+        index: str | Path | None = None,
+    ) -> "NameProvider":
+        """Create a NameProvider from custom name files.
+
+        The files are JSON Lines, CSV or JSON files (see ``utils.iter_records``)
+        with the same keys as the bundled data. JSON Lines and CSV files are
+        streamed, so only the compact name columns are kept in memory. Tribes
+        and genders found in the files are supported without code changes.
+
+        If an ``index`` path is given, the built columns are saved there and
+        reused by later calls as long as the name files are unchanged. An
+        invalid index is rebuilt, and an index that cannot be written is
+        skipped.
+
+        Args:
+            first_names (str | Path): The first names file, with ``tribe``,
+                ``gender`` and ``name`` keys.
+            last_names (str | Path): The last names file, with ``tribe`` and
+                ``name`` keys.
+            index (str | Path | None, optional): The path of the persisted
+                index. Defaults to None (no index).
+
+        Returns:
+            NameProvider: A provider generating names from the files.
+
+        Raises:
+            FileNotFoundError: If a name file is not found.
+            ValueError: If a name file is not valid.
+
+        Examples:
+            .. code-block:: python
+
+                >>> from fakernaija.providers import NameProvider
+                >>> provider = NameProvider.from_files(
+                ...     "corpus/first_names.jsonl",
+                ...     "corpus/last_names.csv",
+                ...     index="corpus/names.index.json",
+                ... )
+                >>> provider.generate_full_name(tribe="tiv")
+                'Terver Akaa'
+        """
+        sources = {
+            "first_names": cls._source_stamp(first_names),
+            "last_names": cls._source_stamp(last_names),
+        }
+        if index is not None:
+            provider = cls._load_index(Path(index), sources)
+            if provider is not None:
+                return provider
+
+        provider = cls(
+            iter_records(first_names, ["tribe", "gender", "name"]),
+            iter_records(last_names, ["tribe", "name"]),
+        )
+        if index is not None:
+            # The index is a cache: an unwritable location only skips it
+            with contextlib.suppress(OSError):
+                provider.save_index(index, sources)
+        return provider
+
+    @classmethod
+    def from_dir(cls, data_dir: str | Path) -> "NameProvider":
+        """Create a NameProvider from the name files of a directory.
+
+        The directory holds a ``first_names`` and a ``last_names`` file, each
+        with a ``.jsonl``, ``.ndjson``, ``.csv`` or ``.json`` extension. The
+        built index is persisted in the directory as ``NAME_INDEX_FILENAME``.
+
+        Args:
+            data_dir (str | Path): The directory of the name files.
+
+        Returns:
+            NameProvider: A provider generating names from the files.
+
+        Raises:
+            FileNotFoundError: If the directory has no first or last names file.
+            ValueError: If a name file is not valid.
+        """
+        data_dir = Path(data_dir)
+        paths = []
+        for stem in ["first_names", "last_names"]:
+            candidates = [data_dir / f"{stem}{suffix}" for suffix in NAME_FILE_SUFFIXES]
+            path = next((path for path in candidates if path.is_file()), None)
+            if path is None:
+                msg = f"File not found: {stem} file in {data_dir}. Expected one of: {', '.join(p.name for p in candidates)}"
+                raise FileNotFoundError(msg)
+            paths.append(path)
+        first_names, last_names = paths
+        return cls.from_files(
+            first_names,
+            last_names,
+            index=data_dir / NAME_INDEX_FILENAME,
+        )
+
+    @staticmethod
+    def _source_stamp(path: str | Path) -> dict[str, Any]:
+        """Identify the version of a name file by its path, size and mtime."""
+        path = Path(path)
+        if not path.is_file():
+            msg = f"File not found: {path}"
+            raise FileNotFoundError(msg)
+        stat = path.stat()
+        return {
+            "path": str(path.resolve()),
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+        }
+
+    def save_index(
+        self,
+        path: str | Path,
+        sources: Mapping[str, Any] | None = None,
+    ) -> None:
+        """Persist the name columns to a JSON index file.
+
+        Args:
+            path (str | Path): The path of the index file.
+            sources (Mapping[str, Any] | None, optional): The stamps of the
+                name files the columns were built from, checked when loading.
+                Defaults to None.
+        """
+        index = {
+            "version": NAME_INDEX_VERSION,
+            "sources": sources or {},
+            "tribes": self.tribes,
+            "genders": self.genders,
+            "first_names": {
+                "values": self.first_name_values,
+                "tribes": base64.b64encode(self.first_name_tribes).decode("ascii"),
+                "genders": base64.b64encode(self.first_name_genders).decode("ascii"),
+            },
+            "last_names": {
+                "values": self.last_name_values,
+                "tribes": base64.b64encode(self.last_name_tribes).decode("ascii"),
+            },
+        }
+        with Path(path).open("w", encoding="utf-8") as file:
+            json.dump(index, file, ensure_ascii=False)
+
+    @classmethod
+    def _load_index(
+        cls,
+        path: Path,
+        sources: Mapping[str, Any],
+    ) -> "NameProvider | None":
+        """Load the name columns of an index, or None if it is missing, stale or invalid."""
+        try:
+            with path.open(encoding="utf-8") as file:
+                index = json.load(file)
+        except (OSError, json.JSONDecodeError):
+            return None
+        if (
+            not isinstance(index, dict)
+            or index.get("version") != NAME_INDEX_VERSION
+            or index.get("sources") != sources
+        ):
+            return None
+
+        provider = cls((), ())
+        try:
+            provider.tribes = list(index["tribes"])
+            provider.genders = list(index["genders"])
+            provider.first_name_values = tuple(index["first_names"]["values"])
+            provider.first_name_tribes = array(
+                "B",
+                base64.b64decode(index["first_names"]["tribes"], validate=True),
+            )
+            provider.first_name_genders = array(
+                "B",
+                base64.b64decode(index["first_names"]["genders"], validate=True),
+            )
+            provider.last_name_values = tuple(index["last_names"]["values"])
+            provider.last_name_tribes = array(
+                "B",
+                base64.b64decode(index["last_names"]["tribes"], validate=True),
+            )
+        except (KeyError, TypeError, ValueError):
+            return None
+        if not provider._valid_columns():
+            return None
+        return provider
+
+    def _valid_columns(self) -> bool:
+        """Check that the name columns are consistent, e.g. after loading an index."""
+        return (
+            all(isinstance(tribe, str) for tribe in self.tribes)
+            and all(isinstance(gender, str) for gender in self.genders)
+            and all(isinstance(name, str) for name in self.first_name_values)
+            and all(isinstance(name, str) for name in self.last_name_values)
+            and len(self.first_name_values)
+            == len(self.first_name_tribes)
+            == len(self.first_name_genders)
+            and len(self.last_name_values) == len(self.last_name_tribes)
+            and max(self.first_name_tribes + self.last_name_tribes, default=0)
+            < len(self.tribes)
+            and max(self.first_name_genders, default=0) < len(self.genders)
+        )
+
+    def _build_columns(
+        self,
+        first_names: Iterable[Mapping[str, Any]],
+        last_names: Iterable[Mapping[str, Any]],
+    ) -> None:
+        """Encode the name records as compact parallel columns in a single pass.
+
+        Names are stored as deduplicated strings, and tribes and genders as
+        one-byte codes indexing ``tribes`` and ``genders``, instead of one
+        dict per name. Tribes and genders found in the data are added to
+        ``tribes`` and ``genders``. The filtered pools are computed on first
+        use and cached.
+        """
+        strings: dict[str, str] = {}
+        tribe_codes = {tribe: code for code, tribe in enumerate(self.tribes)}
+        gender_codes = {gender: code for code, gender in enumerate(self.genders)}
+
+        first_name_values = []
+        self.first_name_tribes = array("B")
+        self.first_name_genders = array("B")
+        for name in first_names:
+            first_name_values.append(strings.setdefault(name["name"], name["name"]))
+            self.first_name_tribes.append(
+                self._encode(self.tribes, tribe_codes, name["tribe"]),
+            )
+            self.first_name_genders.append(
+                self._encode(self.genders, gender_codes, name["gender"]),
+            )
+        self.first_name_values = tuple(first_name_values)
+        del first_name_values
+
+        last_name_values = []
+        self.last_name_tribes = array("B")
+        for name in last_names:
+            last_name_values.append(strings.setdefault(name["name"], name["name"]))
+            self.last_name_tribes.append(
+                self._encode(self.tribes, tribe_codes, name["tribe"]),
+            )
+        self.last_name_values = tuple(last_name_values)
+
+    def _add_backend_categories(self, backend: Backend) -> None:
+        """Add the tribes and genders found in the backend."""
+        for categories, values in [
+            (self.tribes, backend.distinct("first_names", "tribe")),
+            (self.tribes, backend.distinct("last_names", "tribe")),
+            (self.genders, backend.distinct("first_names", "gender")),
+        ]:
+            codes = {category: code for code, category in enumerate(categories)}
+            for value in values:
+                self._encode(categories, codes, value)
+
+    @staticmethod
+    def _encode(categories: list[str], codes: dict[str, int], category: str) -> int:
+        """Get the code of a category, adding new categories to ``categories``.
+
+        Categories are normalized like the tribe and gender arguments, so a
+        corpus tribe such as ``Édo`` is selected with ``edo``.
+        """
+        code = codes.get(category)
+        if code is None:
+            category = normalize_input(category) or category.strip().lower()
+            code = codes.get(category)
+        if code is None:
+            if len(categories) == MAX_CATEGORIES:
+                msg = f"Too many categories: {category}. At most {MAX_CATEGORIES} tribes or genders are supported."
+                raise ValueError(msg)
+            code = codes[category] = len(categories)
+            categories.append(category)
+        return code
+
+    def validate_tribe(self, tribe: str | None) -> str | None:
+        """Normalize and validate a tribe.
+
+        Canonical values (a supported tribe or None) are returned as is, so
+        values validated once can be passed to nested calls without being
+        normalized again.
+
+        Args:
+            tribe (str | None): The tribe to validate.
+
+        Returns:
+            str | None: The canonical tribe or None if no tribe is given.
+
+        Raises:
+            ValueError: If the tribe is not supported.
+        """
+        tribe = normalize_choice(tribe, self.tribes)
+        if tribe and tribe not in self.tribes:
+            suggestions = difflib.get_close_matches(tribe, self.tribes, n=3, cutoff=0.6)
+            msg = (
+                f"Unsupported tribe: {tribe}. Did you mean: {', '.join(suggestions)}?"
+                if suggestions
+                else f"Unsupported tribe: {tribe}. Supported values are: {', '.join(self.tribes)}"
+            )
+            raise ValueError(msg)
+        return tribe
+
+    def validate_gender(self, gender: str | None) -> str | None:
+        """Normalize and validate a gender.
+
+        Canonical values (a supported gender or None) are returned as is.
+
+        Args:
+            gender (str | None): The gender to validate.
+
+        Returns:
+            str | None: The canonical gender or None if no gender is given.
+
+        Raises:
+            ValueError: If the gender is not supported.
+        """
+        gender = normalize_choice(gender, self.genders)
+        if gender and gender not in self.genders:
+            suggestions = difflib.get_close_matches(
+                gender, self.genders, n=3, cutoff=0.6
+            )
+            msg = (
+                f"Unsupported gender: {gender}. Did you mean: {', '.join(suggestions)}?"
+                if suggestions
+                else f"Unsupported gender: {gender}. Supported values are: {', '.join(self.genders)}"
+            )
+            raise ValueError(msg)
+        return gender
 
     def get_first_names(
         self,
@@ -44,22 +432,30 @@ class NameProvider:
         Raises:
             ValueError: If the specified tribe or gender is not supported.
         """
-        tribe = normalize_input(tribe)
-        gender = normalize_input(gender)
-
-        if tribe and tribe not in self.tribes:
-            msg = f"Unsupported tribe: {tribe}. Supported values are: {', '.join(self.tribes)}"
-            raise ValueError(msg)
-
-        if gender and gender not in self.genders:
-            msg = f"Unsupported gender: {gender}. Supported values are: {', '.join(self.genders)}"
-            raise ValueError(msg)
+        tribe = self.validate_tribe(tribe)
+        gender = self.validate_gender(gender)
+        if self.backend is not None:
+            return [
+                name.to_dict()
+                for name in self.backend.select(
+                    "first_names", tribe=tribe, gender=gender
+                )
+            ]
 
         return [
-            name
-            for name in self.first_names
-            if (tribe is None or name["tribe"] == tribe)
-            and (gender is None or name["gender"] == gender)
+            {
+                "tribe": self.tribes[tribe_code],
+                "gender": self.genders[gender_code],
+                "name": name,
+            }
+            for name, tribe_code, gender_code in zip(
+                self.first_name_values,
+                self.first_name_tribes,
+                self.first_name_genders,
+                strict=True,
+            )
+            if (tribe is None or self.tribes[tribe_code] == tribe)
+            and (gender is None or self.genders[gender_code] == gender)
         ]
 
     def get_last_names(self, tribe: str | None = None) -> list[dict[str, str]]:
@@ -74,16 +470,102 @@ class NameProvider:
         Raises:
             ValueError: If the specified tribe is not supported.
         """
-        tribe = normalize_input(tribe)
-
-        if tribe and tribe not in self.tribes:
-            msg = f"Unsupported tribe: {tribe}. Supported tribes are: {', '.join(self.tribes)}"
-            raise ValueError(msg)
+        tribe = self.validate_tribe(tribe)
+        if self.backend is not None:
+            return [
+                name.to_dict()
+                for name in self.backend.select("last_names", tribe=tribe)
+            ]
 
         return [
-            name for name in self.last_names if tribe is None or name["tribe"] == tribe
+            {"tribe": self.tribes[tribe_code], "name": name}
+            for name, tribe_code in zip(
+                self.last_name_values,
+                self.last_name_tribes,
+                strict=True,
+            )
+            if tribe is None or self.tribes[tribe_code] == tribe
         ]
 
+    def get_first_name_values(
+        self,
+        tribe: str | None = None,
+        gender: str | None = None,
+    ) -> tuple[str, ...]:
+        """Get the first names matching the filters as a cached pool of strings.
+
+        Args:
+            tribe (str | None, optional): The ethnic group to filter by. Defaults to None.
+            gender (str | None, optional): The gender to filter by. Defaults to None.
+
+        Returns:
+            tuple[str, ...]: The matching first names.
+
+        Raises:
+            ValueError: If the specified tribe or gender is not supported.
+        """
+        tribe = self.validate_tribe(tribe)
+        gender = self.validate_gender(gender)
+        pool = self._first_name_pools.get((tribe, gender))
+        if pool is None and self.backend is not None:
+            pool = self.backend.values(
+                "first_names", "name", tribe=tribe, gender=gender
+            )
+            self._first_name_pools[tribe, gender] = pool
+        if pool is None:
+            selectors = [
+                (codes, categories.index(value))
+                for codes, categories, value in [
+                    (self.first_name_tribes, self.tribes, tribe),
+                    (self.first_name_genders, self.genders, gender),
+                ]
+                if value is not None
+            ]
+            pool = self._select(self.first_name_values, selectors)
+            self._first_name_pools[tribe, gender] = pool
+        return pool
+
+    def get_last_name_values(self, tribe: str | None = None) -> tuple[str, ...]:
+        """Get the last names matching the filter as a cached pool of strings.
+
+        Args:
+            tribe (str | None, optional): The ethnic group to filter by. Defaults to None.
+
+        Returns:
+            tuple[str, ...]: The matching last names.
+
+        Raises:
+            ValueError: If the specified tribe is not supported.
+        """
+        tribe = self.validate_tribe(tribe)
+        pool = self._last_name_pools.get(tribe)
+        if pool is None and self.backend is not None:
+            pool = self.backend.values("last_names", "name", tribe=tribe)
+            self._last_name_pools[tribe] = pool
+        if pool is None:
+            selectors = (
+                [(self.last_name_tribes, self.tribes.index(tribe))] if tribe else []
+            )
+            pool = self._select(self.last_name_values, selectors)
+            self._last_name_pools[tribe] = pool
+        return pool
+
+    @staticmethod
+    def _select(
+        values: tuple[str, ...],
+        selectors: list[tuple[array, int]],
+    ) -> tuple[str, ...]:
+        """Select the values whose codes match every ``(codes, code)`` selector."""
+        if not selectors:
+            return values
+        mask = [True] * len(values)
+        for codes, code in selectors:
+            mask = [
+                selected and value_code == code
+                for selected, value_code in zip(mask, codes, strict=True)
+            ]
+        return tuple(compress(values, mask))
+
     def generate_first_name(
         self,
         tribe: str | None = None,
@@ -101,34 +583,20 @@ class NameProvider:
         Raises:
             ValueError: If the specified tribe or gender is not supported or if no names are available.
         """
-        tribe = normalize_input(tribe)
-        gender = normalize_input(gender)
-
-        if tribe and tribe not in self.tribes:
-            suggestions = difflib.get_close_matches(tribe, self.tribes, n=3, cutoff=0.6)
-            msg = (
-                f"Unsupported tribe: {tribe}. Did you mean: {', '.join(suggestions)}?"
-                if suggestions
-                else f"Unsupported tribe: {tribe}. Supported values are: {', '.join(self.tribes)}"
-            )
-            raise ValueError(msg)
-
-        if gender and gender not in self.genders:
-            suggestions = difflib.get_close_matches(
-                gender, self.genders, n=3, cutoff=0.6
-            )
-            msg = (
-                f"Unsupported gender: {gender}. Did you mean: {', '.join(suggestions)}?"
-                if suggestions
-                else f"Unsupported gender: {gender}. Supported values are: {', '.join(self.genders)}"
-            )
-            raise ValueError(msg)
-
-        first_names = self.get_first_names(tribe, gender)
+        tribe = self.validate_tribe(tribe)
+        gender = self.validate_gender(gender)
+        if self.backend is not None and (tribe, gender) not in self._first_name_pools:
+            names = self.backend.sample("first_names", 1, tribe=tribe, gender=gender)
+            if not names:
+                msg = "No first names available for the specified criteria."
+                raise ValueError(msg)
+            return names[0]["name"]
+
+        first_names = self.get_first_name_values(tribe, gender)
         if not first_names:
             msg = "No first names available for the specified criteria."
             raise ValueError(msg)
-        return random.choice(first_names)["name"]
+        return random.choice(first_names)
 
     def generate_last_name(self, tribe: str | None = None) -> str:
         """Generate a random last name optionally from a specific tribe.
@@ -142,22 +610,19 @@ class NameProvider:
         Raises:
             ValueError: If the specified tribe is not supported or if no names are available.
         """
-        tribe = normalize_input(tribe)
-
-        if tribe and tribe not in self.tribes:
-            suggestions = difflib.get_close_matches(tribe, self.tribes, n=3, cutoff=0.6)
-            msg = (
-                f"Unsupported tribe: {tribe}. Did you mean: {', '.join(suggestions)}?"
-                if suggestions
-                else f"Unsupported tribe: {tribe}. Supported values are: {', '.join(self.tribes)}"
-            )
-            raise ValueError(msg)
-
-        last_names = self.get_last_names(tribe)
+        tribe = self.validate_tribe(tribe)
+        if self.backend is not None and tribe not in self._last_name_pools:
+            names = self.backend.sample("last_names", 1, tribe=tribe)
+            if not names:
+                msg = "No last names available for the specified criteria."
+                raise ValueError(msg)
+            return names[0]["name"]
+
+        last_names = self.get_last_name_values(tribe)
         if not last_names:
             msg = "No last names available for the specified criteria."
             raise ValueError(msg)
-        return random.choice(last_names)["name"]
+        return random.choice(last_names)
 
     def generate_full_name(
         self,
@@ -176,44 +641,159 @@ class NameProvider:
             str: A random full name.
 
         Raises:
-            ValueError: If the specified tribe or gender is not supported or if no names are available.
+            ValueError: If the specified tribe or gender is not supported, if no
+                names are available or if a middle name is requested and the
+                tribe has a single distinct first name.
         """
-        tribe = normalize_input(tribe)
-        gender = normalize_input(gender)
-
-        if gender and gender not in self.genders:
-            suggestions = difflib.get_close_matches(
-                gender, self.genders, n=3, cutoff=0.6
-            )
-            msg = (
-                f"Unsupported gender: {gender}. Did you mean: {', '.join(suggestions)}?"
-                if suggestions
-                else f"Unsupported gender: {gender}. Supported values are: {', '.join(self.genders)}"
-            )
-            raise ValueError(msg)
-
-        if tribe is None:
-            tribe = random.choice(self.tribes)
-        elif tribe not in self.tribes:
-            suggestions = difflib.get_close_matches(tribe, self.tribes, n=3, cutoff=0.6)
-            msg = (
-                f"Unsupported tribe: {tribe}. Did you mean: {', '.join(suggestions)}?"
-                if suggestions
-                else f"Unsupported tribe: {tribe}. Supported values are: {', '.join(self.tribes)}"
-            )
-            raise ValueError(msg)
+        gender = self.validate_gender(gender)
+        tribe = self.validate_tribe(tribe) or random.choice(self.tribes)
 
+        # The tribe and gender are canonical from here on, so the nested
+        # calls below skip normalization
         first_name = self.generate_first_name(tribe, gender)
         last_name = self.generate_last_name(tribe)
 
         if middle_name:
             optional_middle_name = self.generate_first_name(tribe, gender)
-            while optional_middle_name == first_name:
-                optional_middle_name = self.generate_first_name(tribe, gender)
+            if optional_middle_name == first_name:
+                other_names = [
+                    name
+                    for name in self.get_first_name_values(tribe, gender)
+                    if name != first_name
+                ]
+                if not other_names:
+                    msg = "At least two distinct first names are needed for a middle name."
+                    raise ValueError(msg)
+                optional_middle_name = random.choice(other_names)
             return f"{first_name} {optional_middle_name} {last_name}"
 
         return f"{first_name} {last_name}"
 
+    def compile_first_name(
+        self,
+        tribe: str | None = None,
+        gender: str | None = None,
+    ) -> Callable[[], str]:
+        """Compile a first name generator with the filters applied once.
+
+        Args:
+            tribe (str | None, optional): The tribe name. Defaults to None.
+            gender (str | None, optional): The gender of the name. Defaults to None.
+
+        Returns:
+            Callable[[], str]: A zero-argument callable returning a random first name.
+
+        Raises:
+            ValueError: If the specified tribe or gender is not supported or if no names are available.
+        """
+        first_names = self.get_first_name_values(tribe, gender)
+        if not first_names:
+            msg = "No first names available for the specified criteria."
+            raise ValueError(msg)
+        return functools.partial(random.choice, first_names)
+
+    def compile_last_name(self, tribe: str | None = None) -> Callable[[], str]:
+        """Compile a last name generator with the filter applied once.
+
+        Args:
+            tribe (str | None, optional): The tribe name. Defaults to None.
+
+        Returns:
+            Callable[[], str]: A zero-argument callable returning a random last name.
+
+        Raises:
+            ValueError: If the specified tribe is not supported or if no names are available.
+        """
+        last_names = self.get_last_name_values(tribe)
+        if not last_names:
+            msg = "No last names available for the specified criteria."
+            raise ValueError(msg)
+        return functools.partial(random.choice, last_names)
+
+    def get_name_pools(
+        self,
+        tribe: str | None = None,
+        gender: str | None = None,
+    ) -> tuple[tuple[tuple[str, ...], tuple[str, ...]], ...]:
+        """Get the first and last name pools of each tribe matching the filters.
+
+        Full names and emails draw both names from the same tribe, so the
+        pools are grouped by tribe. Tribes without names for the filters are
+        left out when no tribe is specified.
+
+        Args:
+            tribe (str | None, optional): The tribe name. Defaults to None (all tribes).
+            gender (str | None, optional): The gender of the first names. Defaults to None.
+
+        Returns:
+            tuple: A ``(first_names, last_names)`` pair of tuples per tribe.
+
+        Raises:
+            ValueError: If the specified tribe or gender is not supported or if no names are available.
+        """
+        tribe = self.validate_tribe(tribe)
+        gender = self.validate_gender(gender)
+
+        pools = []
+        for pool_tribe in [tribe] if tribe else self.tribes:
+            first_names = self.get_first_name_values(pool_tribe, gender)
+            last_names = self.get_last_name_values(pool_tribe)
+            if first_names and last_names:
+                pools.append((first_names, last_names))
+        if not pools:
+            msg = f"No matching data found for tribe: {tribe} or gender: {gender}"
+            raise ValueError(msg)
+        return tuple(pools)
+
+    def compile_full_name(
+        self,
+        tribe: str | None = None,
+        gender: str | None = None,
+        middle_name: bool = False,
+    ) -> Callable[[], str]:
+        """Compile a full name generator with the filters applied once.
+
+        Args:
+            tribe (str | None, optional): The tribe name. Defaults to None.
+            gender (str | None, optional): The gender of the name. Defaults to None.
+            middle_name (bool, optional): Whether to include a middle name. Defaults to False.
+
+        Returns:
+            Callable[[], str]: A zero-argument callable returning a random full name.
+
+        Raises:
+            ValueError: If the specified tribe or gender is not supported, if no
+                names are available or if a middle name is requested and no
+                tribe has two distinct first names.
+        """
+        pools = self.get_name_pools(tribe, gender)
+        choice = random.choice
+
+        if middle_name:
+            # The first and middle names are two different names of a tribe
+            middle_name_pools = tuple(
+                (distinct_first_names, last_names)
+                for first_names, last_names in pools
+                if len(distinct_first_names := distinct_values(first_names)) > 1
+            )
+            if not middle_name_pools:
+                msg = "At least two distinct first names are needed for a middle name."
+                raise ValueError(msg)
+            sample = random.sample
+
+            def generate_with_middle_name() -> str:
+                first_names, last_names = choice(middle_name_pools)
+                first_name, optional_middle_name = sample(first_names, 2)
+                return f"{first_name} {optional_middle_name} {choice(last_names)}"
+
+            return generate_with_middle_name
+
+        def generate() -> str:
+            first_names, last_names = choice(pools)
+            return f"{choice(first_names)} {choice(last_names)}"
+
+        return generate
+
     def generate_prefixes(
         self,
         title: str | None,
@@ -224,14 +804,7 @@ class NameProvider:
         Raises:
             ValueError: If an invalid gender or title is provided.
         """
-        if title not in {None, "professional", "traditional"}:
-            msg = f"Invalid title '{title}'. Must be 'professional' or 'traditional'."
-            raise ValueError(msg)
-
-        if gender not in {None, "male", "female"}:
-            msg = f"Invalid gender '{gender}'. Must be 'male' or 'female'."
-            raise ValueError(msg)
-
+        self._validate_prefix_filters(title, gender)
         if title == "professional":
             return [
                 "Prof.",
@@ -245,6 +818,34 @@ class NameProvider:
             return self.get_traditional_prefixes(gender)
         return self.get_general_prefixes(gender)
 
+    def get_prefix_pool(
+        self,
+        title: str | None,
+        gender: str | None,
+    ) -> tuple[str, ...]:
+        """Get the distinct prefixes for a title and gender, built once at load.
+
+        Raises:
+            ValueError: If an invalid gender or title is provided.
+        """
+        self._validate_prefix_filters(title, gender)
+        return self.prefix_pools[title, gender]
+
+    @staticmethod
+    def _validate_prefix_filters(title: str | None, gender: str | None) -> None:
+        """Validate the title and gender of a prefix.
+
+        Raises:
+            ValueError: If an invalid gender or title is provided.
+        """
+        if title not in {None, "professional", "traditional"}:
+            msg = f"Invalid title '{title}'. Must be 'professional' or 'traditional'."
+            raise ValueError(msg)
+
+        if gender not in {None, "male", "female"}:
+            msg = f"Invalid gender '{gender}'. Must be 'male' or 'female'."
+            raise ValueError(msg)
+
     def get_traditional_prefixes(self, gender: str | None) -> list[str]:
         """Helper method to get traditional prefixes based on gender."""
         male_prefixes = [
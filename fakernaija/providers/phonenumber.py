@@ -2,6 +2,7 @@
 
 import difflib
 import random
+from collections.abc import Callable, Iterable
 
 
 class PhoneNumberProvider:
@@ -31,6 +32,78 @@ class PhoneNumberProvider:
         self.all_prefixes = [
             prefix for prefixes in self.network_prefixes.values() for prefix in prefixes
         ]
+        self._build_prefix_index()
+
+    def _build_prefix_index(self) -> None:
+        """Build the reverse index mapping every dialable prefix to its network.
+
+        Each local prefix (e.g. ``0803``) is indexed in its local form and in
+        both international forms (``234803`` and ``+234803``). Since every
+        valid number ends with exactly ten subscriber digits, the length of a
+        number alone tells which of these forms to look up.
+        """
+        self._prefix_network: dict[str, str] = {}
+        for network, prefixes in self.network_prefixes.items():
+            for prefix in prefixes:
+                national = prefix[1:]
+                self._prefix_network[prefix] = network
+                self._prefix_network[f"234{national}"] = network
+                self._prefix_network[f"+234{national}"] = network
+        # Number length -> length of the prefix key to look up
+        self._prefix_lengths = {11: 4, 13: 6, 14: 7}
+
+    def network_for(self, number: str) -> str | None:
+        """Get the network a phone number belongs to.
+
+        Both the local (``08031234567``) and the international
+        (``+2348031234567`` or ``2348031234567``) forms are accepted. The
+        number must not contain spaces or other separators.
+
+        Args:
+            number (str): The phone number to classify.
+
+        Returns:
+            str | None: The network name or None if the number is not a valid
+                Nigerian phone number.
+        """
+        prefix_length = self._prefix_lengths.get(len(number))
+        subscriber = number[-10:]
+        if prefix_length is None or not (subscriber.isascii() and subscriber.isdigit()):
+            return None
+        return self._prefix_network.get(number[:prefix_length])
+
+    def is_valid_number(self, number: str) -> bool:
+        """Check whether a phone number has a known Nigerian network prefix.
+
+        Args:
+            number (str): The phone number to validate.
+
+        Returns:
+            bool: True if the number is valid, False otherwise.
+        """
+        return self.network_for(number) is not None
+
+    def classify(self, numbers: Iterable[str]) -> list[str | None]:
+        """Get the network of every phone number in an iterable.
+
+        Args:
+            numbers (Iterable[str]): The phone numbers to classify.
+
+        Returns:
+            list[str | None]: The network of each number, in order, with None
+                for numbers that are not valid.
+        """
+        # Bind lookups locally to keep the per-number overhead minimal
+        prefix_lengths = self._prefix_lengths.get
+        prefix_network = self._prefix_network.get
+        return [
+            prefix_network(number[:prefix_length])
+            if (prefix_length := prefix_lengths(len(number)))
+            and (subscriber := number[-10:]).isascii()
+            and subscriber.isdigit()
+            else None
+            for number in numbers
+        ]
 
     def generate_random_phone_number(self, prefix: str) -> str:
         """Generates a random phone number with the given prefix.
@@ -43,21 +116,19 @@ class PhoneNumberProvider:
         """
         return prefix + "".join(random.choices("0123456789", k=7))
 
-    def generate_phone_number(
+    def get_prefixes(
         self,
         network: str | None = None,
         prefix: str | None = None,
-    ) -> str:
-        """Generate a random Nigerian phone number.
-
-        The phone number is either random or based on the specified network or prefix.
+    ) -> list[str]:
+        """Get the prefixes matching a network and/or prefix.
 
         Args:
             network (str | None, optional): The name of the network. Defaults to None.
             prefix (str | None, optional): The prefix of the phone number. Defaults to None.
 
         Returns:
-            str: A valid Nigerian phone number.
+            list[str]: The matching prefixes.
 
         Raises:
             ValueError: If the provided prefix or network is not valid.
@@ -71,7 +142,7 @@ class PhoneNumberProvider:
 
         if prefix:
             if prefix in self.all_prefixes:
-                return self.generate_random_phone_number(prefix)
+                return [prefix]
             msg = (
                 f"Prefix '{prefix}' is not recognized. "
                 f"Please use one of the following: {self.all_prefixes}"
@@ -81,8 +152,7 @@ class PhoneNumberProvider:
         if network:
             network = network.lower()
             if network in self.network_prefixes:
-                prefix = random.choice(self.network_prefixes[network])
-                return self.generate_random_phone_number(prefix)
+                return self.network_prefixes[network]
 
             # Suggest similar networks
             suggestions = difflib.get_close_matches(
@@ -97,5 +167,78 @@ class PhoneNumberProvider:
             )
             raise ValueError(msg)
 
-        prefix = random.choice(self.all_prefixes)
+        return self.all_prefixes
+
+    def generate_phone_number(
+        self,
+        network: str | None = None,
+        prefix: str | None = None,
+    ) -> str:
+        """Generate a random Nigerian phone number.
+
+        The phone number is either random or based on the specified network or prefix.
+
+        Args:
+            network (str | None, optional): The name of the network. Defaults to None.
+            prefix (str | None, optional): The prefix of the phone number. Defaults to None.
+
+        Returns:
+            str: A valid Nigerian phone number.
+
+        Raises:
+            ValueError: If the provided prefix or network is not valid.
+        """
+        prefix = random.choice(self.get_prefixes(network, prefix))
         return self.generate_random_phone_number(prefix)
+
+    def phone_numbers(
+        self,
+        n: int,
+        network: str | None = None,
+        prefix: str | None = None,
+    ) -> list[str]:
+        """Generate ``n`` random Nigerian phone numbers.
+
+        Args:
+            n (int): The number of phone numbers to generate.
+            network (str | None, optional): The name of the network. Defaults to None.
+            prefix (str | None, optional): The prefix of the phone number. Defaults to None.
+
+        Returns:
+            list[str]: A list of ``n`` valid Nigerian phone numbers.
+
+        Raises:
+            ValueError: If the provided prefix or network is not valid.
+        """
+        prefixes = self.get_prefixes(network, prefix)
+        randrange = random.randrange
+        return [
+            f"{prefix}{randrange(10_000_000):07d}"
+            for prefix in random.choices(prefixes, k=n)
+        ]
+
+    def compile_phone_number(
+        self,
+        network: str | None = None,
+        prefix: str | None = None,
+    ) -> Callable[[], str]:
+        """Compile a phone number generator with the filters validated once.
+
+        Args:
+            network (str | None, optional): The name of the network. Defaults to None.
+            prefix (str | None, optional): The prefix of the phone number. Defaults to None.
+
+        Returns:
+            Callable[[], str]: A zero-argument callable returning a random phone number.
+
+        Raises:
+            ValueError: If the provided prefix or network is not valid.
+        """
+        prefixes = tuple(self.get_prefixes(network, prefix))
+        choice = random.choice
+        randrange = random.randrange
+
+        def generate() -> str:
+            return f"{choice(prefixes)}{randrange(10_000_000):07d}"
+
+        return generate
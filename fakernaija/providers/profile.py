@@ -0,0 +1,326 @@
+"""This module provides a ProfileProvider class for generating correlated Nigerian person profiles."""
+
+import random
+import re
+from collections.abc import Callable
+from string import ascii_uppercase
+from typing import Any
+
+from fakernaija.backends import Backend
+from fakernaija.providers.email import EMAIL_REGEX, EmailProvider
+from fakernaija.providers.marital_status import MaritalStatusProvider
+from fakernaija.providers.name import NameProvider
+from fakernaija.providers.phonenumber import PhoneNumberProvider
+from fakernaija.providers.religion import ReligionProvider
+from fakernaija.providers.state import StateProvider
+
+NamePool = tuple[str, str, tuple[str, ...], tuple[str, ...]]
+StatePool = tuple[str, str, tuple[tuple[str, str], ...]]
+ProfilePlan = tuple[
+    tuple[NamePool, ...],
+    tuple[StatePool, ...],
+    tuple[str, ...],
+    tuple[str, ...],
+]
+
+
+class ProfileProvider:
+    """Provides functionality for generating coherent person profiles.
+
+    A profile draws its tribe, gender and state once and derives every other
+    field from them: the names come from the tribe and gender, the email from
+    the names, and the LGA, postal code and license plate from the state.
+    """
+
+    def __init__(
+        self,
+        name_provider: NameProvider | None = None,
+        backend: Backend | None = None,
+    ) -> None:
+        """Initialize the ProfileProvider and the providers it draws from.
+
+        Args:
+            name_provider (NameProvider | None, optional): The provider of the
+                names. Defaults to None (a NameProvider of the bundled names).
+            backend (Backend | None, optional): The backend to load the states
+                from. Defaults to None (the bundled JSON file).
+        """
+        self.email_provider = EmailProvider(name_provider)
+        self.name_provider = self.email_provider.name_provider
+        self.state_provider = StateProvider(backend)
+        self.phonenumber_provider = PhoneNumberProvider()
+        self.religions = tuple(ReligionProvider().get_religions())
+        self.marital_statuses = tuple(MaritalStatusProvider().get_marital_statuses())
+        self.letter_pairs = tuple(
+            a + b for a in ascii_uppercase for b in ascii_uppercase
+        )
+        self.profile_columns = (
+            "first_name",
+            "last_name",
+            "gender",
+            "tribe",
+            "email",
+            "phone_number",
+            "state",
+            "lga",
+            "postal_code",
+            "license_plate",
+            "religion",
+            "marital_status",
+        )
+        self._build_indexes()
+
+    def _build_indexes(self) -> None:
+        """Build the name pools of each tribe and gender and the LGAs of each state."""
+        name_provider = self.name_provider
+        self.name_pools: dict[tuple[str, str], NamePool] = {
+            (tribe, gender): (
+                tribe,
+                gender,
+                name_provider.get_first_name_values(tribe, gender),
+                name_provider.get_last_name_values(tribe),
+            )
+            for tribe in name_provider.tribes
+            for gender in name_provider.genders
+            if name_provider.get_first_name_values(tribe, gender)
+            and name_provider.get_last_name_values(tribe)
+        }
+        self.state_pools: dict[str, StatePool] = {
+            state["name"]: (
+                state["name"],
+                state["postal_code"],
+                tuple((lga["name"], lga["code"]) for lga in state["lgas"]),
+            )
+            for state in self.state_provider.states_data
+            if state["lgas"]
+        }
+
+    def prepare(  # noqa: PLR0913, PLR0917
+        self,
+        tribe: str | None = None,
+        gender: str | None = None,
+        state: str | None = None,
+        region: str | None = None,
+        network: str | None = None,
+        domain: str | None = None,
+    ) -> ProfilePlan:
+        """Validate the profile constraints and resolve the pools to draw from.
+
+        Args:
+            tribe (str | None, optional): The tribe of the person. Defaults to None.
+            gender (str | None, optional): The gender of the person. Defaults to None.
+            state (str | None, optional): The state of residence. Defaults to None.
+            region (str | None, optional): The region abbreviation of the state
+                of residence, e.g. ``SW``. Defaults to None.
+            network (str | None, optional): The phone number's network. Defaults to None.
+            domain (str | None, optional): The email domain. Defaults to None.
+
+        Returns:
+            ProfilePlan: The name pools, state pools, phone prefixes and email
+                domains matching the constraints.
+
+        Raises:
+            ValueError: If a constraint is invalid or no data matches them.
+        """
+        tribe, gender, domain = self.email_provider.validate_options(
+            tribe,
+            gender,
+            domain,
+        )
+        name_pools = tuple(
+            pool
+            for (pool_tribe, pool_gender), pool in self.name_pools.items()
+            if tribe in {None, pool_tribe} and gender in {None, pool_gender}
+        )
+        if not name_pools:
+            msg = f"No matching data found for tribe: {tribe} or gender: {gender}"
+            raise ValueError(msg)
+
+        if state:
+            states = [self.state_provider.get_state(state)]
+        else:
+            states = self.state_provider.get_states()
+        if region:
+            self.state_provider.validate_region(region)
+            states = [s for s in states if s["region_abbr"] == region.upper()]
+            if not states:
+                msg = f"The state '{state}' is not in the region '{region}'."
+                raise ValueError(msg)
+        state_pools = tuple(
+            self.state_pools[s["name"]] for s in states if s["name"] in self.state_pools
+        )
+        if not state_pools:
+            msg = f"No matching data found for state: {state} or region: {region}. Profiles need a state with LGAs."
+            raise ValueError(msg)
+
+        prefixes = tuple(self.phonenumber_provider.get_prefixes(network))
+        domains = (domain,) if domain else tuple(self.email_provider.default_domains)
+        return name_pools, state_pools, prefixes, domains
+
+    def generate_profile_rows(
+        self,
+        n: int,
+        plan: ProfilePlan,
+    ) -> list[tuple[str, ...]]:
+        """Generate ``n`` profiles from a prepared plan in a single pass, as tuple rows.
+
+        The values of each row follow ``profile_columns``.
+
+        Args:
+            n (int): The number of profiles to generate.
+            plan (ProfilePlan): The pools returned by ``prepare``.
+
+        Returns:
+            list[tuple[str, ...]]: A list of ``n`` profile rows.
+
+        Raises:
+            ValueError: If a generated email is not valid, e.g. from custom
+                names with characters not allowed in emails.
+        """
+        name_pools, state_pools, prefixes, domains = plan
+        choice = random.choice
+        choices = random.choices
+        randrange = random.randrange
+        match_email = re.compile(EMAIL_REGEX).match
+        separators = (".", "")
+
+        # Independent fields are drawn a column at a time, which is much
+        # faster than drawing them one profile at a time.
+        rows: list[tuple[str, ...]] = []
+        append = rows.append
+        for (
+            (tribe, gender, first_names, last_names),
+            (state, postal_code, lgas),
+            prefix,
+            subscriber,
+            domain,
+            plate_number,
+            plate_letters,
+            religion,
+            marital_status,
+        ) in zip(
+            choices(name_pools, k=n),
+            choices(state_pools, k=n),
+            choices(prefixes, k=n),
+            choices(range(10_000_000), k=n),
+            choices(domains, k=n),
+            choices(range(1000), k=n),
+            choices(self.letter_pairs, k=n),
+            choices(self.religions, k=n),
+            choices(self.marital_statuses, k=n),
+            strict=True,
+        ):
+            first_name = choice(first_names)
+            last_name = choice(last_names)
+            lga, lga_code = choice(lgas)
+
+            # The four email formats: either name first, with or without a dot
+            names = (first_name, last_name) if randrange(2) else (last_name, first_name)
+            local_part = choice(separators).join(names)
+            if randrange(2):
+                local_part = f"{local_part}{randrange(1, 10000)}"
+            email = f"{local_part}@{domain}".lower()
+            if match_email(email) is None:
+                msg = f"Invalid email format generated: {email}"
+                raise ValueError(msg)
+
+            append(
+                (
+                    first_name,
+                    last_name,
+                    gender,
+                    tribe,
+                    email,
+                    f"{prefix}{subscriber:07d}",
+                    state,
+                    lga,
+                    postal_code,
+                    f"{lga_code}-{plate_number:03d}{plate_letters}",
+                    religion,
+                    marital_status,
+                ),
+            )
+        return rows
+
+    def generate_profiles(self, n: int, plan: ProfilePlan) -> list[dict[str, Any]]:
+        """Generate ``n`` profiles from a prepared plan in a single pass.
+
+        Args:
+            n (int): The number of profiles to generate.
+            plan (ProfilePlan): The pools returned by ``prepare``.
+
+        Returns:
+            list[dict[str, Any]]: A list of ``n`` profiles.
+        """
+        columns = self.profile_columns
+        return [
+            dict(zip(columns, row, strict=True))
+            for row in self.generate_profile_rows(n, plan)
+        ]
+
+    def generate_profile(self, **constraints: str | None) -> dict[str, Any]:
+        """Generate a single profile.
+
+        Args:
+            **constraints: The constraints accepted by ``prepare``.
+
+        Returns:
+            dict[str, Any]: A random profile matching the constraints.
+
+        Raises:
+            ValueError: If a constraint is invalid or no data matches them.
+        """
+        return self.generate_profiles(1, self.prepare(**constraints))[0]
+
+    def profiles(self, n: int, **constraints: str | None) -> list[dict[str, Any]]:
+        """Generate ``n`` profiles.
+
+        Args:
+            n (int): The number of profiles to generate.
+            **constraints: The constraints accepted by ``prepare``.
+
+        Returns:
+            list[dict[str, Any]]: A list of ``n`` random profiles.
+
+        Raises:
+            ValueError: If a constraint is invalid or no data matches them.
+        """
+        return self.generate_profiles(n, self.prepare(**constraints))
+
+    def profile_rows(self, n: int, **constraints: str | None) -> list[tuple[str, ...]]:
+        """Generate ``n`` profiles as tuple rows following ``profile_columns``.
+
+        Args:
+            n (int): The number of profiles to generate.
+            **constraints: The constraints accepted by ``prepare``.
+
+        Returns:
+            list[tuple[str, ...]]: A list of ``n`` profile rows.
+
+        Raises:
+            ValueError: If a constraint is invalid or no data matches them.
+        """
+        return self.generate_profile_rows(n, self.prepare(**constraints))
+
+    def compile_profile(
+        self, **constraints: str | None
+    ) -> Callable[[], dict[str, Any]]:
+        """Compile a profile generator with the constraints validated once.
+
+        Args:
+            **constraints: The constraints accepted by ``prepare``.
+
+        Returns:
+            Callable[[], dict[str, Any]]: A zero-argument callable returning a
+                random profile.
+
+        Raises:
+            ValueError: If a constraint is invalid or no data matches them.
+        """
+        plan = self.prepare(**constraints)
+        generate_profiles = self.generate_profiles
+
+        def generate() -> dict[str, Any]:
+            return generate_profiles(1, plan)[0]
+
+        return generate
@@ -1,54 +1,62 @@
 """This module provides a SchoolProvider class for accessing information about schools in Nigeria from a JSON file."""
 
 import difflib
+import random
+from collections.abc import Sequence
 from pathlib import Path
 
+from fakernaija.backends import Backend
 from fakernaija.providers.state import StateProvider
-from fakernaija.utils import load_json, normalize_input
+from fakernaija.records import Record, freeze_records
+from fakernaija.utils import (
+    distinct_values,
+    load_json,
+    normalize_choice,
+    normalize_input,
+    records_to_rows,
+)
 
 
 class SchoolProvider:
-    """A class to provide information about Schools in Nigeria."""
+    """A class to provide information about Schools in Nigeria.
 
-    def __init__(self) -> None:
-        """Initializes the SchoolProvider by loading the school data."""
+    By default, the schools are loaded from the bundled JSON file and held in
+    memory. With a ``backend``, the schools are queried from the backend
+    instead, and only the matching schools are loaded.
+    """
+
+    def __init__(self, backend: Backend | None = None) -> None:
+        """Initializes the SchoolProvider by loading the school data.
+
+        Args:
+            backend (Backend | None, optional): The backend to query the
+                schools from. Defaults to None (the bundled JSON file).
+        """
+        self.backend = backend
         self.data_path = Path(__file__).parent.parent / "data" / "schools.json"
-        self.schools_data = load_json(
-            self.data_path,
-            [
-                "name",
-                "acronym",
-                "state",
-                "type",
-                "ownership",
-            ],
-        )
         self.ownerships = ["federal", "state", "private"]
         self.school_types = ["university", "polytechnic", "college"]
-        self.state_provider = StateProvider()
+        self.school_columns = ("name", "acronym", "state", "type", "ownership")
+        if backend is None:
+            self.schools_data = freeze_records(
+                load_json(self.data_path, list(self.school_columns)),
+            )
+            self.school_rows = records_to_rows(self.schools_data, self.school_columns)
+        self.state_provider = StateProvider(backend)
         self.state_names = self.state_provider.get_state_names()
+        self._school_name_pools: dict[
+            tuple[str | None, str | None, str | None, bool], tuple[str, ...]
+        ] = {}
 
-    def get_schools(
+    def _validate_filters(
         self,
         ownership: str | None = None,
         state: str | None = None,
         school_type: str | None = None,
-    ) -> list[dict[str, str]]:
-        """Get all schools based on filters for ownership, state, and school_type.
-
-        Args:
-            ownership (str | None): Filter by ownership ('federal', 'state', 'private').
-            state (str | None): Filter by state.
-            school_type (str | None): Filter by type ('university', 'polytechnic', 'college').
-
-        Returns:
-            list[dict[str, str]]: A list of dictionaries representing matching schools.
-
-        Raises:
-            ValueError: If an unsupported ownership, state, or school_type is provided.
-        """
-        ownership = normalize_input(ownership)
-        school_type = normalize_input(school_type)
+    ) -> tuple[str | None, str | None, str | None]:
+        """Normalize and validate the school filters."""
+        ownership = normalize_choice(ownership, self.ownerships)
+        school_type = normalize_choice(school_type, self.school_types)
         state = normalize_input(state)
 
         # Ensure that the state name comparison is case-insensitive
@@ -71,8 +79,36 @@ class SchoolProvider:
         if school_type and school_type not in self.school_types:
             msg = f"Unsupported school type: {school_type}. Supported values are: {', '.join(self.school_types)}"
             raise ValueError(msg)
+        return ownership, state, school_type
+
+    def get_schools(
+        self,
+        ownership: str | None = None,
+        state: str | None = None,
+        school_type: str | None = None,
+    ) -> Sequence[Record]:
+        """Get all schools based on filters for ownership, state, and school_type.
+
+        Args:
+            ownership (str | None): Filter by ownership ('federal', 'state', 'private').
+            state (str | None): Filter by state.
+            school_type (str | None): Filter by type ('university', 'polytechnic', 'college').
 
-        filtered_schools = self.schools_data
+        Returns:
+            Sequence[Record]: The matching school records.
+
+        Raises:
+            ValueError: If an unsupported ownership, state, or school_type is provided.
+        """
+        ownership, state, school_type = self._validate_filters(
+            ownership, state, school_type
+        )
+        if self.backend is not None:
+            return self.backend.select(
+                "schools", ownership=ownership, state=state, type=school_type
+            )
+
+        filtered_schools: Sequence[Record] = self.schools_data
 
         if ownership:
             filtered_schools = [
@@ -95,6 +131,68 @@ class SchoolProvider:
 
         return filtered_schools
 
+    def sample_schools(
+        self,
+        n: int,
+        ownership: str | None = None,
+        state: str | None = None,
+        school_type: str | None = None,
+    ) -> list[Record]:
+        """Draw ``n`` random schools, with replacement, matching the filters.
+
+        With a backend, only the drawn schools are loaded.
+
+        Args:
+            n (int): The number of schools to draw.
+            ownership (str | None): Filter by ownership ('federal', 'state', 'private').
+            state (str | None): Filter by state.
+            school_type (str | None): Filter by type ('university', 'polytechnic', 'college').
+
+        Returns:
+            list[Record]: The drawn schools, or an empty list if none match.
+
+        Raises:
+            ValueError: If an unsupported ownership, state, or school_type is provided.
+        """
+        if self.backend is not None:
+            ownership, state, school_type = self._validate_filters(
+                ownership, state, school_type
+            )
+            return self.backend.sample(
+                "schools", n, ownership=ownership, state=state, type=school_type
+            )
+        schools = self.get_schools(ownership, state, school_type)
+        return random.choices(schools, k=n) if schools else []
+
+    def get_school_rows(
+        self,
+        ownership: str | None = None,
+        state: str | None = None,
+        school_type: str | None = None,
+    ) -> tuple[tuple[str, ...], ...]:
+        """Get the schools matching the filters as tuple rows.
+
+        The values of each row follow ``school_columns``. Without a backend,
+        the rows of all schools are precomputed.
+
+        Args:
+            ownership (str | None): Filter by ownership ('federal', 'state', 'private').
+            state (str | None): Filter by state.
+            school_type (str | None): Filter by type ('university', 'polytechnic', 'college').
+
+        Returns:
+            tuple[tuple[str, ...], ...]: The matching school rows.
+
+        Raises:
+            ValueError: If an unsupported ownership, state, or school_type is provided.
+        """
+        if self.backend is None and not (ownership or state or school_type):
+            return self.school_rows
+        return records_to_rows(
+            self.get_schools(ownership, state, school_type),
+            self.school_columns,
+        )
+
     def get_school_names(
         self,
         ownership: str | None = None,
@@ -120,3 +218,40 @@ class SchoolProvider:
             school["acronym"] if acronym else school["name"]
             for school in self.get_schools(ownership, state, school_type)
         ]
+
+    def get_school_name_pool(
+        self,
+        ownership: str | None = None,
+        state: str | None = None,
+        school_type: str | None = None,
+        acronym: bool = False,
+    ) -> tuple[str, ...]:
+        """Get the distinct school names or acronyms matching the filters.
+
+        The pool of each filter is built on first use and cached, for drawing
+        session-unique names without bias or rebuilding the list per draw.
+
+        Args:
+            ownership (str | None): Filter by ownership ('federal', 'state', 'private').
+            state (str | None): Filter by state.
+            school_type (str | None): Filter by type ('university', 'polytechnic', 'college').
+            acronym (bool): Return the schools' acronyms instead of the full names.
+
+        Returns:
+            tuple[str, ...]: The distinct names or acronyms, empty if no school
+                matches.
+
+        Raises:
+            ValueError: If an unsupported ownership or state or school_type is provided.
+        """
+        ownership, state, school_type = self._validate_filters(
+            ownership, state, school_type
+        )
+        key = (ownership, state.lower() if state else None, school_type, acronym)
+        pool = self._school_name_pools.get(key)
+        if pool is None:
+            pool = distinct_values(
+                self.get_school_names(ownership, state, school_type, acronym),
+            )
+            self._school_name_pools[key] = pool
+        return pool
@@ -4,37 +4,75 @@ import difflib
 from pathlib import Path
 from typing import Any
 
-from fakernaija.utils import load_json
+from fakernaija.backends import Backend
+from fakernaija.records import Record, freeze_records
+from fakernaija.utils import load_json, records_to_rows
 
 
 class StateProvider:
-    """A class to provide information about states and their attributes."""
+    """A class to provide information about states and their attributes.
 
-    def __init__(self) -> None:
-        """Initializes the StateProvider instance with data."""
+    With a ``backend``, the states are loaded from the backend instead of the
+    bundled JSON file. There are only 37 states, so they are always held in
+    memory.
+    """
+
+    def __init__(self, backend: Backend | None = None) -> None:
+        """Initializes the StateProvider instance with data.
+
+        Args:
+            backend (Backend | None, optional): The backend to load the states
+                from. Defaults to None (the bundled JSON file).
+        """
         self.data_path = Path(__file__).parent.parent / "data" / "states.json"
-        self.states_data = load_json(
-            self.data_path,
-            [
-                "name",
-                "code",
-                "capital",
-                "slogan",
-                "lgas",
-                "region",
-                "postal_code",
-            ],
+        if backend is None:
+            states_data = load_json(
+                self.data_path,
+                [
+                    "name",
+                    "code",
+                    "capital",
+                    "slogan",
+                    "lgas",
+                    "region",
+                    "postal_code",
+                ],
+            )
+        else:
+            states_data = [state.to_dict() for state in backend.select("states")]
+        self._generate_region_abbrs(states_data)
+        self.states_data = freeze_records(states_data)
+        self.state_columns = (
+            "code",
+            "name",
+            "capital",
+            "slogan",
+            "region",
+            "postal_code",
+            "lgas",
+            "region_abbr",
         )
-        self._generate_region_abbrs()
+        self._build_rows()
 
-    def _generate_region_abbrs(self) -> None:
+    @staticmethod
+    def _generate_region_abbrs(states_data: list[dict[str, Any]]) -> None:
         """Generate unique region abbreviations dynamically based on the region name."""
-        for state in self.states_data:
+        for state in states_data:
             region = state["region"]
             region_abbr = "".join(word[0].upper() for word in region.split())
             state["region_abbr"] = region_abbr
 
-    def _get_state(self, state_name: str) -> dict[str, Any]:
+    def _build_rows(self) -> None:
+        """Precompute the state rows of each region, with ``None`` holding every state."""
+        state_rows = records_to_rows(self.states_data, self.state_columns)
+        self.state_rows_by_region: dict[str | None, tuple[tuple[Any, ...], ...]] = {
+            None: state_rows,
+        }
+        for state, row in zip(self.states_data, state_rows, strict=True):
+            region_rows = self.state_rows_by_region.get(state["region_abbr"], ())
+            self.state_rows_by_region[state["region_abbr"]] = (*region_rows, row)
+
+    def _get_state(self, state_name: str) -> Record:
         """Get state information by state name and raise an error if not found."""
         for state in self.states_data:
             if state["name"].lower() == state_name.lower():
@@ -51,6 +89,20 @@ class StateProvider:
         )
         raise ValueError(msg)
 
+    def get_state(self, state_name: str) -> Record:
+        """Get the information of a specific state.
+
+        Args:
+            state_name (str): The name of the state.
+
+        Returns:
+            Record: The state's information.
+
+        Raises:
+            ValueError: If the specified state does not exist.
+        """
+        return self._get_state(state_name)
+
     def validate_region(self, region: str) -> None:
         """Validate if the provided region is in the list of valid regions.
 
@@ -66,11 +118,31 @@ class StateProvider:
             msg = f"Invalid region abbreviation: {region}. Available options are: {available_options}"
             raise ValueError(msg)
 
-    def get_states(self) -> list[dict[str, str]]:
-        """Get a list of all states.
+    def get_state_rows(self, region: str | None = None) -> tuple[tuple[Any, ...], ...]:
+        """Get the states as tuple rows, optionally filtered by region.
+
+        The values of each row follow ``state_columns``.
+
+        Args:
+            region (str | None, optional): The region abbreviation to filter by.
+                Defaults to None (all states).
+
+        Returns:
+            tuple[tuple[Any, ...], ...]: The precomputed state rows.
+
+        Raises:
+            ValueError: If the region is not valid.
+        """
+        if region:
+            self.validate_region(region)
+            return self.state_rows_by_region[region.upper()]
+        return self.state_rows_by_region[None]
+
+    def get_states(self) -> tuple[Record, ...]:
+        """Get all states.
 
         Returns:
-            list[dict[str, str]]: A list of states.
+            tuple[Record, ...]: The states.
         """
         return self.states_data
 
@@ -90,11 +162,11 @@ class StateProvider:
         """
         return [state["capital"] for state in self.get_states()]
 
-    def get_lgas(self) -> list[str]:
+    def get_lgas(self) -> list[Record]:
         """Get a list of all Local Government Areas for all states.
 
         Returns:
-            list[str]: A list of all LGAs for all states.
+            list[Record]: A list of all LGAs for all states.
         """
         return [lga for state in self.get_states() for lga in state["lgas"]]
 
@@ -117,14 +189,14 @@ class StateProvider:
         """
         return [state["postal_code"] for state in self.get_states()]
 
-    def get_states_by_region(self, region_abbr: str) -> list[dict[str, str]]:
+    def get_states_by_region(self, region_abbr: str) -> list[Record]:
         """Get states by a specific region code.
 
         Args:
             region_abbr (str): The code of the region to filter states.
 
         Returns:
-            list[dict[str, str]]: A list of states belonging to the specified region code.
+            list[Record]: A list of states belonging to the specified region code.
         """
         return [
             state
@@ -147,20 +219,20 @@ class StateProvider:
         state_info = self._get_state(state_name)
         return state_info["postal_code"]
 
-    def get_state_lgas(self, state_name: str) -> list[str]:
+    def get_state_lgas(self, state_name: str) -> list[Record]:
         """Get a list of Local Government Areas for a specific state.
 
         Args:
             state_name (str): The name of the state.
 
         Returns:
-            list[str]: A list of LGAs for the specified state.
+            list[Record]: A list of LGAs for the specified state.
 
         Raises:
             ValueError: If the specified state does not exist.
         """
         state_info = self._get_state(state_name)
-        return state_info["lgas"]
+        return list(state_info["lgas"])
 
     def get_lga_codes(self, state_name: str | None = None) -> dict[str, list[str]]:
         """Get LGA codes for a specific state or all states.
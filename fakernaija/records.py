@@ -0,0 +1,191 @@
+"""This module provides immutable records for the bundled datasets.
+
+Providers freeze their records once at load, so mixins can return them
+directly: callers share the same objects without being able to mutate the
+dataset, and no defensive copies are needed.
+"""
+
+import functools
+from collections.abc import Iterable, Iterator, Mapping
+from typing import Any, NoReturn
+
+RECORD_INDEX_CACHE_SIZE = 256
+_MISSING = object()
+
+
+@functools.lru_cache(maxsize=RECORD_INDEX_CACHE_SIZE)
+def _record_index(keys: tuple[str, ...]) -> dict[str, int]:
+    """Get the key positions shared by all records with the same keys."""
+    return {key: position for position, key in enumerate(keys)}
+
+
+def freeze(value: Any) -> Any:  # noqa: ANN401
+    """Recursively convert dicts to records and lists to tuples.
+
+    Args:
+        value (Any): The value to freeze.
+
+    Returns:
+        Any: The frozen value. Other values are returned as is.
+    """
+    if isinstance(value, Record):
+        return value
+    if isinstance(value, Mapping):
+        return Record(value)
+    if isinstance(value, list | tuple):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+def to_builtin(value: Any) -> Any:  # noqa: ANN401
+    """Recursively convert records to dicts and tuples to lists.
+
+    This is the inverse of ``freeze``, and can be used as the ``default`` of
+    ``json.dump``.
+
+    Args:
+        value (Any): The value to convert.
+
+    Returns:
+        Any: The converted value. Other values are returned as is.
+    """
+    if isinstance(value, Record):
+        return value.to_dict()
+    if isinstance(value, tuple):
+        return [to_builtin(item) for item in value]
+    return value
+
+
+def _values_equal(value: Any, other: Any) -> bool:  # noqa: ANN401
+    """Compare a frozen value of a record to any value, like ``to_builtin`` would."""
+    if isinstance(value, tuple):
+        return (
+            isinstance(other, list | tuple)
+            and len(value) == len(other)
+            and all(map(_values_equal, value, other))
+        )
+    return bool(value == other)
+
+
+def freeze_records(records: Iterable[Mapping[str, Any]]) -> tuple["Record", ...]:
+    """Freeze the records of a dataset.
+
+    Args:
+        records (Iterable[Mapping[str, Any]]): The records to freeze.
+
+    Returns:
+        tuple[Record, ...]: The frozen records.
+    """
+    return tuple(Record(record) for record in records)
+
+
+class Record(Mapping[str, Any]):
+    """An immutable, read-only record.
+
+    A record supports the read-only dict interface (``record["name"]``,
+    ``get``, ``keys``, ``items``, ``in``, ``len``) and compares equal to a dict
+    with the same items. Nested dicts are frozen to records and nested lists
+    to tuples. Records are hashable, and ``to_dict`` returns a mutable copy.
+
+    Examples:
+        .. code-block:: python
+
+            >>> from fakernaija.records import Record
+            >>> degree = Record({"name": "Bachelor of Science", "abbr": "B.Sc."})
+            >>> degree["abbr"]
+            'B.Sc.'
+            >>> degree == {"name": "Bachelor of Science", "abbr": "B.Sc."}
+            True
+            >>> degree.to_dict()
+            {'name': 'Bachelor of Science', 'abbr': 'B.Sc.'}
+    """
+
+    __slots__ = ("_index", "_values")
+
+    _index: dict[str, int]
+    _values: tuple[Any, ...]
+
+    def __init__(self, data: Mapping[str, Any]) -> None:
+        """Freeze a mapping into a record.
+
+        Args:
+            data (Mapping[str, Any]): The items of the record.
+        """
+        keys = tuple(data)
+        object.__setattr__(self, "_index", _record_index(keys))
+        object.__setattr__(self, "_values", tuple(freeze(data[key]) for key in keys))
+
+    def __getitem__(self, key: str) -> Any:  # noqa: ANN401
+        """Get the value of a key."""
+        return self._values[self._index[key]]
+
+    def __contains__(self, key: object) -> bool:
+        """Check whether the record has a key."""
+        return key in self._index
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the keys of the record."""
+        return iter(self._index)
+
+    def __len__(self) -> int:
+        """Get the number of keys of the record."""
+        return len(self._values)
+
+    def __eq__(self, other: object) -> bool:
+        """Compare the items of the record, ignoring list and tuple differences.
+
+        Records sharing their key positions compare their value tuples, and
+        other mappings are compared item by item, without building dicts.
+        """
+        if isinstance(other, Record):
+            if self._index is other._index:
+                return self._values == other._values
+            if self._index.keys() != other._index.keys():
+                return False
+        if isinstance(other, Mapping):
+            if len(self._values) != len(other):
+                return False
+            for key, value in zip(self._index, self._values, strict=True):
+                other_value = other.get(key, _MISSING)
+                if other_value is _MISSING or not _values_equal(value, other_value):
+                    return False
+            return True
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        """Hash the items of the record."""
+        return hash(frozenset(zip(self._index, self._values, strict=True)))
+
+    def __setattr__(self, name: str, value: object) -> NoReturn:
+        """Prevent attribute assignment."""
+        msg = "Record objects are immutable. Use to_dict() for a mutable copy."
+        raise AttributeError(msg)
+
+    def __delattr__(self, name: str) -> NoReturn:
+        """Prevent attribute deletion."""
+        msg = "Record objects are immutable. Use to_dict() for a mutable copy."
+        raise AttributeError(msg)
+
+    def __reduce__(self) -> tuple[type["Record"], tuple[dict[str, Any]]]:
+        """Support pickling and copying."""
+        return type(self), (self.to_dict(),)
+
+    def __repr__(self) -> str:
+        """Get the representation of the record."""
+        return f"Record({self.to_dict()!r})"
+
+    def __str__(self) -> str:
+        """Format the record like a dict."""
+        return str(self.to_dict())
+
+    def to_dict(self) -> dict[str, Any]:
+        """Get a mutable copy of the record.
+
+        Returns:
+            dict[str, Any]: The items of the record, with nested records
+            converted to dicts and tuples to lists.
+        """
+        return {
+            key: to_builtin(value)
+            for key, value in zip(self._index, self._values, strict=True)
+        }
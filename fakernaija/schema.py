@@ -0,0 +1,520 @@
+"""This module compiles declarative dataset schemas into generation plans.
+
+A schema maps column names to field specs. A spec is either a string such
+as ``"full_name(tribe=yoruba)"`` or a mapping such as
+``{"field": "email", "name": "$name"}``. Argument values starting with ``$``
+reference another column of the same row, optionally followed by keys into
+a record column, e.g. ``$state.name``.
+"""
+
+import difflib
+import functools
+import graphlib
+import inspect
+import json
+import re
+import sys
+from collections.abc import Callable, Hashable, Iterator, Mapping
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if sys.version_info >= (3, 11):
+    import tomllib
+else:
+    tomllib = None
+
+if TYPE_CHECKING:
+    from fakernaija.naija import Naija
+
+DEFAULT_BATCH_SIZE = 10_000
+COMPILED_CACHE_SIZE = 4096
+
+SPEC_REGEX = re.compile(r"^\s*(?P<field>\w+)\s*(?:\((?P<args>.*)\))?\s*$", re.DOTALL)
+ARG_REGEX = re.compile(
+    r"""\s*(?P<name>\w+)\s*=\s*(?P<value>"[^"]*"|'[^']*'|[^,]*?)\s*(?:,|$)""",
+)
+LITERALS = {"true": True, "false": False, "none": None, "null": None}
+COLUMN_REGEX = re.compile(r"^\s*(?P<column>\w+)\s*=(?P<spec>[^=(]*\w.*)$", re.DOTALL)
+
+# The argument of a field that another listed field can supply, and those
+# fields with the keys into their values, in order of preference
+STATE_LINK = ("state", (("state_name", ()), ("state", ("name",))))
+FIELD_LINKS: dict[str, tuple[str, tuple[tuple[str, tuple[str, ...]], ...]]] = {
+    "email": ("name", (("full_name", ()),)),
+    "license_plate": STATE_LINK,
+    "school": STATE_LINK,
+    "school_name": STATE_LINK,
+    "state_lga": STATE_LINK,
+    "state_postal_code": STATE_LINK,
+}
+
+
+@dataclass(frozen=True)
+class Reference:
+    """A reference to the value of another column in the same row."""
+
+    column: str
+    keys: tuple[str, ...] = ()
+
+    def resolve(self, value: Any) -> Any:  # noqa: ANN401
+        """Follow the keys of the reference into a column value."""
+        for key in self.keys:
+            value = value[key]
+        return value
+
+
+@dataclass(frozen=True)
+class Column:
+    """A compiled schema column."""
+
+    name: str
+    field: str
+    arguments: dict[str, Any]
+    references: dict[str, Reference]
+
+
+def parse_value(value: Any) -> Any:  # noqa: ANN401
+    """Parse an argument value of a field spec.
+
+    Args:
+        value (Any): The raw value. Strings are parsed; other values are
+            returned as is.
+
+    Returns:
+        Any: A ``Reference`` for ``$column`` values, or the literal value.
+    """
+    if not isinstance(value, str):
+        return value
+    value = value.strip()
+    if value[:1] in {'"', "'"} and value[-1:] == value[:1] and len(value) > 1:
+        return value[1:-1]
+    if value.startswith("$"):
+        column, *keys = value[1:].split(".")
+        return Reference(column, tuple(keys))
+    if value.lower() in LITERALS:
+        return LITERALS[value.lower()]
+    if value.lstrip("-").isdigit():
+        return int(value)
+    return value
+
+
+def parse_spec(spec: str | Mapping[str, Any]) -> tuple[str, dict[str, Any]]:
+    """Parse a field spec into its field name and arguments.
+
+    Args:
+        spec (str | Mapping[str, Any]): A spec string such as
+            ``"state_lga(state=$state)"`` or a mapping with a ``field`` key
+            and the arguments as the other keys.
+
+    Returns:
+        tuple[str, dict[str, Any]]: The field name and the parsed arguments.
+
+    Raises:
+        ValueError: If the spec is malformed.
+    """
+    if isinstance(spec, Mapping):
+        if "field" not in spec:
+            msg = f"Invalid field spec: {dict(spec)}. A 'field' key is required."
+            raise ValueError(msg)
+        arguments = {
+            name: parse_value(value) for name, value in spec.items() if name != "field"
+        }
+        return str(spec["field"]), arguments
+
+    match = SPEC_REGEX.match(spec)
+    if match is None:
+        msg = f"Invalid field spec: {spec!r}. Expected 'field' or 'field(arg=value, ...)'."
+        raise ValueError(msg)
+
+    arguments = {}
+    raw_arguments = (match["args"] or "").strip()
+    position = 0
+    while position < len(raw_arguments):
+        argument = ARG_REGEX.match(raw_arguments, position)
+        if argument is None or not argument["value"] or argument.end() == position:
+            msg = f"Invalid arguments in field spec: {spec!r}."
+            raise ValueError(msg)
+        arguments[argument["name"]] = parse_value(argument["value"])
+        position = argument.end()
+    return match["field"], arguments
+
+
+def split_fields(fields: str) -> list[str]:
+    """Split a comma-separated field list, keeping the commas of field arguments.
+
+    Args:
+        fields (str): The field list, e.g. ``"full_name(tribe=igbo),email"``.
+
+    Returns:
+        list[str]: The field specs, e.g. ``["full_name(tribe=igbo)", "email"]``.
+    """
+    specs = []
+    depth = 0
+    quote = ""
+    start = 0
+    for position, character in enumerate(fields):
+        if quote:
+            quote = "" if character == quote else quote
+        elif character in {'"', "'"}:
+            quote = character
+        elif character == "(":
+            depth += 1
+        elif character == ")":
+            depth = max(0, depth - 1)
+        elif character == "," and not depth:
+            specs.append(fields[start:position])
+            start = position + 1
+    specs.append(fields[start:])
+    return [spec.strip() for spec in specs if spec.strip()]
+
+
+def parse_fields(fields: str, link: bool = True) -> dict[str, Any]:
+    """Build a schema from a comma-separated list of field specs.
+
+    Each spec is a field with optional arguments, e.g.
+    ``full_name(tribe=yoruba)``, and is generated into a column named after
+    the field, or ``column=spec`` to name the column. With ``link``, fields
+    that take the value of another listed field get it, so the rows are
+    coherent: ``email`` uses the ``full_name`` of its row, and
+    ``state_lga``, ``state_postal_code``, ``license_plate``, ``school`` and
+    ``school_name`` use its ``state_name`` or ``state``. Arguments given in
+    a spec are never replaced.
+
+    Args:
+        fields (str): The field list, e.g.
+            ``"full_name,email,phone_number(network=mtn),state_name"``.
+        link (bool, optional): Link the fields of each row. Defaults to True.
+
+    Returns:
+        dict[str, Any]: The schema, mapping column names to field specs.
+
+    Raises:
+        ValueError: If the list is empty, a spec is malformed or a column is
+            defined twice.
+
+    Examples:
+        .. code-block:: python
+
+            >>> from fakernaija.schema import parse_fields
+            >>> parse_fields("name=full_name(tribe=igbo),email")
+            {'name': {'field': 'full_name', 'tribe': 'igbo'}, 'email': {'field': 'email', 'name': '$name'}}
+    """
+    schema: dict[str, dict[str, Any]] = {}
+    for raw_spec in split_fields(fields):
+        match = COLUMN_REGEX.match(raw_spec)
+        column, spec = (match["column"], match["spec"]) if match else (None, raw_spec)
+        field, arguments = parse_spec(spec)
+        column = column or field
+        if column in schema:
+            msg = f"Duplicate column: {column}. Name one of them with '{column}_2={spec.strip()}'."
+            raise ValueError(msg)
+        schema[column] = {"field": field, **arguments}
+    if not schema:
+        msg = "The field list must name at least one field."
+        raise ValueError(msg)
+
+    if link:
+        columns_by_field: dict[str, str] = {}
+        for column, spec in schema.items():
+            columns_by_field.setdefault(spec["field"], column)
+        for spec in schema.values():
+            argument, sources = FIELD_LINKS.get(spec["field"], ("", ()))
+            if not argument or argument in spec:
+                continue
+            for source, keys in sources:
+                if source in columns_by_field:
+                    spec[argument] = Reference(columns_by_field[source], keys)
+                    break
+    return {
+        column: {name: _unparse_value(value) for name, value in spec.items()}
+        for column, spec in schema.items()
+    }
+
+
+def _unparse_value(value: Any) -> Any:  # noqa: ANN401
+    """Convert a parsed argument value back to a value ``parse_value`` reads as it."""
+    if isinstance(value, Reference):
+        return "$" + ".".join((value.column, *value.keys))
+    if isinstance(value, str) and parse_value(value) != value:
+        quote = "'" if '"' in value else '"'
+        return f"{quote}{value}{quote}"
+    return value
+
+
+def load_schema(path: str | Path) -> dict[str, Any]:
+    """Load a schema from a JSON or TOML file.
+
+    Args:
+        path (str | Path): The path to a ``.json`` or ``.toml`` schema file.
+
+    Returns:
+        dict[str, Any]: The schema, mapping column names to field specs.
+
+    Raises:
+        FileNotFoundError: If the schema file is not found.
+        ValueError: If the file is not a valid schema file.
+    """
+    path = Path(path)
+    if not path.is_file():
+        msg = f"File not found: {path}"
+        raise FileNotFoundError(msg)
+
+    if path.suffix.lower() == ".toml":
+        if tomllib is None:
+            msg = (
+                "TOML schemas require Python 3.11 or newer. Use a JSON schema instead."
+            )
+            raise ValueError(msg)
+        try:
+            with path.open("rb") as file:
+                schema = tomllib.load(file)
+        except tomllib.TOMLDecodeError as exc:
+            msg = f"Error decoding TOML from file: {path}"
+            raise ValueError(msg) from exc
+    else:
+        try:
+            with path.open(encoding="utf-8") as file:
+                schema = json.load(file)
+        except json.JSONDecodeError as exc:
+            msg = f"Error decoding JSON from file: {path}"
+            raise ValueError(msg) from exc
+
+    if not isinstance(schema, dict):
+        msg = (
+            f"Invalid schema in file: {path}. Expected a mapping of columns to fields."
+        )
+        raise ValueError(msg)  # noqa: TRY004
+    return schema
+
+
+class SchemaPlan:
+    """A schema compiled into an execution plan.
+
+    Compiling validates every field and argument, orders the columns so that
+    referenced columns are generated first, and binds the generators. Columns
+    without references are generated a batch at a time with ``Naija.many``;
+    columns with references reuse a compiled generator per distinct set of
+    referenced values.
+    """
+
+    def __init__(self, naija: "Naija", schema: Mapping[str, Any]) -> None:
+        """Compile a schema against a Naija instance.
+
+        Args:
+            naija (Naija): The Naija instance generating the data.
+            schema (Mapping[str, Any]): A mapping of column names to field specs.
+
+        Raises:
+            ValueError: If the schema is empty, a field or argument is not
+                supported, a reference is unknown or the references are cyclic.
+        """
+        if not schema:
+            msg = "The schema must define at least one column."
+            raise ValueError(msg)
+
+        self.naija = naija
+        self.columns = {
+            name: self._compile_column(name, spec, [c for c in schema if c != name])
+            for name, spec in schema.items()
+        }
+        self.header = tuple(self.columns)
+
+        graph = graphlib.TopologicalSorter(
+            {
+                name: {reference.column for reference in column.references.values()}
+                for name, column in self.columns.items()
+            },
+        )
+        try:
+            self.order = tuple(graph.static_order())
+        except graphlib.CycleError as exc:
+            msg = f"Circular column references: {' -> '.join(exc.args[1])}"
+            raise ValueError(msg) from None
+
+        self._compiled = functools.lru_cache(maxsize=COMPILED_CACHE_SIZE)(
+            self._compile_generator,
+        )
+
+    def _compile_column(
+        self,
+        name: str,
+        spec: str | Mapping[str, Any],
+        other_columns: list[str],
+    ) -> Column:
+        """Parse and validate the spec of a column."""
+        field, arguments = parse_spec(spec)
+        fields = self.naija.fields()
+        if field not in fields:
+            suggestions = difflib.get_close_matches(field, fields)
+            msg = f"Unsupported field for column '{name}': {field}."
+            if suggestions:
+                msg += f" Did you mean: {', '.join(suggestions)}?"
+            raise ValueError(msg)
+
+        parameters = inspect.signature(getattr(self.naija, field)).parameters
+        for argument in arguments:
+            if argument not in parameters:
+                msg = f"Unsupported argument for {field}: {argument}."
+                if parameters:
+                    msg += f" Supported arguments are: {', '.join(parameters)}."
+                raise ValueError(msg)
+
+        references = {
+            argument: value
+            for argument, value in arguments.items()
+            if isinstance(value, Reference)
+        }
+        for reference in references.values():
+            if reference.column not in other_columns:
+                suggestions = difflib.get_close_matches(reference.column, other_columns)
+                msg = (
+                    f"Unknown column reference in column '{name}': ${reference.column}."
+                )
+                if suggestions:
+                    msg += f" Did you mean: {', '.join(f'${s}' for s in suggestions)}?"
+                raise ValueError(msg)
+
+        static_arguments = {
+            argument: value
+            for argument, value in arguments.items()
+            if argument not in references
+        }
+        # Compiling validates the static arguments once, up front
+        self.naija.compile(field, **static_arguments)
+        return Column(name, field, static_arguments, references)
+
+    def _compile_generator(
+        self,
+        field: str,
+        arguments: tuple[tuple[str, Any], ...],
+    ) -> Callable[[], Any]:
+        """Compile a field generator for a set of argument values."""
+        return self.naija.compile(field, **dict(arguments))
+
+    def _generate_column(
+        self,
+        column: Column,
+        generated: dict[str, list[Any]],
+        n: int,
+    ) -> list[Any]:
+        """Generate the values of a column for a batch of ``n`` rows."""
+        if not column.references:
+            return list(self.naija.many(column.field, n, **column.arguments))
+
+        static = tuple(column.arguments.items())
+        referenced = [
+            (argument, reference, generated[reference.column])
+            for argument, reference in column.references.items()
+        ]
+        compiled = self._compiled
+        values = []
+        for row in range(n):
+            arguments = static + tuple(
+                (argument, reference.resolve(column_values[row]))
+                for argument, reference, column_values in referenced
+            )
+            if all(isinstance(value, Hashable) for _, value in arguments):
+                generate = compiled(column.field, arguments)
+            else:
+                generate = self._compile_generator(column.field, arguments)
+            values.append(generate())
+        return values
+
+    def columns_batch(self, n: int) -> dict[str, list[Any]]:
+        """Generate a batch of ``n`` rows as columns of values.
+
+        Args:
+            n (int): The number of rows to generate.
+
+        Returns:
+            dict[str, list[Any]]: The values of each column, in header order.
+        """
+        generated: dict[str, list[Any]] = {}
+        for name in self.order:
+            generated[name] = self._generate_column(self.columns[name], generated, n)
+        return {name: generated[name] for name in self.header}
+
+    def row_batches(
+        self,
+        n: int,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> Iterator[list[tuple[Any, ...]]]:
+        """Generate ``n`` rows lazily as tuples in header order, a batch at a time.
+
+        Args:
+            n (int): The total number of rows to generate.
+            batch_size (int, optional): The maximum number of rows per batch.
+                Defaults to ``DEFAULT_BATCH_SIZE``.
+
+        Yields:
+            list[tuple[Any, ...]]: A batch of rows, one value per column of
+            ``header``.
+
+        Raises:
+            ValueError: If ``n`` is negative or ``batch_size`` is not positive.
+        """
+        if n < 0 or batch_size < 1:
+            msg = "The number of rows must be non-negative and the batch size positive."
+            raise ValueError(msg)
+        for start in range(0, n, batch_size):
+            columns = self.columns_batch(min(batch_size, n - start))
+            yield list(zip(*columns.values(), strict=True))
+
+    def batches(
+        self,
+        n: int,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> Iterator[list[dict[str, Any]]]:
+        """Generate ``n`` rows lazily, a batch at a time.
+
+        Args:
+            n (int): The total number of rows to generate.
+            batch_size (int, optional): The maximum number of rows per batch.
+                Defaults to ``DEFAULT_BATCH_SIZE``.
+
+        Yields:
+            list[dict[str, Any]]: A batch of rows mapping column names to values.
+
+        Raises:
+            ValueError: If ``n`` is negative or ``batch_size`` is not positive.
+        """
+        header = self.header
+        for batch in self.row_batches(n, batch_size):
+            yield [dict(zip(header, row, strict=True)) for row in batch]
+
+    def rows(
+        self, n: int, batch_size: int = DEFAULT_BATCH_SIZE
+    ) -> list[tuple[Any, ...]]:
+        """Generate ``n`` rows as tuples in header order.
+
+        Args:
+            n (int): The number of rows to generate.
+            batch_size (int, optional): The number of rows generated per batch.
+                Defaults to ``DEFAULT_BATCH_SIZE``.
+
+        Returns:
+            list[tuple[Any, ...]]: The rows, one value per column of ``header``.
+
+        Raises:
+            ValueError: If ``n`` is negative or ``batch_size`` is not positive.
+        """
+        return [row for batch in self.row_batches(n, batch_size) for row in batch]
+
+    def generate(
+        self, n: int, batch_size: int = DEFAULT_BATCH_SIZE
+    ) -> list[dict[str, Any]]:
+        """Generate ``n`` rows.
+
+        Args:
+            n (int): The number of rows to generate.
+            batch_size (int, optional): The number of rows generated per batch.
+                Defaults to ``DEFAULT_BATCH_SIZE``.
+
+        Returns:
+            list[dict[str, Any]]: The rows, mapping column names to values.
+
+        Raises:
+            ValueError: If ``n`` is negative or ``batch_size`` is not positive.
+        """
+        return [row for batch in self.batches(n, batch_size) for row in batch]
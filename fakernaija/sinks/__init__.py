@@ -0,0 +1,88 @@
+from typing import Any, TextIO
+
+from .base import SINK_CHUNK_SIZE, Sink, chunked
+from .compression import COMPRESSIONS, compressed_stream
+from .formats import (
+    CsvSink,
+    JsonlSink,
+    JsonSink,
+    TextSink,
+    write_json_array,
+    write_jsonl,
+)
+from .sql import (
+    SQL_BATCH_ROWS,
+    PgCopySink,
+    SqlSink,
+    copy_row,
+    copy_value,
+    sql_literal,
+    sql_row,
+)
+from .sqlite import SQLiteSink, write_sqlite
+
+SINKS: dict[str, type[Sink]] = {
+    "json": JsonSink,
+    "jsonl": JsonlSink,
+    "csv": CsvSink,
+    "text": TextSink,
+    "pgcopy": PgCopySink,
+    "sql": SqlSink,
+}
+
+
+def create_sink(
+    output: str,
+    file: TextIO,
+    data_type: str = "values",
+    **options: Any,  # noqa: ANN401
+) -> Sink:
+    """Create the sink of an output format.
+
+    Args:
+        output (str): The output format, e.g. ``csv`` or ``sql``.
+        file (TextIO): The open file to write to.
+        data_type (str, optional): The type of data being written.
+            Defaults to "values".
+        **options (Any): Extra sink options, e.g. ``table``. Options the sink
+            does not accept, and options set to None, are ignored.
+
+    Returns:
+        Sink: The sink writing to the file.
+    """
+    sink = SINKS[output]
+    return sink(
+        file,
+        data_type,
+        **{
+            name: value
+            for name, value in options.items()
+            if name in sink.options and value is not None
+        },
+    )
+
+
+__all__ = [
+    "COMPRESSIONS",
+    "SINKS",
+    "SINK_CHUNK_SIZE",
+    "SQL_BATCH_ROWS",
+    "CsvSink",
+    "JsonSink",
+    "JsonlSink",
+    "PgCopySink",
+    "SQLiteSink",
+    "Sink",
+    "SqlSink",
+    "TextSink",
+    "chunked",
+    "compressed_stream",
+    "copy_row",
+    "copy_value",
+    "create_sink",
+    "sql_literal",
+    "sql_row",
+    "write_json_array",
+    "write_jsonl",
+    "write_sqlite",
+]
@@ -0,0 +1,135 @@
+"""This module defines the interface of the output sinks."""
+
+import itertools
+import json
+from abc import ABC, abstractmethod
+from collections.abc import Iterable, Iterator, Sequence
+from typing import Any, TextIO
+
+from fakernaija.records import to_builtin
+
+SINK_CHUNK_SIZE = 10_000
+
+# Encodes nested values, e.g. LGA records, as compact JSON text in the
+# tabular formats, matching the JSON and JSON Lines output
+encode_json = json.JSONEncoder(
+    ensure_ascii=False,
+    separators=(",", ":"),
+    default=to_builtin,
+).encode
+
+
+def chunked(items: Iterable[Any], size: int) -> Iterator[list[Any]]:
+    """Split an iterable into lists of at most ``size`` items, lazily.
+
+    Args:
+        items (Iterable[Any]): The items to split.
+        size (int): The maximum number of items per list.
+
+    Yields:
+        list[Any]: The next items, in order.
+    """
+    iterator = iter(items)
+    while chunk := list(itertools.islice(iterator, size)):
+        yield chunk
+
+
+def column_label(key: str) -> str:
+    """Format a record key as a label, e.g. ``postal_code`` as ``Postal code``."""
+    return key.capitalize().replace("_", " ")
+
+
+class Sink(ABC):
+    """Writes generated items to an open file as they are produced.
+
+    Items are either strings or records (mappings). A sink is fed batches of
+    items with ``write`` and finished with ``close``; the header, if any, is
+    written with the first batch, based on its first item. Sinks never hold
+    more than the batch they are writing.
+
+    ``options`` names the extra keyword arguments a sink accepts, e.g. the
+    table of SQL output, which ``create_sink`` passes on to it.
+    """
+
+    extension = ""
+    options: tuple[str, ...] = ()
+
+    def __init__(self, file: TextIO, data_type: str = "values") -> None:
+        """Initialize the sink.
+
+        Args:
+            file (TextIO): The open file to write to. The sink does not close it.
+            data_type (str, optional): The type of data being written, used for
+                the header of string items. Defaults to "values".
+        """
+        self.file = file
+        self.data_type = data_type
+        self.count = 0
+
+    def write(self, items: Sequence[Any]) -> None:
+        """Write a batch of items.
+
+        Args:
+            items (Sequence[Any]): The items to write.
+        """
+        if not items:
+            return
+        if not self.count:
+            self.start(items[0])
+        self.write_items(items)
+        self.count += len(items)
+
+    def write_all(
+        self,
+        items: Iterable[Any],
+        chunk_size: int = SINK_CHUNK_SIZE,
+    ) -> int:
+        """Write all items, chunk by chunk, and close the sink.
+
+        The output is flushed after every chunk, so a lazy iterator of any
+        length is written in constant memory, and readers of the file see
+        the output as it is produced.
+
+        Args:
+            items (Iterable[Any]): The items to write.
+            chunk_size (int, optional): The number of items written at once.
+                Defaults to SINK_CHUNK_SIZE.
+
+        Returns:
+            int: The total number of items written.
+        """
+        for chunk in chunked(items, chunk_size):
+            self.write(chunk)
+            self.flush()
+        self.close()
+        return self.count
+
+    def flush(self) -> None:
+        """Flush the written items to the output."""
+        self.file.flush()
+
+    def reopen(self, file: TextIO) -> None:
+        """Continue the output in a reopened file, e.g. a file opened to append.
+
+        Args:
+            file (TextIO): The open file to write the rest of the output to.
+        """
+        self.file = file
+
+    def start(self, first: Any) -> None:  # noqa: ANN401, B027
+        """Write the header of the output, if any.
+
+        Args:
+            first (Any): The first item of the output.
+        """
+
+    @abstractmethod
+    def write_items(self, items: Sequence[Any]) -> None:
+        """Write a non-empty batch of items after the header.
+
+        Args:
+            items (Sequence[Any]): The items to write.
+        """
+
+    def close(self) -> None:  # noqa: B027
+        """Write the footer of the output, if any."""
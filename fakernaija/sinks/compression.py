@@ -0,0 +1,195 @@
+"""This module provides streamed compression of the output files."""
+
+import bz2
+import contextlib
+import gzip
+import io
+import lzma
+import queue
+import threading
+from collections.abc import Iterator
+from pathlib import Path
+from typing import IO, TYPE_CHECKING, cast
+
+if TYPE_CHECKING:
+    from _typeshed import ReadableBuffer
+
+COMPRESSIONS = {"gzip": ".gz", "bz2": ".bz2", "xz": ".xz"}
+DEFAULT_COMPRESS_LEVELS = {"gzip": 6, "bz2": 9, "xz": 6}
+COMPRESS_BUFFER_SIZE = 1 << 20
+COMPRESS_QUEUE_SIZE = 8
+
+
+def infer_compression(output_path: str | Path) -> str | None:
+    """Infer the compression of an output path from its extension.
+
+    Args:
+        output_path (str | Path): The output path, e.g. ``data.csv.gz``.
+
+    Returns:
+        str | None: The compression, e.g. ``gzip``, or None if the extension
+            is not a compression extension.
+    """
+    suffix = Path(output_path).suffix.lower()
+    for compression, extension in COMPRESSIONS.items():
+        if extension == suffix:
+            return compression
+    return None
+
+
+def validate_compression(compression: str, level: int | None = None) -> int:
+    """Validate a compression and its level.
+
+    Args:
+        compression (str): The compression: gzip, bz2 or xz.
+        level (int | None, optional): The compression level, from 0 (1 for
+            bz2) to 9. Defaults to None (DEFAULT_COMPRESS_LEVELS).
+
+    Returns:
+        int: The compression level to use.
+
+    Raises:
+        ValueError: If the compression or level is not supported.
+    """
+    if compression not in COMPRESSIONS:
+        msg = f"Unsupported compression: {compression}. Supported values are: {', '.join(COMPRESSIONS)}"
+        raise ValueError(msg)
+    if level is None:
+        return DEFAULT_COMPRESS_LEVELS[compression]
+    lowest = 1 if compression == "bz2" else 0
+    if not lowest <= level <= 9:  # noqa: PLR2004
+        msg = f"Unsupported {compression} compression level: {level}. Use a level from {lowest} to 9."
+        raise ValueError(msg)
+    return level
+
+
+def _compressor(
+    binary: IO[bytes],
+    compression: str,
+    level: int,
+) -> IO[bytes]:
+    """Open a compressed writer over a binary stream, without taking ownership of it."""
+    compressor: io.BufferedIOBase
+    if compression == "gzip":
+        # No name and a fixed time, so identical data compresses identically
+        compressor = gzip.GzipFile(
+            filename="",
+            mode="wb",
+            compresslevel=level,
+            fileobj=binary,
+            mtime=0,
+        )
+    elif compression == "bz2":
+        compressor = bz2.BZ2File(binary, "wb", compresslevel=level)
+    else:
+        compressor = lzma.LZMAFile(binary, "wb", preset=level)  # noqa: SIM115
+    return cast("IO[bytes]", compressor)
+
+
+class ThreadedWriter(io.RawIOBase):
+    """A writer that hands its writes to a background thread.
+
+    Writes are queued and written to the target by a separate thread, so
+    the producer keeps generating while the target, e.g. a compressor,
+    works on earlier data. The zlib, bz2 and lzma compressors release the
+    GIL, so both run in parallel on multicore machines. The queue is bounded,
+    so a slow target holds the producer back instead of filling memory.
+    Errors of the target are raised by the next write, or on close.
+    """
+
+    def __init__(
+        self,
+        target: IO[bytes],
+        queue_size: int = COMPRESS_QUEUE_SIZE,
+    ) -> None:
+        """Start the writer thread.
+
+        Args:
+            target (IO[bytes]): The stream to write to. It is not closed.
+            queue_size (int, optional): The maximum number of pending writes.
+                Defaults to COMPRESS_QUEUE_SIZE.
+        """
+        super().__init__()
+        self.target = target
+        self._queue: queue.Queue[bytes | None] = queue.Queue(maxsize=queue_size)
+        self._error: BaseException | None = None
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        """Write the queued data until the end marker."""
+        while (data := self._queue.get()) is not None:
+            if self._error is None:
+                try:
+                    self.target.write(data)
+                except BaseException as error:  # noqa: BLE001
+                    # Keep draining the queue so the producer never blocks
+                    self._error = error
+
+    def _raise_error(self) -> None:
+        """Raise the error of the writer thread, if any."""
+        if self._error is not None:
+            raise self._error
+
+    def writable(self) -> bool:
+        """Check whether the writer is writable."""
+        return True
+
+    def write(self, data: "ReadableBuffer", /) -> int:
+        """Queue data to be written by the writer thread.
+
+        Args:
+            data (ReadableBuffer): The data to write.
+
+        Returns:
+            int: The number of bytes queued.
+        """
+        self._raise_error()
+        chunk = bytes(data)
+        self._queue.put(chunk)
+        return len(chunk)
+
+    def close(self) -> None:
+        """Wait for the queued data to be written and stop the thread."""
+        if not self.closed:
+            self._queue.put(None)
+            self._thread.join()
+            super().close()
+            self._raise_error()
+
+
+@contextlib.contextmanager
+def compressed_stream(
+    binary: IO[bytes],
+    compression: str,
+    level: int | None = None,
+    threaded: bool = False,
+) -> Iterator[IO[bytes]]:
+    """Compress the data written to a binary stream, as it is written.
+
+    The compressed data is finished on exit; the binary stream itself is
+    left open.
+
+    Args:
+        binary (IO[bytes]): The stream receiving the compressed data.
+        compression (str): The compression: gzip, bz2 or xz.
+        level (int | None, optional): The compression level, from 0 (1 for
+            bz2) to 9. Defaults to None (DEFAULT_COMPRESS_LEVELS).
+        threaded (bool, optional): Compress on a separate thread, so
+            compression overlaps with writing the data. Defaults to False.
+
+    Yields:
+        IO[bytes]: The stream to write the uncompressed data to.
+
+    Raises:
+        ValueError: If the compression or level is not supported.
+    """
+    level = validate_compression(compression, level)
+    with contextlib.ExitStack() as stack:
+        compressor = stack.enter_context(_compressor(binary, compression, level))
+        if not threaded:
+            yield compressor
+            return
+        writer = stack.enter_context(ThreadedWriter(compressor))
+        with io.BufferedWriter(writer, COMPRESS_BUFFER_SIZE) as buffered:
+            yield cast("IO[bytes]", buffered)
@@ -0,0 +1,224 @@
+"""This module provides the sinks of the CLI output formats."""
+
+import csv
+import json
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from typing import Any, TextIO
+
+from fakernaija.records import to_builtin
+from fakernaija.sinks.base import Sink, column_label, encode_json
+
+
+def _is_scalar(value: Any) -> bool:  # noqa: ANN401
+    """Check whether a value is written to CSV as it is."""
+    return value is None or isinstance(value, str | int | float)
+
+
+def _csv_value(value: Any) -> Any:  # noqa: ANN401
+    """Get the CSV field of a value, with nested values as JSON text."""
+    return value if _is_scalar(value) else encode_json(value)
+
+
+class CsvSink(Sink):
+    """Writes items as CSV rows, with a header row of column labels.
+
+    The labels of record keys are pluralized, e.g. ``Postal codes`` for
+    ``postal_code``. Without ``label_columns``, the header holds the record
+    keys unchanged, e.g. the column names of a dataset schema. Nested values,
+    e.g. LGA records, are written as JSON text, as in the other formats.
+    """
+
+    extension = ".csv"
+    options = ("label_columns",)
+
+    def __init__(
+        self,
+        file: TextIO,
+        data_type: str = "values",
+        label_columns: bool = True,
+    ) -> None:
+        """Initialize the sink.
+
+        Args:
+            file (TextIO): The open file to write to, opened with ``newline=""``.
+            data_type (str, optional): The type of data being written.
+                Defaults to "values".
+            label_columns (bool, optional): Write the record keys as labels
+                instead of as they are. Defaults to True.
+        """
+        super().__init__(file, data_type)
+        self.writer = csv.writer(file)
+        self.label_columns = label_columns
+        self._row: Callable[[Any], Iterable[Any]] = lambda item: (item,)
+
+    def reopen(self, file: TextIO) -> None:
+        """Continue the rows in a reopened file, without repeating the header."""
+        super().reopen(file)
+        self.writer = csv.writer(file)
+
+    def start(self, first: Any) -> None:  # noqa: ANN401
+        """Write the header row and get the fields of the rows from the first item.
+
+        Only rows whose first item has nested values are converted field by
+        field; the values of flat records are written as they are.
+        """
+        if isinstance(first, Mapping):
+            if self.label_columns:
+                self.writer.writerow([column_label(key) + "s" for key in first])
+            else:
+                self.writer.writerow(list(first))
+            if all(map(_is_scalar, first.values())):
+                self._row = lambda record: record.values()
+            else:
+                self._row = lambda record: map(_csv_value, record.values())
+        else:
+            self.writer.writerow([self.data_type.title()])
+            if not _is_scalar(first):
+                self._row = lambda item: (_csv_value(item),)
+
+    def write_items(self, items: Sequence[Any]) -> None:
+        """Write one row per item."""
+        self.writer.writerows(map(self._row, items))
+
+
+class JsonSink(Sink):
+    """Writes items as a JSON array, one element at a time.
+
+    With the default indent, the output is the same as
+    ``json.dump(items, file, indent=4)``, without building the list of items.
+    Without an indent, elements are encoded compactly, one per line.
+    """
+
+    extension = ".json"
+
+    def __init__(
+        self,
+        file: TextIO,
+        data_type: str = "values",
+        indent: int | None = 4,
+    ) -> None:
+        """Initialize the sink.
+
+        Args:
+            file (TextIO): The open file to write to.
+            data_type (str, optional): The type of data being written.
+                Defaults to "values".
+            indent (int | None, optional): The indent of the elements, or None
+                for compact elements. Defaults to 4.
+        """
+        super().__init__(file, data_type)
+        self.encoder = json.JSONEncoder(
+            indent=indent,
+            separators=None if indent else (",", ":"),
+            default=to_builtin,
+        )
+        self.element_prefix = "\n" + " " * (indent or 0)
+
+    def write_items(self, items: Sequence[Any]) -> None:
+        """Write the items as array elements."""
+        prefix = self.element_prefix
+        separator = "," + prefix
+        encode = self.encoder.encode
+        self.file.write(
+            (separator if self.count else "[" + prefix)
+            + separator.join(encode(item).replace("\n", prefix) for item in items),
+        )
+
+    def close(self) -> None:
+        """Close the array."""
+        self.file.write("\n]" if self.count else "[]")
+
+
+class JsonlSink(Sink):
+    """Writes items as JSON Lines, one compact JSON value per line.
+
+    Each item is encoded on its own as it is written, with one encoder reused
+    for the whole output, so the output can be streamed, appended to, split
+    by line ranges and read in parallel.
+    """
+
+    extension = ".jsonl"
+
+    def __init__(self, file: TextIO, data_type: str = "values") -> None:
+        """Initialize the sink.
+
+        Args:
+            file (TextIO): The open file to write to.
+            data_type (str, optional): The type of data being written.
+                Defaults to "values".
+        """
+        super().__init__(file, data_type)
+        self.encoder = json.JSONEncoder(
+            ensure_ascii=False,
+            separators=(",", ":"),
+            default=to_builtin,
+        )
+
+    def write_items(self, items: Sequence[Any]) -> None:
+        """Write one line per item."""
+        encode = self.encoder.encode
+        self.file.writelines(f"{encode(item)}\n" for item in items)
+
+
+class TextSink(Sink):
+    """Writes one line per item, with the labeled values of records."""
+
+    extension = ".txt"
+
+    def write_items(self, items: Sequence[Any]) -> None:
+        """Write one line per item."""
+        if isinstance(items[0], Mapping):
+            self.file.writelines(
+                " | ".join(
+                    f"{column_label(key)}: {value}"
+                    for key, value in to_builtin(record).items()
+                )
+                + "\n"
+                for record in items
+            )
+        else:
+            self.file.writelines(f"{item}\n" for item in items)
+
+
+def write_jsonl(items: Iterable[Any], file: TextIO) -> int:
+    """Write items to a file as JSON Lines, as they are produced.
+
+    Args:
+        items (Iterable[Any]): The items to write, e.g. a lazy iterator of
+            records or strings.
+        file (TextIO): The open file to write to.
+
+    Returns:
+        int: The number of items written.
+
+    Examples:
+        .. code-block:: python
+
+            >>> from fakernaija import Naija
+            >>> from fakernaija.sinks import write_jsonl
+            >>> naija = Naija()
+            >>> with open("profiles.jsonl", "w", encoding="utf-8") as file:
+            ...     write_jsonl(naija.many("profile", 100_000, stream=True), file)
+            100000
+    """
+    return JsonlSink(file).write_all(items)
+
+
+def write_json_array(
+    items: Iterable[Any],
+    file: TextIO,
+    indent: int | None = None,
+) -> int:
+    """Write items to a file as a JSON array, without building the list.
+
+    Args:
+        items (Iterable[Any]): The items to write, e.g. a lazy iterator of
+            records or strings.
+        file (TextIO): The open file to write to.
+        indent (int | None, optional): The indent of the elements, or None to
+            write compact elements, one per line. Defaults to None.
+
+    Returns:
+        int: The number of items written.
+    """
+    return JsonSink(file, indent=indent).write_all(items)
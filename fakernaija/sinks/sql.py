@@ -0,0 +1,259 @@
+"""This module provides the sinks of the PostgreSQL COPY and SQL INSERT output formats."""
+
+from collections.abc import Callable, Mapping, Sequence
+from operator import itemgetter
+from typing import Any, TextIO
+
+from fakernaija.sinks.base import Sink, encode_json
+from fakernaija.sinks.sqlite import column_name, quote_identifier
+
+SQL_BATCH_ROWS = 1000
+POSTGRES_TYPES: tuple[tuple[type, str], ...] = (
+    (bool, "boolean"),
+    (int, "bigint"),
+    (float, "double precision"),
+    (str, "text"),
+)
+COPY_ESCAPES = str.maketrans(
+    {"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"},
+)
+COPY_NULL = "\\N"
+
+
+def copy_value(value: Any) -> str:  # noqa: ANN401
+    r"""Format a value as a field of PostgreSQL COPY text.
+
+    Backslashes, tabs, newlines and carriage returns are escaped, None is
+    ``\N``, booleans are ``t`` and ``f``, and nested values, e.g. LGA
+    records, are JSON.
+
+    Args:
+        value (Any): The value to format.
+
+    Returns:
+        str: The escaped field.
+    """
+    if value is None:
+        return COPY_NULL
+    if isinstance(value, str):
+        return value.translate(COPY_ESCAPES)
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    if isinstance(value, int | float):
+        return repr(value)
+    return encode_json(value).translate(COPY_ESCAPES)
+
+
+def sql_literal(value: Any) -> str:  # noqa: ANN401
+    """Format a value as an SQL literal.
+
+    Strings are quoted with inner quotes doubled, which is the standard SQL
+    escaping used by PostgreSQL (with the default
+    ``standard_conforming_strings``) and SQLite. Nested values, e.g. LGA
+    records, are quoted JSON.
+
+    Args:
+        value (Any): The value to format.
+
+    Returns:
+        str: The literal, e.g. ``'O''Brien'``, ``42``, ``TRUE`` or ``NULL``.
+    """
+    if value is None:
+        return "NULL"
+    if isinstance(value, bool):
+        return "TRUE" if value else "FALSE"
+    if isinstance(value, int | float):
+        return repr(value)
+    if not isinstance(value, str):
+        value = encode_json(value)
+    return "'" + value.replace("'", "''") + "'"
+
+
+def copy_row(values: Sequence[Any]) -> str:
+    """Format the values of a row as a line of PostgreSQL COPY text.
+
+    Rows of strings without special characters, the common case, are joined
+    as they are, without escaping each value.
+
+    Args:
+        values (Sequence[Any]): The values of the row.
+
+    Returns:
+        str: The tab-separated, escaped fields, ending with a newline.
+    """
+    try:
+        line = "\t".join(values)
+    except TypeError:
+        pass
+    else:
+        if (
+            line.count("\t") == len(values) - 1
+            and "\\" not in line
+            and "\n" not in line
+            and "\r" not in line
+        ):
+            return line + "\n"
+    return "\t".join(map(copy_value, values)) + "\n"
+
+
+def sql_row(values: Sequence[Any]) -> str:
+    """Format the values of a row as an SQL row constructor, e.g. ``('Ada', 30)``.
+
+    Rows of strings without quotes, the common case, are quoted at once,
+    without formatting each value.
+
+    Args:
+        values (Sequence[Any]): The values of the row.
+
+    Returns:
+        str: The row of literals in parentheses.
+    """
+    try:
+        literals = "', '".join(values)
+    except TypeError:
+        pass
+    else:
+        if literals.count("'") == 2 * (len(values) - 1):
+            return "('" + literals + "')"
+    return "(" + ", ".join(map(sql_literal, values)) + ")"
+
+
+def _postgres_type(value: Any) -> str:  # noqa: ANN401
+    """Get the PostgreSQL type of a column from its first value; others are JSON."""
+    for python_type, postgres_type in POSTGRES_TYPES:
+        if isinstance(value, python_type):
+            return postgres_type
+    return "text" if value is None else "jsonb"
+
+
+def _row_values(first: Any) -> Callable[[Any], Sequence[Any]]:  # noqa: ANN401
+    """Get the function returning the column values of an item, in order."""
+    if not isinstance(first, Mapping):
+        return lambda item: (item,)
+    getter = itemgetter(*first)
+    if len(first) == 1:
+        return lambda record: (getter(record),)
+    return getter
+
+
+class PgCopySink(Sink):
+    r"""Writes items as PostgreSQL COPY text, one tab-separated row per line.
+
+    The output has no header, so it can be streamed straight into
+    ``COPY table FROM STDIN``, e.g. through ``psql``. Records have a field
+    per column, in the order of their keys; strings have a single column.
+
+    Examples:
+        .. code-block:: console
+
+            $ naija profile --repeat 1000000 --output pgcopy --out - \
+                | psql staging -c "COPY profiles FROM STDIN"
+    """
+
+    extension = ".copy"
+
+    def __init__(self, file: TextIO, data_type: str = "values") -> None:
+        """Initialize the sink.
+
+        Args:
+            file (TextIO): The open file to write to.
+            data_type (str, optional): The type of data being written.
+                Defaults to "values".
+        """
+        super().__init__(file, data_type)
+        self._row: Callable[[Any], Sequence[Any]] = lambda item: (item,)
+
+    def start(self, first: Any) -> None:  # noqa: ANN401
+        """Get the columns of the rows from the first item."""
+        self._row = _row_values(first)
+
+    def write_items(self, items: Sequence[Any]) -> None:
+        """Write one line per item."""
+        row = self._row
+        self.file.writelines(copy_row(row(item)) for item in items)
+
+
+class SqlSink(Sink):
+    """Writes items as an SQL script of multi-row ``INSERT`` statements.
+
+    The script creates the table if it does not exist, typed after the
+    values of the first record, and inserts ``batch_rows`` rows per
+    statement, in a single transaction. Strings are inserted into a single
+    column named after the data type. The script runs in PostgreSQL, e.g.
+    piped into ``psql``, and in SQLite.
+    """
+
+    extension = ".sql"
+    options = ("table", "batch_rows")
+
+    def __init__(
+        self,
+        file: TextIO,
+        data_type: str = "values",
+        table: str | None = None,
+        batch_rows: int = SQL_BATCH_ROWS,
+    ) -> None:
+        """Initialize the sink.
+
+        Args:
+            file (TextIO): The open file to write to.
+            data_type (str, optional): The type of data being written.
+                Defaults to "values".
+            table (str | None, optional): The name of the table. Defaults to
+                None (a table named after the data type).
+            batch_rows (int, optional): The maximum number of rows per
+                ``INSERT`` statement. Defaults to SQL_BATCH_ROWS.
+
+        Raises:
+            ValueError: If the table name is empty or the batch size is not
+                positive.
+        """
+        super().__init__(file, data_type)
+        table = column_name(data_type) if table is None else table
+        if not table.strip():
+            msg = "The SQL table name must not be empty."
+            raise ValueError(msg)
+        if batch_rows < 1:
+            msg = "The number of rows per INSERT statement must be positive."
+            raise ValueError(msg)
+        self.table = table
+        self.batch_rows = batch_rows
+        self._insert = ""
+        self._row: Callable[[Any], Sequence[Any]] = lambda item: (item,)
+
+    def start(self, first: Any) -> None:  # noqa: ANN401
+        """Write the transaction start and the table definition."""
+        if isinstance(first, Mapping):
+            columns = list(first)
+            types = [_postgres_type(value) for value in first.values()]
+        else:
+            columns = [column_name(self.data_type)]
+            types = [_postgres_type(first)]
+        self._row = _row_values(first)
+
+        table = quote_identifier(self.table)
+        definitions = ",\n".join(
+            f"    {quote_identifier(column)} {column_type}"
+            for column, column_type in zip(columns, types, strict=True)
+        )
+        self._insert = (
+            f"INSERT INTO {table} ({', '.join(map(quote_identifier, columns))}) "
+            "VALUES\n"
+        )
+        self.file.write(
+            f"BEGIN;\nCREATE TABLE IF NOT EXISTS {table} (\n{definitions}\n);\n",
+        )
+
+    def write_items(self, items: Sequence[Any]) -> None:
+        """Write one ``INSERT`` statement per ``batch_rows`` items."""
+        row = self._row
+        values = [sql_row(row(item)) for item in items]
+        self.file.writelines(
+            self._insert + ",\n".join(values[start : start + self.batch_rows]) + ";\n"
+            for start in range(0, len(values), self.batch_rows)
+        )
+
+    def close(self) -> None:
+        """Commit the transaction."""
+        if self.count:
+            self.file.write("COMMIT;\n")
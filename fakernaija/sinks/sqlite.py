@@ -0,0 +1,213 @@
+"""This module provides the sink loading generated items into an SQLite table."""
+
+import json
+import re
+import sqlite3
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from operator import itemgetter
+from pathlib import Path
+from typing import Any
+
+from fakernaija.records import to_builtin
+from fakernaija.sinks.base import SINK_CHUNK_SIZE, Sink
+
+SQLITE_TRANSACTION_ROWS = 500_000
+SQLITE_EXTENSIONS = (".db", ".sqlite", ".sqlite3")
+SQLITE_TYPES: tuple[tuple[type, str], ...] = (
+    (bool, "INTEGER"),
+    (int, "INTEGER"),
+    (float, "REAL"),
+    (str, "TEXT"),
+)
+
+
+def quote_identifier(name: str) -> str:
+    """Quote an SQL identifier, e.g. a table or column name.
+
+    Args:
+        name (str): The identifier.
+
+    Returns:
+        str: The identifier in double quotes, with inner quotes doubled.
+    """
+    return '"' + name.replace('"', '""') + '"'
+
+
+def column_name(data_type: str) -> str:
+    """Get the column name of string items, e.g. ``email_addresses``."""
+    return re.sub(r"\W+", "_", data_type.strip().lower()).strip("_") or "value"
+
+
+def _column_type(value: Any) -> str:  # noqa: ANN401
+    """Get the SQLite type of a column from its first value; others are JSON text."""
+    for python_type, sqlite_type in SQLITE_TYPES:
+        if isinstance(value, python_type):
+            return sqlite_type
+    return "TEXT"
+
+
+def _to_json(value: Any) -> Any:  # noqa: ANN401
+    """Encode a nested value, e.g. an LGA record, as JSON text."""
+    if value is None or isinstance(value, str | int | float):
+        return value
+    return json.dumps(to_builtin(value), ensure_ascii=False)
+
+
+class SQLiteSink(Sink):
+    """Loads items into an SQLite table, creating it from the first item.
+
+    Records become rows with a column per field, typed after the values of
+    the first record; nested values, e.g. LGA records, are stored as JSON
+    text. Strings become rows of a single column named after the data type.
+    Rows are inserted with ``executemany`` in transactions of
+    ``transaction_rows`` rows, with the journal and syncing turned off while
+    loading, and the pragmas are restored on close. An interrupted load can
+    therefore corrupt the database, which suits generated test data.
+
+    The table is created if it does not exist; rows are appended to an
+    existing table.
+
+    Examples:
+        .. code-block:: python
+
+            >>> import sqlite3
+            >>> from fakernaija import Naija
+            >>> from fakernaija.sinks import SQLiteSink
+            >>> connection = sqlite3.connect("test.db")
+            >>> sink = SQLiteSink(connection, "profiles")
+            >>> sink.write_all(Naija().many("profile", 100_000, stream=True))
+            100000
+    """
+
+    extension = ".db"
+
+    def __init__(
+        self,
+        connection: sqlite3.Connection,
+        table: str,
+        data_type: str = "values",
+        transaction_rows: int = SQLITE_TRANSACTION_ROWS,
+    ) -> None:
+        """Initialize the sink.
+
+        Args:
+            connection (sqlite3.Connection): The database connection. The sink
+                does not close it.
+            table (str): The name of the table to load.
+            data_type (str, optional): The type of data being written, used as
+                the column name of string items. Defaults to "values".
+            transaction_rows (int, optional): The number of rows inserted per
+                transaction. Defaults to SQLITE_TRANSACTION_ROWS.
+
+        Raises:
+            ValueError: If the table name is empty.
+        """
+        if not table.strip():
+            msg = "The SQLite table name must not be empty."
+            raise ValueError(msg)
+        self.connection = connection
+        self.table = table
+        self.data_type = data_type
+        self.transaction_rows = transaction_rows
+        self.count = 0
+        self._uncommitted = 0
+        self._insert = ""
+        self._row: Callable[[Any], tuple[Any, ...]] = lambda item: (item,)
+        self._pragmas: dict[str, Any] = {}
+
+    def start(self, first: Any) -> None:  # noqa: ANN401
+        """Create the table and turn off the journal and syncing."""
+        if isinstance(first, Mapping):
+            columns = list(first)
+            types = [_column_type(value) for value in first.values()]
+            json_columns = [
+                index
+                for index, value in enumerate(first.values())
+                if _column_type(value) == "TEXT" and not isinstance(value, str)
+            ]
+            getter = itemgetter(*columns)
+            if len(columns) == 1:
+                if json_columns:
+                    self._row = lambda record: (_to_json(getter(record)),)
+                else:
+                    self._row = lambda record: (getter(record),)
+            elif json_columns:
+                self._row = lambda record: tuple(map(_to_json, getter(record)))
+            else:
+                self._row = getter
+        else:
+            columns = [column_name(self.data_type)]
+            types = [_column_type(first)]
+            if not isinstance(first, str | int | float) and first is not None:
+                self._row = lambda item: (_to_json(item),)
+
+        for pragma in ("journal_mode", "synchronous"):
+            self._pragmas[pragma] = self.connection.execute(
+                f"PRAGMA {pragma}"
+            ).fetchone()[0]
+        self.connection.execute("PRAGMA journal_mode = OFF")
+        self.connection.execute("PRAGMA synchronous = OFF")
+
+        table = quote_identifier(self.table)
+        definitions = ", ".join(
+            f"{quote_identifier(column)} {column_type}"
+            for column, column_type in zip(columns, types, strict=True)
+        )
+        self.connection.execute(f"CREATE TABLE IF NOT EXISTS {table} ({definitions})")
+        self._insert = (
+            f"INSERT INTO {table} ({', '.join(map(quote_identifier, columns))}) "  # noqa: S608
+            f"VALUES ({', '.join('?' for _ in columns)})"
+        )
+
+    def write_items(self, items: Sequence[Any]) -> None:
+        """Insert one row per item, committing every ``transaction_rows`` rows."""
+        self.connection.executemany(self._insert, map(self._row, items))
+        self._uncommitted += len(items)
+        if self._uncommitted >= self.transaction_rows:
+            self.connection.commit()
+            self._uncommitted = 0
+
+    def flush(self) -> None:
+        """Do nothing: rows are committed in transactions of ``transaction_rows``."""
+
+    def close(self) -> None:
+        """Commit the last rows and restore the journal and syncing."""
+        self.connection.commit()
+        self._uncommitted = 0
+        for pragma, value in self._pragmas.items():
+            self.connection.execute(f"PRAGMA {pragma} = {value}")
+        self._pragmas.clear()
+
+
+def write_sqlite(
+    items: Iterable[Any],
+    database: str | Path,
+    table: str,
+    data_type: str = "values",
+    chunk_size: int = SINK_CHUNK_SIZE,
+) -> int:
+    """Load items into a table of an SQLite database file, as they are produced.
+
+    Args:
+        items (Iterable[Any]): The items to load, e.g. a lazy iterator of
+            records or strings.
+        database (str | Path): The path of the database file. It is created
+            if it does not exist.
+        table (str): The name of the table, created if it does not exist.
+        data_type (str, optional): The type of data being written, used as
+            the column name of string items. Defaults to "values".
+        chunk_size (int, optional): The number of items inserted at once.
+            Defaults to SINK_CHUNK_SIZE.
+
+    Returns:
+        int: The number of rows loaded.
+
+    Raises:
+        sqlite3.Error: If the database cannot be written, e.g. an existing
+            table has other columns.
+    """
+    connection = sqlite3.connect(database)
+    try:
+        return SQLiteSink(connection, table, data_type).write_all(items, chunk_size)
+    finally:
+        connection.close()
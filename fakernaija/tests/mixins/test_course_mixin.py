@@ -7,6 +7,7 @@ to interact with the CourseProvider class for generating course information.
 import unittest
 
 from fakernaija.mixins import Course
+from fakernaija.records import Record
 
 
 class TestCourse(unittest.TestCase):
@@ -17,9 +18,12 @@ class TestCourse(unittest.TestCase):
         self.course = Course()
 
     def test_course(self) -> None:
-        """Test that course returns a dictionary."""
+        """Test that course returns a read-only record."""
         course = self.course.course()
-        self.assertIsInstance(course, dict)
+        self.assertIsInstance(course, Record)
+        self.assertEqual(set(course), {"name", "code"})
+        with self.assertRaises(TypeError):
+            course["name"] = "Changed"  # type: ignore[index]
 
     def test_course_name(self) -> None:
         """Test that course_name returns a string."""
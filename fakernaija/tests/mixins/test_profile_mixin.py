@@ -0,0 +1,43 @@
+"""Unit tests for the Profile mixin methods."""
+
+import unittest
+from unittest.mock import MagicMock, patch
+
+from fakernaija.mixins import Profile
+from fakernaija.providers import ProfileProvider
+
+
+class TestProfileMixin(unittest.TestCase):
+    """Test cases for the Profile mixin class."""
+
+    def setUp(self) -> None:
+        """Set up the Profile mixin instance for testing."""
+        self.mixin = Profile()
+
+    @patch.object(ProfileProvider, "generate_profile")
+    def test_profile(self, mock_generate_profile: MagicMock) -> None:
+        """Test that profile passes its constraints to the provider."""
+        mock_generate_profile.return_value = {"first_name": "Ade"}
+
+        profile = self.mixin.profile(tribe="yoruba", state="lagos")
+
+        mock_generate_profile.assert_called_once_with(
+            tribe="yoruba",
+            gender=None,
+            state="lagos",
+            region=None,
+            network=None,
+            domain=None,
+        )
+        self.assertEqual(profile, {"first_name": "Ade"})
+
+    def test_profiles(self) -> None:
+        """Test that profiles returns the requested number of profiles."""
+        profiles = self.mixin.profiles(10, gender="male")
+        self.assertEqual(len(profiles), 10)
+        for profile in profiles:
+            self.assertEqual(profile["gender"], "male")
+
+
+if __name__ == "__main__":
+    unittest.main()
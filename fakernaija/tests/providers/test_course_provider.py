@@ -22,6 +22,17 @@ class TestCourseProvider(unittest.TestCase):
         courses = self.course_provider.get_courses_code()
         self.assertIn("COS101", courses)
 
+    def test_getters_return_lists(self) -> None:
+        """Test that the name and code getters return copies of the cached pools."""
+        names = self.course_provider.get_courses_name()
+        self.assertIsInstance(names, list)
+        self.assertEqual(names, list(self.course_provider.course_names))
+        names.clear()
+        self.assertTrue(self.course_provider.get_courses_name())
+        codes = self.course_provider.get_courses_code()
+        self.assertIsInstance(codes, list)
+        self.assertEqual(codes, list(self.course_provider.course_codes))
+
     def test_get_courses(self) -> None:
         """Test getting a list of all courses with their names and codes."""
         courses = self.course_provider.get_courses()
@@ -29,3 +40,49 @@ class TestCourseProvider(unittest.TestCase):
             {"name": "Introduction to Computer Science", "code": "COS101"},
             courses,
         )
+
+    def test_get_courses_by_code(self) -> None:
+        """Test looking up courses by code, ignoring case."""
+        courses = self.course_provider.get_courses_by_code("cos101")
+        self.assertEqual(
+            courses,
+            ({"name": "Introduction to Computer Science", "code": "COS101"},),
+        )
+
+    def test_get_courses_by_invalid_code(self) -> None:
+        """Test looking up courses by an unknown code."""
+        with self.assertRaises(ValueError):
+            self.course_provider.get_courses_by_code("XYZ999")
+
+    def test_get_courses_by_prefix(self) -> None:
+        """Test looking up courses by department-style code prefix."""
+        courses = self.course_provider.get_courses_by_prefix("mth")
+        self.assertTrue(courses)
+        for course in courses:
+            self.assertTrue(course["code"].startswith("MTH"))
+
+    def test_get_courses_by_invalid_prefix(self) -> None:
+        """Test looking up courses by an unknown code prefix."""
+        with self.assertRaises(ValueError) as context:
+            self.course_provider.get_courses_by_prefix("CSS")
+        self.assertIn("Did you mean", str(context.exception))
+
+    def test_get_course_codes_by_name(self) -> None:
+        """Test looking up course codes by course name."""
+        codes = self.course_provider.get_course_codes_by_name(
+            "introduction to computer science",
+        )
+        self.assertEqual(codes, ("COS101",))
+
+    def test_get_course_codes_by_invalid_name(self) -> None:
+        """Test looking up course codes by an unknown course name."""
+        with self.assertRaises(ValueError):
+            self.course_provider.get_course_codes_by_name("Underwater Basket Weaving")
+
+    def test_courses_batch(self) -> None:
+        """Test drawing a batch of courses filtered by code prefix."""
+        courses = self.course_provider.courses(25, code_prefix="PHY")
+        self.assertEqual(len(courses), 25)
+        for course in courses:
+            self.assertTrue(course["code"].startswith("PHY"))
+        self.assertEqual(len(self.course_provider.courses(5)), 5)
@@ -92,3 +92,53 @@ class TestDegreeProvider(unittest.TestCase):
         """Tests the validate_degree_type method with None."""
         result = self.degree_provider.validate_degree_type(None)
         self.assertIsNone(result)
+
+    def test_get_degrees_is_cached(self) -> None:
+        """Tests that degrees are bucketed by type once and getters return copies."""
+        names = self.degree_provider.get_degree_names("masters")
+        self.assertIsInstance(names, list)
+        self.assertEqual(
+            names, list(self.degree_provider.degree_names_by_type["masters"])
+        )
+        names.append("Master of Nothing")
+        self.assertNotIn(
+            "Master of Nothing", self.degree_provider.get_degree_names("masters")
+        )
+        self.assertIsInstance(self.degree_provider.get_degrees(), list)
+        for abbr in self.degree_provider.get_degree_abbrs("doctorate"):
+            self.assertIn(abbr, self.degree_provider.degree_abbrs_by_type[None])
+
+    def test_degrees_batch(self) -> None:
+        """Tests the degrees method returns n degrees of the given type."""
+        degrees = self.degree_provider.degrees(10, degree_type="Masters")
+        self.assertEqual(len(degrees), 10)
+        for degree in degrees:
+            self.assertEqual(degree["degree_type"], "masters")
+
+    def test_degrees_batch_invalid_type(self) -> None:
+        """Tests the degrees method with an invalid degree type."""
+        with self.assertRaises(ValueError):
+            self.degree_provider.degrees(10, degree_type="invalid_type")
+
+    def test_get_degrees_by_abbr(self) -> None:
+        """Tests the abbreviation lookup ignores dots, spaces and case."""
+        for abbr in ["B.Sc.", "BSc", "b.sc"]:
+            degrees = self.degree_provider.get_degrees_by_abbr(abbr)
+            self.assertEqual(
+                [degree["name"] for degree in degrees],
+                ["Bachelor of Science"],
+            )
+
+    def test_get_degrees_by_shared_abbr(self) -> None:
+        """Tests that an abbreviation shared by several degrees returns them all."""
+        degrees = self.degree_provider.get_degrees_by_abbr("DVM")
+        self.assertEqual(
+            {degree["degree_type"] for degree in degrees},
+            {"undergraduate", "doctorate"},
+        )
+
+    def test_get_degrees_by_invalid_abbr(self) -> None:
+        """Tests the abbreviation lookup with an unknown abbreviation."""
+        with self.assertRaises(ValueError) as context:
+            self.degree_provider.get_degrees_by_abbr("X.Y.Z.")
+        self.assertIn("Invalid degree abbreviation", str(context.exception))
@@ -291,3 +291,20 @@ class TestGenerateEmailMethod(unittest.TestCase):
             ),
             f"Generated email '{email}' does not match the expected format.",
         )
+
+    def test_compile_email(self) -> None:
+        """Test that compiled emails are valid and use the given domain."""
+        generate = EmailProvider().compile_email(
+            tribe="igbo",
+            gender="female",
+            domain="unn.edu.ng",
+        )
+        for _ in range(20):
+            email = generate()
+            self.assertTrue(self.email_provider.validate_email(email))
+            self.assertTrue(email.endswith("@unn.edu.ng"))
+
+    def test_compile_email_invalid_domain(self) -> None:
+        """Test that compiling with an invalid domain fails up front."""
+        with self.assertRaises(ValueError):
+            EmailProvider().compile_email(domain="invalid")
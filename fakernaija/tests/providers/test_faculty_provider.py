@@ -84,3 +84,42 @@ class TestFacultyProvider(unittest.TestCase):
             self.faculty_provider.get_department_names("Invalid Faculty")
         self.assertIn("Invalid faculty name", str(context.exception))
         self.assertIn("Valid faculties are:", str(context.exception))
+
+    def test_departments_by_faculty_index(self) -> None:
+        """Test that departments are indexed by casefolded faculty name."""
+        self.assertEqual(
+            self.faculty_provider.departments_by_faculty["basic medical sciences"],
+            ("Human Anatomy", "Physiology"),
+        )
+        self.assertEqual(
+            len(self.faculty_provider.departments_by_faculty[None]),
+            11,
+        )
+
+    def test_department_names_batch(self) -> None:
+        """Test the department_names method returns n departments of a faculty."""
+        departments = self.faculty_provider.department_names(
+            20,
+            faculty="Basic Medical Sciences",
+        )
+        self.assertEqual(len(departments), 20)
+        for department in departments:
+            self.assertIn(department, ["Human Anatomy", "Physiology"])
+
+    def test_department_names_batch_invalid_faculty(self) -> None:
+        """Test the department_names method with an invalid faculty."""
+        with self.assertRaises(ValueError):
+            self.faculty_provider.department_names(5, faculty="Invalid Faculty")
+
+    def test_get_faculty_names_by_department(self) -> None:
+        """Test the department to faculty reverse lookup."""
+        self.assertEqual(
+            self.faculty_provider.get_faculty_names_by_department("Physiology"),
+            ("Basic Medical Sciences",),
+        )
+
+    def test_get_faculty_names_by_invalid_department(self) -> None:
+        """Test the department to faculty reverse lookup with an invalid department."""
+        with self.assertRaises(ValueError) as context:
+            self.faculty_provider.get_faculty_names_by_department("Physiologie")
+        self.assertIn("Did you mean: Physiology?", str(context.exception))
@@ -102,3 +102,12 @@ class TestLicensePlateProvider(unittest.TestCase):
         plate = self.license_plate_provider.generate_license_plate()
 
         self.assertRegex(plate, r"^[A-Z]{3}-\d{3}[A-Z]{2}$")
+
+    def test_compile_license_plate(self) -> None:
+        """Test that compiled license plates use the state's LGA codes."""
+        lga_codes = set(self.license_plate_provider.get_plate_codes("Lagos"))
+        generate = self.license_plate_provider.compile_license_plate("Lagos")
+        for _ in range(20):
+            plate = generate()
+            self.assertRegex(plate, r"^[A-Z]{3}-\d{3}[A-Z]{2}$")
+            self.assertIn(plate[:3], lga_codes)
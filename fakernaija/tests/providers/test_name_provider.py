@@ -1,9 +1,14 @@
 """Unit tests for the NameProvider class."""
 
+import json
+import tempfile
 import unittest
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+from fakernaija import Naija
 from fakernaija.providers import NameProvider
+from fakernaija.providers.name import NAME_INDEX_FILENAME
 
 
 class TestNameProvider(unittest.TestCase):
@@ -90,10 +95,7 @@ class TestNameProvider(unittest.TestCase):
             self.name_provider.generate_full_name(tribe="igbo", gender="invalid")
         self.assertIn("Unsupported gender: invalid", str(context.exception))
 
-    @patch(
-        "random.choice",
-        return_value={"tribe": "igbo", "gender": "female", "name": "Ugochi"},
-    )
+    @patch("random.choice", return_value="Ugochi")
     def test_generate_first_name_with_filters(self, mock_choice: MagicMock) -> None:  # noqa: ARG002
         """Test generating a random first name with filters."""
         first_name = self.name_provider.generate_first_name(
@@ -102,7 +104,7 @@ class TestNameProvider(unittest.TestCase):
         )
         self.assertEqual(first_name, "Ugochi")
 
-    @patch("random.choice", return_value={"tribe": "igbo", "name": "Maduike"})
+    @patch("random.choice", return_value="Maduike")
     def test_generate_last_name(self, mock_choice: MagicMock) -> None:  # noqa: ARG002
         """Test generating a random last name with tribe filter."""
         last_name = self.name_provider.generate_last_name(tribe="igbo")
@@ -110,10 +112,7 @@ class TestNameProvider(unittest.TestCase):
 
     @patch(
         "random.choice",
-        side_effect=[
-            {"tribe": "igbo", "gender": "female", "name": "Ugochi"},
-            {"tribe": "igbo", "name": "Maduike"},
-        ],
+        side_effect=["Ugochi", "Maduike"],
     )
     def test_generate_full_name_no_middle(
         self,
@@ -129,9 +128,9 @@ class TestNameProvider(unittest.TestCase):
     @patch(
         "random.choice",
         side_effect=[
-            {"tribe": "yoruba", "gender": "male", "name": "Ade"},  # First name
-            {"tribe": "yoruba", "name": "Ojo"},  # Last name
-            {"tribe": "yoruba", "gender": "male", "name": "Bisi"},  # Middle name
+            "Ade",  # First name
+            "Ojo",  # Last name
+            "Bisi",  # Middle name
         ],
     )
     def test_generate_full_name_with_middle(
@@ -174,11 +173,63 @@ class TestNameProvider(unittest.TestCase):
         mock_load_json: MagicMock,
     ) -> None:
         """Test that a ValueError is raised for an unsupported tribe."""
-        mock_load_json.return_value = self.mock_last_names
+        mock_load_json.side_effect = [self.mock_first_names, self.mock_last_names]
         provider = NameProvider()
         with self.assertRaises(ValueError):
             provider.generate_last_name(tribe="unsupported_tribe")
 
+    def test_name_columns(self) -> None:
+        """Test that names are stored as interned values and byte codes."""
+        provider = self.name_provider
+        self.assertEqual(
+            provider.first_name_values, ("Ade", "Bisi", "Jidenna", "Ugochi")
+        )
+        self.assertEqual(provider.first_name_tribes.typecode, "B")
+        self.assertEqual(
+            [provider.tribes[code] for code in provider.first_name_tribes],
+            ["yoruba", "yoruba", "igbo", "igbo"],
+        )
+        self.assertEqual(
+            [provider.genders[code] for code in provider.first_name_genders],
+            ["male", "female", "male", "female"],
+        )
+        self.assertEqual(provider.get_first_name_values("igbo", "female"), ("Ugochi",))
+        self.assertEqual(
+            provider.get_first_name_values(gender="male"), ("Ade", "Jidenna")
+        )
+        self.assertEqual(provider.get_last_name_values("yoruba"), ("Ojo",))
+        self.assertEqual(provider.get_last_name_values("hausa"), ())
+        self.assertIs(
+            provider.get_first_name_values("yoruba"),
+            provider.get_first_name_values("Yoruba"),
+        )
+
+    @patch("fakernaija.providers.name.load_json")
+    def test_name_columns_new_tribe(self, mock_load_json: MagicMock) -> None:
+        """Test that tribes found in the data are added to the supported tribes."""
+        mock_load_json.side_effect = [
+            [{"tribe": "tiv", "gender": "male", "name": "Terver"}],
+            [{"tribe": "tiv", "name": "Akaa"}],
+        ]
+        provider = NameProvider()
+        self.assertIn("tiv", provider.tribes)
+        self.assertEqual(provider.generate_full_name(tribe="tiv"), "Terver Akaa")
+
+    @patch("fakernaija.providers.name.load_json")
+    def test_name_columns_accented_tribe(self, mock_load_json: MagicMock) -> None:
+        """Test that tribes in the data are normalized like the tribe argument."""
+        mock_load_json.side_effect = [
+            [{"tribe": " Ìjaw ", "gender": "Male", "name": "Ebi"}],
+            [{"tribe": "IJAW", "name": "Alamieyeseigha"}],
+        ]
+        provider = NameProvider()
+        self.assertIn("ijaw", provider.tribes)
+        self.assertNotIn("ìjaw", provider.tribes)
+        self.assertEqual(
+            provider.generate_full_name(tribe="Ìjaw", gender="male"),
+            "Ebi Alamieyeseigha",
+        )
+
     def test_generate_full_name_with_filters(self) -> None:
         """Test generating a random full name with filters."""
         full_name = self.name_provider.generate_full_name(tribe="igbo", gender="female")
@@ -240,3 +291,154 @@ class TestNameProvider(unittest.TestCase):
         prefixes = self.name_provider.get_general_prefixes(None)
         self.assertIn("Mr.", prefixes)
         self.assertIn("Mrs.", prefixes)
+
+    def test_compile_first_name(self) -> None:
+        """Test that compiled first names respect the filters."""
+        generate = self.name_provider.compile_first_name(tribe="igbo", gender="male")
+        self.assertEqual({generate() for _ in range(10)}, {"Jidenna"})
+
+    def test_compile_last_name_invalid_tribe(self) -> None:
+        """Test that compiling with an unsupported tribe fails up front."""
+        with self.assertRaises(ValueError):
+            self.name_provider.compile_last_name(tribe="unknown")
+
+    def test_compile_full_name(self) -> None:
+        """Test that compiled full names use names from a single tribe."""
+        generate = self.name_provider.compile_full_name(gender="female")
+        for _ in range(20):
+            self.assertIn(generate(), {"Bisi Ojo", "Ugochi Maduike"})
+
+    def test_middle_name_needs_two_first_names(self) -> None:
+        """Test that middle names differ from first names or fail when they cannot."""
+        provider = NameProvider(
+            first_names=[{"tribe": "edo", "gender": "male", "name": "Osa"}],
+            last_names=[{"tribe": "edo", "name": "Ogie"}],
+        )
+        self.assertEqual(provider.compile_full_name()(), "Osa Ogie")
+        with self.assertRaisesRegex(ValueError, "two distinct first names"):
+            provider.compile_full_name(middle_name=True)
+        with self.assertRaisesRegex(ValueError, "two distinct first names"):
+            provider.generate_full_name(tribe="edo", middle_name=True)
+
+        provider = NameProvider(
+            first_names=[
+                {"tribe": "edo", "gender": "male", "name": "Osa"},
+                {"tribe": "edo", "gender": "male", "name": "Osa"},
+                {"tribe": "edo", "gender": "male", "name": "Eghe"},
+            ],
+            last_names=[{"tribe": "edo", "name": "Ogie"}],
+        )
+        generate = provider.compile_full_name(middle_name=True)
+        for _ in range(20):
+            self.assertIn(generate(), {"Osa Eghe Ogie", "Eghe Osa Ogie"})
+            self.assertIn(
+                provider.generate_full_name(tribe="edo", middle_name=True),
+                {"Osa Eghe Ogie", "Eghe Osa Ogie"},
+            )
+
+
+class TestNameProviderFromFiles(unittest.TestCase):
+    """Test suite for NameProvider instances built from custom name files."""
+
+    def setUp(self) -> None:
+        """Write a small custom corpus with new tribes."""
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = Path(directory.name)
+        self.first_names = self.directory / "first_names.jsonl"
+        self.first_names.write_text(
+            "\n".join(
+                json.dumps(name)
+                for name in [
+                    {"tribe": "Tiv", "gender": "male", "name": "Terver"},
+                    {"tribe": "tiv", "gender": "female", "name": "Mbalamen"},
+                    {"tribe": "efik", "gender": "female", "name": "Affiong"},
+                ]
+            ),
+            encoding="utf-8",
+        )
+        self.last_names = self.directory / "last_names.csv"
+        self.last_names.write_text(
+            "tribe,name\ntiv,Akaa\nefik,Bassey\n",
+            encoding="utf-8",
+        )
+
+    def test_from_files(self) -> None:
+        """Test that custom files add their tribes and generate their names."""
+        provider = NameProvider.from_files(self.first_names, self.last_names)
+        self.assertIn("tiv", provider.tribes)
+        self.assertIn("efik", provider.tribes)
+        self.assertEqual(provider.get_first_name_values("tiv"), ("Terver", "Mbalamen"))
+        self.assertEqual(
+            provider.generate_full_name(tribe="efik", gender="female"),
+            "Affiong Bassey",
+        )
+
+    def test_index_is_persisted_and_reused(self) -> None:
+        """Test that the index is reused until the name files change."""
+        index = self.directory / "names.index.json"
+        provider = NameProvider.from_files(self.first_names, self.last_names, index)
+        self.assertTrue(index.is_file())
+
+        with patch("fakernaija.providers.name.iter_records") as mock_iter_records:
+            reloaded = NameProvider.from_files(self.first_names, self.last_names, index)
+        mock_iter_records.assert_not_called()
+        self.assertEqual(reloaded.tribes, provider.tribes)
+        self.assertEqual(reloaded.first_name_values, provider.first_name_values)
+        self.assertEqual(reloaded.first_name_genders, provider.first_name_genders)
+        self.assertEqual(reloaded.get_last_name_values("tiv"), ("Akaa",))
+
+        with self.last_names.open("a", encoding="utf-8") as file:
+            file.write("tiv,Iorliam\n")
+        rebuilt = NameProvider.from_files(self.first_names, self.last_names, index)
+        self.assertEqual(rebuilt.get_last_name_values("tiv"), ("Akaa", "Iorliam"))
+
+    def test_invalid_index_is_rebuilt(self) -> None:
+        """Test that an index with missing or inconsistent columns is rebuilt."""
+        index = self.directory / "names.index.json"
+        NameProvider.from_files(self.first_names, self.last_names, index)
+        data = json.loads(index.read_text(encoding="utf-8"))
+        broken = [
+            {key: value for key, value in data.items() if key != "tribes"},
+            {**data, "tribes": None},
+            {**data, "tribes": data["tribes"][:1]},
+            {**data, "last_names": {**data["last_names"], "tribes": "@@"}},
+            {**data, "first_names": {**data["first_names"], "values": ["Terver"]}},
+        ]
+        for index_data in broken:
+            with self.subTest(index=index_data):
+                index.write_text(json.dumps(index_data), encoding="utf-8")
+                provider = NameProvider.from_files(
+                    self.first_names, self.last_names, index
+                )
+                self.assertEqual(provider.get_last_name_values("tiv"), ("Akaa",))
+                self.assertEqual(json.loads(index.read_text(encoding="utf-8")), data)
+
+    def test_unwritable_index_is_skipped(self) -> None:
+        """Test that an index that cannot be written does not fail the load."""
+        index = self.directory / "missing" / "names.index.json"
+        provider = NameProvider.from_files(self.first_names, self.last_names, index)
+        self.assertFalse(index.exists())
+        self.assertEqual(provider.get_last_name_values("efik"), ("Bassey",))
+
+    def test_naija_data_dir(self) -> None:
+        """Test that Naija generates names, emails and profiles from a data dir."""
+        naija = Naija(data_dir=self.directory)
+        self.assertTrue((self.directory / NAME_INDEX_FILENAME).is_file())
+        self.assertIs(naija.name_provider, naija.email_provider.name_provider)
+        self.assertIs(naija.name_provider, naija.profile_provider.name_provider)
+        self.assertEqual(naija.last_name(tribe="tiv"), "Akaa")
+        self.assertIn("bassey", naija.email(tribe="efik"))
+        self.assertEqual(naija.profile(tribe="efik")["first_name"], "Affiong")
+
+    def test_invalid_name_files(self) -> None:
+        """Test that missing or invalid name files raise errors."""
+        with self.assertRaises(FileNotFoundError):
+            Naija(data_dir=self.directory / "missing")
+        self.last_names.write_text("tribe,name\ntiv,\n", encoding="utf-8")
+        with self.assertRaisesRegex(ValueError, "line 2"):
+            NameProvider.from_files(self.first_names, self.last_names)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -62,3 +62,61 @@ class TestPhoneNumberProvider(unittest.TestCase):
         """Test that phone_number raises ValueError for a valid network and invalid prefix combination."""
         with self.assertRaises(ValueError):
             self.provider.generate_phone_number(network="glo", prefix="0703")
+
+    def test_network_for_local_number(self) -> None:
+        """Test that network_for maps a local number to its network."""
+        self.assertEqual(self.provider.network_for("08031234567"), "mtn")
+        self.assertEqual(self.provider.network_for("09081234567"), "etisalat")
+
+    def test_network_for_international_number(self) -> None:
+        """Test that network_for accepts international forms of a number."""
+        self.assertEqual(self.provider.network_for("+2348051234567"), "glo")
+        self.assertEqual(self.provider.network_for("2348021234567"), "airtel")
+
+    def test_network_for_invalid_number(self) -> None:
+        """Test that network_for returns None for invalid numbers."""
+        for number in [
+            "",
+            "0803123456",
+            "080312345678",
+            "0803123456a",
+            "08001234567",
+            "x2348031234567",
+            "+2340031234567",
+        ]:
+            self.assertIsNone(self.provider.network_for(number))
+
+    def test_is_valid_number(self) -> None:
+        """Test that is_valid_number accepts generated numbers only."""
+        phone_number = self.provider.generate_phone_number()
+        self.assertTrue(self.provider.is_valid_number(phone_number))
+        self.assertTrue(self.provider.is_valid_number("+234" + phone_number[1:]))
+        self.assertFalse(self.provider.is_valid_number("12345678901"))
+
+    def test_classify(self) -> None:
+        """Test that classify returns the network of every number in order."""
+        numbers = ["08031234567", "+2348051234567", "invalid", "09091234567"]
+        self.assertEqual(
+            self.provider.classify(numbers),
+            ["mtn", "glo", None, "etisalat"],
+        )
+        self.assertEqual(self.provider.classify(iter([])), [])
+
+    def test_compile_phone_number(self) -> None:
+        """Test that compiled phone numbers belong to the requested network."""
+        generate = self.provider.compile_phone_number(network="glo")
+        for _ in range(20):
+            self.assertEqual(self.provider.network_for(generate()), "glo")
+
+    def test_compile_phone_number_invalid_network(self) -> None:
+        """Test that compiling with an unsupported network fails up front."""
+        with self.assertRaises(ValueError):
+            self.provider.compile_phone_number(network="unknown")
+
+    def test_phone_numbers(self) -> None:
+        """Test that phone_numbers generates a batch for the requested prefix."""
+        phone_numbers = self.provider.phone_numbers(50, prefix="0803")
+        self.assertEqual(len(phone_numbers), 50)
+        for phone_number in phone_numbers:
+            self.assertTrue(phone_number.startswith("0803"))
+            self.assertTrue(self.provider.is_valid_number(phone_number))
@@ -0,0 +1,131 @@
+"""Unit tests for the ProfileProvider class."""
+
+import unittest
+
+from fakernaija.providers import NameProvider, ProfileProvider
+
+
+class TestProfileProvider(unittest.TestCase):
+    """Test suite for the ProfileProvider class."""
+
+    def setUp(self) -> None:
+        """Set up the test case environment."""
+        self.provider = ProfileProvider()
+        self.state_provider = self.provider.state_provider
+
+    def assert_consistent(self, profile: dict) -> None:
+        """Assert that the fields of a profile agree with each other."""
+        first_names = self.provider.name_provider.get_first_names(
+            profile["tribe"],
+            profile["gender"],
+        )
+        last_names = self.provider.name_provider.get_last_names(profile["tribe"])
+        self.assertIn(profile["first_name"], [name["name"] for name in first_names])
+        self.assertIn(profile["last_name"], [name["name"] for name in last_names])
+
+        local_part = profile["email"].split("@")[0]
+        self.assertIn(profile["first_name"].lower(), local_part)
+        self.assertIn(profile["last_name"].lower(), local_part)
+
+        lgas = self.state_provider.get_state(profile["state"])["lgas"]
+        lga_codes = [lga["code"] for lga in lgas if lga["name"] == profile["lga"]]
+        self.assertIn(profile["license_plate"][:3], lga_codes)
+        self.assertEqual(
+            profile["postal_code"],
+            self.state_provider.get_postal_code_by_state(profile["state"]),
+        )
+        self.assertTrue(
+            self.provider.phonenumber_provider.is_valid_number(profile["phone_number"]),
+        )
+        self.assertRegex(profile["license_plate"], r"^[A-Z]{3}-\d{3}[A-Z]{2}$")
+
+    def test_generate_profile(self) -> None:
+        """Test that a single profile has consistent fields."""
+        self.assert_consistent(self.provider.generate_profile())
+
+    def test_profiles_are_consistent(self) -> None:
+        """Test that every profile of a batch has consistent fields."""
+        profiles = self.provider.profiles(500)
+        self.assertEqual(len(profiles), 500)
+        for profile in profiles:
+            self.assert_consistent(profile)
+
+    def test_profiles_with_constraints(self) -> None:
+        """Test that the constraints apply to every profile."""
+        profiles = self.provider.profiles(
+            100,
+            tribe="Igbo",
+            gender="female",
+            region="SW",
+            network="glo",
+            domain="unn.edu.ng",
+        )
+        southwest = {
+            state["name"] for state in self.state_provider.get_states_by_region("SW")
+        }
+        for profile in profiles:
+            self.assertEqual(profile["tribe"], "igbo")
+            self.assertEqual(profile["gender"], "female")
+            self.assertIn(profile["state"], southwest)
+            self.assertTrue(profile["email"].endswith("@unn.edu.ng"))
+            self.assertEqual(
+                self.provider.phonenumber_provider.network_for(profile["phone_number"]),
+                "glo",
+            )
+
+    def test_state_constraint(self) -> None:
+        """Test that a state constraint fixes the state of every profile."""
+        profiles = self.provider.profiles(20, state="lagos")
+        self.assertEqual({profile["state"] for profile in profiles}, {"Lagos"})
+
+    def test_invalid_constraints(self) -> None:
+        """Test that invalid constraints raise a ValueError."""
+        with self.assertRaises(ValueError):
+            self.provider.profiles(1, tribe="unknown")
+        with self.assertRaises(ValueError):
+            self.provider.profiles(1, state="unknown")
+        with self.assertRaises(ValueError):
+            self.provider.profiles(1, state="lagos", region="SE")
+        with self.assertRaises(ValueError):
+            self.provider.profiles(1, network="unknown")
+
+    def test_no_state_pools(self) -> None:
+        """Test that a plan without states with LGAs raises a ValueError."""
+        self.provider.state_pools = {}
+        with self.assertRaisesRegex(ValueError, "state with LGAs"):
+            self.provider.prepare()
+
+    def test_invalid_emails_are_rejected(self) -> None:
+        """Test that batch profiles validate emails like the single email API."""
+        name_provider = NameProvider(
+            [{"tribe": "yoruba", "gender": "female", "name": "Ọlá"}],
+            [{"tribe": "yoruba", "name": "Adé"}],
+        )
+        provider = ProfileProvider(name_provider)
+        with self.assertRaisesRegex(ValueError, "Invalid email format"):
+            provider.email_provider.generate_email(tribe="yoruba")
+        with self.assertRaisesRegex(ValueError, "Invalid email format"):
+            provider.profiles(5)
+
+    def test_compile_profile(self) -> None:
+        """Test that a compiled profile generator keeps its constraints."""
+        generate = self.provider.compile_profile(tribe="yoruba")
+        for _ in range(10):
+            profile = generate()
+            self.assertEqual(profile["tribe"], "yoruba")
+            self.assert_consistent(profile)
+
+    def test_profile_rows(self) -> None:
+        """Test that profile rows follow the profile columns."""
+        columns = self.provider.profile_columns
+        rows = self.provider.profile_rows(50, gender="male", state="Kano")
+        self.assertEqual(len(rows), 50)
+        for row in rows:
+            profile = dict(zip(columns, row, strict=True))
+            self.assertEqual(profile["gender"], "male")
+            self.assertEqual(profile["state"], "Kano")
+            self.assert_consistent(profile)
+
+
+if __name__ == "__main__":
+    unittest.main()
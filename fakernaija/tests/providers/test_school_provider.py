@@ -47,7 +47,7 @@ class TestSchoolProvider(unittest.TestCase):
         """Test the initialization of SchoolProvider."""
         mock_load_json.return_value = self.sample_schools
         provider = SchoolProvider()
-        self.assertEqual(provider.schools_data, self.sample_schools)
+        self.assertEqual(list(provider.schools_data), self.sample_schools)
 
     @patch("fakernaija.providers.school.load_json")
     def test_get_schools_no_filters(self, mock_load_json: MagicMock) -> None:
@@ -55,7 +55,7 @@ class TestSchoolProvider(unittest.TestCase):
         mock_load_json.return_value = self.sample_schools
         provider = SchoolProvider()
         result = provider.get_schools()
-        self.assertEqual(result, self.sample_schools)
+        self.assertEqual(list(result), self.sample_schools)
 
     @patch("fakernaija.providers.school.load_json")
     def test_get_schools_ownership_filter(self, mock_load_json: MagicMock) -> None:
@@ -0,0 +1,154 @@
+"""Unit tests for the dataset backends."""
+
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from fakernaija import Naija
+from fakernaija.backends import MemoryBackend, SQLiteBackend
+from fakernaija.providers import NameProvider, SchoolProvider
+from fakernaija.records import Record
+
+
+class TestBackends(unittest.TestCase):
+    """Test suite for the MemoryBackend and SQLiteBackend classes."""
+
+    temp_dir: tempfile.TemporaryDirectory[str]
+    sqlite: SQLiteBackend
+    memory: MemoryBackend
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Build an SQLite database of the bundled data."""
+        cls.temp_dir = tempfile.TemporaryDirectory()
+        cls.sqlite = SQLiteBackend.build(Path(cls.temp_dir.name) / "dataset.db")
+        cls.memory = MemoryBackend()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        """Close the database and remove the temporary directory."""
+        cls.sqlite.close()
+        cls.temp_dir.cleanup()
+
+    def test_backends_agree(self) -> None:
+        """Test that both backends answer the same queries alike."""
+        queries = [
+            ("schools", {}),
+            ("schools", {"ownership": "FEDERAL", "state": "lagos"}),
+            ("schools", {"state": "ekiti", "type": "college", "ownership": "private"}),
+            ("first_names", {"tribe": "igbo", "gender": "female"}),
+            ("last_names", {"tribe": "edo"}),
+            ("states", {"region": "South West"}),
+        ]
+        for table, filters in queries:
+            with self.subTest(table=table, filters=filters):
+                records = self.memory.select(table, **filters)
+                self.assertEqual(self.sqlite.select(table, **filters), records)
+                self.assertEqual(self.sqlite.count(table, **filters), len(records))
+        self.assertEqual(
+            self.sqlite.values("first_names", "name", tribe="yoruba"),
+            self.memory.values("first_names", "name", tribe="yoruba"),
+        )
+        self.assertEqual(
+            self.sqlite.distinct("first_names", "tribe"),
+            self.memory.distinct("first_names", "tribe"),
+        )
+
+    def test_sample(self) -> None:
+        """Test that samples only hold matching records."""
+        for backend in (self.memory, self.sqlite):
+            with self.subTest(backend=type(backend).__name__):
+                schools = backend.sample("schools", 2000, state="lagos")
+                self.assertEqual(len(schools), 2000)
+                self.assertTrue(all(isinstance(s, Record) for s in schools))
+                self.assertEqual({school["state"] for school in schools}, {"Lagos"})
+                self.assertEqual(
+                    backend.sample(
+                        "schools", 5, state="ekiti", ownership="private", type="college"
+                    ),
+                    [],
+                )
+                state = backend.sample("states", 1, name="lagos")[0]
+                self.assertEqual(state["lgas"][0], {"name": "Agege", "code": "GGE"})
+
+    def test_invalid_queries(self) -> None:
+        """Test that unknown tables, filters and columns raise errors."""
+        for backend in (self.memory, self.sqlite):
+            with self.subTest(backend=type(backend).__name__):
+                with self.assertRaisesRegex(ValueError, "Unknown table"):
+                    backend.select("cities")
+                with self.assertRaisesRegex(ValueError, "Unsupported filter"):
+                    backend.select("schools", acronym="UNILAG")
+                with self.assertRaisesRegex(ValueError, "Unknown column"):
+                    backend.values("schools", "city")
+        with self.assertRaises(FileNotFoundError):
+            SQLiteBackend(Path(self.temp_dir.name) / "missing.db")
+
+    def test_build_from_records(self) -> None:
+        """Test that a database is built from custom record files."""
+        names = Path(self.temp_dir.name) / "first_names.jsonl"
+        names.write_text(
+            "\n".join(
+                json.dumps({"tribe": "Tiv", "gender": "male", "name": name})
+                for name in ["Terver", "Aondona"]
+            ),
+            encoding="utf-8",
+        )
+        backend = SQLiteBackend.build(
+            Path(self.temp_dir.name) / "custom.db",
+            {"first_names": names},
+            batch_size=1,
+        )
+        self.addCleanup(backend.close)
+        self.assertEqual(backend.count("first_names", tribe="tiv"), 2)
+        self.assertEqual(backend.count("first_names"), 2)
+        self.assertGreater(backend.count("last_names"), 0)
+
+        provider = NameProvider(backend=backend)
+        self.assertIn("tiv", provider.tribes)
+        self.assertIn(provider.generate_first_name(tribe="tiv"), {"Terver", "Aondona"})
+        self.assertEqual(
+            provider.get_first_name_values(tribe="tiv"), ("Terver", "Aondona")
+        )
+
+    def test_providers_with_backend(self) -> None:
+        """Test that the providers query the backend."""
+        provider = SchoolProvider(self.sqlite)
+        self.assertEqual(
+            list(provider.get_schools(ownership="federal", state="lagos")),
+            list(SchoolProvider().get_schools(ownership="federal", state="lagos")),
+        )
+        with self.assertRaisesRegex(ValueError, "Did you mean"):
+            provider.sample_schools(1, state="lagso")
+        with self.assertRaisesRegex(ValueError, "not both"):
+            NameProvider(first_names=[], backend=self.sqlite)
+
+    def test_naija_with_backend(self) -> None:
+        """Test that Naija generates data from a backend."""
+        naija = Naija(backend=self.sqlite)
+        school = naija.school(state="lagos", school_type="university")
+        if school is None:
+            self.fail("No school found.")
+        self.assertEqual(school["state"], "Lagos")
+        self.assertIsNone(
+            naija.school(state="ekiti", ownership="private", school_type="college")
+        )
+        self.assertEqual(len(list(naija.many("school", 10, ownership="state"))), 10)
+        self.assertEqual(naija.state(region="SW")["region"], "South West")
+        self.assertIn(
+            naija.state_lga("lagos")["name"],
+            {
+                "Agege",
+                *(lga["name"] for lga in naija.state_provider.get_state_lgas("lagos")),
+            },
+        )
+        self.assertIn(
+            naija.first_name(tribe="hausa", gender="male"),
+            naija.name_provider.get_first_name_values("hausa", "male"),
+        )
+        self.assertEqual(len(naija.profile()), len(Naija().profile()))
+
+
+if __name__ == "__main__":
+    unittest.main()
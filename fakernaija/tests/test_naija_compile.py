@@ -0,0 +1,61 @@
+"""Unit tests for the compiled generators of the Naija class."""
+
+import unittest
+
+from fakernaija import Naija
+
+
+class TestNaijaCompile(unittest.TestCase):
+    """Test suite for Naija.compile."""
+
+    def setUp(self) -> None:
+        """Set up the test case environment."""
+        self.naija = Naija()
+
+    def test_fields(self) -> None:
+        """Test that every public generator can be compiled."""
+        fields = Naija.fields()
+        self.assertIn("email", fields)
+        self.assertIn("state_postal_code", fields)
+        for field in fields:
+            self.assertTrue(callable(getattr(self.naija, field)))
+
+    def test_compile_every_field(self) -> None:
+        """Test that every compiled field returns values."""
+        for field in Naija.fields():
+            with self.subTest(field=field):
+                self.assertIsNotNone(self.naija.compile(field)())
+
+    def test_compile_with_arguments(self) -> None:
+        """Test that compiled arguments are bound."""
+        state_lga = self.naija.compile("state_lga", state="lagos")
+        lagos_lgas = self.naija.state_provider.get_state_lgas("lagos")
+        for _ in range(10):
+            self.assertIn(state_lga(), lagos_lgas)
+        self.assertEqual(
+            self.naija.compile("state_postal_code", state="lagos")(),
+            self.naija.state_postal_code(state="lagos"),
+        )
+
+    def test_compile_shares_used_values(self) -> None:
+        """Test that compiled unique fields share used values with the method."""
+        religion = self.naija.compile("religion")
+        first = self.naija.religion()
+        self.assertNotEqual(religion(), first)
+
+    def test_compile_validates_arguments(self) -> None:
+        """Test that invalid arguments are rejected when compiling."""
+        with self.assertRaises(ValueError):
+            self.naija.compile("email", gender="unknown")
+        with self.assertRaises(TypeError):
+            self.naija.compile("religion", tribe="igbo")
+
+    def test_compile_unsupported_field(self) -> None:
+        """Test that an unsupported field suggests close matches."""
+        with self.assertRaises(ValueError) as context:
+            self.naija.compile("emial")
+        self.assertIn("Did you mean: email", str(context.exception))
+
+
+if __name__ == "__main__":
+    unittest.main()
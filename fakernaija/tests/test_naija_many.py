@@ -0,0 +1,72 @@
+"""Unit tests for the batch generation of the Naija class."""
+
+import unittest
+from collections.abc import Iterator
+from unittest.mock import patch
+
+from fakernaija import Naija
+
+
+class TestNaijaMany(unittest.TestCase):
+    """Test suite for Naija.many."""
+
+    def setUp(self) -> None:
+        """Set up the test case environment."""
+        self.naija = Naija()
+
+    def test_many_every_field(self) -> None:
+        """Test that every field generates a batch of the requested size."""
+        for field in Naija.fields():
+            with self.subTest(field=field):
+                values = self.naija.many(field, 25)
+                self.assertIsInstance(values, list)
+                self.assertEqual(len(list(values)), 25)
+
+    def test_many_with_arguments(self) -> None:
+        """Test that arguments are applied to the whole batch."""
+        phone_numbers = self.naija.many("phone_number", 100, network="glo")
+        provider = self.naija.phonenumber_provider
+        self.assertEqual(set(provider.classify(phone_numbers)), {"glo"})
+
+        emails = self.naija.many("email", 100, domain="unn.edu.ng")
+        self.assertTrue(all(email.endswith("@unn.edu.ng") for email in emails))
+
+    def test_many_unique_field(self) -> None:
+        """Test that unique fields cycle through the whole pool."""
+        states = self.naija.many("state_name", 37)
+        self.assertEqual(len(set(states)), 37)
+
+    def test_many_stream(self) -> None:
+        """Test that stream returns a lazy iterator."""
+        values = self.naija.many("full_name", 5, stream=True, tribe="igbo")
+        self.assertIsInstance(values, Iterator)
+        self.assertEqual(len(list(values)), 5)
+
+    def test_many_zero(self) -> None:
+        """Test that asking for no values returns an empty list."""
+        self.assertEqual(self.naija.many("email", 0), [])
+
+    def test_many_validates_before_generating(self) -> None:
+        """Test that invalid input is rejected even when streaming."""
+        with self.assertRaises(ValueError):
+            self.naija.many("email", -1)
+        with self.assertRaises(ValueError):
+            self.naija.many("phone_number", 10, stream=True, network="unknown")
+        with self.assertRaises(ValueError):
+            self.naija.many("unknown", 10)
+
+    def test_many_validates_once(self) -> None:
+        """Test that batch fields validate their arguments once per call."""
+        provider = self.naija.degree_provider
+        with patch.object(
+            provider,
+            "validate_degree_type",
+            wraps=provider.validate_degree_type,
+        ) as validate:
+            names = self.naija.many("degree_name", 10, degree_type="Masters")
+        validate.assert_called_once_with("Masters")
+        self.assertTrue(set(names) <= set(provider.degree_names_by_type["masters"]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,116 @@
+"""Unit tests for the tuple rows of the Naija class."""
+
+import json
+import sqlite3
+import unittest
+
+from fakernaija import Naija
+
+
+class TestNaijaRows(unittest.TestCase):
+    """Test suite for Naija.rows and Naija.row_header."""
+
+    def setUp(self) -> None:
+        """Set up the test case environment."""
+        self.naija = Naija()
+
+    def test_record_rows_match_records(self) -> None:
+        """Test that record rows follow the header of their records."""
+        for field in ["state", "school", "degree", "course", "faculty", "profile"]:
+            with self.subTest(field=field):
+                header = self.naija.row_header(field)
+                self.assertEqual(header, tuple(self.naija.compile(field)()))
+                rows = self.naija.rows(field, 20)
+                self.assertEqual(len(rows), 20)
+                for row in rows:
+                    self.assertIsInstance(row, tuple)
+                    self.assertEqual(len(row), len(header))
+
+    def test_record_rows_with_arguments(self) -> None:
+        """Test that arguments filter record rows."""
+        header = self.naija.row_header("state")
+        for row in self.naija.rows("state", 50, region="SW"):
+            self.assertEqual(
+                dict(zip(header, row, strict=True))["region"], "South West"
+            )
+
+        header = self.naija.row_header("school")
+        for row in self.naija.rows("school", 50, ownership="federal", state="lagos"):
+            school = dict(zip(header, row, strict=True))
+            self.assertEqual(
+                (school["ownership"], school["state"]), ("Federal", "Lagos")
+            )
+
+        self.assertEqual(
+            self.naija.rows(
+                "school", 5, state="ekiti", school_type="college", ownership="private"
+            ),
+            [],
+        )
+
+    def test_single_field_rows(self) -> None:
+        """Test that other fields generate one-column rows."""
+        self.assertEqual(self.naija.row_header("email"), ("email",))
+        rows = self.naija.rows("email", 10, domain="unilag.edu.ng")
+        self.assertEqual(len(rows), 10)
+        self.assertTrue(all(email.endswith("@unilag.edu.ng") for (email,) in rows))
+
+    def test_multiple_field_rows(self) -> None:
+        """Test that a sequence of fields generates one column per field."""
+        fields = ["full_name", "state_name", "phone_number"]
+        self.assertEqual(self.naija.row_header(fields), tuple(fields))
+        rows = self.naija.rows(fields, 15)
+        self.assertEqual(len(rows), 15)
+        self.assertTrue(all(len(row) == len(fields) for row in rows))
+
+    def test_rows_feed_executemany(self) -> None:
+        """Test that the rows of every field can be inserted with executemany."""
+        connection = sqlite3.connect(":memory:")
+        self.addCleanup(connection.close)
+        for index, field in enumerate(self.naija.fields()):
+            with self.subTest(field=field):
+                header = self.naija.row_header(field)
+                columns = ", ".join(f"c{i}" for i in range(len(header)))
+                connection.execute(f"CREATE TABLE t{index} ({columns})")
+                connection.executemany(
+                    f"INSERT INTO t{index} VALUES ({', '.join('?' * len(header))})",  # noqa: S608
+                    self.naija.rows(field, 10),
+                )
+
+    def test_nested_columns_are_json(self) -> None:
+        """Test that nested columns are JSON text, not the provider's data."""
+        header = self.naija.row_header("faculty")
+        name, departments = self.naija.rows("faculty", 1)[0]
+        faculty = next(
+            faculty
+            for faculty in self.naija.faculty_provider.faculties_data
+            if faculty["name"] == name
+        )
+        self.assertEqual(header, ("faculty_name", "departments"))
+        self.assertEqual(json.loads(departments), list(faculty["departments"]))
+
+        header = self.naija.row_header("state")
+        state = dict(zip(header, self.naija.rows("state", 1)[0], strict=True))
+        self.assertIsInstance(json.loads(state["lgas"]), list)
+
+        ((lga,),) = self.naija.rows("state_lga", 1)
+        self.assertEqual(set(json.loads(lga)), {"name", "code"})
+
+    def test_invalid_rows(self) -> None:
+        """Test that invalid fields, sizes and arguments raise errors."""
+        with self.assertRaisesRegex(ValueError, "Did you mean: state"):
+            self.naija.rows("stat", 5)
+        with self.assertRaisesRegex(ValueError, "Did you mean: email"):
+            self.naija.row_header(["full_name", "emial"])
+        with self.assertRaisesRegex(ValueError, "non-negative"):
+            self.naija.rows("state", -1)
+        with self.assertRaisesRegex(ValueError, "compile_schema"):
+            self.naija.rows(["full_name", "email"], 5, tribe="igbo")
+        with self.assertRaisesRegex(ValueError, "At least one field"):
+            self.naija.rows([], 5)
+        with self.assertRaises(ValueError):
+            self.naija.rows("state", 5, region="nowhere")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,76 @@
+"""Unit tests for the streaming generators of the Naija class."""
+
+import itertools
+import unittest
+
+from fakernaija import Naija
+
+
+class TestNaijaStream(unittest.TestCase):
+    """Test suite for Naija.stream."""
+
+    def setUp(self) -> None:
+        """Set up the test case environment."""
+        self.naija = Naija()
+
+    def test_stream_every_field(self) -> None:
+        """Test that every field streams across chunk boundaries."""
+        for field in Naija.fields():
+            with self.subTest(field=field):
+                stream = self.naija.stream(field, chunk_size=4)
+                self.assertEqual(len(list(itertools.islice(stream, 10))), 10)
+
+    def test_stream_with_arguments(self) -> None:
+        """Test that arguments apply to every streamed value."""
+        stream = self.naija.stream("phone_number", chunk_size=8, network="glo")
+        phone_numbers = list(itertools.islice(stream, 20))
+        provider = self.naija.phonenumber_provider
+        self.assertEqual(set(provider.classify(phone_numbers)), {"glo"})
+
+    def test_send_changes_arguments(self) -> None:
+        """Test that sent arguments apply from the next value on."""
+        stream = self.naija.stream("phone_number", network="mtn")
+        provider = self.naija.phonenumber_provider
+        self.assertEqual(provider.network_for(next(stream)), "mtn")
+
+        self.assertEqual(provider.network_for(stream.send({"network": "glo"})), "glo")
+        self.assertEqual(provider.network_for(next(stream)), "glo")
+
+        phone_number = stream.send({"network": None, "prefix": "0803"})
+        self.assertTrue(phone_number.startswith("0803"))
+
+    def test_stream_validates_eagerly(self) -> None:
+        """Test that invalid input is rejected before the first value."""
+        with self.assertRaises(ValueError):
+            self.naija.stream("email", tribe="unknown")
+        with self.assertRaises(ValueError):
+            self.naija.stream("email", chunk_size=0)
+        with self.assertRaises(ValueError):
+            self.naija.stream("unknown")
+        with self.assertRaisesRegex(ValueError, "list values are not supported"):
+            self.naija.stream("email", tribe=["igbo"])
+
+    def test_send_invalid_arguments(self) -> None:
+        """Test that invalid sent arguments raise and end the stream."""
+        stream = self.naija.stream("state_name")
+        next(stream)
+        with self.assertRaises(ValueError):
+            stream.send({"region": "unknown"})
+        with self.assertRaises(StopIteration):
+            next(stream)
+
+    def test_send_unhashable_arguments(self) -> None:
+        """Test that unhashable sent values raise the ValueError of ``many``."""
+        with self.assertRaises(ValueError) as many_error:
+            self.naija.many("phone_number", 3, network=["glo"])
+        stream = self.naija.stream("phone_number")
+        next(stream)
+        with self.assertRaises(ValueError) as stream_error:
+            stream.send({"network": ["glo"]})
+        self.assertEqual(str(stream_error.exception), str(many_error.exception))
+        with self.assertRaises(StopIteration):
+            next(stream)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,91 @@
+"""Unit tests for the parallel chunked generation."""
+
+import random
+import unittest
+
+from click.testing import CliRunner
+
+from fakernaija import Naija
+from fakernaija.commands.email import email
+from fakernaija.parallel import (
+    FieldJob,
+    SchemaJob,
+    chunk_sizes,
+    derive_seed,
+    generate_chunks,
+)
+
+
+class TestParallel(unittest.TestCase):
+    """Test suite for generate_chunks and the --workers and --seed options."""
+
+    def test_chunk_sizes_and_seeds(self) -> None:
+        """Test that chunks cover the values and seeds are derived stably."""
+        self.assertEqual(chunk_sizes(25, 10), [10, 10, 5])
+        self.assertEqual(chunk_sizes(20, 10), [10, 10])
+        self.assertEqual(chunk_sizes(0, 10), [])
+        self.assertEqual(derive_seed(42, 3), derive_seed(42, 3))
+        self.assertNotEqual(derive_seed(42, 3), derive_seed(42, 4))
+        self.assertNotEqual(derive_seed(42, 3), derive_seed(43, 3))
+
+    def test_same_output_for_any_workers(self) -> None:
+        """Test that a seed gives the same chunks in and across processes."""
+        job = SchemaJob({"name": "full_name", "state": "state_name"})
+        expected = list(generate_chunks(job, 2500, seed=7, chunk_size=1000))
+        self.assertEqual([len(chunk) for chunk in expected], [1000, 1000, 500])
+        self.assertEqual(
+            list(generate_chunks(job, 2500, workers=2, seed=7, chunk_size=1000)),
+            expected,
+        )
+        unordered = generate_chunks(
+            job, 2500, workers=2, seed=7, ordered=False, chunk_size=1000
+        )
+        self.assertCountEqual(
+            [tuple(row.values()) for chunk in unordered for row in chunk],
+            [tuple(row.values()) for chunk in expected for row in chunk],
+        )
+        self.assertNotEqual(
+            list(generate_chunks(job, 2500, seed=8, chunk_size=1000)), expected
+        )
+
+    def test_chunks_are_independent(self) -> None:
+        """Test that session-unique values restart in every chunk."""
+        chunks = list(generate_chunks(FieldJob("religion"), 20, seed=1, chunk_size=10))
+        first = list(generate_chunks(FieldJob("religion"), 10, seed=1, chunk_size=10))
+        self.assertEqual(chunks[0], first[0])
+
+    def test_random_state_is_kept(self) -> None:
+        """Test that in-process chunks leave the global random state as it was."""
+        random.seed(5)
+        expected = random.random()
+        random.seed(5)
+        list(generate_chunks(FieldJob("email", {"tribe": "igbo"}), 100, seed=1))
+        self.assertEqual(random.random(), expected)
+        with self.assertRaises(ValueError):
+            list(generate_chunks(FieldJob("email"), 10, workers=0))
+
+    def test_reset_unique(self) -> None:
+        """Test that reset_unique forgets the used values."""
+        naija = Naija()
+        naija.state_name()
+        self.assertTrue(naija._used_state_names)  # noqa: SLF001
+        naija.reset_unique()
+        self.assertFalse(naija._used_state_names)  # noqa: SLF001
+
+    def test_workers_option(self) -> None:
+        """Test that --workers and --seed give the same output as --seed alone."""
+        runner = CliRunner()
+        arguments = ["-r", "30", "--out", "-", "--seed", "3"]
+        expected = runner.invoke(email, arguments)
+        self.assertEqual(expected.exit_code, 0)
+        self.assertEqual(len(expected.output.splitlines()), 30)
+        result = runner.invoke(email, [*arguments, "--workers", "2"])
+        self.assertEqual(result.output, expected.output)
+        result = runner.invoke(
+            email, ["-r", "3", "--domain", "nowhere", "--workers", "2"]
+        )
+        self.assertIn("Error", result.output)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,105 @@
+"""Unit tests for the immutable records of the fakernaija package."""
+
+import copy
+import json
+import pickle
+import unittest
+from unittest.mock import patch
+
+from fakernaija import Naija
+from fakernaija.records import Record, freeze, to_builtin
+
+
+class TestRecord(unittest.TestCase):
+    """Test suite for the Record class."""
+
+    def setUp(self) -> None:
+        """Set up a nested record for testing."""
+        self.data = {
+            "name": "Lagos",
+            "lgas": [{"name": "Ikeja", "code": "IKJ"}, {"name": "Epe", "code": "EPE"}],
+        }
+        self.record = Record(self.data)
+
+    def test_mapping_interface(self) -> None:
+        """Test that a record reads like a dict and equals it."""
+        self.assertEqual(self.record["name"], "Lagos")
+        self.assertEqual(self.record.get("slogan", "none"), "none")
+        self.assertIn("lgas", self.record)
+        self.assertEqual(list(self.record), ["name", "lgas"])
+        self.assertEqual(len(self.record), 2)
+        self.assertEqual(self.record, self.data)
+        self.assertEqual(str(self.record), str(self.data))
+        with self.assertRaises(KeyError):
+            self.record["capital"]
+
+    def test_nested_values_are_frozen(self) -> None:
+        """Test that nested dicts and lists are frozen."""
+        lgas = self.record["lgas"]
+        self.assertIsInstance(lgas, tuple)
+        self.assertIsInstance(lgas[0], Record)
+        self.assertEqual(freeze([{"a": [1]}]), (Record({"a": (1,)}),))
+
+    def test_equality(self) -> None:
+        """Test that records compare by items, ignoring order and list types."""
+        reordered = {"lgas": tuple(self.data["lgas"]), "name": "Lagos"}
+        self.assertEqual(self.record, Record(reordered))
+        self.assertEqual(self.record, reordered)
+        self.assertEqual(Record({"codes": [[1, 2]]}), {"codes": [(1, 2)]})
+        for other in (
+            {"name": "Lagos"},
+            {"name": "Lagos", "capital": self.data["lgas"]},
+            {"name": "Lagos", "lgas": self.data["lgas"][:1]},
+            {"name": "Lagos", "lgas": "Ikeja, Epe"},
+        ):
+            with self.subTest(other=other):
+                self.assertNotEqual(self.record, other)
+                self.assertNotEqual(self.record, Record(other))
+        with patch.object(Record, "to_dict") as to_dict:
+            self.assertEqual(self.record, Record(self.data))
+            self.assertEqual(self.record, self.data)
+        to_dict.assert_not_called()
+
+    def test_immutable(self) -> None:
+        """Test that records cannot be modified."""
+        with self.assertRaises(TypeError):
+            self.record["name"] = "Abuja"  # type: ignore[index]
+        with self.assertRaises(AttributeError):
+            self.record.name = "Abuja"
+        with self.assertRaises(AttributeError):
+            del self.record.name  # type: ignore[attr-defined]
+
+    def test_to_dict(self) -> None:
+        """Test that to_dict returns an independent mutable copy."""
+        data = self.record.to_dict()
+        self.assertEqual(data, self.data)
+        self.assertIsInstance(data["lgas"], list)
+        self.assertIsInstance(data["lgas"][0], dict)
+        data["lgas"].append({"name": "Badagry", "code": "BDG"})
+        self.assertEqual(len(self.record["lgas"]), 2)
+
+    def test_hash_copy_and_serialization(self) -> None:
+        """Test that records hash, copy, pickle and serialize to JSON."""
+        self.assertEqual(hash(self.record), hash(Record(self.data)))
+        self.assertEqual(len({self.record, Record(self.data)}), 1)
+        self.assertEqual(copy.deepcopy(self.record), self.record)
+        self.assertEqual(pickle.loads(pickle.dumps(self.record)), self.record)  # noqa: S301
+        self.assertEqual(
+            json.loads(json.dumps(self.record, default=to_builtin)),
+            self.data,
+        )
+
+    def test_naija_records_are_shared_and_read_only(self) -> None:
+        """Test that generated records are the provider's records, read-only."""
+        naija = Naija()
+        state = naija.state()
+        self.assertIs(state, naija.state_provider.get_state(state["name"]))
+        school = naija.school()
+        self.assertIsNotNone(school)
+        for record in [state, school, naija.course(), naija.degree()]:
+            with self.subTest(record=record), self.assertRaises(TypeError):
+                record["name"] = "Changed"  # type: ignore[index]
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,253 @@
+"""Unit tests for the schema compiler."""
+
+import ast
+import json
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+from click.testing import CliRunner
+
+from fakernaija import Naija
+from fakernaija.commands.generate import generate
+from fakernaija.schema import (
+    Reference,
+    SchemaPlan,
+    load_schema,
+    parse_fields,
+    parse_spec,
+    split_fields,
+)
+
+
+class TestParseSpec(unittest.TestCase):
+    """Test suite for parse_spec."""
+
+    def test_field_only(self) -> None:
+        """Test parsing a spec without arguments."""
+        self.assertEqual(parse_spec("email"), ("email", {}))
+        self.assertEqual(parse_spec(" email() "), ("email", {}))
+
+    def test_arguments(self) -> None:
+        """Test parsing literal and reference arguments."""
+        field, arguments = parse_spec(
+            "school_name(acronym=true, state='akwa ibom', ownership=federal, x=$s.name)",
+        )
+        self.assertEqual(field, "school_name")
+        self.assertEqual(
+            arguments,
+            {
+                "acronym": True,
+                "state": "akwa ibom",
+                "ownership": "federal",
+                "x": Reference("s", ("name",)),
+            },
+        )
+
+    def test_mapping(self) -> None:
+        """Test parsing a mapping spec."""
+        self.assertEqual(
+            parse_spec({"field": "email", "name": "$name", "tribe": "igbo"}),
+            ("email", {"name": Reference("name"), "tribe": "igbo"}),
+        )
+
+    def test_invalid_specs(self) -> None:
+        """Test that malformed specs raise a ValueError."""
+        for spec in [
+            "email(",
+            "email(name=)",
+            "email(name)",
+            "full name",
+            {"name": "x"},
+        ]:
+            with self.subTest(spec=spec), self.assertRaises(ValueError):
+                parse_spec(spec)  # type: ignore[arg-type]
+
+
+class TestSchemaPlan(unittest.TestCase):
+    """Test suite for SchemaPlan."""
+
+    def setUp(self) -> None:
+        """Set up the test case environment."""
+        self.naija = Naija()
+
+    def test_generate(self) -> None:
+        """Test that rows follow the schema and resolve references."""
+        plan = SchemaPlan(
+            self.naija,
+            {
+                "email": "email(name=$name)",
+                "name": "full_name(tribe=yoruba)",
+                "state": "state(region=SW)",
+                "lga": "state_lga(state=$state.name)",
+            },
+        )
+        self.assertEqual(plan.header, ("email", "name", "state", "lga"))
+        self.assertLess(plan.order.index("name"), plan.order.index("email"))
+
+        rows = plan.generate(50, batch_size=7)
+        self.assertEqual(len(rows), 50)
+        for row in rows:
+            self.assertEqual(list(row), ["email", "name", "state", "lga"])
+            first_name, last_name = row["name"].lower().split()
+            self.assertIn(first_name, row["email"])
+            self.assertIn(last_name, row["email"])
+            self.assertEqual(row["state"]["region"], "South West")
+            self.assertIn(row["lga"], row["state"]["lgas"])
+
+    def test_batches(self) -> None:
+        """Test that rows are generated in batches of the requested size."""
+        plan = SchemaPlan(self.naija, {"phone": "phone_number(network=mtn)"})
+        self.assertEqual([len(batch) for batch in plan.batches(25, 10)], [10, 10, 5])
+
+    def test_rows(self) -> None:
+        """Test that rows are tuples in header order."""
+        plan = SchemaPlan(self.naija, {"name": "full_name", "state": "state_name"})
+        rows = plan.rows(25, 10)
+        self.assertEqual(len(rows), 25)
+        for name, state in rows:
+            self.assertEqual(len(name.split()), 2)
+            self.assertIn(state, self.naija.state_provider.get_state_names())
+
+    def test_invalid_schemas(self) -> None:
+        """Test that invalid schemas are rejected when compiling."""
+        schemas = [
+            {},
+            {"a": "emial"},
+            {"a": "email(unknown=1)"},
+            {"a": "email(tribe=unknown)"},
+            {"a": "email(name=$b)"},
+            {"a": "email(name=$a)"},
+            {"a": "email(name=$b)", "b": "full_name(tribe=$a)"},
+        ]
+        for schema in schemas:
+            with self.subTest(schema=schema), self.assertRaises(ValueError):
+                SchemaPlan(self.naija, schema)
+
+    def test_compile_schema_from_files(self) -> None:
+        """Test that Naija.compile_schema loads JSON and TOML schemas."""
+        with tempfile.TemporaryDirectory() as directory:
+            json_path = Path(directory) / "schema.json"
+            json_path.write_text(json.dumps({"state": "state_name(region=SE)"}))
+            toml_path = Path(directory) / "schema.toml"
+            toml_path.write_text('state = { field = "state_name", region = "SE" }\n')
+
+            self.assertEqual(load_schema(json_path), {"state": "state_name(region=SE)"})
+            paths = [json_path]
+            if sys.version_info >= (3, 11):
+                paths.append(toml_path)
+            for path in paths:
+                rows = self.naija.compile_schema(path).generate(5)
+                southeast = self.naija.state_provider.get_states_by_region("SE")
+                for row in rows:
+                    self.assertIn(row["state"], [state["name"] for state in southeast])
+
+
+class TestParseFields(unittest.TestCase):
+    """Test suite for parse_fields and the generate --fields command."""
+
+    def test_split_fields(self) -> None:
+        """Test that commas inside arguments and quotes do not split fields."""
+        self.assertEqual(
+            split_fields("full_name(tribe=igbo, gender=male), email ,state_name,"),
+            ["full_name(tribe=igbo, gender=male)", "email", "state_name"],
+        )
+        self.assertEqual(
+            split_fields("email(domain='a,b'),phone_number"),
+            ["email(domain='a,b')", "phone_number"],
+        )
+
+    def test_columns(self) -> None:
+        """Test that columns are named after fields, or explicitly."""
+        self.assertEqual(
+            parse_fields("name=full_name(tribe=igbo),phone_number(network=mtn)"),
+            {
+                "name": {"field": "full_name", "tribe": "igbo"},
+                "phone_number": {"field": "phone_number", "network": "mtn"},
+            },
+        )
+        with self.assertRaisesRegex(ValueError, "Duplicate column"):
+            parse_fields("email,email")
+        with self.assertRaisesRegex(ValueError, "at least one field"):
+            parse_fields(" , ")
+
+    def test_links(self) -> None:
+        """Test that fields take the values of the fields they depend on."""
+        schema = parse_fields("state,full_name,email,state_lga,lp=license_plate")
+        self.assertEqual(schema["email"], {"field": "email", "name": "$full_name"})
+        self.assertEqual(
+            schema["lp"], {"field": "license_plate", "state": "$state.name"}
+        )
+        schema = parse_fields("state_name,state_lga(state=lagos),email")
+        self.assertEqual(schema["state_lga"], {"field": "state_lga", "state": "lagos"})
+        self.assertEqual(schema["email"], {"field": "email"})
+        self.assertNotIn("name", parse_fields("full_name,email", link=False)["email"])
+
+    def test_literals_round_trip(self) -> None:
+        """Test that quoted literals stay literals in the built schema."""
+        schema = parse_fields("email(domain='none'),x=email(domain=\"$x\")")
+        self.assertEqual(parse_spec(schema["email"]), ("email", {"domain": "none"}))
+        self.assertEqual(parse_spec(schema["x"]), ("email", {"domain": "$x"}))
+
+    def test_coherent_rows(self) -> None:
+        """Test that linked fields generate coherent rows."""
+        naija = Naija()
+        plan = naija.compile_schema(
+            parse_fields("state_name,full_name,email,state_lga")
+        )
+        for row in plan.generate(50):
+            lgas = naija.state_provider.get_state_lgas(row["state_name"])
+            self.assertIn(row["state_lga"], lgas)
+            first, last = row["full_name"].lower().split()[:2]
+            self.assertTrue(first in row["email"] or last in row["email"])
+
+    def test_generate_command(self) -> None:
+        """Test that generate takes either a schema file or a field list."""
+        runner = CliRunner()
+        result = runner.invoke(
+            generate,
+            [
+                "--fields",
+                "full_name,email,phone_number",
+                "-r",
+                "5",
+                "--out",
+                "-",
+                "-o",
+                "csv",
+            ],
+        )
+        self.assertEqual(result.exit_code, 0)
+        lines = result.output.splitlines()
+        self.assertEqual(lines[0], "full_name,email,phone_number")
+        self.assertEqual(len(lines), 6)
+        result = runner.invoke(
+            generate,
+            [
+                "-f",
+                "name=full_name,lga=state_lga",
+                "-r",
+                "2",
+                "--out",
+                "-",
+                "-o",
+                "csv",
+            ],
+        )
+        self.assertEqual(result.output.splitlines()[0], "name,lga")
+        result = runner.invoke(
+            generate, ["--fields", "state_name,state_lga", "-r", "3"]
+        )
+        self.assertEqual(result.exit_code, 0)
+        self.assertNotIn("Record(", result.output)
+        for line in result.output.splitlines():
+            row = ast.literal_eval(line)
+            self.assertEqual(set(row["state_lga"]), {"name", "code"})
+        for arguments in ([], ["--fields", "email", "--schema", __file__]):
+            result = runner.invoke(generate, arguments)
+            self.assertIn("Use either --schema or --fields", result.output)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,806 @@
+"""Unit tests for the output sinks and the streaming CLI output."""
+
+import bz2
+import csv
+import gzip
+import io
+import json
+import lzma
+import sqlite3
+import tempfile
+import unittest
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+import click
+from click.testing import CliRunner
+
+from fakernaija import Naija
+from fakernaija.records import Record, to_builtin
+from fakernaija.sinks import (
+    COMPRESSIONS,
+    CsvSink,
+    JsonlSink,
+    JsonSink,
+    PgCopySink,
+    Sink,
+    SQLiteSink,
+    SqlSink,
+    TextSink,
+    compressed_stream,
+    copy_row,
+    create_sink,
+    sql_row,
+    write_json_array,
+    write_jsonl,
+    write_sqlite,
+)
+from fakernaija.sinks.compression import infer_compression
+from fakernaija.utils import (
+    OUTPUT_CHUNK_SIZE,
+    chunked,
+    command_chunk_sizes,
+    generate_command_data,
+    get_unique_filename,
+    handle_command_output,
+    infer_output_format,
+    output_options,
+    parse_size,
+    partition_name,
+    write_data_to_file,
+    write_data_to_partitions,
+    write_data_to_shards,
+)
+
+
+class TestSinks(unittest.TestCase):
+    """Test suite for the CSV, JSON and text sinks."""
+
+    def setUp(self) -> None:
+        """Set up the test case environment."""
+        self.records = [
+            Record({"name": "Lagos", "postal_code": "100001", "lgas": ["Epe"]}),
+            Record({"name": "Oyo", "postal_code": "200001", "lgas": ["Saki"]}),
+            Record({"name": "Kano", "postal_code": "700001", "lgas": []}),
+        ]
+
+    def write(
+        self, sink_class: type[Sink], items: list[Any], batch_size: int = 2
+    ) -> str:
+        """Write items through a sink in batches and return the output."""
+        file = io.StringIO(newline="")
+        sink = sink_class(file, "states")
+        for batch in chunked(items, batch_size):
+            sink.write(batch)
+        sink.close()
+        return file.getvalue()
+
+    def test_json_sink_matches_json_dump(self) -> None:
+        """Test that the streamed JSON array is the same as json.dump."""
+        cases: list[list[Any]] = [self.records, ["a", "b", "c"], ["a"], []]
+        for items in cases:
+            with self.subTest(items=items):
+                expected = json.dumps(
+                    [
+                        record.to_dict() if isinstance(record, Record) else record
+                        for record in items
+                    ],
+                    indent=4,
+                )
+                self.assertEqual(self.write(JsonSink, items), expected)
+
+    def test_compact_json_array(self) -> None:
+        """Test that compact JSON arrays hold one element per line."""
+        output = self.write(JsonSink, self.records)
+        self.assertEqual(json.loads(output), [r.to_dict() for r in self.records])
+
+        file = io.StringIO()
+        self.assertEqual(write_json_array(iter(self.records), file), 3)
+        lines = file.getvalue().splitlines()
+        self.assertEqual(lines[0], "[")
+        self.assertEqual(
+            lines[1], '{"name":"Lagos","postal_code":"100001","lgas":["Epe"]},'
+        )
+        self.assertEqual(lines[-1], "]")
+        self.assertEqual(
+            json.loads(file.getvalue()), [r.to_dict() for r in self.records]
+        )
+
+        file = io.StringIO()
+        self.assertEqual(write_json_array(iter([]), file), 0)
+        self.assertEqual(file.getvalue(), "[]")
+
+    def test_jsonl_sink(self) -> None:
+        """Test that JSON Lines hold one compact value per line."""
+        lines = self.write(JsonlSink, [*self.records, "Ọ̀yọ́"]).splitlines()
+        self.assertEqual(len(lines), 4)
+        self.assertEqual(
+            lines[0], '{"name":"Lagos","postal_code":"100001","lgas":["Epe"]}'
+        )
+        self.assertEqual(json.loads(lines[2]), self.records[2])
+        self.assertEqual(lines[3], '"Ọ̀yọ́"')
+
+        file = io.StringIO()
+        profiles = Naija().many("profile", 50, stream=True)
+        self.assertEqual(write_jsonl(profiles, file), 50)
+        for line in file.getvalue().splitlines():
+            self.assertIn("email", json.loads(line))
+
+    def test_csv_sink(self) -> None:
+        """Test that the CSV header follows the first item."""
+        rows = list(csv.reader(io.StringIO(self.write(CsvSink, self.records))))
+        self.assertEqual(rows[0], ["Names", "Postal codes", "Lgass"])
+        self.assertEqual(rows[1][:2], ["Lagos", "100001"])
+        self.assertEqual(len(rows), 4)
+
+        rows = list(csv.reader(io.StringIO(self.write(CsvSink, ["a", "b", "c"]))))
+        self.assertEqual(rows, [["States"], ["a"], ["b"], ["c"]])
+
+    def test_csv_sink_keeps_column_names(self) -> None:
+        """Test that the CSV header can keep the record keys unchanged."""
+        file = io.StringIO(newline="")
+        CsvSink(file, label_columns=False).write_all([{"name": "Ada", "lga": "Aba"}])
+        self.assertEqual(file.getvalue().splitlines()[0], "name,lga")
+
+    def test_csv_nested_values_round_trip(self) -> None:
+        """Test that nested CSV fields are JSON text that parses back."""
+        naija = Naija()
+        records = [
+            {"state": "Lagos", "lga": lga, "code": None}
+            for lga in naija.many("state_lga", 5, state="lagos")
+        ]
+        file = io.StringIO(newline="")
+        CsvSink(file, label_columns=False).write_all(records)
+        rows = list(csv.DictReader(io.StringIO(file.getvalue())))
+        self.assertEqual(len(rows), 5)
+        for row, record in zip(rows, records, strict=True):
+            self.assertEqual(row["state"], "Lagos")
+            self.assertEqual(json.loads(row["lga"]), to_builtin(record["lga"]))
+            self.assertEqual(row["code"], "")
+
+        rows = list(csv.reader(io.StringIO(self.write(CsvSink, self.records))))
+        self.assertEqual(
+            [json.loads(row[2]) for row in rows[1:]], [["Epe"], ["Saki"], []]
+        )
+        rows = list(csv.reader(io.StringIO(self.write(CsvSink, [["Epe"], ["Ọ̀yọ́"]]))))
+        self.assertEqual(rows[1:], [['["Epe"]'], ['["Ọ̀yọ́"]']])
+
+    def test_text_sink(self) -> None:
+        """Test that text lines label record values."""
+        lines = self.write(TextSink, self.records).splitlines()
+        self.assertEqual(len(lines), 3)
+        self.assertEqual(lines[0], "Name: Lagos | Postal code: 100001 | Lgas: ['Epe']")
+        self.assertEqual(self.write(TextSink, ["a", "b"]), "a\nb\n")
+
+
+class TestStreamingOutput(unittest.TestCase):
+    """Test suite for the streaming CLI data generation and file output."""
+
+    def setUp(self) -> None:
+        """Set up the test case environment."""
+        self.naija = Naija()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+
+    def test_chunk_sizes(self) -> None:
+        """Test that chunks grow up to the output chunk size and sum up."""
+        sizes = list(command_chunk_sizes(100_000))
+        self.assertEqual(sum(sizes), 100_000)
+        self.assertLess(sizes[0], sizes[1])
+        self.assertEqual(max(sizes), OUTPUT_CHUNK_SIZE)
+        self.assertEqual(list(command_chunk_sizes(10)), [10])
+
+    def test_generate_command_data_is_lazy(self) -> None:
+        """Test that only the first chunk is generated before consumption."""
+        with patch.object(self.naija, "many", wraps=self.naija.many) as many:
+            data = generate_command_data(50_000, self.naija, "phone_number")
+            self.assertEqual(many.call_count, 1)
+            self.assertEqual(sum(1 for _ in data), 50_000)
+            self.assertGreater(many.call_count, 1)
+
+    def test_generate_command_data_errors(self) -> None:
+        """Test that errors are reported before anything is output."""
+        with patch("click.echo") as echo:
+            self.assertEqual(generate_command_data(0, self.naija, "email"), [])
+            self.assertEqual(
+                generate_command_data(5, self.naija, "email", tribe="nowhere"),
+                [],
+            )
+            self.assertEqual(
+                generate_command_data(
+                    5,
+                    self.naija,
+                    "school",
+                    state="ekiti",
+                    ownership="private",
+                    school_type="college",
+                ),
+                [],
+            )
+        self.assertEqual(echo.call_count, 3)
+
+    def test_write_iterator_to_file(self) -> None:
+        """Test that a lazy iterator is written in full."""
+        path = Path(self.temp_dir.name) / "numbers.csv"
+        data = generate_command_data(25_000, self.naija, "phone_number")
+        with patch("click.echo"):
+            write_data_to_file(data, path, "csv", "phone numbers")
+        with path.open(encoding="utf-8", newline="") as file:
+            rows = list(csv.reader(file))
+        self.assertEqual(rows[0], ["Phone Numbers"])
+        self.assertEqual(len(rows), 25_001)
+
+    def test_write_error_removes_partial_output(self) -> None:
+        """Test that an error midway through the data leaves no partial files."""
+
+        def failing_data() -> Any:  # noqa: ANN401
+            for i in range(25_000):
+                yield {"state": f"state{i % 3}", "email": f"user{i}@mail.com"}
+            msg = "Invalid name: Ada"
+            raise ValueError(msg)
+
+        directory = Path(self.temp_dir.name)
+        for options in ({}, {"shard_rows": 10_000}, {"partition_by": "state"}):
+            with self.subTest(options=options), patch("click.echo") as echo:
+                write_data_to_file(
+                    failing_data(), directory / "emails.csv", "csv", "emails", **options
+                )
+                self.assertEqual(list(directory.iterdir()), [])
+                echo.assert_called_once_with(
+                    "Error: Invalid name: Ada No partial output was kept.",
+                    err=True,
+                )
+
+
+class TestCommandOutput(unittest.TestCase):
+    """Test suite for the output paths of the CLI commands."""
+
+    def setUp(self) -> None:
+        """Set up a command with the shared output options."""
+
+        @click.command()
+        @click.option("--output", "-o", default=None)
+        @output_options
+        def numbers(output: str) -> None:
+            handle_command_output(["a", "b", "c"], output, "numbers", "numbers")
+
+        self.command = numbers
+        self.runner = CliRunner()
+
+    def test_out_stdout(self) -> None:
+        """Test that ``--out -`` writes the formatted data to stdout only."""
+        result = self.runner.invoke(self.command, ["--out", "-", "-o", "csv"])
+        self.assertEqual(result.exit_code, 0)
+        self.assertEqual(result.output.splitlines(), ["Numbers", "a", "b", "c"])
+
+        result = self.runner.invoke(self.command, ["--out", "-"])
+        self.assertEqual(result.output, "a\nb\nc\n")
+
+    def test_out_path(self) -> None:
+        """Test that ``--out PATH`` writes that path in the format of its extension."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "data.jsonl"
+            for _ in range(2):
+                result = self.runner.invoke(self.command, ["--out", str(path)])
+                self.assertEqual(result.exit_code, 0)
+            self.assertEqual(path.read_text(encoding="utf-8"), '"a"\n"b"\n"c"\n')
+            self.assertEqual(
+                [p.name for p in Path(directory).iterdir()], ["data.jsonl"]
+            )
+
+            with patch("pathlib.Path.cwd", return_value=Path(directory)):
+                self.runner.invoke(self.command, ["-o", "csv"])
+                self.runner.invoke(self.command, ["-o", "csv"])
+            self.assertTrue((Path(directory) / "numbers_1.csv").is_file())
+
+    def test_infer_output_format(self) -> None:
+        """Test that formats are inferred from extensions."""
+        self.assertEqual(infer_output_format("out/data.CSV"), "csv")
+        self.assertEqual(infer_output_format("data.jsonl"), "jsonl")
+        self.assertEqual(infer_output_format("data.txt"), "text")
+        self.assertEqual(infer_output_format("-"), "text")
+        self.assertEqual(infer_output_format("data.csv.gz"), "csv")
+        self.assertEqual(infer_output_format("data.jsonl.XZ"), "jsonl")
+        self.assertEqual(infer_compression("data.csv.bz2"), "bz2")
+        self.assertIsNone(infer_compression("data.csv"))
+
+    def test_unique_filename(self) -> None:
+        """Test that the first free numbered name is used."""
+        with tempfile.TemporaryDirectory() as directory:
+            base = Path(directory) / "emails.csv"
+            self.assertEqual(get_unique_filename(base), base)
+            for name in ["emails.csv", "emails_1.csv", "emails_2.csv", "emails_1.json"]:
+                (Path(directory) / name).touch()
+            self.assertEqual(get_unique_filename(base).name, "emails_3.csv")
+            self.assertEqual(
+                get_unique_filename(Path(directory) / "emails.json").name,
+                "emails.json",
+            )
+            (Path(directory) / "emails.csv.gz").touch()
+            self.assertEqual(
+                get_unique_filename(Path(directory) / "emails.csv.gz").name,
+                "emails_1.csv.gz",
+            )
+
+    def test_compressed_out(self) -> None:
+        """Test that ``--out`` compresses by extension and ``--compress`` by option."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "data.csv.gz"
+            result = self.runner.invoke(self.command, ["--out", str(path)])
+            self.assertEqual(result.exit_code, 0)
+            with gzip.open(path, "rt", encoding="utf-8") as file:
+                self.assertEqual(file.read().splitlines(), ["Numbers", "a", "b", "c"])
+
+            with patch("pathlib.Path.cwd", return_value=Path(directory)):
+                self.runner.invoke(
+                    self.command,
+                    ["-o", "json", "--compress", "xz", "--compress-thread"],
+                )
+            with lzma.open(Path(directory) / "numbers.json.xz", "rt") as file:
+                self.assertEqual(json.load(file), ["a", "b", "c"])
+
+            path = Path(directory) / "bad.csv.bz2"
+            result = self.runner.invoke(
+                self.command, ["--out", str(path), "--compress-level", "0"]
+            )
+            self.assertIn("Use a level from 1 to 9", result.output)
+            self.assertFalse(path.exists())
+
+
+class TestShards(unittest.TestCase):
+    """Test suite for the sharded file output."""
+
+    def setUp(self) -> None:
+        """Set up the test case environment."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.directory = Path(self.temp_dir.name)
+        self.data = [f"user{i}@mail.com" for i in range(1000)]
+
+    def read_manifest(self, name: str) -> dict[str, Any]:
+        """Read a shard manifest of the temporary directory."""
+        with (self.directory / name).open(encoding="utf-8") as file:
+            return json.load(file)
+
+    def test_shard_rows(self) -> None:
+        """Test that row shards are complete files listed in the manifest."""
+        manifest_path = write_data_to_shards(
+            iter(self.data),
+            self.directory / "emails.csv",
+            "csv",
+            "emails",
+            shard_rows=300,
+        )
+        self.assertEqual(manifest_path.name, "emails.manifest.json")
+        manifest = self.read_manifest("emails.manifest.json")
+        self.assertEqual(manifest["rows"], 1000)
+        self.assertEqual(
+            [shard["path"] for shard in manifest["shards"]],
+            [f"emails-0000{i}.csv" for i in range(4)],
+        )
+        self.assertEqual(
+            [shard["rows"] for shard in manifest["shards"]], [300] * 3 + [100]
+        )
+        rows: list[str] = []
+        for shard in manifest["shards"]:
+            path = self.directory / shard["path"]
+            self.assertEqual(path.stat().st_size, shard["bytes"])
+            with path.open(encoding="utf-8", newline="") as file:
+                header, *shard_rows = csv.reader(file)
+            self.assertEqual(header, ["Emails"])
+            rows.extend(row[0] for row in shard_rows)
+        self.assertEqual(rows, self.data)
+
+    def test_shard_rows_exact(self) -> None:
+        """Test that no empty shard follows data that fills the last shard."""
+        write_data_to_shards(
+            self.data, self.directory / "emails.json", "json", "emails", shard_rows=500
+        )
+        manifest = self.read_manifest("emails.manifest.json")
+        self.assertEqual(len(manifest["shards"]), 2)
+        with (self.directory / "emails-00001.json").open(encoding="utf-8") as file:
+            self.assertEqual(json.load(file), self.data[500:])
+
+    def test_shard_bytes(self) -> None:
+        """Test that byte shards end close to the size limit."""
+        for compression in (None, "gzip"):
+            with self.subTest(compression=compression):
+                data = (f"user{i}@mail.com" for i in range(100_000))
+                write_data_to_shards(
+                    data,
+                    self.directory / f"{compression}.jsonl",
+                    "jsonl",
+                    "emails",
+                    shard_bytes=64 * 1024,
+                    compression=compression,
+                )
+                manifest = self.read_manifest(f"{compression}.manifest.json")
+                self.assertEqual(manifest["rows"], 100_000)
+                self.assertGreater(len(manifest["shards"]), 1)
+                for shard in manifest["shards"][:-1]:
+                    self.assertAlmostEqual(shard["bytes"], 64 * 1024, delta=4096)
+
+    def test_shard_errors(self) -> None:
+        """Test that sharding needs a file path and a limit."""
+        with self.assertRaisesRegex(ValueError, "stdout"):
+            write_data_to_shards(self.data, "-", "csv", "emails", shard_rows=10)
+        with self.assertRaisesRegex(ValueError, "row or byte limit"):
+            write_data_to_shards(
+                self.data, self.directory / "emails.csv", "csv", "emails"
+            )
+
+    def test_parse_size(self) -> None:
+        """Test that sizes are parsed in powers of 1024."""
+        self.assertEqual(parse_size("512"), 512)
+        self.assertEqual(parse_size("64k"), 64 * 1024)
+        self.assertEqual(parse_size("100MB"), 100 * 1024**2)
+        self.assertEqual(parse_size(" 1 GiB "), 1024**3)
+        for value in ["", "0", "1.5M", "10x", "-1"]:
+            with self.subTest(value=value), self.assertRaises(ValueError):
+                parse_size(value)
+
+    def test_shard_options(self) -> None:
+        """Test that the shard options write numbered files in the current directory."""
+
+        @click.command()
+        @click.option("--output", "-o", default=None)
+        @output_options
+        def emails(output: str) -> None:
+            handle_command_output(self.data, output, "emails", "emails")
+
+        runner = CliRunner()
+        with patch("pathlib.Path.cwd", return_value=self.directory):
+            for _ in range(2):
+                result = runner.invoke(emails, ["--shard-rows", "400", "-o", "csv"])
+                self.assertEqual(result.exit_code, 0)
+            result = runner.invoke(emails, ["--shard-bytes", "1x"])
+        self.assertIn("Invalid size", result.output)
+        self.assertEqual(len(self.read_manifest("emails_1.manifest.json")["shards"]), 3)
+        self.assertTrue((self.directory / "emails_1-00002.csv").is_file())
+
+
+class TestPartitions(unittest.TestCase):
+    """Test suite for the partitioned file output."""
+
+    def setUp(self) -> None:
+        """Set up the test case environment."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.directory = Path(self.temp_dir.name)
+        self.profiles = list(Naija().many("profile", 3000))
+
+    def read_manifest(self) -> dict[str, Any]:
+        """Read the manifest of the partitioned profiles."""
+        with (self.directory / "profiles.manifest.json").open(encoding="utf-8") as file:
+            return json.load(file)
+
+    def test_partition_files(self) -> None:
+        """Test that each record is written to the file of its value only."""
+        for output in ("csv", "json"):
+            with self.subTest(output=output):
+                write_data_to_partitions(
+                    iter(self.profiles),
+                    self.directory / f"profiles.{output}",
+                    output,
+                    "profiles",
+                    "state",
+                    max_open_files=3,
+                )
+                manifest = self.read_manifest()
+                states = {profile["state"] for profile in self.profiles}
+                self.assertEqual({p["value"] for p in manifest["partitions"]}, states)
+                self.assertEqual(manifest["rows"], 3000)
+                for partition in manifest["partitions"]:
+                    path = self.directory / partition["path"]
+                    self.assertEqual(path.stat().st_size, partition["bytes"])
+                    expected = [
+                        profile
+                        for profile in self.profiles
+                        if profile["state"] == partition["value"]
+                    ]
+                    with path.open(encoding="utf-8", newline="") as file:
+                        if output == "json":
+                            records = json.load(file)
+                        else:
+                            header, *records = csv.reader(file)
+                            self.assertEqual(header[0], "First names")
+                    self.assertEqual(len(records), partition["rows"])
+                    self.assertEqual(len(records), len(expected))
+                    if output == "json":
+                        self.assertEqual(records, expected)
+
+    def test_reopened_compressed_partitions(self) -> None:
+        """Test that compressed files closed by the pool are appended to."""
+        data = (
+            {"tribe": tribe, "name": f"{tribe}{i}"}
+            for i in range(30_000)
+            for tribe in ("igbo", "yoruba", "hausa")
+        )
+        write_data_to_partitions(
+            data,
+            self.directory / "profiles.jsonl.gz",
+            "jsonl",
+            "names",
+            "tribe",
+            compression="gzip",
+            max_open_files=1,
+        )
+        with gzip.open(self.directory / "profiles-hausa.jsonl.gz", "rt") as file:
+            lines = file.read().splitlines()
+        self.assertEqual(len(lines), 30_000)
+        self.assertEqual(
+            json.loads(lines[-1]), {"tribe": "hausa", "name": "hausa29999"}
+        )
+
+    def test_partition_errors(self) -> None:
+        """Test that only records with the field are partitioned, to files."""
+        path = self.directory / "profiles.csv"
+        with self.assertRaisesRegex(ValueError, "Only records"):
+            write_data_to_partitions(["a@b.com"], path, "csv", "emails", "state")
+        with self.assertRaisesRegex(ValueError, "Unknown partition field"):
+            write_data_to_partitions(self.profiles, path, "csv", "profiles", "town")
+        with self.assertRaisesRegex(ValueError, "stdout"):
+            write_data_to_partitions(self.profiles, "-", "csv", "profiles", "state")
+        self.assertEqual(partition_name("Akwa Ibom"), "Akwa_Ibom")
+        self.assertEqual(partition_name("Ife/Ijesa"), "Ife_Ijesa")
+        self.assertEqual(partition_name(None), "None")
+
+
+class TestSQLite(unittest.TestCase):
+    """Test suite for the SQLite output."""
+
+    def setUp(self) -> None:
+        """Set up the test case environment."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.database = Path(self.temp_dir.name) / "data.db"
+
+    def query(self, sql: str) -> list[tuple[Any, ...]]:
+        """Run a query against the test database."""
+        connection = sqlite3.connect(self.database)
+        try:
+            return connection.execute(sql).fetchall()
+        finally:
+            connection.close()
+
+    def test_records(self) -> None:
+        """Test that records load with typed columns and nested values as JSON."""
+        records = [
+            {"name": "Chidi", "age": 30, "score": 1.5, "lga": {"name": "Aba"}},
+            {"name": "Ngozi", "age": 25, "score": 2.0, "lga": {"name": "Ikeja"}},
+        ]
+        self.assertEqual(write_sqlite(records, self.database, "people"), 2)
+        self.assertEqual(
+            self.query("SELECT * FROM people"),
+            [
+                ("Chidi", 30, 1.5, '{"name": "Aba"}'),
+                ("Ngozi", 25, 2.0, '{"name": "Ikeja"}'),
+            ],
+        )
+        columns = self.query("PRAGMA table_info(people)")
+        self.assertEqual(
+            [(column[1], column[2]) for column in columns],
+            [("name", "TEXT"), ("age", "INTEGER"), ("score", "REAL"), ("lga", "TEXT")],
+        )
+
+    def test_single_nested_column(self) -> None:
+        """Test that a single column of nested records is stored as JSON."""
+        naija = Naija()
+        rows = [{"state_lga": lga} for lga in naija.many("state_lga", 3)]
+        self.assertEqual(write_sqlite(rows, self.database, "lgas"), 3)
+        self.assertEqual(
+            [json.loads(value) for (value,) in self.query("SELECT * FROM lgas")],
+            [to_builtin(row["state_lga"]) for row in rows],
+        )
+
+    def test_strings_append(self) -> None:
+        """Test that strings load into a column named after the data type."""
+        emails = list(Naija().many("email", 1200))
+        for _ in range(2):
+            write_sqlite(emails, self.database, "emails", "email addresses", 500)
+        self.assertEqual(
+            self.query("SELECT email_addresses FROM emails"),
+            [(email,) for email in emails * 2],
+        )
+
+    def test_transactions_and_pragmas(self) -> None:
+        """Test that rows commit in transactions and the pragmas are restored."""
+        connection = sqlite3.connect(self.database)
+        self.addCleanup(connection.close)
+        sink = SQLiteSink(connection, "names", "names", transaction_rows=2)
+        self.assertEqual(sink.write_all(["Ada", "Bayo", "Chidi"], chunk_size=1), 3)
+        self.assertEqual(
+            connection.execute("PRAGMA journal_mode").fetchone()[0], "delete"
+        )
+        self.assertEqual(connection.execute("PRAGMA synchronous").fetchone()[0], 2)
+        self.assertEqual(self.query("SELECT COUNT(*) FROM names"), [(3,)])
+        with self.assertRaisesRegex(ValueError, "table name"):
+            SQLiteSink(connection, " ")
+
+    def test_command_output(self) -> None:
+        """Test that ``--output sqlite`` and ``.db`` paths load a table."""
+
+        @click.command()
+        @click.option("--output", "-o", default=None)
+        @output_options
+        def numbers(output: str) -> None:
+            handle_command_output(["a", "b", "c"], output, "numbers", "numbers")
+
+        runner = CliRunner()
+        result = runner.invoke(numbers, ["--out", str(self.database)])
+        self.assertEqual(result.exit_code, 0)
+        self.assertIn("table numbers", result.output)
+        result = runner.invoke(
+            numbers,
+            ["-o", "sqlite", "--out", str(self.database), "--table", "digits"],
+        )
+        self.assertIn("table digits", result.output)
+        self.assertEqual(self.query("SELECT COUNT(*) FROM digits"), [(3,)])
+        self.assertEqual(infer_output_format("data.sqlite3"), "sqlite")
+
+        result = runner.invoke(numbers, ["-o", "sqlite", "--out", "-"])
+        self.assertIn("Error: SQLite output cannot be written to stdout", result.output)
+        result = runner.invoke(
+            numbers, ["--out", str(self.database), "--compress", "gzip"]
+        )
+        self.assertIn("cannot be compressed", result.output)
+
+
+class TestPostgresOutput(unittest.TestCase):
+    """Test suite for the PostgreSQL COPY and SQL INSERT output."""
+
+    def setUp(self) -> None:
+        """Set up records with values that need escaping."""
+        self.records = [
+            {"name": "O'Brien", "bio": "a\tb\\c\nd\re", "age": 30, "lga": None},
+            {"name": "Ada", "bio": "plain", "age": 25, "lga": {"name": "Aba"}},
+            {"name": "Bayo", "bio": "x", "age": 1, "lga": True},
+        ]
+
+    def test_copy_row(self) -> None:
+        """Test that COPY fields are escaped and rows of plain strings are joined."""
+        self.assertEqual(copy_row(["Ada", "Lagos"]), "Ada\tLagos\n")
+        self.assertEqual(
+            copy_row(["a\tb", "c\\d", "e\nf\rg", None, 1.5, False]),
+            "a\\tb\tc\\\\d\te\\nf\\rg\t\\N\t1.5\tf\n",
+        )
+
+    def test_pgcopy_sink(self) -> None:
+        """Test that records become tab-separated lines without a header."""
+        file = io.StringIO()
+        self.assertEqual(PgCopySink(file).write_all(self.records), 3)
+        self.assertEqual(
+            file.getvalue().split("\n"),
+            [
+                "O'Brien\ta\\tb\\\\c\\nd\\re\t30\t\\N",
+                'Ada\tplain\t25\t{"name":"Aba"}',
+                "Bayo\tx\t1\tt",
+                "",
+            ],
+        )
+
+    def test_sql_row(self) -> None:
+        """Test that SQL literals are quoted and rows of plain strings are joined."""
+        self.assertEqual(sql_row(["Ada", "Lagos"]), "('Ada', 'Lagos')")
+        self.assertEqual(
+            sql_row(["O'Brien", "', '", None, 2, True]),
+            "('O''Brien', ''', ''', NULL, 2, TRUE)",
+        )
+
+    def test_sql_sink_runs(self) -> None:
+        """Test that the SQL script creates and fills the table in SQLite."""
+        file = io.StringIO()
+        sink = SqlSink(file, "people", table="staff", batch_rows=2)
+        sink.write_all(self.records)
+        script = file.getvalue()
+        self.assertTrue(script.startswith('BEGIN;\nCREATE TABLE IF NOT EXISTS "staff"'))
+        self.assertTrue(script.endswith("COMMIT;\n"))
+        self.assertEqual(script.count("INSERT INTO"), 2)
+        self.assertIn('"age" bigint', script)
+
+        connection = sqlite3.connect(":memory:")
+        self.addCleanup(connection.close)
+        connection.executescript(script)
+        self.assertEqual(
+            connection.execute("SELECT * FROM staff").fetchall(),
+            [
+                ("O'Brien", "a\tb\\c\nd\re", 30, None),
+                ("Ada", "plain", 25, '{"name":"Aba"}'),
+                ("Bayo", "x", 1, "1"),
+            ],
+        )
+
+    def test_sql_sink_strings(self) -> None:
+        """Test that strings go into a column named after the data type."""
+        file = io.StringIO()
+        SqlSink(file, "email addresses").write_all([])
+        self.assertEqual(file.getvalue(), "")
+        SqlSink(file, "email addresses").write_all(["a@b.com"])
+        self.assertIn(
+            'INSERT INTO "email_addresses" ("email_addresses") VALUES\n(\'a@b.com\');',
+            file.getvalue(),
+        )
+        with self.assertRaisesRegex(ValueError, "positive"):
+            SqlSink(file, batch_rows=0)
+
+    def test_create_sink(self) -> None:
+        """Test that sinks only receive the options they accept."""
+        sink = create_sink("sql", io.StringIO(), "names", table="t", batch_rows=None)
+        assert isinstance(sink, SqlSink)
+        self.assertEqual(sink.table, "t")
+        self.assertIsInstance(
+            create_sink("csv", io.StringIO(), "names", table="t"), CsvSink
+        )
+
+    def test_command_output(self) -> None:
+        """Test ``--output sql`` with ``--table`` and ``--sql-batch-rows``."""
+
+        @click.command()
+        @click.option("--output", "-o", default=None)
+        @output_options
+        def numbers(output: str) -> None:
+            handle_command_output(["a", "b", "c"], output, "numbers", "numbers")
+
+        runner = CliRunner()
+        result = runner.invoke(
+            numbers,
+            ["-o", "sql", "--out", "-", "--table", "digits", "--sql-batch-rows", "2"],
+        )
+        self.assertEqual(result.exit_code, 0)
+        self.assertEqual(result.output.count('INSERT INTO "digits"'), 2)
+        result = runner.invoke(numbers, ["-o", "pgcopy", "--out", "-"])
+        self.assertEqual(result.output, "a\nb\nc\n")
+        self.assertEqual(infer_output_format("seed.sql"), "sql")
+        self.assertEqual(infer_output_format("seed.copy.gz"), "pgcopy")
+
+
+class TestCompression(unittest.TestCase):
+    """Test suite for the streamed output compression."""
+
+    def test_round_trip(self) -> None:
+        """Test that every compression decompresses to the written data."""
+        data = b"".join(f"{i},Lagos\n".encode() for i in range(200_000))
+        openers = {
+            "gzip": gzip.decompress,
+            "bz2": bz2.decompress,
+            "xz": lzma.decompress,
+        }
+        for compression in COMPRESSIONS:
+            for threaded in (False, True):
+                with self.subTest(compression=compression, threaded=threaded):
+                    binary = io.BytesIO()
+                    with compressed_stream(
+                        binary, compression, level=1, threaded=threaded
+                    ) as stream:
+                        for start in range(0, len(data), 4096):
+                            stream.write(data[start : start + 4096])
+                    self.assertFalse(binary.closed)
+                    self.assertEqual(openers[compression](binary.getvalue()), data)
+
+    def test_gzip_is_reproducible(self) -> None:
+        """Test that gzip output does not depend on the time."""
+        outputs = set()
+        for _ in range(2):
+            binary = io.BytesIO()
+            with compressed_stream(binary, "gzip") as stream:
+                stream.write(b"Lagos")
+            outputs.add(binary.getvalue())
+        self.assertEqual(len(outputs), 1)
+
+    def test_invalid_compression(self) -> None:
+        """Test that unknown compressions and levels raise errors."""
+        with (
+            self.assertRaisesRegex(ValueError, "Unsupported compression"),
+            compressed_stream(io.BytesIO(), "zip"),
+        ):
+            pass
+        with (
+            self.assertRaisesRegex(ValueError, "level: 10"),
+            compressed_stream(io.BytesIO(), "xz", level=10),
+        ):
+            pass
+
+
+if __name__ == "__main__":
+    unittest.main()
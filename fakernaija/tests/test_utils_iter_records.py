@@ -0,0 +1,79 @@
+"""Unit tests for streaming records with utils.iter_records."""
+
+import tempfile
+import unittest
+from pathlib import Path
+
+from fakernaija.utils import iter_records
+
+
+class TestIterRecords(unittest.TestCase):
+    """Test suite for iter_records."""
+
+    def setUp(self) -> None:
+        """Create a temporary directory for the data files."""
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = Path(directory.name)
+        self.required_keys = ["tribe", "name"]
+
+    def write(self, filename: str, content: str) -> Path:
+        """Write a data file and return its path."""
+        path = self.directory / filename
+        path.write_text(content, encoding="utf-8")
+        return path
+
+    def test_json_lines(self) -> None:
+        """Test that JSON Lines records are streamed, skipping blank lines."""
+        path = self.write(
+            "names.jsonl",
+            '{"tribe": "tiv", "name": "Akaa"}\n\n{"tribe": "efik", "name": "Bassey"}\n',
+        )
+        records = iter_records(path, self.required_keys)
+        self.assertEqual(next(records), {"tribe": "tiv", "name": "Akaa"})
+        self.assertEqual(list(records), [{"tribe": "efik", "name": "Bassey"}])
+
+    def test_csv(self) -> None:
+        """Test that CSV rows are streamed and extra columns kept."""
+        path = self.write("names.csv", "tribe,name,source\ntiv,Akaa,survey\n")
+        self.assertEqual(
+            list(iter_records(path, self.required_keys)),
+            [{"tribe": "tiv", "name": "Akaa", "source": "survey"}],
+        )
+
+    def test_json(self) -> None:
+        """Test that JSON files are loaded whole."""
+        path = self.write("names.json", '[{"tribe": "tiv", "name": "Akaa"}]')
+        self.assertEqual(
+            list(iter_records(path, self.required_keys)),
+            [{"tribe": "tiv", "name": "Akaa"}],
+        )
+
+    def test_invalid_records_report_their_line(self) -> None:
+        """Test that invalid records raise a ValueError with their line number."""
+        files = {
+            "missing.jsonl": (
+                '{"tribe": "tiv", "name": "Akaa"}\n{"tribe": "tiv"}\n',
+                "line 2",
+            ),
+            "empty.csv": ("tribe,name\ntiv,Akaa\ntiv,\n", "line 3"),
+            "broken.jsonl": ('{"tribe": "tiv", "name": "Akaa"}\n{"tribe"\n', "line 2"),
+            "array.jsonl": ('["tiv", "Akaa"]\n', "line 1"),
+            "columns.csv": ("tribe,surname\ntiv,Akaa\n", "Missing columns"),
+            "names.txt": ("Akaa\n", "Unsupported file format"),
+        }
+        for filename, (content, message) in files.items():
+            with (
+                self.subTest(filename=filename),
+                self.assertRaisesRegex(ValueError, message),
+            ):
+                list(iter_records(self.write(filename, content), self.required_keys))
+
+    def test_file_not_found(self) -> None:
+        """Test that a missing file raises a FileNotFoundError."""
+        with self.assertRaises(FileNotFoundError):
+            list(iter_records(self.directory / "missing.jsonl", self.required_keys))
+
+
+if __name__ == "__main__":
+    unittest.main()
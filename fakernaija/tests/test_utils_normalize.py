@@ -0,0 +1,59 @@
+"""Unittests for the input normalization functions in the utils module."""
+
+import unittest
+from unittest.mock import MagicMock, patch
+
+from fakernaija.providers import NameProvider
+from fakernaija.utils import normalize_choice, normalize_input
+
+
+class TestNormalizeInput(unittest.TestCase):
+    """Unit tests for normalize_input."""
+
+    def test_normalize_input(self) -> None:
+        """Test that values are stripped, lowercased and stripped of accents."""
+        self.assertEqual(normalize_input("  Yorùbá "), "yoruba")
+        self.assertIsNone(normalize_input("   "))
+        self.assertIsNone(normalize_input(None))
+
+    def test_normalize_input_invalid_type(self) -> None:
+        """Test that non-string values raise a TypeError."""
+        with self.assertRaises(TypeError):
+            normalize_input(1)  # type: ignore[arg-type]
+
+    def test_normalize_input_long_value(self) -> None:
+        """Test that long values are normalized without being cached."""
+        value = "A" * 100
+        self.assertEqual(normalize_input(value), "a" * 100)
+
+    @patch("fakernaija.utils.unicodedata.normalize", side_effect=lambda _, v: v)
+    def test_normalize_input_is_memoized(self, mock_normalize: MagicMock) -> None:
+        """Test that repeated short values are only normalized once."""
+        for _ in range(3):
+            self.assertEqual(normalize_input("MeMoIzEd"), "memoized")
+        self.assertEqual(mock_normalize.call_count, 1)
+
+
+class TestNormalizeChoice(unittest.TestCase):
+    """Unit tests for normalize_choice."""
+
+    def test_canonical_value_skips_normalization(self) -> None:
+        """Test that canonical values are returned without normalization."""
+        with patch("fakernaija.utils.normalize_input") as mock_normalize_input:
+            self.assertEqual(normalize_choice("igbo", ["igbo"]), "igbo")
+            self.assertIsNone(normalize_choice(None, ["igbo"]))
+        mock_normalize_input.assert_not_called()
+
+    def test_non_canonical_value_is_normalized(self) -> None:
+        """Test that other values are normalized."""
+        self.assertEqual(normalize_choice(" IGBO ", ["igbo"]), "igbo")
+
+    def test_nested_name_calls_skip_normalization(self) -> None:
+        """Test that full names normalize the tribe and gender only once."""
+        provider = NameProvider()
+        with patch(
+            "fakernaija.utils.normalize_input",
+            side_effect=normalize_input,
+        ) as mock_normalize_input:
+            provider.generate_full_name(tribe="Yoruba", gender="Male")
+        self.assertEqual(mock_normalize_input.call_count, 2)
@@ -0,0 +1,92 @@
+"""Unit tests for the unique_values utility function."""
+
+import random
+import unittest
+
+from fakernaija.providers import (
+    CourseProvider,
+    DegreeProvider,
+    FacultyProvider,
+    NameProvider,
+    SchoolProvider,
+)
+from fakernaija.utils import (
+    compile_unique_value,
+    distinct_values,
+    get_unique_value,
+    unique_values,
+)
+
+
+class TestUniqueValues(unittest.TestCase):
+    """Test suite for unique_values."""
+
+    def test_values_are_unique_until_exhausted(self) -> None:
+        """Test that values only repeat once every value has been used."""
+        values = ["a", "b", "c", "d"]
+        used_values: set[str] = set()
+        result = unique_values(values, used_values, 10)
+        self.assertEqual(len(result), 10)
+        self.assertEqual(set(result[:4]), set(values))
+        self.assertEqual(set(result[4:8]), set(values))
+        self.assertEqual(used_values, set(result[8:]))
+
+    def test_used_values_are_skipped(self) -> None:
+        """Test that values used earlier in the session are skipped."""
+        used_values = {"a", "b"}
+        result = unique_values(["a", "b", "c", "d"], used_values, 2)
+        self.assertEqual(set(result), {"c", "d"})
+        self.assertEqual(used_values, {"a", "b", "c", "d"})
+
+    def test_duplicate_values(self) -> None:
+        """Test that duplicate values in the pool are drawn once per cycle."""
+        result = unique_values(["a", "a", "b"], set(), 2)
+        self.assertEqual(sorted(result), ["a", "b"])
+
+    def test_zero_values(self) -> None:
+        """Test that asking for no values returns an empty list."""
+        self.assertEqual(unique_values(["a"], set(), 0), [])
+
+    def test_empty_values(self) -> None:
+        """Test that an empty pool raises instead of looping forever."""
+        with self.assertRaisesRegex(ValueError, "empty sequence"):
+            unique_values([], set(), 3)
+        with self.assertRaisesRegex(ValueError, "empty sequence"):
+            get_unique_value([], set())
+        self.assertEqual(unique_values([], set(), 0), [])
+
+    def test_distinct_pools_do_not_bias_draws(self) -> None:
+        """Test that a value repeated in the data is not drawn more often."""
+        random.seed(7)
+        values = distinct_values(["a", "a", "a", "b"])
+        draws = [get_unique_value(values, set()) for _ in range(4000)]
+        self.assertAlmostEqual(draws.count("a") / len(draws), 0.5, delta=0.05)
+        generate = compile_unique_value(values, set())
+        self.assertEqual({generate(), generate()}, {"a", "b"})
+
+    def test_distinct_values(self) -> None:
+        """Test that distinct values keep their order of first appearance."""
+        self.assertEqual(distinct_values(("b", "a", "b", "c")), ("b", "a", "c"))
+        self.assertEqual(distinct_values(iter(["a", "a"])), ("a",))
+
+    def test_provider_pools_are_distinct(self) -> None:
+        """Test that providers build their unique-value pools without repeats."""
+        course_provider = CourseProvider()
+        self.assertLess(
+            len(course_provider.course_name_pool), len(course_provider.course_names)
+        )
+        pools = [
+            course_provider.course_name_pool,
+            course_provider.course_code_pool,
+            *DegreeProvider().degree_abbr_pools.values(),
+            *FacultyProvider().department_pools.values(),
+            *NameProvider().prefix_pools.values(),
+            SchoolProvider().get_school_name_pool(acronym=True),
+        ]
+        for pool in pools:
+            self.assertIsInstance(pool, tuple)
+            self.assertEqual(len(pool), len(set(pool)))
+
+
+if __name__ == "__main__":
+    unittest.main()
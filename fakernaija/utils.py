@@ -1,15 +1,44 @@
 """Utility file that provides functions to common functionalities."""
 
+import collections
+import contextlib
 import csv
+import functools
+import io
+import itertools
 import json
+import math
+import os
 import random
+import re
+import sqlite3
+import sys
 import unicodedata
-from collections.abc import Callable
+from collections.abc import Callable, Collection, Iterable, Iterator, Mapping, Sequence
 from pathlib import Path
-from typing import Any
+from typing import IO, TYPE_CHECKING, Any, TextIO
 
 import click
 
+from fakernaija.parallel import FieldJob, Job, generate_chunks
+from fakernaija.records import to_builtin
+from fakernaija.sinks import SINK_CHUNK_SIZE, SINKS, Sink, chunked, create_sink
+from fakernaija.sinks.compression import (
+    COMPRESSIONS,
+    compressed_stream,
+    infer_compression,
+    validate_compression,
+)
+from fakernaija.sinks.sqlite import (
+    SQLITE_EXTENSIONS,
+    SQLiteSink,
+    column_name,
+    write_sqlite,
+)
+
+if TYPE_CHECKING:
+    from fakernaija.naija import Naija
+
 
 def load_json(
     file_path: str | Path,
@@ -42,6 +71,66 @@ def load_json(
         raise ValueError(msg) from exc
 
 
+def row_value(value: Any) -> Any:  # noqa: ANN401
+    """Convert a value to one that ``csv`` and ``sqlite3`` accept as it is.
+
+    Strings, numbers and None are returned as they are; nested values, e.g.
+    LGA records or lists of departments, are encoded as compact JSON text.
+
+    Args:
+        value (Any): The value to convert.
+
+    Returns:
+        Any: The scalar value.
+    """
+    if value is None or isinstance(value, str | int | float):
+        return value
+    return json.dumps(
+        to_builtin(value),
+        ensure_ascii=False,
+        separators=(",", ":"),
+        default=to_builtin,
+    )
+
+
+def row_column(values: Iterable[Any]) -> list[Any]:
+    """Convert the values of a row column with ``row_value``.
+
+    Columns of scalars, the common case, are returned as they are.
+
+    Args:
+        values (Iterable[Any]): The values of the column.
+
+    Returns:
+        list[Any]: The scalar values.
+    """
+    values = values if isinstance(values, list) else list(values)
+    if all(value is None or isinstance(value, str | int | float) for value in values):
+        return values
+    return [row_value(value) for value in values]
+
+
+def records_to_rows(
+    records: Iterable[Mapping[str, Any]],
+    columns: Sequence[str],
+) -> tuple[tuple[Any, ...], ...]:
+    """Convert records to tuple rows with a fixed column order.
+
+    Nested values are encoded as JSON text with ``row_value``, so the rows
+    only hold scalars.
+
+    Args:
+        records (Iterable[Mapping[str, Any]]): The records to convert.
+        columns (Sequence[str]): The keys of the record values, in column order.
+
+    Returns:
+        tuple[tuple[Any, ...], ...]: One tuple of values per record.
+    """
+    return tuple(
+        tuple(row_value(record[column]) for column in columns) for record in records
+    )
+
+
 def validate_json_structure(
     data: list[dict[str, Any]],
     required_keys: list[str],
@@ -72,20 +161,138 @@ def validate_json_structure(
             raise ValueError(msg)
 
 
-def get_unique_value(values: list[str], used_values: set[str]) -> str:
-    """Helper method to get a unique value from a list of strings.
+def iter_records(
+    file_path: str | Path,
+    required_keys: list[str],
+) -> Iterator[dict[str, Any]]:
+    """Stream the records of a JSON Lines, CSV or JSON file, validating each one.
+
+    JSON Lines (``.jsonl``/``.ndjson``) and CSV files are read one record at
+    a time, so large files are never held in memory at once. JSON files are
+    loaded whole with ``load_json``. Columns other than the required keys are
+    ignored.
+
+    Args:
+        file_path (str | Path): The path to the data file.
+        required_keys (list[str]): The keys that each record must have, with a
+            non-empty string value.
+
+    Yields:
+        dict[str, Any]: The records of the file, in order.
+
+    Raises:
+        FileNotFoundError: If the file is not found.
+        ValueError: If the file format is not supported, or a record cannot
+            be decoded or misses a required key.
+    """
+    path = Path(file_path)
+    suffix = path.suffix.lower()
+    if suffix == ".json":
+        yield from load_json(path, required_keys)
+        return
+    if suffix not in {".jsonl", ".ndjson", ".csv"}:
+        msg = f"Unsupported file format: {path}. Use a .jsonl, .ndjson, .csv or .json file."
+        raise ValueError(msg)
+    if not path.is_file():
+        msg = f"File not found: {path}"
+        raise FileNotFoundError(msg)
+
+    with path.open(encoding="utf-8", newline="") as file:
+        if suffix == ".csv":
+            reader = csv.DictReader(file)
+            missing_columns = set(required_keys) - set(reader.fieldnames or ())
+            if missing_columns:
+                msg = (
+                    f"Missing columns in file: {path}. Missing keys: {missing_columns}."
+                )
+                raise ValueError(msg)
+            for record in reader:
+                _validate_record(record, required_keys, path, reader.line_num)
+                yield record
+            return
+
+        for line_number, line in enumerate(file, 1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError as exc:
+                msg = f"Error decoding JSON on line {line_number} of file: {path}"
+                raise ValueError(msg) from exc
+            _validate_record(record, required_keys, path, line_number)
+            yield record
+
+
+def _validate_record(
+    record: Any,  # noqa: ANN401
+    required_keys: list[str],
+    path: Path,
+    line_number: int,
+) -> None:
+    """Validate a streamed record, reporting the line it was read from."""
+    if not isinstance(record, dict):
+        msg = (
+            f"Invalid record on line {line_number} of file: {path}. Expected an object."
+        )
+        raise ValueError(msg)  # noqa: TRY004
+    missing_keys = {
+        key
+        for key in required_keys
+        if not isinstance(record.get(key), str) or not record[key].strip()
+    }
+    if missing_keys:
+        msg = f"Invalid record on line {line_number} of file: {path}. Missing keys: {missing_keys}."
+        raise ValueError(msg)
+
+
+UNIQUE_DRAW_ATTEMPTS = 8
+
+
+def distinct_values(values: Iterable[str]) -> tuple[str, ...]:
+    """Get the distinct values of a pool, in order of first appearance.
+
+    Providers build the pools passed to ``get_unique_value`` with this once
+    at load, as a value listed twice would be drawn twice as often.
+
+    Args:
+        values (Iterable[str]): The pool of values.
+
+    Returns:
+        tuple[str, ...]: The values without duplicates.
+    """
+    return tuple(dict.fromkeys(values))
+
+
+def get_unique_value(values: Sequence[str], used_values: set[str]) -> str:
+    """Helper method to get a unique value from a sequence of strings.
 
     Ensures the generated value is unique within the session by:
         * Checking available values against used values.
         * Resetting used values if all options are exhausted.
 
+    The values should be distinct (see ``distinct_values``), as a value
+    listed several times is drawn more often.
+
     Args:
-        values (list[str]): The list of possible values.
+        values (Sequence[str]): The sequence of possible values.
         used_values (set[str]): The set of values that have already been used.
 
     Returns:
-        str: A unique value from the list.
+        str: A unique value from the sequence.
+
+    Raises:
+        ValueError: If the sequence is empty.
     """
+    if not values:
+        msg = "Cannot get a unique value from an empty sequence."
+        raise ValueError(msg)
+    # While most values are unused, a few direct draws almost always find
+    # one, which avoids building the set difference below on every call.
+    for _ in range(UNIQUE_DRAW_ATTEMPTS):
+        value = random.choice(values)
+        if value not in used_values:
+            return value
+
     # Calculate the set difference to find values that have not been used
     available_values = set(values) - used_values
 
@@ -98,9 +305,85 @@ def get_unique_value(values: list[str], used_values: set[str]) -> str:
     return random.choice(list(available_values))
 
 
+def compile_unique_value(
+    values: Sequence[str],
+    used_values: set[str],
+) -> Callable[[], str]:
+    """Compile a generator of session-unique values from a fixed pool.
+
+    The returned callable behaves like calling ``get_unique_value`` and then
+    recording the value in ``used_values``, with the pool bound once. The
+    values should be distinct, as for ``get_unique_value``.
+
+    Args:
+        values (Sequence[str]): The sequence of possible values.
+        used_values (set[str]): The set of values that have already been used.
+
+    Returns:
+        Callable[[], str]: A zero-argument callable returning a unique value.
+    """
+
+    def generate() -> str:
+        value = get_unique_value(values, used_values)
+        used_values.add(value)
+        return value
+
+    return generate
+
+
+def unique_values(
+    values: Sequence[str],
+    used_values: set[str],
+    n: int,
+) -> list[str]:
+    """Get ``n`` session-unique values from a sequence of strings at once.
+
+    This is the batch form of calling ``get_unique_value`` ``n`` times and
+    recording each value in ``used_values``: unused values are sampled
+    without replacement, and the used values are reset whenever the pool
+    is exhausted.
+
+    Args:
+        values (Sequence[str]): The sequence of possible values.
+        used_values (set[str]): The set of values that have already been used.
+        n (int): The number of values to return.
+
+    Returns:
+        list[str]: A list of ``n`` values.
+
+    Raises:
+        ValueError: If ``n`` is positive and the sequence is empty.
+    """
+    if n > 0 and not values:
+        msg = "Cannot get unique values from an empty sequence."
+        raise ValueError(msg)
+    pool = list(dict.fromkeys(values))
+    result: list[str] = []
+    while len(result) < n:
+        available_values = [value for value in pool if value not in used_values]
+        if not available_values:
+            used_values.clear()
+            available_values = pool
+        drawn = random.sample(
+            available_values,
+            min(n - len(result), len(available_values)),
+        )
+        used_values.update(drawn)
+        result.extend(drawn)
+    return result
+
+
+NORMALIZE_CACHE_SIZE = 1024
+NORMALIZE_CACHE_MAX_LENGTH = 64
+
+
 def normalize_input(value: str | None) -> str | None:
     """Normalize input value to lowercase.
 
+    Short values, such as the enum-like tribe, gender or school type
+    arguments, are memoized in a bounded cache since the same few values
+    are normalized over and over.
+
     Args:
         value (str | None): The value to normalize.
 
@@ -115,6 +398,32 @@ def normalize_input(value: str | None) -> str | None:
         msg = f"Expected a string or None, got {type(value).__name__}"
         raise TypeError(msg)
 
+    if len(value) <= NORMALIZE_CACHE_MAX_LENGTH:
+        return _normalize_cached(value)
+    return _normalize(value)
+
+
+def normalize_choice(value: str | None, choices: Collection[str]) -> str | None:
+    """Normalize an enum-like input value unless it is already canonical.
+
+    Values that are already one of the canonical choices, such as a tribe
+    validated by an outer call, are returned as is without normalization.
+
+    Args:
+        value (str | None): The value to normalize.
+        choices (Collection[str]): The canonical values.
+
+    Returns:
+        str | None: The canonical or normalized value, or None if the input
+            is None.
+    """
+    if value is None or value in choices:
+        return value
+    return normalize_input(value)
+
+
+def _normalize(value: str) -> str | None:
+    """Strip, remove accents from and lowercase a string."""
     # Normalize and strip whitespace
     value = value.strip()
 
@@ -127,90 +436,998 @@ def normalize_input(value: str | None) -> str | None:
     return value.lower() if value else None
 
 
+_normalize_cached = functools.lru_cache(maxsize=NORMALIZE_CACHE_SIZE)(_normalize)
+
+
+OUTPUT_BUFFER_SIZE = 1 << 20
+OUTPUT_CHUNK_SIZE = SINK_CHUNK_SIZE
+COMMAND_FIRST_CHUNK_SIZE = 256
+OUTPUT_OPTIONS_KEY = "fakernaija.output_options"
+STDOUT = "-"
+SQLITE = "sqlite"
+SHARD_DIGITS = 5
+SHARD_MANIFEST_SUFFIX = ".manifest.json"
+PARTITION_MAX_OPEN_FILES = 64
+PARTITION_BUFFER_SIZE = 1 << 16
+SIZE_UNITS = {"": 1, "k": 1 << 10, "m": 1 << 20, "g": 1 << 30, "t": 1 << 40}
+SIZE_PATTERN = re.compile(r"(\d+)\s*([kmgt]?)(?:i?b)?", re.IGNORECASE)
+
+
+def console_value(item: Any) -> str:  # noqa: ANN401
+    """Format a generated item for the console, with nested records as dicts.
+
+    Args:
+        item (Any): The item, e.g. a string, a record or a schema row.
+
+    Returns:
+        str: The item as printed, e.g. ``{'name': 'Ose', 'code': 'FFN'}``.
+    """
+    if isinstance(item, Mapping):
+        return str({key: to_builtin(value) for key, value in item.items()})
+    return str(to_builtin(item))
+
+
 def get_unique_filename(base_path: Path) -> Path:
-    """Generate a unique file name by appending numbers if the file exists."""
+    """Generate a unique file name by appending numbers if the file exists.
+
+    The number goes before all extensions, e.g. ``emails_1.csv.gz``. The
+    directory is listed once, rather than probing each candidate name with a
+    ``stat`` call, so directories holding many outputs stay fast.
+    """
+    directory = base_path.parent
+    if not directory.is_dir():
+        return base_path
+    suffix = "".join(base_path.suffixes)
+    prefix = f"{base_path.name.removesuffix(suffix)}_"
+    taken = {
+        entry.name
+        for entry in os.scandir(directory)
+        if entry.name == base_path.name
+        or (entry.name.startswith(prefix) and entry.name.endswith(suffix))
+    }
+    if base_path.name not in taken:
+        return base_path
     counter = 1
-    unique_path = base_path
-    while unique_path.exists():
-        unique_path = base_path.with_stem(f"{base_path.stem}_{counter}")
+    while f"{prefix}{counter}{suffix}" in taken:
         counter += 1
-    return unique_path
+    return base_path.with_name(f"{prefix}{counter}{suffix}")
+
+
+def infer_output_format(output_path: str | Path) -> str:
+    """Infer the output format from the extension of an output path.
+
+    A compression extension is skipped, e.g. ``data.csv.gz`` is CSV.
+
+    Args:
+        output_path (str | Path): The output path, or ``-`` for stdout.
+
+    Returns:
+        str: The format whose sink uses the extension, ``sqlite`` for
+            database files, or ``text`` if none does.
+    """
+    path = Path(output_path)
+    if infer_compression(path):
+        path = path.with_suffix("")
+    suffix = path.suffix.lower()
+    if suffix in SQLITE_EXTENSIONS:
+        return SQLITE
+    for output, sink in SINKS.items():
+        if sink.extension == suffix:
+            return output
+    return "text"
+
+
+@contextlib.contextmanager
+def _open_binary_output(
+    output_path: str | Path,
+    append: bool = False,
+    buffer_size: int = OUTPUT_BUFFER_SIZE,
+) -> Iterator[IO[bytes]]:
+    """Open an output file, or stdout for ``-``, in binary mode with a large buffer."""
+    if str(output_path) != STDOUT:
+        with Path(output_path).open(
+            "ab" if append else "wb", buffering=buffer_size
+        ) as file:
+            yield file
+        return
+
+    sys.stdout.flush()
+    stdout = sys.stdout.buffer
+    try:
+        fileno = stdout.fileno()
+    except (AttributeError, OSError):
+        # stdout is not a real file, e.g. in tests, so use it as is
+        yield stdout
+        stdout.flush()
+        return
+    with open(fileno, "wb", buffering=OUTPUT_BUFFER_SIZE, closefd=False) as file:
+        yield file
+
+
+@contextlib.contextmanager
+def open_output(  # noqa: PLR0913
+    output_path: str | Path,
+    output: str,
+    compression: str | None = None,
+    compress_level: int | None = None,
+    compress_thread: bool = False,
+    *,
+    append: bool = False,
+    buffer_size: int = OUTPUT_BUFFER_SIZE,
+) -> Iterator[TextIO]:
+    """Open an output file, or stdout for ``-``, for writing with a large buffer.
+
+    Stdout is written through its binary stream with a buffer of
+    ``OUTPUT_BUFFER_SIZE`` bytes, so output can be piped into another program
+    efficiently. Stdout is flushed, but not closed, on exit. With a
+    compression, the output is compressed as it is written; appending to a
+    compressed file adds a compressed stream, which gzip, bz2 and xz readers
+    read as one.
+
+    Args:
+        output_path (str | Path): The path of the output file, or ``-``.
+        output (str): The output format. CSV files are opened without newline
+            translation.
+        compression (str | None, optional): The compression: gzip, bz2 or xz.
+            Defaults to None (no compression).
+        compress_level (int | None, optional): The compression level.
+            Defaults to None (the default level of the compression).
+        compress_thread (bool, optional): Compress on a separate thread.
+            Defaults to False.
+        append (bool, optional): Append to the file instead of replacing it.
+            Defaults to False.
+        buffer_size (int, optional): The buffer size of the file, in bytes.
+            Defaults to OUTPUT_BUFFER_SIZE.
+
+    Yields:
+        TextIO: The open file.
+
+    Raises:
+        ValueError: If the compression or level is not supported.
+    """
+    if compression:
+        # Fail before the output file is created
+        compress_level = validate_compression(compression, compress_level)
+    with contextlib.ExitStack() as stack:
+        binary = stack.enter_context(
+            _open_binary_output(output_path, append, buffer_size),
+        )
+        if compression:
+            binary = stack.enter_context(
+                compressed_stream(binary, compression, compress_level, compress_thread),
+            )
+        file = io.TextIOWrapper(
+            binary,
+            encoding="utf-8",
+            newline="" if output == "csv" else None,
+        )
+        try:
+            yield file
+        finally:
+            try:
+                file.flush()
+            finally:
+                # Leave closing the binary stream to its own context
+                file.detach()
+
+
+def parse_size(value: str) -> int:
+    """Parse a byte size, e.g. ``512``, ``64k``, ``100MB`` or ``1GiB``.
+
+    Units are powers of 1024.
+
+    Args:
+        value (str): The size.
+
+    Returns:
+        int: The size in bytes.
+
+    Raises:
+        ValueError: If the size is not valid or not positive.
+    """
+    match = SIZE_PATTERN.fullmatch(value.strip())
+    if not match or not int(match[1]):
+        msg = f"Invalid size: {value}. Use a positive number of bytes, optionally with a unit, e.g. 64k, 100MB or 1GiB."
+        raise ValueError(msg)
+    return int(match[1]) * SIZE_UNITS[match[2].lower()]
+
+
+def output_extension(output: str, compression: str | None = None) -> str:
+    """Get the extensions of the output files of a format, e.g. ``.csv.gz``."""
+    extension = SQLiteSink.extension if output == SQLITE else SINKS[output].extension
+    if compression:
+        extension += COMPRESSIONS[compression]
+    return extension
+
+
+@contextlib.contextmanager
+def _remove_on_error(paths: list[Path]) -> Iterator[list[Path]]:
+    """Remove the files of an output if writing it fails.
+
+    Generation errors can be raised midway through the output, e.g. by an
+    invalid custom name, so this keeps incomplete files from being mistaken
+    for complete ones. Callers add each file to ``paths`` before creating it.
+
+    Yields:
+        list[Path]: The paths of the files to remove on error.
+    """
+    try:
+        yield paths
+    except BaseException:
+        for path in paths:
+            with contextlib.suppress(OSError):
+                path.unlink()
+        raise
+
+
+def shard_manifest_path(output_path: str | Path, extension: str) -> Path:
+    """Get the path of the manifest of sharded output.
+
+    Args:
+        output_path (str | Path): The output path the shards are named
+            after, e.g. ``emails.csv``.
+        extension (str): The extensions of the shards, e.g. ``.csv``.
+
+    Returns:
+        Path: The manifest path, e.g. ``emails.manifest.json``.
+    """
+    path = Path(output_path)
+    if extension and path.name.lower().endswith(extension):
+        stem = path.name[: -len(extension)]
+    else:
+        stem = path.stem
+    return path.with_name(f"{stem}{SHARD_MANIFEST_SUFFIX}")
+
+
+def _write_shard(  # noqa: PLR0913
+    path: Path,
+    sink: Sink,
+    items: Iterator[Any],
+    *,
+    shard_rows: int | None,
+    shard_bytes: int | None,
+    row_size: float | None,
+) -> float | None:
+    """Write items to one shard until it is full or the items run out.
+
+    Batches are sized to end at the row limit, and at the end of the byte
+    limit estimated from the bytes per row written so far, so shards do not
+    overshoot their limits by a batch. Without an estimate yet, a small
+    first batch measures the row size.
+
+    Returns:
+        float | None: The estimated bytes per row, for the next shard.
+    """
+    batch_size = OUTPUT_CHUNK_SIZE
+    if shard_bytes:
+        batch_size = (
+            math.ceil(shard_bytes / row_size) if row_size else COMMAND_FIRST_CHUNK_SIZE
+        )
+    while True:
+        if shard_rows:
+            batch_size = min(batch_size, shard_rows - sink.count)
+        batch = list(
+            itertools.islice(items, max(0, min(batch_size, OUTPUT_CHUNK_SIZE)))
+        )
+        if not batch:
+            return row_size
+        sink.write(batch)
+        sink.file.flush()
+        batch_size = OUTPUT_CHUNK_SIZE
+        if shard_bytes:
+            size = path.stat().st_size
+            if size:
+                # Compressors may hold data back, so sizes can lag behind
+                row_size = size / sink.count
+                batch_size = math.ceil((shard_bytes - size) / row_size)
+
+
+def write_data_to_shards(  # noqa: PLR0913
+    data: Iterable[Any],
+    output_path: str | Path,
+    output: str,
+    data_type: str,
+    *,
+    shard_rows: int | None = None,
+    shard_bytes: int | None = None,
+    compression: str | None = None,
+    compress_level: int | None = None,
+    compress_thread: bool = False,
+    sink_options: Mapping[str, Any] | None = None,
+) -> Path:
+    """Write data to numbered shard files, followed by a manifest.
+
+    The shards are named after the output path, e.g. ``emails-00000.csv``,
+    ``emails-00001.csv`` for ``emails.csv``, and each is a complete file of
+    the format, with its own CSV header or JSON array. A shard is finished
+    once it holds ``shard_rows`` items or reaches ``shard_bytes`` bytes on
+    disk, whichever comes first, and the data is streamed across the shards
+    in constant memory. The manifest, e.g. ``emails.manifest.json``, lists
+    the shards with their row counts and sizes, so loaders can read the
+    shards in parallel. If writing fails, the shards written so far are
+    removed and no manifest is written.
+
+    Args:
+        data (Iterable[Any]): The data to write.
+        output_path (str | Path): The output path the shards are named after.
+        output (str): The format of the shards (e.g., json, csv, text).
+        data_type (str): The type of data being written.
+        shard_rows (int | None, optional): The maximum number of items per
+            shard. Defaults to None (no row limit).
+        shard_bytes (int | None, optional): The size in bytes after which a
+            shard is finished. Compressed shards are measured compressed.
+            Defaults to None (no size limit).
+        compression (str | None, optional): Compress the shards with gzip,
+            bz2 or xz. Defaults to None (no compression).
+        compress_level (int | None, optional): The compression level.
+            Defaults to None (the default level of the compression).
+        compress_thread (bool, optional): Compress on a separate thread.
+            Defaults to False.
+        sink_options (Mapping[str, Any] | None, optional): Extra options of
+            the sink, e.g. the ``table`` of SQL output. Defaults to None.
+
+    Returns:
+        Path: The path of the manifest.
+
+    Raises:
+        ValueError: If the output path is stdout, or no shard limit, or an
+            unsupported compression is given.
+        OSError: If there is an error writing the files.
+    """
+    if str(output_path) == STDOUT:
+        msg = "Sharded output cannot be written to stdout. Use a file path."
+        raise ValueError(msg)
+    if not shard_rows and not shard_bytes:
+        msg = "Sharded output needs a row or byte limit per shard."
+        raise ValueError(msg)
+    extension = output_extension(output, compression)
+    manifest_path = shard_manifest_path(output_path, extension)
+    stem = manifest_path.name.removesuffix(SHARD_MANIFEST_SUFFIX)
+
+    items = iter(data)
+    row_size = None
+    shards: list[dict[str, Any]] = []
+    with _remove_on_error([]) as paths:
+        for index in itertools.count():
+            # Peek, so no empty shard is created once the data runs out
+            first = list(itertools.islice(items, 1))
+            if not first:
+                break
+            path = manifest_path.with_name(
+                f"{stem}-{index:0{SHARD_DIGITS}d}{extension}"
+            )
+            paths.append(path)
+            with open_output(
+                path,
+                output,
+                compression,
+                compress_level,
+                compress_thread,
+            ) as file:
+                sink = create_sink(output, file, data_type, **(sink_options or {}))
+                row_size = _write_shard(
+                    path,
+                    sink,
+                    itertools.chain(first, items),
+                    shard_rows=shard_rows,
+                    shard_bytes=shard_bytes,
+                    row_size=row_size,
+                )
+                sink.close()
+            shards.append(
+                {"path": path.name, "rows": sink.count, "bytes": path.stat().st_size}
+            )
+
+    _write_manifest(
+        manifest_path,
+        {"format": output, "compression": compression},
+        "shards",
+        shards,
+    )
+    return manifest_path
+
+
+class _PartitionFiles:
+    """The partition files of a partitioned output, with a bounded pool of open files.
+
+    At most ``max_open_files`` files are open at once; writing to another
+    partition closes the least recently used file first. A closed partition
+    is reopened to append, and its sink continues where it stopped, so each
+    file still holds a single CSV header or JSON array.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        manifest_path: Path,
+        extension: str,
+        output: str,
+        data_type: str,
+        *,
+        compression: str | None,
+        compress_level: int | None,
+        compress_thread: bool,
+        max_open_files: int,
+        sink_options: Mapping[str, Any],
+    ) -> None:
+        """Initialize the partition files; files are created when first written."""
+        self.stem = manifest_path.name.removesuffix(SHARD_MANIFEST_SUFFIX)
+        self.directory = manifest_path.parent
+        self.extension = extension
+        self.output = output
+        self.data_type = data_type
+        self.open_args = (compression, compress_level, compress_thread)
+        self.max_open_files = max_open_files
+        self.sink_options = sink_options
+        self.sinks: dict[str, Sink] = {}
+        self.values: dict[str, Any] = {}
+        self.paths: list[Path] = []
+        self.open_files: collections.OrderedDict[str, contextlib.ExitStack] = (
+            collections.OrderedDict()
+        )
+
+    def path(self, name: str) -> Path:
+        """Get the path of a partition file."""
+        return self.directory / f"{self.stem}-{name}{self.extension}"
+
+    def sink(self, name: str) -> Sink:
+        """Get the sink of a partition, opening its file if it is closed."""
+        if name in self.open_files:
+            self.open_files.move_to_end(name)
+            return self.sinks[name]
+        if len(self.open_files) >= self.max_open_files:
+            _, stack = self.open_files.popitem(last=False)
+            stack.close()
+        if name not in self.sinks:
+            self.paths.append(self.path(name))
+        with contextlib.ExitStack() as stack:
+            file = stack.enter_context(
+                open_output(
+                    self.path(name),
+                    self.output,
+                    *self.open_args,
+                    append=name in self.sinks,
+                    buffer_size=PARTITION_BUFFER_SIZE,
+                ),
+            )
+            self.open_files[name] = stack.pop_all()
+        if name in self.sinks:
+            self.sinks[name].reopen(file)
+        else:
+            self.sinks[name] = create_sink(
+                self.output,
+                file,
+                self.data_type,
+                **self.sink_options,
+            )
+        return self.sinks[name]
+
+    def write(self, name: str, value: Any, items: list[Any]) -> None:  # noqa: ANN401
+        """Write items to a partition."""
+        self.values.setdefault(name, value)
+        self.sink(name).write(items)
+
+    def finish(self) -> list[dict[str, Any]]:
+        """Close the sinks and files of all partitions.
+
+        Returns:
+            list[dict[str, Any]]: The partitions, with their value, file, row
+                count and size, in order of first appearance.
+        """
+        for name in self.sinks:
+            self.sink(name).close()
+            self.open_files.pop(name).close()
+        return [
+            {
+                "value": self.values[name],
+                "path": self.path(name).name,
+                "rows": sink.count,
+                "bytes": self.path(name).stat().st_size,
+            }
+            for name, sink in self.sinks.items()
+        ]
+
+    def close(self) -> None:
+        """Close the open files."""
+        while self.open_files:
+            self.open_files.popitem()[1].close()
+
+
+def partition_name(value: Any) -> str:  # noqa: ANN401
+    """Get the file name part of a partition value, e.g. ``Akwa_Ibom``."""
+    return re.sub(r"[^\w-]+", "_", str(value)).strip("_") or "_"
+
+
+def write_data_to_partitions(  # noqa: PLR0913
+    data: Iterable[Any],
+    output_path: str | Path,
+    output: str,
+    data_type: str,
+    partition_by: str,
+    *,
+    compression: str | None = None,
+    compress_level: int | None = None,
+    compress_thread: bool = False,
+    max_open_files: int = PARTITION_MAX_OPEN_FILES,
+    sink_options: Mapping[str, Any] | None = None,
+) -> Path:
+    """Write records to one file per value of a field, followed by a manifest.
+
+    Each record is routed to the file of its partition as it is generated,
+    e.g. ``profiles-Lagos.csv`` for ``profiles.csv`` partitioned by
+    ``state``, so no second pass over the data is needed. Each file is a
+    complete file of the format. The data is grouped a chunk at a time, and
+    only ``max_open_files`` files are kept open, so any number of partitions
+    is written in bounded memory. Values that only differ in characters that
+    are not allowed in file names share a file. The manifest, e.g.
+    ``profiles.manifest.json``, lists the partitions with their values, row
+    counts and sizes. If writing fails, the files written so far are removed
+    and no manifest is written.
+
+    Args:
+        data (Iterable[Any]): The records to write.
+        output_path (str | Path): The output path the partitions are named after.
+        output (str): The format of the files (e.g., json, csv, text).
+        data_type (str): The type of data being written.
+        partition_by (str): The record field to partition by, e.g. ``state``.
+        compression (str | None, optional): Compress the files with gzip,
+            bz2 or xz. Defaults to None (no compression).
+        compress_level (int | None, optional): The compression level.
+            Defaults to None (the default level of the compression).
+        compress_thread (bool, optional): Compress on a separate thread.
+            Defaults to False.
+        max_open_files (int, optional): The maximum number of files open at
+            once. Defaults to PARTITION_MAX_OPEN_FILES.
+        sink_options (Mapping[str, Any] | None, optional): Extra options of
+            the sinks, e.g. the ``table`` of SQL output. Defaults to None.
+
+    Returns:
+        Path: The path of the manifest.
+
+    Raises:
+        ValueError: If the output path is stdout, the data are not records
+            or the field does not exist.
+        OSError: If there is an error writing the files.
+    """
+    if str(output_path) == STDOUT:
+        msg = "Partitioned output cannot be written to stdout. Use a file path."
+        raise ValueError(msg)
+    extension = output_extension(output, compression)
+    manifest_path = shard_manifest_path(output_path, extension)
+    files = _PartitionFiles(
+        manifest_path,
+        extension,
+        output,
+        data_type,
+        compression=compression,
+        compress_level=compress_level,
+        compress_thread=compress_thread,
+        max_open_files=max_open_files,
+        sink_options=sink_options or {},
+    )
+    with _remove_on_error(files.paths):
+        try:
+            for chunk in chunked(data, OUTPUT_CHUNK_SIZE):
+                if not isinstance(chunk[0], Mapping):
+                    msg = f"Only records can be partitioned, not {data_type}."
+                    raise ValueError(msg)  # noqa: TRY004
+                if partition_by not in chunk[0]:
+                    msg = f"Unknown partition field: {partition_by}. Available fields are: {', '.join(chunk[0])}"
+                    raise ValueError(msg)
+                groups: dict[str, tuple[Any, list[Any]]] = {}
+                for record in chunk:
+                    value = record[partition_by]
+                    name = partition_name(value)
+                    if name not in groups:
+                        groups[name] = (value, [])
+                    groups[name][1].append(record)
+                for name, (value, records) in groups.items():
+                    files.write(name, value, records)
+            partitions = files.finish()
+        finally:
+            files.close()
+
+    _write_manifest(
+        manifest_path,
+        {"format": output, "compression": compression, "partition_by": partition_by},
+        "partitions",
+        partitions,
+    )
+    return manifest_path
+
+
+def _write_manifest(
+    manifest_path: Path,
+    info: dict[str, Any],
+    key: str,
+    files: list[dict[str, Any]],
+) -> None:
+    """Write the manifest of output files, with their total rows and bytes."""
+    manifest = {
+        **info,
+        "rows": sum(file["rows"] for file in files),
+        "bytes": sum(file["bytes"] for file in files),
+        key: files,
+    }
+    with manifest_path.open("w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=4, default=to_builtin)
+        f.write("\n")
+
 
+def _write_sqlite_output(
+    data: Iterable[Any],
+    output_path: str | Path,
+    data_type: str,
+    table: str | None,
+) -> str:
+    """Load data into a table of a database file and return the table name."""
+    if str(output_path) == STDOUT:
+        msg = "SQLite output cannot be written to stdout. Use a database file path."
+        raise ValueError(msg)
+    table = table or column_name(data_type)
+    write_sqlite(data, output_path, table, data_type, OUTPUT_CHUNK_SIZE)
+    return table
 
-def write_data_to_file(
-    data: list[Any],
-    output_path: Path,
+
+def write_data_to_file(  # noqa: PLR0913
+    data: Iterable[Any],
+    output_path: str | Path,
     output: str,
     data_type: str,
+    *,
+    compression: str | None = None,
+    compress_level: int | None = None,
+    compress_thread: bool = False,
+    shard_rows: int | None = None,
+    shard_bytes: int | None = None,
+    partition_by: str | None = None,
+    table: str | None = None,
+    batch_rows: int | None = None,
+    label_columns: bool = True,
 ) -> None:
     """Write data to file in specified format.
 
+    The data is written in chunks as it is consumed, through a buffered file
+    that is flushed after every chunk, so an iterator of any length can be
+    written in constant memory. With a shard limit, the data is split across
+    numbered files instead (see ``write_data_to_shards``), and with a
+    partition field, across one file per value of the field (see
+    ``write_data_to_partitions``). The ``sqlite`` format loads the data into
+    a table of a database file (see ``SQLiteSink``).
+
     Args:
-        data (list[Any]): The data to write. Can be a list of dicts or a list of strings.
-        output_path (Path): The path to the output file.
+        data (Iterable[Any]): The data to write. Can be strings or records,
+            e.g. a list or a lazy iterator.
+        output_path (str | Path): The path to the output file, or ``-`` to
+            write to stdout.
         output (str): The format of the output file (e.g., json, csv, text).
         data_type (str): The type of data being written.
+        compression (str | None, optional): Compress the file as it is
+            written with gzip, bz2 or xz. Defaults to None (no compression).
+        compress_level (int | None, optional): The compression level.
+            Defaults to None (the default level of the compression).
+        compress_thread (bool, optional): Compress on a separate thread, so
+            generation and compression overlap. Defaults to False.
+        shard_rows (int | None, optional): Split the output into shards of
+            at most this many items. Defaults to None (one file).
+        shard_bytes (int | None, optional): Split the output into shards of
+            about this many bytes. Defaults to None (one file).
+        partition_by (str | None, optional): Split the records into one file
+            per value of this field. Defaults to None (one file).
+        table (str | None, optional): The table the ``sqlite`` format loads
+            and the ``sql`` format inserts into. Defaults to None (a table
+            named after the data type).
+        batch_rows (int | None, optional): The number of rows per ``INSERT``
+            statement of the ``sql`` format. Defaults to None (SQL_BATCH_ROWS).
+        label_columns (bool, optional): Write the CSV header as labels of the
+            record keys, or as the keys unchanged, e.g. the columns of a
+            dataset schema. Defaults to True.
+
+    Generation errors, e.g. an invalid custom name, can be raised midway
+    through the output. The files written so far are then removed, and the
+    error is reported with its own message.
 
     Raises:
         OSError: If there is an error writing to the file.
     """
+    sink_options = {
+        "table": table,
+        "batch_rows": batch_rows,
+        "label_columns": label_columns,
+    }
+    # Added to generation errors raised midway through the output
+    note = "" if str(output_path) == STDOUT else " No partial output was kept."
     try:
-        if output == "json":
-            with output_path.open("w") as f:
-                json.dump(data, f, indent=4)
-        elif output == "csv":
-            with output_path.open("w", newline="") as f:
-                writer = csv.writer(f)
-                if data:
-                    if isinstance(data[0], dict):
-                        writer.writerow(
-                            [
-                                key.capitalize().replace("_", " ") + "s"
-                                for key in data[0]
-                            ],
-                        )
-                        for record in data:
-                            writer.writerow(record.values())
-                    else:
-                        writer.writerow([data_type.title()])
-                        for record in data:
-                            writer.writerow([record])
-        elif output == "text":
-            with output_path.open("w") as f:
-                if isinstance(data[0], dict):
-                    for record in data:
-                        f.write(
-                            " | ".join(
-                                f"{key.capitalize().replace('_', ' ')}: {value}"
-                                for key, value in record.items()
-                            )
-                            + "\n",
-                        )
-                else:
-                    for record in data:
-                        f.write(record + "\n")
-        click.echo(f"Generated data saved to {output_path}")
+        if output == SQLITE:
+            if compression or shard_rows or shard_bytes or partition_by:
+                msg = "SQLite output cannot be compressed, sharded or partitioned."
+                raise ValueError(msg)  # noqa: TRY301
+            if note:
+                note = " Rows committed to the database before the error were kept."
+            table = _write_sqlite_output(data, output_path, data_type, table)
+            message = f"Generated data saved to table {table} in {output_path}"
+        elif partition_by and (shard_rows or shard_bytes):
+            msg = "Partitioned output cannot be sharded as well."
+            raise ValueError(msg)  # noqa: TRY301
+        elif partition_by:
+            manifest_path = write_data_to_partitions(
+                data,
+                output_path,
+                output,
+                data_type,
+                partition_by,
+                compression=compression,
+                compress_level=compress_level,
+                compress_thread=compress_thread,
+                sink_options=sink_options,
+            )
+            message = f"Generated data saved to partitions listed in {manifest_path}"
+        elif shard_rows or shard_bytes:
+            manifest_path = write_data_to_shards(
+                data,
+                output_path,
+                output,
+                data_type,
+                shard_rows=shard_rows,
+                shard_bytes=shard_bytes,
+                compression=compression,
+                compress_level=compress_level,
+                compress_thread=compress_thread,
+                sink_options=sink_options,
+            )
+            message = f"Generated data saved to shards listed in {manifest_path}"
+        else:
+            with (
+                _remove_on_error(
+                    [] if str(output_path) == STDOUT else [Path(output_path)],
+                ),
+                open_output(
+                    output_path,
+                    output,
+                    compression,
+                    compress_level,
+                    compress_thread,
+                ) as f,
+            ):
+                sink = create_sink(output, f, data_type, **sink_options)
+                sink.write_all(data, OUTPUT_CHUNK_SIZE)
+            message = f"Generated data saved to {output_path}"
+    except BrokenPipeError:
+        # The reading end of the pipe closed early, e.g. ``| head``
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, sys.stdout.fileno())
+        return
     except OSError as e:
         click.echo(
             f"Error: Could not write to file {output_path}. {e}",
             err=True,
         )
+        return
+    except sqlite3.Error as e:
+        click.echo(f"Error: Could not load the database {output_path}. {e}", err=True)
+        return
+    except ValueError as e:
+        click.echo(f"Error: {e}{note}", err=True)
+        return
+    if str(output_path) != STDOUT:
+        click.echo(message)
+
+
+def _store_output_option(
+    ctx: click.Context,
+    param: click.Parameter,
+    value: Any,  # noqa: ANN401
+) -> Any:  # noqa: ANN401
+    """Keep the value of a shared output option in the context."""
+    ctx.meta.setdefault(OUTPUT_OPTIONS_KEY, {})[param.name] = value
+    return value
+
+
+def _store_size_option(
+    ctx: click.Context,
+    param: click.Parameter,
+    value: str | None,
+) -> int | None:
+    """Parse a byte size option and keep its value in the context."""
+    try:
+        size = None if value is None else parse_size(value)
+    except ValueError as e:
+        raise click.BadParameter(str(e), ctx, param) from None
+    return _store_output_option(ctx, param, size)
+
+
+def get_output_options() -> dict[str, Any]:
+    """Get the shared output options of the running CLI command.
+
+    Returns:
+        dict[str, Any]: The values of the options added by ``output_options``,
+            or an empty dict outside of a command.
+    """
+    ctx = click.get_current_context(silent=True)
+    if ctx is None:
+        return {}
+    return dict(ctx.meta.get(OUTPUT_OPTIONS_KEY, {}))
+
+
+def output_options(command: Callable[..., Any]) -> Callable[..., Any]:
+    """Add the output options shared by all CLI commands.
+
+    The options are not passed to the command function: ``handle_command_output``
+    reads them from the command's context.
+
+    Args:
+        command (Callable[..., Any]): The command function.
+
+    Returns:
+        Callable[..., Any]: The command function with the options added.
+    """
+    options = [
+        click.option(
+            "--out",
+            default=None,
+            help=(
+                "Write the output to this path, or to stdout for '-', instead of "
+                "a new file in the current directory. The format and compression "
+                "default to the path's extensions."
+            ),
+            type=click.Path(dir_okay=False, allow_dash=True),
+            expose_value=False,
+            callback=_store_output_option,
+        ),
+        click.option(
+            "--compress",
+            default=None,
+            help="Compress the output file as it is written.",
+            type=click.Choice(list(COMPRESSIONS), case_sensitive=False),
+            expose_value=False,
+            callback=_store_output_option,
+        ),
+        click.option(
+            "--compress-level",
+            default=None,
+            help="The compression level, from 0 (1 for bz2) to 9.",
+            type=click.IntRange(0, 9),
+            expose_value=False,
+            callback=_store_output_option,
+        ),
+        click.option(
+            "--compress-thread",
+            is_flag=True,
+            help="Compress on a separate thread, overlapping with generation.",
+            expose_value=False,
+            callback=_store_output_option,
+        ),
+        click.option(
+            "--table",
+            default=None,
+            help="The table of the sqlite and sql output formats. Defaults to the data name.",
+            metavar="NAME",
+            expose_value=False,
+            callback=_store_output_option,
+        ),
+        click.option(
+            "--sql-batch-rows",
+            type=click.IntRange(min=1),
+            default=None,
+            help="The number of rows per INSERT statement of the sql output format.",
+            metavar="N",
+            expose_value=False,
+            callback=_store_output_option,
+        ),
+        click.option(
+            "--workers",
+            default=None,
+            help="Generate the data in chunks across N worker processes.",
+            type=click.IntRange(min=1),
+            metavar="N",
+            expose_value=False,
+            callback=_store_output_option,
+        ),
+        click.option(
+            "--seed",
+            default=None,
+            help="Seed the data chunks, for the same output with any number of workers.",
+            type=int,
+            expose_value=False,
+            callback=_store_output_option,
+        ),
+        click.option(
+            "--unordered",
+            is_flag=True,
+            help="Output the chunks of the workers as they are done, not in order.",
+            expose_value=False,
+            callback=_store_output_option,
+        ),
+        click.option(
+            "--shard-rows",
+            default=None,
+            help="Split the output file into numbered shards of at most N rows.",
+            type=click.IntRange(min=1),
+            metavar="N",
+            expose_value=False,
+            callback=_store_output_option,
+        ),
+        click.option(
+            "--shard-bytes",
+            default=None,
+            help="Split the output file into numbered shards of about SIZE bytes, e.g. 100MB.",
+            metavar="SIZE",
+            expose_value=False,
+            callback=_store_size_option,
+        ),
+        click.option(
+            "--partition-by",
+            default=None,
+            help="Write one file per value of this record field, e.g. state.",
+            metavar="FIELD",
+            expose_value=False,
+            callback=_store_output_option,
+        ),
+    ]
+    for option in reversed(options):
+        command = option(command)
+    return command
+
+
+def command_chunk_sizes(repeat: int) -> Iterator[int]:
+    """Get the sizes of the chunks a CLI command generates ``repeat`` values in.
+
+    The chunks start small, so the first values are output right away, and
+    double up to ``OUTPUT_CHUNK_SIZE``.
+
+    Args:
+        repeat (int): The total number of values.
+
+    Yields:
+        int: The size of the next chunk.
+    """
+    size = COMMAND_FIRST_CHUNK_SIZE
+    while repeat > 0:
+        size = min(size, repeat)
+        yield size
+        repeat -= size
+        size = min(size * 2, OUTPUT_CHUNK_SIZE)
+
+
+def _generate_parallel_field_data(
+    repeat: int,
+    naija: "Naija",
+    field: str,
+    kwargs: dict[str, Any],
+) -> Iterable[Any]:
+    """Validate the arguments of a field, then generate it across the workers."""
+    try:
+        first = [item for item in naija.many(field, 1, **kwargs) if item is not None]
+    except ValueError as e:
+        click.echo(f"Error: {e}", err=True)
+        return []
+    if not first:
+        click.echo("Error: No data was generated.", err=True)
+        return []
+    return generate_parallel_command_data(FieldJob(field, kwargs), repeat)
 
 
 def generate_command_data(
     repeat: int,
-    generator_func: Callable[..., str | dict[str, Any] | None],
+    naija: "Naija",
+    field: str,
     **kwargs: Any,  # noqa: ANN401
-) -> list[str | dict[str, Any]]:
-    """Generates CLI data using the provided generator function.
+) -> Iterable[Any]:
+    """Generates CLI data for a field lazily, in growing chunks.
+
+    The arguments are validated and the first chunk is generated before
+    returning, so errors are reported before any output is written. The
+    rest is generated as the returned iterator is consumed, so only one
+    chunk is held in memory at a time.
 
     Args:
         repeat (int): The number of times to generate the data.
-        generator_func (Callable): The function to generate data.
-        **kwargs: Additional keyword arguments to pass to the generator function.
+        naija (Naija): The Naija instance generating the data.
+        field (str): The field to generate, e.g. ``email``.
+        **kwargs: Additional keyword arguments to pass to the field's generator.
 
     Returns:
-        list: A list of generated data.
+        Iterable[Any]: An iterator of the generated data, or an empty list if
+            nothing can be generated.
     """
     if repeat < 1:
         click.echo(
@@ -218,45 +1435,133 @@ def generate_command_data(
             err=True,
         )
         return []
-    data = []
+    if uses_parallel_generation():
+        return _generate_parallel_field_data(repeat, naija, field, kwargs)
+
+    sizes = command_chunk_sizes(repeat)
     try:
-        for _ in range(repeat):
-            item = generator_func(**kwargs)
-            if item is not None:
-                data.append(item)
-            else:
-                return []
+        first = [
+            item
+            for item in naija.many(field, next(sizes), **kwargs)
+            if item is not None
+        ]
     except ValueError as e:
         click.echo(f"Error: {e}", err=True)
         return []
-    if not data:
+    if not first:
         click.echo("Error: No data was generated.", err=True)
-    return data
+        return []
+    rest = (
+        item
+        for size in sizes
+        for item in naija.many(field, size, **kwargs)
+        if item is not None
+    )
+    return itertools.chain(first, rest)
+
+
+def uses_parallel_generation() -> bool:
+    """Check whether the running CLI command generates with ``--workers`` or ``--seed``."""
+    options = get_output_options()
+    return bool(options.get("workers")) or options.get("seed") is not None
+
+
+def generate_parallel_command_data(job: Job, repeat: int) -> Iterator[Any]:
+    """Generate CLI data in chunks, with the ``--workers`` and ``--seed`` options.
+
+    See ``fakernaija.parallel.generate_chunks``: the chunks are generated
+    across ``--workers`` processes, from seeds derived from ``--seed``, and
+    output in order, or as they are done with ``--unordered``.
+
+    Args:
+        job (Job): The job, a ``FieldJob`` or ``SchemaJob``.
+        repeat (int): The number of values to generate.
+
+    Returns:
+        Iterator[Any]: An iterator of the generated data.
+    """
+    options = get_output_options()
+    return itertools.chain.from_iterable(
+        generate_chunks(
+            job,
+            repeat,
+            options.get("workers") or 1,
+            options.get("seed"),
+            ordered=not options.get("unordered"),
+        ),
+    )
 
 
 def handle_command_output(
-    data: list[str | dict[str, Any]],
+    data: Iterable[Any],
     output: str | None,
     base_filename_prefix: str,
     data_type: str,
+    *,
+    label_columns: bool = True,
 ) -> None:
     """Handles output to a file or console based on user options.
 
+    The data is written as it is consumed, so a lazy iterator is output in
+    constant memory. With the ``--out`` option (see ``output_options``), the
+    data is written to that path or to stdout, in the given format or the
+    one of the path's extension. Otherwise, a format writes a new file in
+    the current directory, and no format prints the data. With a shard
+    limit or a partition field, the data is written to several files and a
+    manifest instead, as text if no format is given.
+
     Args:
-        data (list): The list of data to output.
+        data (Iterable[Any]): The data to output.
         output (str): The format of the output file, if provided.
         base_filename_prefix (str): The base name prefix for the output file.
         data_type (str): The type of data for header labeling.
+        label_columns (bool, optional): Label the record keys in CSV headers;
+            False keeps user-chosen column names as they are. Defaults to True.
     """
+    options = get_output_options()
+    out = options.get("out")
+    compression = options.get("compress")
+    sharded = (
+        options.get("shard_rows")
+        or options.get("shard_bytes")
+        or options.get("partition_by")
+    )
+    if sharded and not out and not output:
+        output = "text"
+    if out:
+        output = output or infer_output_format(out)
+        output_path: str | Path = out
+        compression = compression or infer_compression(out)
+    elif output:
+        extension = output_extension(output, compression)
+        if sharded:
+            # Number the shards after a free manifest name
+            manifest_path = get_unique_filename(
+                Path.cwd() / f"{base_filename_prefix}{SHARD_MANIFEST_SUFFIX}",
+            )
+            output_path = manifest_path.with_name(
+                manifest_path.name.removesuffix(SHARD_MANIFEST_SUFFIX) + extension
+            )
+        else:
+            output_path = get_unique_filename(
+                Path.cwd() / f"{base_filename_prefix}{extension}",
+            )
     if output:
-        file_extensions = {
-            "json": ".json",
-            "text": ".txt",
-            "csv": ".csv",
-        }
-        base_filename = Path(f"{base_filename_prefix}{file_extensions[output]}")
-        output_path = get_unique_filename(Path.cwd() / base_filename)
-        write_data_to_file(data, output_path, output, data_type)
+        write_data_to_file(
+            data,
+            output_path,
+            output,
+            data_type,
+            compression=compression,
+            compress_level=options.get("compress_level"),
+            compress_thread=bool(options.get("compress_thread")),
+            shard_rows=options.get("shard_rows"),
+            shard_bytes=options.get("shard_bytes"),
+            partition_by=options.get("partition_by"),
+            table=options.get("table") or base_filename_prefix,
+            batch_rows=options.get("sql_batch_rows"),
+            label_columns=label_columns,
+        )
     else:
-        for item in data:
-            click.echo(item)
+        for chunk in chunked(data, OUTPUT_CHUNK_SIZE):
+            click.echo("\n".join(map(console_value, chunk)))